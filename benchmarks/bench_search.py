@@ -0,0 +1,265 @@
+"""
+Benchmark de búsqueda: latencias p50/p95/p99 y número de consultas
+
+Genera (o reutiliza) bases de datos sintéticas de varios tamaños con
+synthetic_dataset.py y mide, con un conjunto fijo de consultas:
+- AdvancedSearchEngine.search en todos los modos (smart, fts5, fuzzy, exact)
+- UniversalSearchEngine.search_items y DBManager.universal_search_items_count
+- Autocompletado (AutocompleteService.suggest)
+- SmartCollectionsManager.execute_collection
+
+La caché de resultados compartida se vacía antes de cada llamada (se mide el
+motor, no la caché) salvo con --with-cache. La primera pasada de cada carga
+construye los índices en memoria y se reporta aparte como warmup_ms.
+
+El informe se guarda en JSON; con --baseline se compara contra un informe
+anterior y el proceso termina con código 1 si algún p95 empeora más de
+--max-regression (o si aumenta el número de consultas por llamada).
+
+Uso:
+    python benchmarks/bench_search.py --sizes 1000,10000 --output search.json
+    python benchmarks/bench_search.py --sizes 1000,10000 --baseline search.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.database.db_manager import DBManager
+from src.core.search import AdvancedSearchEngine, get_autocomplete_service, get_search_cache
+from src.core.universal_search_engine import UniversalSearchEngine
+from src.core.smart_collections_manager import SmartCollectionsManager
+
+from bench_tag_hydration import QueryCounter
+from synthetic_dataset import generate
+
+# Consultas fijas: palabra frecuente, dos palabras, prefijo corto, sin resultados y con erratas
+QUERIES = ['git', 'docker compose', 'pyt', 'deploy server', 'zzzz', 'dokcer', 'invoice client']
+FUZZY_QUERIES = ['dokcer', 'kubctl', 'pythn', 'git psh', 'terrafrom']
+PREFIXES = ['gi', 'doc', 'py', 'ser', 'inv', 'ter', 'mon', 'ba']
+SEARCH_MODES = ['smart', 'fts5', 'fuzzy', 'exact']
+COLLECTIONS = [
+    {'name': 'Favoritos', 'is_favorite': 1},
+    {'name': 'Docker', 'search_text': 'docker'},
+    {'name': 'Tags git', 'tags_include': 'git-0,git-73'},
+    {'name': 'Activos sin secretos', 'is_active_filter': 1, 'tags_exclude': 'secret-71'},
+]
+
+# Diferencia mínima (ms) para considerar regresión: evita falsos positivos por ruido
+MIN_REGRESSION_MS = 1.0
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def measure(conn: sqlite3.Connection, calls: List[Callable[[], object]], repeat: int,
+            before_call: Callable[[], None] = None) -> Dict:
+    """
+    Time a list of calls repeat times (after one warmup pass)
+
+    Returns:
+        Dict with warmup_ms, calls, p50/p95/p99/mean/max (ms) and queries_per_call
+    """
+    start = time.perf_counter()
+    for call in calls:
+        if before_call:
+            before_call()
+        call()
+    warmup_ms = (time.perf_counter() - start) * 1000
+
+    samples = []
+    queries = 0
+    with QueryCounter(conn) as counter:
+        for _ in range(repeat):
+            for call in calls:
+                if before_call:
+                    before_call()
+                start = time.perf_counter()
+                call()
+                samples.append((time.perf_counter() - start) * 1000)
+        queries = counter.count
+
+    return {
+        'warmup_ms': round(warmup_ms, 3),
+        'calls': len(samples),
+        'p50_ms': round(percentile(samples, 50), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+        'p99_ms': round(percentile(samples, 99), 3),
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'queries_per_call': round(queries / len(samples), 2)
+    }
+
+
+def collection_runners(db_path: str) -> Tuple[List[Callable[[], object]], str]:
+    """
+    Callables executing the benchmark smart collections
+
+    Uses create_collection + execute_collection when the smart_collections
+    table has the filter columns; older schemas only store query_config, so
+    the same filters are then run through the manager's filter executor.
+    """
+    manager = SmartCollectionsManager(db_path)
+    logging.disable(logging.ERROR)
+    try:
+        ids = [
+            (manager.get_collection_by_name(spec['name']) or {}).get('id')
+            or manager.create_collection(**spec)
+            for spec in COLLECTIONS
+        ]
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if all(ids):
+        return [lambda cid=cid: manager.execute_collection(cid) for cid in ids], 'execute_collection'
+    return [lambda spec=spec: manager._execute_filters(spec) for spec in COLLECTIONS], '_execute_filters'
+
+
+def run_size(n_items: int, data_dir: str, repeat: int, with_cache: bool, regenerate: bool) -> Dict:
+    """Benchmark every workload on a dataset of n_items"""
+    db_path = os.path.join(data_dir, f"widget_sidebar_{n_items}.db")
+    dataset = None
+    if regenerate or not os.path.exists(db_path):
+        dataset = generate(db_path, n_items)
+
+    db = DBManager(db_path)
+    conn = db.connect()
+    cache = get_search_cache()
+    before_call = None if with_cache else cache.clear
+
+    advanced = AdvancedSearchEngine(db)
+    universal = UniversalSearchEngine(db)
+    autocomplete = get_autocomplete_service(db)
+
+    workloads = {}
+    for mode in SEARCH_MODES:
+        queries = FUZZY_QUERIES if mode == 'fuzzy' else QUERIES
+        workloads[f"advanced_{mode}"] = [
+            lambda q=q, m=mode: advanced.search(q, mode=m, limit=100) for q in queries
+        ]
+    workloads['universal_search_items'] = [
+        lambda q=q: universal.search_items(q, limit=100) for q in QUERIES
+    ]
+    workloads['universal_search_items_count'] = [
+        lambda q=q: db.universal_search_items_count(q) for q in QUERIES
+    ]
+    workloads['autocomplete'] = [lambda p=p: autocomplete.suggest(p) for p in PREFIXES]
+    workloads['smart_collections'], collections_via = collection_runners(db_path)
+
+    results = {}
+    for name, calls in workloads.items():
+        results[name] = measure(conn, calls, repeat, before_call)
+        logging.getLogger(__name__).debug(f"{n_items} {name}: {results[name]}")
+
+    db.close()
+    return {
+        'db_path': db_path,
+        'dataset': dataset,
+        'smart_collections_via': collections_via,
+        'workloads': results
+    }
+
+
+def compare(report: Dict, baseline: Dict, max_regression: float) -> List[str]:
+    """
+    Regressions of report against baseline
+
+    Returns:
+        List[str]: One line per workload whose p95 or queries_per_call got worse
+    """
+    regressions = []
+    for size, size_report in report['results'].items():
+        base_size = baseline.get('results', {}).get(size)
+        if not base_size:
+            continue
+        for name, stats in size_report['workloads'].items():
+            base = base_size['workloads'].get(name)
+            if not base:
+                continue
+            limit = base['p95_ms'] * (1 + max_regression)
+            if stats['p95_ms'] > limit and stats['p95_ms'] - base['p95_ms'] > MIN_REGRESSION_MS:
+                regressions.append(
+                    f"{size} {name}: p95 {base['p95_ms']:.2f} -> {stats['p95_ms']:.2f} ms"
+                )
+            if stats['queries_per_call'] > base['queries_per_call']:
+                regressions.append(
+                    f"{size} {name}: queries/call {base['queries_per_call']} -> {stats['queries_per_call']}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000",
+                        help="Tamaños de dataset separados por comas (p. ej. 1000,10000,100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Pasadas medidas por carga")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "widget_sidebar_bench"))
+    parser.add_argument("--regenerate", action="store_true", help="Regenerar los datasets existentes")
+    parser.add_argument("--with-cache", action="store_true", help="No vaciar la caché de resultados")
+    parser.add_argument("--output", help="Ruta del informe JSON")
+    parser.add_argument("--baseline", help="Informe JSON anterior para detectar regresiones")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Empeoramiento de p95 tolerado (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    # Algunos módulos configuran el logger raíz al importarse
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'with_cache': args.with_cache
+        },
+        'results': {}
+    }
+
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        size_report = run_size(size, args.data_dir, args.repeat, args.with_cache, args.regenerate)
+        report['results'][str(size)] = size_report
+
+        print(f"\n{size} items ({size_report['db_path']})")
+        print(f"  {'workload':<30} {'p50':>9} {'p95':>9} {'p99':>9} {'queries':>8} {'warmup':>10}")
+        for name, stats in size_report['workloads'].items():
+            print(f"  {name:<30} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+                  f"{stats['p99_ms']:>9.2f} {stats['queries_per_call']:>8.2f} {stats['warmup_ms']:>10.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
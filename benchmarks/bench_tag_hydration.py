@@ -0,0 +1,124 @@
+"""
+Benchmark: hidratación de tags por item vs. carga en bloque
+
+Compara el patrón anterior (una consulta get_tags_by_item por fila) con
+DBManager.get_tags_by_items/attach_tags (una consulta por lote de ids),
+midiendo número de SELECTs y tiempo total sobre una base de datos sintética.
+
+Uso:
+    python benchmarks/bench_tag_hydration.py --items 20000 --tags-per-item 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.db_manager import DBManager
+
+
+class QueryCounter:
+    """Cuenta sentencias SELECT ejecutadas sobre una conexión sqlite3"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.count = 0
+
+    def _trace(self, statement: str):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        self.conn.set_trace_callback(self._trace)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.conn.set_trace_callback(None)
+
+
+def populate(db: DBManager, n_items: int, tags_per_item: int, n_tags: int = 200) -> int:
+    """Crea una categoría con n_items items y tags aleatorios; devuelve el category_id"""
+    conn = db.connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO categories (name, order_index) VALUES (?, ?)", ("bench", 0)
+    )
+    category_id = cursor.lastrowid
+
+    cursor.executemany(
+        "INSERT INTO tags (name) VALUES (?)",
+        [(f"tag{i}",) for i in range(n_tags)]
+    )
+    tag_ids = [row[0] for row in cursor.execute("SELECT id FROM tags")]
+
+    cursor.executemany(
+        "INSERT INTO items (category_id, label, content, type) VALUES (?, ?, ?, 'TEXT')",
+        [(category_id, f"item {i}", f"content {i}") for i in range(n_items)]
+    )
+    item_ids = [row[0] for row in cursor.execute(
+        "SELECT id FROM items WHERE category_id = ?", (category_id,)
+    )]
+
+    rng = random.Random(42)
+    relations = []
+    for item_id in item_ids:
+        for tag_id in rng.sample(tag_ids, min(tags_per_item, len(tag_ids))):
+            relations.append((item_id, tag_id))
+    cursor.executemany(
+        "INSERT INTO item_tags (item_id, tag_id) VALUES (?, ?)", relations
+    )
+    conn.commit()
+    return category_id
+
+
+def hydrate_per_item(db: DBManager, items: list) -> None:
+    """Patrón anterior: una consulta de tags por item"""
+    for item in items:
+        item['tags'] = db.get_tags_by_item(item['id'])
+
+
+def hydrate_bulk(db: DBManager, items: list) -> None:
+    """Patrón nuevo: carga en bloque de todos los tags del resultado"""
+    db.attach_tags(items)
+
+
+def run(n_items: int, tags_per_item: int) -> dict:
+    db = DBManager(":memory:")
+    category_id = populate(db, n_items, tags_per_item)
+    base_rows = db.execute_query(
+        "SELECT * FROM items WHERE category_id = ? ORDER BY created_at", (category_id,)
+    )
+
+    report = {}
+    for name, fn in (("per_item", hydrate_per_item), ("bulk", hydrate_bulk)):
+        items = [dict(row) for row in base_rows]
+        with QueryCounter(db.connect()) as counter:
+            start = time.perf_counter()
+            fn(db, items)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        report[name] = {'queries': counter.count, 'time_ms': round(elapsed_ms, 2)}
+        report[f"{name}_tags"] = {item['id']: item['tags'] for item in items}
+
+    assert report.pop("per_item_tags") == report.pop("bulk_tags"), "Resultados distintos"
+    db.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--tags-per-item", type=int, default=3)
+    args = parser.parse_args()
+
+    report = run(args.items, args.tags_per_item)
+    print(f"Items: {args.items}  Tags/item: {args.tags_per_item}")
+    for name, stats in report.items():
+        print(f"  {name:<9} queries={stats['queries']:>6}  time={stats['time_ms']:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
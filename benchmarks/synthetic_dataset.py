@@ -0,0 +1,244 @@
+"""
+Generador de bases de datos sintéticas para benchmarks
+
+Crea un widget_sidebar.db con el esquema real (DBManager) y datos con forma
+realista: categorías, tags con distribución Zipf (pocos tags muy usados),
+items de varios tipos con use_count de cola larga, favoritos, filas sensibles,
+listas, tablas, proyectos, áreas y procesos relacionados con items.
+
+La generación es determinista (semilla fija): el mismo tamaño produce siempre
+la misma base de datos, así que dos ejecuciones del benchmark son comparables.
+
+Uso:
+    python benchmarks/synthetic_dataset.py --items 10000 --output /tmp/widget_sidebar_10k.db
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+
+VOCABULARY = [
+    'git', 'push', 'pull', 'commit', 'branch', 'merge', 'rebase', 'docker', 'compose',
+    'build', 'deploy', 'kubectl', 'pod', 'service', 'nginx', 'config', 'server', 'ssh',
+    'python', 'pip', 'install', 'venv', 'pytest', 'django', 'flask', 'api', 'token',
+    'database', 'sqlite', 'postgres', 'query', 'backup', 'restore', 'migration', 'index',
+    'react', 'npm', 'node', 'webpack', 'eslint', 'css', 'html', 'component', 'layout',
+    'invoice', 'client', 'meeting', 'report', 'budget', 'email', 'password', 'account',
+    'linux', 'bash', 'grep', 'find', 'chmod', 'cron', 'log', 'monitor', 'alert', 'cache',
+    'aws', 's3', 'lambda', 'bucket', 'azure', 'terraform', 'ansible', 'vault', 'secret',
+]
+
+ITEM_TYPES = [('TEXT', 0.45), ('CODE', 0.25), ('URL', 0.2), ('PATH', 0.1)]
+
+# Proporciones respecto al número de items
+FAVORITE_RATE = 0.05
+SENSITIVE_RATE = 0.03
+LIST_ITEM_RATE = 0.08
+TABLE_ITEM_RATE = 0.05
+PROJECT_ITEM_RATE = 0.15
+AREA_ITEM_RATE = 0.1
+PROCESS_ITEM_RATE = 0.04
+
+
+def _zipf_weights(n: int, s: float = 1.1) -> list:
+    return [1.0 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def _label(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _content(rng: random.Random, item_type: str, label: str) -> str:
+    if item_type == 'URL':
+        return f"https://{rng.choice(VOCABULARY)}.example.com/{label.replace(' ', '/')}"
+    if item_type == 'PATH':
+        return f"C:\\Users\\dev\\{rng.choice(VOCABULARY)}\\{label.replace(' ', '_')}.txt"
+    if item_type == 'CODE':
+        return f"{label} --{rng.choice(VOCABULARY)} {rng.randint(1, 9999)}"
+    return f"{label}. " + ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(5, 25)))
+
+
+def generate(db_path: str, n_items: int, seed: int = 42) -> dict:
+    """
+    Create a synthetic database
+
+    Args:
+        db_path: Output file (overwritten)
+        n_items: Number of items
+        seed: Random seed
+
+    Returns:
+        dict: Row counts per entity
+    """
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    db = DBManager(db_path)
+
+    with db.transaction() as conn:
+        n_categories = max(5, min(60, n_items // 500))
+        conn.executemany(
+            "INSERT INTO categories (name, icon, order_index) VALUES (?, ?, ?)",
+            [(f"{VOCABULARY[i % len(VOCABULARY)].title()} {i}", '📁', i) for i in range(n_categories)]
+        )
+        category_ids = [row[0] for row in conn.execute("SELECT id FROM categories ORDER BY id")]
+
+        n_tags = max(20, min(2000, n_items // 30))
+        tag_names = [f"{VOCABULARY[i % len(VOCABULARY)]}-{i}" for i in range(n_tags)]
+        conn.executemany("INSERT INTO tags (name) VALUES (?)", [(name,) for name in tag_names])
+        tag_ids = dict(conn.execute("SELECT name, id FROM tags"))
+        tag_weights = _zipf_weights(n_tags)
+
+        # Listas y tablas: grupos de items dentro de una categoría
+        n_lists = max(2, int(n_items * LIST_ITEM_RATE) // 10)
+        conn.executemany(
+            "INSERT INTO listas (category_id, name) VALUES (?, ?)",
+            [(rng.choice(category_ids), f"Lista {i}") for i in range(n_lists)]
+        )
+        lists = conn.execute("SELECT id, category_id, name FROM listas").fetchall()
+        n_tables = max(1, int(n_items * TABLE_ITEM_RATE) // 20)
+        conn.executemany(
+            "INSERT INTO tables (name) VALUES (?)", [(f"Tabla {i}",) for i in range(n_tables)]
+        )
+        table_ids = [row[0] for row in conn.execute("SELECT id FROM tables")]
+
+        now = datetime(2025, 6, 1)
+        type_names = [name for name, _ in ITEM_TYPES]
+        type_weights = [weight for _, weight in ITEM_TYPES]
+        rows = []
+        item_tag_names = []
+        table_cells = {}
+        for i in range(n_items):
+            item_type = rng.choices(type_names, type_weights)[0]
+            label = _label(rng, rng.randint(1, 4))
+            is_sensitive = rng.random() < SENSITIVE_RATE
+            # Filas sensibles: contenido opaco con forma de token cifrado (Fernet)
+            content = ('gAAAAAB' + ''.join(rng.choice('abcdefXYZ0123456789') for _ in range(60))
+                       if is_sensitive else _content(rng, item_type, label))
+            tags = sorted(set(rng.choices(tag_names, tag_weights, k=rng.randint(0, 4))))
+            item_tag_names.append(tags)
+            use_count = int(rng.paretovariate(1.2)) - 1
+            created = now - timedelta(days=rng.randint(0, 900), minutes=rng.randint(0, 1440))
+            last_used = (created + timedelta(days=rng.randint(0, 60))).isoformat(' ') if use_count else None
+
+            category_id = rng.choice(category_ids)
+            list_id = list_group = orden_lista = table_id = orden_table = None
+            is_list = 0
+            roll = rng.random()
+            if roll < LIST_ITEM_RATE:
+                list_id, category_id, list_group = rng.choice(lists)
+                is_list, orden_lista = 1, i
+            elif roll < LIST_ITEM_RATE + TABLE_ITEM_RATE:
+                table_id = rng.choice(table_ids)
+                cell = table_cells.get(table_id, 0)
+                table_cells[table_id] = cell + 1
+                orden_table = json.dumps([cell // 5, cell % 5])
+
+            rows.append((
+                category_id, label, content, item_type,
+                f"{label} ({item_type.lower()})" if rng.random() < 0.3 else None,
+                ','.join(tags) or None, int(rng.random() < FAVORITE_RATE), int(is_sensitive),
+                use_count, created.isoformat(' '), created.isoformat(' '), last_used,
+                list_id, is_list, list_group, orden_lista, table_id, orden_table
+            ))
+
+        conn.executemany("""
+            INSERT INTO items (
+                category_id, label, content, type, description, tags,
+                is_favorite, is_sensitive, use_count, created_at, updated_at, last_used,
+                list_id, is_list, list_group, orden_lista, table_id, orden_table
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        item_ids = [row[0] for row in conn.execute("SELECT id FROM items ORDER BY id")]
+
+        conn.executemany(
+            "INSERT INTO item_tags (item_id, tag_id) VALUES (?, ?)",
+            [(item_id, tag_ids[name]) for item_id, names in zip(item_ids, item_tag_names) for name in names]
+        )
+
+        # Proyectos, áreas y procesos con relaciones a una muestra de items
+        def relate(table, relation_sql, count, rate, prefix):
+            conn.executemany(f"INSERT INTO {table} (name) VALUES (?)",
+                             [(f"{prefix} {i}",) for i in range(count)])
+            owner_ids = [row[0] for row in conn.execute(f"SELECT id FROM {table} ORDER BY id")]
+            members = rng.sample(item_ids, int(len(item_ids) * rate))
+            relations = {(rng.choice(owner_ids), item_id) for item_id in members}
+            conn.executemany(relation_sql, [
+                (owner_id, item_id, order) for order, (owner_id, item_id) in enumerate(sorted(relations))
+            ])
+            return len(owner_ids), len(relations)
+
+        n_owners = max(3, n_items // 400)
+        projects = relate(
+            'proyectos',
+            "INSERT INTO project_relations (project_id, entity_type, entity_id, order_index) VALUES (?, 'item', ?, ?)",
+            n_owners, PROJECT_ITEM_RATE, 'Proyecto'
+        )
+        areas = relate(
+            'areas',
+            "INSERT INTO area_relations (area_id, entity_type, entity_id, order_index) VALUES (?, 'item', ?, ?)",
+            max(2, n_owners // 2), AREA_ITEM_RATE, 'Área'
+        )
+        processes = relate(
+            'processes',
+            "INSERT INTO process_items (process_id, item_id, step_order) VALUES (?, ?, ?)",
+            n_owners, PROCESS_ITEM_RATE, 'Proceso'
+        )
+
+        conn.execute("""
+            UPDATE categories SET item_count = (
+                SELECT COUNT(*) FROM items WHERE items.category_id = categories.id
+            )
+        """)
+
+    conn = db.connect()
+    conn.execute("ANALYZE")
+    conn.commit()
+    db.close()
+
+    counts = {
+        'items': n_items,
+        'categories': n_categories,
+        'tags': n_tags,
+        'lists': n_lists,
+        'tables': n_tables,
+        'projects': projects[0], 'project_relations': projects[1],
+        'areas': areas[0], 'area_relations': areas[1],
+        'processes': processes[0], 'process_items': processes[1],
+        'generation_s': round(time.perf_counter() - start, 2)
+    }
+    logger.info(f"Synthetic dataset {db_path}: {counts}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--output", default="widget_sidebar_bench.db")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Algunos módulos configuran el logger raíz al importarse
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    counts = generate(args.output, args.items, args.seed)
+    print(f"{args.output}: " + ', '.join(f"{key}={value}" for key, value in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
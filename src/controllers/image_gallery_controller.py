@@ -9,8 +9,9 @@ Gestiona la lógica de negocio, paginación, filtros y caché de thumbnails.
 import logging
 import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QPixmap
 
 from src.database.db_manager import DBManager
 from src.utils.thumbnail_cache import ThumbnailCache
@@ -37,6 +38,7 @@ class ImageGalleryController(QObject):
     loading_started = pyqtSignal()  # Inicia carga
     loading_finished = pyqtSignal()  # Termina carga
     error_occurred = pyqtSignal(str)  # Error con mensaje
+    thumbnail_ready = pyqtSignal(str, str, QPixmap)  # (image_path, size, pixmap) generado en background
 
     def __init__(self, db_manager: DBManager, main_controller=None):
         """
@@ -53,6 +55,7 @@ class ImageGalleryController(QObject):
 
         # Thumbnail cache
         self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_cache.thumbnail_ready.connect(self._on_thumbnail_ready)
 
         # Estado de paginación
         self.current_page = 1
@@ -60,6 +63,11 @@ class ImageGalleryController(QObject):
         self.total_items = 0
         self.total_pages = 0
 
+        # Cursores keyset por página: página -> (created_at, id) del último
+        # item de la página anterior. Válidos solo para la misma consulta.
+        self._page_cursors: Dict[int, Tuple[str, int]] = {}
+        self._cursor_query_key = None
+
         # Estado de filtros
         self.active_filters = {
             'category_id': None,
@@ -189,33 +197,53 @@ class ImageGalleryController(QObject):
             # Calcular offset
             offset = (page - 1) * self.items_per_page
 
-            # Preparar parámetros de query
-            query_params = {
-                'limit': self.items_per_page,
-                'offset': offset
-            }
-
-            # Aplicar filtros si está habilitado
+            # Filtros de la consulta (sin paginación)
+            count_params = {}
             if apply_filters:
                 for key, value in self.active_filters.items():
                     if value is not None:
-                        query_params[key] = value
+                        count_params[key] = value
+
+            # Los cursores solo sirven para la misma consulta y tamaño de página
+            query_key = (
+                tuple(sorted((k, tuple(v) if isinstance(v, list) else v)
+                             for k, v in count_params.items())),
+                self.items_per_page
+            )
+            query_changed = query_key != self._cursor_query_key
+            if query_changed:
+                self._page_cursors.clear()
+                self._cursor_query_key = query_key
+
+            # Preparar parámetros de query
+            query_params = dict(count_params, limit=self.items_per_page, offset=offset)
+            cursor = self._page_cursors.get(page)
+            if cursor is not None:
+                query_params['cursor'] = cursor
 
             # Obtener imágenes desde BD
-            logger.debug(f"Loading images: page={page}, offset={offset}, filters={apply_filters}")
+            logger.debug(f"Loading images: page={page}, offset={offset}, "
+                         f"cursor={cursor}, filters={apply_filters}")
             images = self.db.get_image_items(**query_params)
 
+            # Cursor de la página siguiente (antes de resolver rutas)
+            if images:
+                self._page_cursors[page + 1] = (images[-1]['created_at'], images[-1]['id'])
+
             # Resolver rutas relativas a absolutas
             images = self._resolve_images_paths(images)
 
-            # Actualizar contador total
-            count_params = {k: v for k, v in query_params.items() if k not in ['limit', 'offset']}
-            self.total_items = self.db.get_image_count(**count_params)
-            self.total_pages = max(1, (self.total_items + self.items_per_page - 1) // self.items_per_page)
+            # Actualizar contador total (solo al empezar una consulta nueva)
+            if query_changed or page == 1:
+                self.total_items = self.db.get_image_count(**count_params)
+                self.total_pages = max(1, (self.total_items + self.items_per_page - 1) // self.items_per_page)
 
             # Guardar imágenes actuales
             self.current_images = images
 
+            # Anticipar los thumbnails de la página siguiente en background
+            self.prefetch_next_page()
+
             logger.info(f"Loaded {len(images)} images (page {page}/{self.total_pages})")
 
             # Emitir señales
@@ -388,37 +416,69 @@ class ImageGalleryController(QObject):
         """
         return self.apply_filters(min_size=min_size, max_size=max_size)
 
+    def _size_tuple(self, size: str) -> Tuple[int, int]:
+        """Mapear nombre de tamaño ('small', 'medium', 'large') a tupla"""
+        size_map = {
+            'small': self.thumbnail_cache.SIZE_SMALL,
+            'medium': self.thumbnail_cache.SIZE_MEDIUM,
+            'large': self.thumbnail_cache.SIZE_LARGE
+        }
+        return size_map.get(size, self.thumbnail_cache.SIZE_MEDIUM)
+
+    def _size_name(self, size_tuple: Tuple[int, int]) -> str:
+        """Mapear tupla de tamaño a nombre"""
+        if size_tuple == self.thumbnail_cache.SIZE_SMALL:
+            return 'small'
+        if size_tuple == self.thumbnail_cache.SIZE_LARGE:
+            return 'large'
+        return 'medium'
+
     def get_thumbnail(self, image_path: str, size: str = 'medium'):
         """
-        Obtener thumbnail de imagen
+        Obtener thumbnail de imagen (síncrono)
 
         Args:
-            image_path: Ruta a imagen original
+            image_path: Ruta a la imagen
             size: Tamaño ('small', 'medium', 'large')
 
         Returns:
             QPixmap con thumbnail o None
         """
         try:
-            # Mapear string a tupla de tamaño
-            size_map = {
-                'small': self.thumbnail_cache.SIZE_SMALL,
-                'medium': self.thumbnail_cache.SIZE_MEDIUM,
-                'large': self.thumbnail_cache.SIZE_LARGE
-            }
-
-            size_tuple = size_map.get(size, self.thumbnail_cache.SIZE_MEDIUM)
-
             # Obtener desde caché
-            return self.thumbnail_cache.get_thumbnail(image_path, size_tuple)
+            return self.thumbnail_cache.get_thumbnail(image_path, self._size_tuple(size))
 
         except Exception as e:
             logger.error(f"Error getting thumbnail for {image_path}: {e}")
             return None
 
+    def request_thumbnail(self, image_path: str, size: str = 'medium'):
+        """
+        Obtener thumbnail sin bloquear la GUI
+
+        Args:
+            image_path: Ruta a la imagen
+            size: Tamaño ('small', 'medium', 'large')
+
+        Returns:
+            QPixmap si ya estaba en memoria; si no, None y se emitirá
+            thumbnail_ready cuando esté generado
+        """
+        try:
+            return self.thumbnail_cache.request_thumbnail(
+                image_path, self._size_tuple(size), self.thumbnail_cache.PRIORITY_VISIBLE
+            )
+        except Exception as e:
+            logger.error(f"Error requesting thumbnail for {image_path}: {e}")
+            return None
+
+    def _on_thumbnail_ready(self, image_path: str, size_tuple, pixmap: QPixmap):
+        """Reenviar thumbnails generados en background a la vista"""
+        self.thumbnail_ready.emit(image_path, self._size_name(size_tuple), pixmap)
+
     def preload_thumbnails(self, images: Optional[List[Dict]] = None, size: str = 'medium'):
         """
-        Pre-cargar thumbnails en background
+        Pre-cargar thumbnails en background (prioridad baja, no bloquea)
 
         Args:
             images: Lista de imágenes (usa current_images si None)
@@ -434,22 +494,41 @@ class ImageGalleryController(QObject):
             if not image_paths:
                 return
 
-            # Mapear tamaño
-            size_map = {
-                'small': self.thumbnail_cache.SIZE_SMALL,
-                'medium': self.thumbnail_cache.SIZE_MEDIUM,
-                'large': self.thumbnail_cache.SIZE_LARGE
-            }
-            size_tuple = size_map.get(size, self.thumbnail_cache.SIZE_MEDIUM)
-
             # Pre-cargar
             logger.info(f"Preloading {len(image_paths)} thumbnails ({size})...")
-            self.thumbnail_cache.preload_thumbnails(image_paths, size_tuple)
-            logger.info("Thumbnails preloaded")
+            self.thumbnail_cache.preload_thumbnails(
+                image_paths, self._size_tuple(size), self.thumbnail_cache.PRIORITY_PREFETCH
+            )
 
         except Exception as e:
             logger.error(f"Error preloading thumbnails: {e}")
 
+    def prefetch_next_page(self, size: str = 'medium'):
+        """
+        Encolar los thumbnails de la página siguiente con prioridad de prefetch
+
+        Usa el cursor keyset ya calculado, así que la consulta es barata.
+        """
+        if self.current_page >= self.total_pages:
+            return
+
+        cursor = self._page_cursors.get(self.current_page + 1)
+        if cursor is None:
+            return
+
+        try:
+            params = dict(self._cursor_query_key[0]) if self._cursor_query_key else {}
+            if isinstance(params.get('tags'), tuple):
+                params['tags'] = list(params['tags'])
+
+            next_images = self.db.get_image_items(
+                **params, limit=self.items_per_page, cursor=cursor
+            )
+            self.preload_thumbnails(self._resolve_images_paths(next_images), size)
+
+        except Exception as e:
+            logger.error(f"Error prefetching next page: {e}")
+
     def get_categories_with_images(self) -> List[Dict]:
         """
         Obtener categorías que contienen imágenes
@@ -4,6 +4,7 @@ Main Controller
 import sys
 from pathlib import Path
 from typing import List, Optional
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
@@ -25,6 +26,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class DataChangeDispatcher(QObject):
+    """Delivers DataChangeBus events posted by background threads on the GUI thread"""
+
+    events_pending = pyqtSignal()
+
+    def __init__(self, bus, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        # Queued: el slot corre en el hilo de este objeto (GUI) aunque se emita desde otro hilo
+        self.events_pending.connect(self.dispatch, Qt.ConnectionType.QueuedConnection)
+
+    def dispatch(self):
+        self.bus.dispatch_pending()
+
+
 class MainController:
     """Main application controller - coordinates all app logic"""
 
@@ -39,6 +55,7 @@ class MainController:
         self.workarea_manager = WorkareaManager()
         self.component_manager = ComponentManager(self.config_manager.db)
         self.project_manager = ProjectManager(self.config_manager.db)
+        self.start_background_services()
 
         # Initialize controllers
         self.clipboard_controller = ClipboardController(self.clipboard_manager)
@@ -72,6 +89,23 @@ class MainController:
         # Setup hotkeys
         self.setup_hotkeys()
 
+    def start_background_services(self) -> None:
+        """Start the usage event writer and the usage score refresh thread"""
+        # Mismos módulos (src.core...) que los UsageTracker y los motores de búsqueda:
+        # los registros de writers y managers son por módulo
+        from src.core.cache_invalidation import get_data_change_bus
+        from src.core.usage_tracker import get_usage_writer
+        from src.core.search.usage_scores import get_usage_score_manager
+
+        # Antes del writer: sus eventos (post) se entregan en el hilo de la GUI
+        bus = get_data_change_bus()
+        self.data_change_dispatcher = DataChangeDispatcher(bus)
+        bus.set_dispatch_hook(self.data_change_dispatcher.events_pending.emit)
+
+        db = self.config_manager.db
+        get_usage_writer(db.db_path)
+        get_usage_score_manager(db).start()
+
     def load_data(self) -> None:
         """Load configuration and categories"""
         print("Loading configuration...")
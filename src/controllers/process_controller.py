@@ -104,13 +104,15 @@ class ProcessController(QObject):
 
     def execute_process(self, process_id: int) -> bool:
         """
-        Execute a process
+        Start executing a process (non-blocking)
+
+        The result is reported by the executor's execution_completed signal.
 
         Args:
             process_id: Process ID
 
         Returns:
-            Success status
+            True if execution started
         """
         # Get process
         process = self.process_manager.get_process(process_id)
@@ -121,6 +123,33 @@ class ProcessController(QObject):
         # Execute
         return self.process_executor.execute_process(process)
 
+    def execute_processes(self, process_ids: List[int], on_complete=None,
+                          concurrent: bool = True, on_failure=None) -> bool:
+        """
+        Start executing several processes (non-blocking)
+
+        Args:
+            process_ids: Process IDs
+            on_complete: Callback(process, success, index, total) after each process
+            concurrent: Run them at the same time instead of one after another
+            on_failure: Callback(process) -> bool after a failure in sequential
+                mode; False stops the batch
+
+        Returns:
+            True if the batch started
+        """
+        processes = []
+        for process_id in process_ids:
+            process = self.process_manager.get_process(process_id)
+            if process:
+                processes.append(process)
+            else:
+                logger.error(f"Process {process_id} not found")
+
+        return self.process_executor.execute_multiple_processes(
+            processes, on_complete=on_complete, concurrent=concurrent, on_failure=on_failure
+        )
+
     def get_executor(self) -> ProcessExecutor:
         """Get process executor instance"""
         return self.process_executor
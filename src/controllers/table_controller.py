@@ -3,6 +3,7 @@ Table Controller
 Gestiona la lógica de negocio de tablas de items
 """
 
+import csv
 import sys
 import logging
 from pathlib import Path
@@ -12,6 +13,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from database.db_manager import DBManager
 from core.table_validator import TableValidator
+from core.table_exporter import TableExporter
 
 logger = logging.getLogger(__name__)
 
@@ -285,25 +287,17 @@ class TableController(QObject):
                     'error': error_msg
                 }
 
-            # Actualizar celdas una por una
-            updates_count = 0
-            errors = []
+            # Actualizar solo las celdas modificadas (una transacción)
+            sanitized_data = [
+                [self.sanitize_cell_content(cell_value) for cell_value in row_data]
+                for row_data in table_data
+            ]
+            result = self.db.update_table_cells(table_name, sanitized_data)
 
-            for row_idx, row_data in enumerate(table_data):
-                for col_idx, cell_value in enumerate(row_data):
-                    sanitized_value = self.sanitize_cell_content(cell_value)
-
-                    success = self.db.update_table_cell(
-                        table_name=table_name,
-                        row=row_idx,
-                        col=col_idx,
-                        new_content=sanitized_value
-                    )
-
-                    if success:
-                        updates_count += 1
-                    else:
-                        errors.append(f"Error updating cell [{row_idx}, {col_idx}]")
+            updates_count = result['updated']
+            errors = [f"Error updating cell [{row_idx}, {col_idx}]" for row_idx, col_idx in result['missing']]
+            if not result['success']:
+                errors.append(result.get('error', f"Error updating table '{table_name}'"))
 
             # Obtener category_id de la tabla
             category_id = existing_items[0].get('category_id') if existing_items else None
@@ -312,10 +306,10 @@ class TableController(QObject):
             if category_id:
                 self.table_updated.emit(table_name, category_id)
 
-            logger.info(f"Table '{table_name}' updated: {updates_count} cells")
+            logger.info(f"Table '{table_name}' updated: {updates_count} changed cells")
 
             return {
-                'success': updates_count > 0,
+                'success': result['success'] and (updates_count > 0 or not errors),
                 'table_name': table_name,
                 'updates_count': updates_count,
                 'errors': errors
@@ -330,6 +324,101 @@ class TableController(QObject):
                 'error': str(e)
             }
 
+    # ========== IMPORTACIÓN / EXPORTACIÓN ==========
+
+    def import_table_from_csv(self, category_id: int, table_name: str, csv_path: str,
+                              delimiter: str = ',', has_headers: bool = True,
+                              tags: List[str] = None, sensitive_columns: List[int] = None,
+                              url_columns: List[int] = None) -> Dict[str, Any]:
+        """
+        Crea una tabla desde un archivo CSV/TSV leyéndolo en streaming
+
+        Las filas se sanitizan y se pasan a add_table_items a medida que se
+        leen (inserción por lotes), sin cargar el archivo en memoria.
+
+        Args:
+            category_id: ID de categoría destino
+            table_name: Nombre de la tabla
+            csv_path: Ruta del archivo
+            delimiter: Delimitador (',' para CSV, '\\t' para TSV)
+            has_headers: Si la primera fila contiene los nombres de columnas
+            tags: Tags opcionales
+            sensitive_columns: Índices de columnas sensibles (opcional)
+            url_columns: Índices de columnas tipo URL (opcional)
+
+        Returns:
+            Dict con 'success', 'items_created', 'table_name', 'errors'
+        """
+        try:
+            logger.info(f"[TableController] Importing table '{table_name}' from {csv_path}")
+
+            is_valid_name, error_msg = self.validate_table_name(table_name)
+            if not is_valid_name:
+                logger.error(f"Invalid table name: {error_msg}")
+                self.error_occurred.emit(error_msg)
+                return {
+                    'success': False,
+                    'items_created': 0,
+                    'table_name': table_name,
+                    'errors': [error_msg]
+                }
+
+            with open(csv_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f, delimiter=delimiter)
+                column_names = next(reader, []) if has_headers else []
+                rows = (
+                    [self.sanitize_cell_content(cell_value) for cell_value in row_data]
+                    for row_data in reader
+                )
+                result = self.db.add_table_items(
+                    category_id=category_id,
+                    table_name=table_name,
+                    table_data=rows,
+                    column_names=column_names,
+                    tags=tags,
+                    sensitive_columns=sensitive_columns,
+                    url_columns=url_columns
+                )
+
+            if result['success']:
+                logger.info(f"Table '{table_name}' imported: {result['items_created']} items")
+                self.table_created.emit(table_name, result['items_created'], category_id)
+            else:
+                error_msg = '; '.join(result['errors'][:3]) or "El archivo no contiene datos"
+                logger.error(f"Failed to import table: {error_msg}")
+                self.error_occurred.emit(error_msg)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error importing table: {e}", exc_info=True)
+            self.error_occurred.emit(f"Error al importar tabla: {str(e)}")
+            return {
+                'success': False,
+                'items_created': 0,
+                'table_name': table_name,
+                'errors': [str(e)]
+            }
+
+    def export_table(self, table_name: str, output_path: str, format: str = 'csv',
+                     **options) -> bool:
+        """
+        Exporta una tabla leyendo sus filas de la base de datos por bloques
+
+        Args:
+            table_name: Nombre de la tabla
+            output_path: Ruta del archivo de salida
+            format: 'csv', 'tsv', 'json', 'json_records' o 'jsonl'
+            **options: include_headers, include_metadata, pretty, decrypt, chunk_size
+
+        Returns:
+            bool: True si exportación exitosa
+        """
+        success = TableExporter.export_table_from_db(self.db, table_name, output_path, format, **options)
+        if not success:
+            self.error_occurred.emit(f"Error al exportar tabla '{table_name}'")
+        return success
+
     def delete_table(self, table_name: str) -> Dict[str, Any]:
         """
         Elimina todos los items de una tabla
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from src.core.export_utils import (
+    JSONStreamWriter, ProgressCallback, atomic_write, existing_relation_keys,
+    iter_relation_records, run_export_pool
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,99 +43,9 @@ class AreaExportManager:
                 logger.error(f"Proyecto {area_id} no encontrado")
                 return None
 
-            # Construir estructura de exportación
-            export_data = {
-                'version': '1.0',
-                'export_date': datetime.now().isoformat(),
-                'Area': {
-                    'name': area['name'],
-                    'description': area.get('description', ''),
-                    'color': area.get('color', '#9b59b6'),
-                    'icon': area.get('icon', '📁'),
-                },
-                'relations': [],
-                'components': []
-            }
-
-            # Obtener relaciones con contenido completo
+            # Relaciones con los datos de cada elemento (una consulta por tipo)
             relations = self.db.get_area_relations(area_id)
-            for relation in relations:
-                relation_data = {
-                    'entity_type': relation['entity_type'],
-                    'entity_id': relation['entity_id'],
-                    'description': relation.get('description', ''),
-                    'order_index': relation.get('order_index', 0),
-                }
-
-                # Agregar metadata del elemento
-                try:
-                    if relation['entity_type'] == 'tag':
-                        tag = self.db.get_tag_by_id(relation['entity_id'])
-                        if tag:
-                            relation_data['entity_data'] = {'name': tag.get('name', '')}
-
-                    elif relation['entity_type'] == 'item':
-                        # Buscar item en todas las categorías
-                        item = None
-                        for cat in self.db.get_categories():
-                            items = self.db.get_items_by_category(cat['id'])
-                            for i in items:
-                                if i.get('id') == relation['entity_id']:
-                                    item = i
-                                    break
-                            if item:
-                                break
-
-                        if item:
-                            relation_data['entity_data'] = {
-                                'label': item.get('label', ''),
-                                'content': item.get('content', ''),
-                                'item_type': item.get('item_type', 'TEXT'),
-                            }
-
-                    elif relation['entity_type'] == 'category':
-                        category = self.db.get_category_by_id(relation['entity_id'])
-                        if category:
-                            relation_data['entity_data'] = {
-                                'name': category.get('name', ''),
-                                'icon': category.get('icon', '📂'),
-                            }
-
-                    elif relation['entity_type'] == 'list':
-                        lista = self.db.get_lista(relation['entity_id'])
-                        if lista:
-                            relation_data['entity_data'] = {
-                                'name': lista.get('name', ''),
-                            }
-
-                    elif relation['entity_type'] == 'table':
-                        table = self.db.get_table(relation['entity_id'])
-                        if table:
-                            relation_data['entity_data'] = {
-                                'name': table.get('name', ''),
-                            }
-
-                    elif relation['entity_type'] == 'process':
-                        process = self.db.get_process(relation['entity_id'])
-                        if process:
-                            relation_data['entity_data'] = {
-                                'name': process.get('name', ''),
-                            }
-
-                except Exception as e:
-                    logger.warning(f"Error obteniendo datos de {relation['entity_type']}#{relation['entity_id']}: {e}")
-                    relation_data['entity_data'] = None
-
-                export_data['relations'].append(relation_data)
-
-            # Obtener componentes
             components = self.db.get_area_components(area_id)
-            for component in components:
-                export_data['components'].append({
-                    'component_type': component['component_type'],
-                    'content': component.get('content', ''),
-                    'order_index': component.get('order_index', 0),
-                })
 
             # Generar nombre de archivo si no se provee
             if not file_path:
@@ -139,9 +54,26 @@ class AreaExportManager:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 file_path = f"proyecto_{safe_name}_{timestamp}.json"
 
-            # Escribir archivo
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Escribir archivo en streaming (sin construir el documento completo);
+            # el destino solo se reemplaza si la exportación termina
+            with atomic_write(file_path) as f, JSONStreamWriter(f) as writer:
+                writer.write_field('version', '1.0')
+                writer.write_field('export_date', datetime.now().isoformat())
+                writer.write_field('Area', {
+                    'name': area['name'],
+                    'description': area.get('description', ''),
+                    'color': area.get('color', '#9b59b6'),
+                    'icon': area.get('icon', '📁'),
+                })
+                writer.write_list('relations', iter_relation_records(self.db, relations))
+                writer.write_list('components', (
+                    {
+                        'component_type': component['component_type'],
+                        'content': component.get('content', ''),
+                        'order_index': component.get('order_index', 0),
+                    }
+                    for component in components
+                ))
 
             logger.info(f"Proyecto exportado a: {file_path}")
             return file_path
@@ -208,14 +140,14 @@ class AreaExportManager:
             # Importar relaciones
             imported_relations = 0
             if 'relations' in import_data:
+                # Verificar existencia de todos los elementos en lote
+                existing = existing_relation_keys(self.db, import_data['relations'])
                 for relation in import_data['relations']:
                     # Solo importar si el elemento existe
                     entity_type = relation['entity_type']
                     entity_id = relation['entity_id']
 
-                    # Verificar existencia del elemento
-                    exists = self._entity_exists(entity_type, entity_id)
-                    if not exists:
+                    if (entity_type, entity_id) not in existing:
                         logger.warning(f"Saltando {entity_type}#{entity_id} - no existe en BD")
                         continue
 
@@ -258,36 +190,22 @@ class AreaExportManager:
     def _entity_exists(self, entity_type: str, entity_id: int) -> bool:
         """Verifica si una entidad existe en la base de datos"""
         try:
-            if entity_type == 'tag':
-                return self.db.get_tag_by_id(entity_id) is not None
-
-            elif entity_type == 'item':
-                # Buscar item en todas las categorías
-                for cat in self.db.get_categories():
-                    items = self.db.get_items_by_category(cat['id'])
-                    for i in items:
-                        if i.get('id') == entity_id:
-                            return True
-                return False
-
-            elif entity_type == 'category':
-                return self.db.get_category_by_id(entity_id) is not None
-            elif entity_type == 'list':
-                return self.db.get_lista(entity_id) is not None
-            elif entity_type == 'table':
-                return self.db.get_table(entity_id) is not None
-            elif entity_type == 'process':
-                return self.db.get_process(entity_id) is not None
-            return False
-        except:
+            return entity_id in self.db.get_existing_entity_ids(entity_type, [entity_id])
+        except Exception:
             return False
 
-    def export_all_areas(self, output_dir: str = "exports") -> List[str]:
+    def export_all_areas(self, output_dir: str = "exports", max_workers: int = 4,
+                         progress_callback: Optional[ProgressCallback] = None) -> List[str]:
         """
         Exporta todos los areas activos a archivos JSON individuales
 
+        Los areas se exportan en paralelo (un hilo por exportación, cada uno con
+        su propia conexión del pool).
+
         Args:
             output_dir: Directorio donde guardar los archivos
+            max_workers: Número máximo de exportaciones simultáneas
+            progress_callback: Llamado con (completados, total, nombre) tras cada exportación
 
         Returns:
             Lista de rutas de archivos creados
@@ -299,15 +217,13 @@ class AreaExportManager:
             # Obtener todos los areas activos
             areas = self.db.get_all_areas(active_only=True)
 
-            exported_files = []
-            for area in areas:
+            def export_one(area):
                 safe_name = "".join(c for c in area['name'] if c.isalnum() or c in (' ', '-', '_')).strip()
                 safe_name = safe_name.replace(' ', '_')
                 file_path = Path(output_dir) / f"{safe_name}_{area['id']}.json"
+                return self.export_area(area['id'], str(file_path))
 
-                result = self.export_area(area['id'], str(file_path))
-                if result:
-                    exported_files.append(result)
+            exported_files = run_export_pool(self.db, areas, export_one, max_workers, progress_callback)
 
             logger.info(f"Exportados {len(exported_files)} areas a {output_dir}")
             return exported_files
@@ -0,0 +1,290 @@
+"""
+Cache Invalidation
+Write-through invalidation bus for in-memory caches
+
+DBManager publishes a DataChangeEvent after every mutation (items, tags,
+categories...). Caches subscribe to the tables they depend on and evict only
+the affected keys instead of being flushed by hand. Hit/miss/evict counters
+of every cache are reported to a single CacheMetrics registry.
+"""
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Tablas publicadas por DBManager
+TABLE_ITEMS = 'items'
+TABLE_ITEM_TAGS = 'item_tags'
+TABLE_TAGS = 'tags'
+TABLE_CATEGORIES = 'categories'
+TABLE_CATEGORY_TAGS = 'category_tags'
+TABLE_PROCESS_ITEMS = 'process_items'  # ids = process IDs whose steps changed
+TABLE_PROJECTS = 'proyectos'
+TABLE_PROJECT_RELATIONS = 'project_relations'  # ids = project IDs (empty = unknown)
+TABLE_AREAS = 'areas'
+TABLE_AREA_RELATIONS = 'area_relations'  # ids = area IDs (empty = unknown)
+# Tags de elementos, sus asociaciones y los órdenes por tag / filtrados
+TABLE_PROJECT_ELEMENT_TAGS = 'project_element_tags'  # ids = project IDs (empty = unknown)
+TABLE_AREA_ELEMENT_TAGS = 'area_element_tags'  # ids = area IDs (empty = unknown)
+TABLE_PROCESSES = 'processes'
+TABLE_LISTAS = 'listas'
+TABLE_TABLES = 'tables'
+
+# Tablas de las que dependen los árboles categoría -> items (config/dashboard)
+CATALOG_TABLES = (
+    TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS,
+    TABLE_CATEGORIES, TABLE_CATEGORY_TAGS, TABLE_PROCESS_ITEMS
+)
+
+# Acciones
+ACTION_INSERT = 'insert'
+ACTION_UPDATE = 'update'
+ACTION_DELETE = 'delete'
+
+
+@dataclass(frozen=True)
+class DataChangeEvent:
+    """Table-level change notification published after a committed write"""
+    table: str
+    action: str
+    ids: Tuple[int, ...] = ()
+    category_ids: Tuple[int, ...] = ()
+
+    @property
+    def is_item_change(self) -> bool:
+        """True for changes to items or their tag relations"""
+        return self.table in (TABLE_ITEMS, TABLE_ITEM_TAGS)
+
+    @property
+    def is_category_change(self) -> bool:
+        """True for changes to categories or category tags"""
+        return self.table in (TABLE_CATEGORIES, TABLE_CATEGORY_TAGS)
+
+
+@dataclass
+class _Subscription:
+    ref: Callable[[], Optional[Callable[[DataChangeEvent], None]]]
+    tables: Optional[frozenset] = None
+
+
+class DataChangeBus:
+    """
+    Process-wide publish/subscribe bus for database change events
+
+    Bound methods are held through weak references, so subscribing a cache
+    does not keep its owner (e.g. a dashboard window) alive.
+
+    Subscribers are not thread-safe: background threads must use post(),
+    which queues the event until dispatch_pending() runs on the GUI thread.
+    """
+
+    def __init__(self):
+        """Initialize an empty bus"""
+        self._subscriptions: List[_Subscription] = []
+        self._pending: List[DataChangeEvent] = []
+        self._dispatch_hook: Optional[Callable[[], None]] = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[DataChangeEvent], None],
+                  tables: Optional[Iterable[str]] = None) -> None:
+        """
+        Subscribe a callback to change events
+
+        Args:
+            callback: Called with each DataChangeEvent
+            tables: Only deliver events for these tables (None = all)
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda cb=callback: cb
+        subscription = _Subscription(ref, frozenset(tables) if tables else None)
+
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+    def unsubscribe(self, callback: Callable[[DataChangeEvent], None]) -> None:
+        """
+        Remove a previously subscribed callback
+
+        Args:
+            callback: Callback passed to subscribe()
+        """
+        with self._lock:
+            self._subscriptions = [
+                sub for sub in self._subscriptions
+                if sub.ref() is not None and sub.ref() != callback
+            ]
+
+    def publish(self, event: DataChangeEvent) -> None:
+        """
+        Deliver an event to every matching subscriber
+
+        Args:
+            event: Change event
+        """
+        with self._lock:
+            # Drop subscriptions whose owner has been garbage collected
+            self._subscriptions = [sub for sub in self._subscriptions if sub.ref() is not None]
+            targets = [
+                sub.ref() for sub in self._subscriptions
+                if sub.tables is None or event.table in sub.tables
+            ]
+
+        for callback in targets:
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Error in change subscriber {callback}: {e}")
+
+    def set_dispatch_hook(self, hook: Optional[Callable[[], None]]) -> None:
+        """
+        Set the callable that post() uses to wake up the GUI thread
+
+        The hook is called on the posting thread and must only schedule
+        dispatch_pending() on the GUI thread (e.g. emit a queued Qt signal).
+
+        Args:
+            hook: Scheduling callable (None = events wait for dispatch_pending())
+        """
+        with self._lock:
+            self._dispatch_hook = hook
+
+    def post(self, event: DataChangeEvent) -> None:
+        """
+        Queue an event published from a background thread
+
+        Args:
+            event: Change event, delivered by the next dispatch_pending()
+        """
+        with self._lock:
+            self._pending.append(event)
+            hook = self._dispatch_hook
+
+        if hook is not None:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"Error scheduling change dispatch: {e}")
+
+    def dispatch_pending(self) -> int:
+        """
+        Deliver the events queued by post() (call on the GUI thread)
+
+        Returns:
+            int: Number of events delivered
+        """
+        with self._lock:
+            events, self._pending = self._pending, []
+
+        for event in events:
+            self.publish(event)
+        return len(events)
+
+
+@dataclass
+class CacheCounters:
+    """Hit/miss/evict counters for one named cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits / total * 100) if total > 0 else 0
+        }
+
+
+@dataclass
+class CacheMetrics:
+    """Single instrumentation surface for cache statistics"""
+    _counters: Dict[str, CacheCounters] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _get(self, cache_name: str) -> CacheCounters:
+        counters = self._counters.get(cache_name)
+        if counters is None:
+            counters = self._counters[cache_name] = CacheCounters()
+        return counters
+
+    def record_hit(self, cache_name: str) -> None:
+        with self._lock:
+            self._get(cache_name).hits += 1
+
+    def record_miss(self, cache_name: str) -> None:
+        with self._lock:
+            self._get(cache_name).misses += 1
+
+    def record_eviction(self, cache_name: str, count: int = 1) -> None:
+        if count <= 0:
+            return
+        with self._lock:
+            self._get(cache_name).evictions += count
+
+    def get_stats(self, cache_name: Optional[str] = None) -> Dict:
+        """
+        Get counters for one cache or for all of them
+
+        Args:
+            cache_name: Cache name (None = all caches)
+
+        Returns:
+            Dict with hits, misses, evictions and hit_rate (keyed by cache name if all)
+        """
+        with self._lock:
+            if cache_name is not None:
+                return self._get(cache_name).to_dict()
+            return {name: counters.to_dict() for name, counters in self._counters.items()}
+
+    def reset(self, cache_name: Optional[str] = None) -> None:
+        """Reset counters for one cache or for all of them"""
+        with self._lock:
+            if cache_name is None:
+                self._counters.clear()
+            else:
+                self._counters.pop(cache_name, None)
+
+
+# === SINGLETON PATTERN ===
+# Single bus and metrics registry for the entire application
+
+_data_change_bus_instance = None
+_cache_metrics_instance = None
+
+
+def get_data_change_bus() -> DataChangeBus:
+    """
+    Get singleton instance of DataChangeBus
+
+    Example:
+        from src.core.cache_invalidation import get_data_change_bus, TABLE_ITEMS
+
+        get_data_change_bus().subscribe(self._on_data_changed, tables=[TABLE_ITEMS])
+    """
+    global _data_change_bus_instance
+
+    if _data_change_bus_instance is None:
+        _data_change_bus_instance = DataChangeBus()
+        logger.info("Global DataChangeBus instance created")
+
+    return _data_change_bus_instance
+
+
+def get_cache_metrics() -> CacheMetrics:
+    """Get singleton instance of CacheMetrics"""
+    global _cache_metrics_instance
+
+    if _cache_metrics_instance is None:
+        _cache_metrics_instance = CacheMetrics()
+
+    return _cache_metrics_instance
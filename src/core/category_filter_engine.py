@@ -11,11 +11,11 @@ Filtros soportados:
 - Ordenamiento: alfabético, popularidad, fecha, accesos, anclado
 """
 
-import sqlite3
 import logging
 import hashlib
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -24,6 +24,11 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.category import Category
+from src.database.connection_pool import get_connection_pool
+from src.core.cache_invalidation import (
+    get_data_change_bus, get_cache_metrics, DataChangeEvent,
+    TABLE_CATEGORIES, ACTION_INSERT, ACTION_DELETE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +51,12 @@ class CategoryFilterEngine:
     - Soporte para múltiples filtros combinados
     - Estadísticas de resultados
     - Optimización con índices
+    - Caché LRU invalidado por eventos de escritura en categories
     """
 
+    # Nombre del caché en CacheMetrics
+    CACHE_NAME = 'category_filter'
+
     def __init__(self, db_path: str, cache_enabled: bool = True, cache_max_size: int = 100):
         """
         Inicializar el motor de filtrado
@@ -65,10 +74,15 @@ class CategoryFilterEngine:
         # Sistema de caché
         self.cache_enabled = cache_enabled
         self.cache_max_size = cache_max_size
-        self._result_cache: Dict[str, List[Category]] = {}
+        self._result_cache: "OrderedDict[str, List[Category]]" = OrderedDict()
+        # Por entrada: (ids de categorías del resultado, si la query tiene WHERE)
+        self._cache_entry_meta: Dict[str, Tuple[FrozenSet[int], bool]] = {}
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Invalidación write-through: solo los filtros leen la tabla categories
+        get_data_change_bus().subscribe(self._on_data_changed, tables=[TABLE_CATEGORIES])
+
     def apply_filters(self, filters: Dict[str, Any]) -> List[Category]:
         """
         Aplicar filtros a las categorías
@@ -101,6 +115,8 @@ class CategoryFilterEngine:
 
             if filter_hash in self._result_cache:
                 self._cache_hits += 1
+                get_cache_metrics().record_hit(self.CACHE_NAME)
+                self._result_cache.move_to_end(filter_hash)
                 cached_result = self._result_cache[filter_hash]
 
                 # Calcular estadísticas (más rápido desde caché)
@@ -126,6 +142,7 @@ class CategoryFilterEngine:
 
             else:
                 self._cache_misses += 1
+                get_cache_metrics().record_miss(self.CACHE_NAME)
                 logger.debug(f"Cache MISS: Executing query "
                             f"(hits: {self._cache_hits}, misses: {self._cache_misses})")
 
@@ -136,8 +153,7 @@ class CategoryFilterEngine:
             self.last_params = params
 
             # Ejecutar query
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = get_connection_pool(self.db_path).get_connection()
             cursor = conn.cursor()
 
             logger.debug(f"Executing query: {query}")
@@ -176,8 +192,6 @@ class CategoryFilterEngine:
             cursor.execute("SELECT COUNT(*) as total FROM categories")
             total_count = cursor.fetchone()['total']
 
-            conn.close()
-
             # Calcular estadísticas
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
@@ -196,7 +210,7 @@ class CategoryFilterEngine:
 
             # Guardar en caché
             if self.cache_enabled and filter_hash:
-                self._add_to_cache(filter_hash, categories)
+                self._add_to_cache(filter_hash, categories, restricted='WHERE' in query)
 
             return categories
 
@@ -386,7 +400,7 @@ class CategoryFilterEngine:
             Lista de colores (hex) únicos
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = get_connection_pool(self.db_path).get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -397,8 +411,6 @@ class CategoryFilterEngine:
             """)
 
             colors = [row[0] for row in cursor.fetchall()]
-            conn.close()
-
             return colors
 
         except Exception as e:
@@ -413,7 +425,7 @@ class CategoryFilterEngine:
             Diccionario con fechas mínimas y máximas
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = get_connection_pool(self.db_path).get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -428,8 +440,6 @@ class CategoryFilterEngine:
             """)
 
             row = cursor.fetchone()
-            conn.close()
-
             return {
                 'min_created': row[0],
                 'max_created': row[1],
@@ -451,7 +461,7 @@ class CategoryFilterEngine:
             Diccionario con estadísticas min/max/avg
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = get_connection_pool(self.db_path).get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -469,8 +479,6 @@ class CategoryFilterEngine:
             """)
 
             row = cursor.fetchone()
-            conn.close()
-
             return {
                 'min_items': int(row[0] or 0),
                 'max_items': int(row[1] or 0),
@@ -489,7 +497,9 @@ class CategoryFilterEngine:
 
     def clear_cache(self):
         """Limpiar caché de resultados"""
+        get_cache_metrics().record_eviction(self.CACHE_NAME, len(self._result_cache))
         self._result_cache.clear()
+        self._cache_entry_meta.clear()
         self._cache_hits = 0
         self._cache_misses = 0
         self.last_query = None
@@ -533,25 +543,66 @@ class CategoryFilterEngine:
         hash_obj = hashlib.md5(filter_json.encode('utf-8'))
         return hash_obj.hexdigest()
 
-    def _add_to_cache(self, filter_hash: str, categories: List[Category]) -> None:
+    def _add_to_cache(self, filter_hash: str, categories: List[Category],
+                      restricted: bool = True) -> None:
         """
         Agregar resultado al caché
 
         Args:
             filter_hash: Hash del filtro
             categories: Lista de categorías a cachear
+            restricted: Si la query filtra filas (WHERE); si no, el resultado
+                contiene todas las categorías
         """
-        # Si el caché está lleno, eliminar entrada más antigua (FIFO)
+        # Si el caché está lleno, eliminar entrada menos usada (LRU)
         if len(self._result_cache) >= self.cache_max_size:
-            # Obtener primera clave (más antigua)
-            oldest_key = next(iter(self._result_cache))
-            del self._result_cache[oldest_key]
-            logger.debug(f"Cache full, removed oldest entry: {oldest_key[:8]}...")
+            oldest_key, _ = self._result_cache.popitem(last=False)
+            self._cache_entry_meta.pop(oldest_key, None)
+            get_cache_metrics().record_eviction(self.CACHE_NAME)
+            logger.debug(f"Cache full, removed least recently used entry: {oldest_key[:8]}...")
 
         # Agregar al caché
         self._result_cache[filter_hash] = categories
+        self._cache_entry_meta[filter_hash] = (
+            frozenset(int(category.id) for category in categories),
+            restricted
+        )
         logger.debug(f"Added to cache: {filter_hash[:8]}... ({len(categories)} categories)")
 
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """
+        Evict cached results affected by a write to categories
+
+        - delete: entries that contained the deleted categories
+        - insert: every entry (the new category may match any filter)
+        - update: entries that contained the category, plus filtered entries
+          the category may now match
+
+        Args:
+            event: Change event published by DBManager
+        """
+        if not self._result_cache:
+            return
+
+        changed_ids = set(event.ids)
+        if event.action == ACTION_INSERT or not changed_ids:
+            stale = list(self._result_cache.keys())
+        else:
+            stale = [
+                key for key, (category_ids, restricted) in self._cache_entry_meta.items()
+                if category_ids & changed_ids
+                or (event.action != ACTION_DELETE and restricted)
+            ]
+
+        for key in stale:
+            self._result_cache.pop(key, None)
+            self._cache_entry_meta.pop(key, None)
+
+        if stale:
+            get_cache_metrics().record_eviction(self.CACHE_NAME, len(stale))
+            logger.debug(f"Cache invalidated by {event.table}/{event.action}: "
+                         f"{len(stale)} entries evicted")
+
 
 # Función de utilidad para crear filtros predefinidos
 def create_preset_filters() -> Dict[str, Dict[str, Any]]:
@@ -3,9 +3,11 @@ Config Manager - SQLite Version
 Manages application configuration using SQLite database
 """
 import json
+import logging
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 
 # Add models to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -13,11 +15,19 @@ from models.category import Category
 from models.item import Item, ItemType
 from database.db_manager import DBManager
 from core.encryption_manager import EncryptionManager
+from src.core.cache_invalidation import (
+    get_data_change_bus, get_cache_metrics, DataChangeEvent, CATALOG_TABLES
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ConfigManager:
     """Manages application configuration using SQLite"""
 
+    # Cache name in CacheMetrics
+    CACHE_NAME = 'config_categories'
+
     def __init__(self, db_path: Optional[str] = None, base_dir: Optional[Path] = None):
         """
         Initialize ConfigManager with SQLite database
@@ -51,6 +61,12 @@ class ConfigManager:
 
         # Cache for categories
         self._categories_cache: Optional[List[Category]] = None
+        # Categories whose items changed since the cache was built
+        self._dirty_category_ids: Set[int] = set()
+        get_data_change_bus().subscribe(self._on_data_changed, tables=CATALOG_TABLES)
+
+        # Timings (ms) per phase of the last get_categories() load
+        self.last_load_timings: Dict[str, float] = {}
 
     def load_config(self) -> Dict[str, Any]:
         """
@@ -90,28 +106,89 @@ class ConfigManager:
         """
         # Return cached categories if available
         if self._categories_cache is not None:
+            if self._dirty_category_ids:
+                self._refresh_dirty_categories()
+            get_cache_metrics().record_hit(self.CACHE_NAME)
             return self._categories_cache
 
-        # Load from database
+        get_cache_metrics().record_miss(self.CACHE_NAME)
+
+        # Load from database: active categories + all their items in bulk
+        start = time.perf_counter()
         categories_data = self.db.get_categories(include_inactive=False)
-        categories = []
+        t_categories = time.perf_counter()
+
+        # Sensitive content stays encrypted until Item.content is read
+        items_by_category = self.db.get_items_by_categories(
+            [cat_data['id'] for cat_data in categories_data],
+            decrypt=False
+        )
+        t_items = time.perf_counter()
 
+        # Group in memory into Category/Item objects
+        categories = []
         for cat_data in categories_data:
-            # Convert database dict to Category object
             category = self._dict_to_category(cat_data)
-
-            # Load items for this category
-            items_data = self.db.get_items_by_category(cat_data['id'])
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
-                category.add_item(item)
-
+            for item_data in items_by_category.get(cat_data['id'], []):
+                category.add_item(self._dict_to_item(item_data))
             categories.append(category)
+        t_build = time.perf_counter()
+
+        self.last_load_timings = {
+            'categories_ms': (t_categories - start) * 1000,
+            'items_ms': (t_items - t_categories) * 1000,
+            'build_ms': (t_build - t_items) * 1000,
+            'total_ms': (t_build - start) * 1000,
+        }
+        timings = self.last_load_timings
+        total_items = sum(len(items) for items in items_by_category.values())
+        logger.info(
+            f"Categories loaded: {len(categories)} categories, {total_items} items "
+            f"(categories {timings['categories_ms']:.1f}ms, items {timings['items_ms']:.1f}ms, "
+            f"build {timings['build_ms']:.1f}ms, total {timings['total_ms']:.1f}ms)"
+        )
 
         # Cache results
         self._categories_cache = categories
+        self._dirty_category_ids.clear()
         return categories
 
+    def _refresh_dirty_categories(self) -> None:
+        """Reload only the items of cached categories changed by database writes"""
+        dirty_ids = list(self._dirty_category_ids)
+        self._dirty_category_ids.clear()
+
+        items_by_category = self.db.get_items_by_categories(dirty_ids, decrypt=False)
+        for category in self._categories_cache:
+            if category.id.isdigit() and int(category.id) in items_by_category:
+                category.items = [
+                    self._dict_to_item(item_data)
+                    for item_data in items_by_category[int(category.id)]
+                ]
+
+        logger.debug(f"Categories cache refreshed for categories: {dirty_ids}")
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """
+        Evict the parts of the categories cache affected by a database write
+
+        Item writes only mark their categories for reload; category and tag
+        writes invalidate the whole cache.
+
+        Args:
+            event: Change event published by DBManager
+        """
+        if self._categories_cache is None:
+            return
+
+        if event.is_item_change and event.category_ids:
+            self._dirty_category_ids.update(event.category_ids)
+            get_cache_metrics().record_eviction(self.CACHE_NAME, len(event.category_ids))
+        else:
+            self._categories_cache = None
+            self._dirty_category_ids.clear()
+            get_cache_metrics().record_eviction(self.CACHE_NAME)
+
     def get_category(self, category_id) -> Optional[Category]:
         """
         Get a specific category by ID
@@ -144,8 +221,8 @@ class ConfigManager:
 
             category = self._dict_to_category(cat_data)
 
-            # Load items
-            items_data = self.db.get_items_by_category(cat_id)
+            # Load items (sensitive content decrypted lazily by Item.content)
+            items_data = self.db.get_items_by_category(cat_id, decrypt=False)
             for item_data in items_data:
                 item = self._dict_to_item(item_data)
                 category.add_item(item)
@@ -3,15 +3,22 @@ Dashboard Manager
 Manages business logic for the Structure Dashboard
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 import logging
 
+from src.core.cache_invalidation import (
+    get_data_change_bus, get_cache_metrics, DataChangeEvent, CATALOG_TABLES
+)
+
 logger = logging.getLogger(__name__)
 
 
 class DashboardManager:
     """Manager for dashboard data loading and processing"""
 
+    # Nombre del caché en CacheMetrics
+    CACHE_NAME = 'dashboard_structure'
+
     def __init__(self, db_manager):
         """
         Initialize the dashboard manager
@@ -22,6 +29,9 @@ class DashboardManager:
         self.db = db_manager
         self._structure_cache = None
         self._statistics_cache = None
+        # Categories whose items changed since the structure was cached
+        self._dirty_category_ids: Set[int] = set()
+        get_data_change_bus().subscribe(self._on_data_changed, tables=CATALOG_TABLES)
         logger.info("DashboardManager initialized")
 
     def get_full_structure(self, force_refresh: bool = False) -> Dict:
@@ -59,21 +69,25 @@ class DashboardManager:
         """
         # Return cached if available and no force refresh
         if self._structure_cache and not force_refresh:
+            if self._dirty_category_ids:
+                self._refresh_dirty_categories()
+            get_cache_metrics().record_hit(self.CACHE_NAME)
             logger.debug("Returning cached structure")
             return self._structure_cache
 
+        get_cache_metrics().record_miss(self.CACHE_NAME)
         logger.info("Loading full structure from database...")
 
         try:
-            # Get all categories
+            # Get all categories and their items in bulk
             categories = self.db.get_categories()
+            items_by_category = self.db.get_items_by_categories(
+                [category['id'] for category in categories]
+            )
 
             structure = {'categories': []}
 
             for category in categories:
-                # Get items for this category
-                items = self.db.get_items_by_category(category['id'])
-
                 category_data = {
                     'id': category['id'],
                     'name': category['name'],
@@ -81,33 +95,14 @@ class DashboardManager:
                     'tags': self._parse_tags(category.get('tags', '')),
                     'is_predefined': category.get('is_predefined', False),
                     'is_active': category.get('is_active', 1),  # Agregar campo is_active
-                    'items': []
+                    'items': self._build_items_data(items_by_category.get(category['id'], []))
                 }
 
-                # Process each item
-                for item in items:
-                    item_data = {
-                        'id': item['id'],
-                        'label': item['label'],
-                        'content': item['content'],
-                        'type': item['type'],
-                        'tags': self._parse_tags(item.get('tags', '')),
-                        'is_favorite': bool(item.get('is_favorite', 0)),
-                        'is_sensitive': bool(item.get('is_sensitive', 0)),
-                        'description': item.get('description', ''),
-                        'is_list': bool(item.get('is_list', 0)),
-                        'list_group': item.get('list_group', None),
-                        'is_active': item.get('is_active', 1),  # Agregar campo is_active
-                        'is_archived': bool(item.get('is_archived', 0)),  # Agregar campo is_archived
-                        'use_count': item.get('use_count', 0),  # Agregar campo use_count para filtro "Más Usados"
-                        'last_used': item.get('last_used', None)  # Agregar campo last_used para filtro "Recientes"
-                    }
-                    category_data['items'].append(item_data)
-
                 structure['categories'].append(category_data)
 
             # Cache the structure
             self._structure_cache = structure
+            self._dirty_category_ids.clear()
 
             logger.info(f"Loaded structure: {len(structure['categories'])} categories, "
                        f"{sum(len(c['items']) for c in structure['categories'])} total items")
@@ -118,6 +113,71 @@ class DashboardManager:
             logger.error(f"Error loading full structure: {e}", exc_info=True)
             return {'categories': []}
 
+    def _build_items_data(self, items: List[Dict]) -> List[Dict]:
+        """
+        Convert item rows into the dashboard item structure
+
+        Args:
+            items: Item dictionaries from DBManager
+
+        Returns:
+            List[Dict]: Dashboard item dictionaries
+        """
+        return [
+            {
+                'id': item['id'],
+                'label': item['label'],
+                'content': item['content'],
+                'type': item['type'],
+                'tags': self._parse_tags(item.get('tags', '')),
+                'is_favorite': bool(item.get('is_favorite', 0)),
+                'is_sensitive': bool(item.get('is_sensitive', 0)),
+                'description': item.get('description', ''),
+                'is_list': bool(item.get('is_list', 0)),
+                'list_group': item.get('list_group', None),
+                'is_active': item.get('is_active', 1),  # Agregar campo is_active
+                'is_archived': bool(item.get('is_archived', 0)),  # Agregar campo is_archived
+                'use_count': item.get('use_count', 0),  # Agregar campo use_count para filtro "Más Usados"
+                'last_used': item.get('last_used', None)  # Agregar campo last_used para filtro "Recientes"
+            }
+            for item in items
+        ]
+
+    def _refresh_dirty_categories(self):
+        """Reload only the items of categories changed since the structure was cached"""
+        dirty_ids = list(self._dirty_category_ids)
+        self._dirty_category_ids.clear()
+
+        items_by_category = self.db.get_items_by_categories(dirty_ids)
+        for category_data in self._structure_cache['categories']:
+            if category_data['id'] in items_by_category:
+                category_data['items'] = self._build_items_data(items_by_category[category_data['id']])
+
+        logger.debug(f"Dashboard structure refreshed for categories: {dirty_ids}")
+
+    def _on_data_changed(self, event: DataChangeEvent):
+        """
+        Evict the parts of the cached structure affected by a database write
+
+        Item writes only mark their categories for reload; category and tag
+        writes invalidate the whole structure.
+
+        Args:
+            event: Change event published by DBManager
+        """
+        if self._structure_cache is None and self._statistics_cache is None:
+            return
+
+        self._statistics_cache = None
+
+        if event.is_item_change and event.category_ids:
+            self._dirty_category_ids.update(event.category_ids)
+            get_cache_metrics().record_eviction(self.CACHE_NAME, len(event.category_ids))
+        elif self._structure_cache is not None:
+            self._structure_cache = None
+            self._dirty_category_ids.clear()
+            get_cache_metrics().record_eviction(self.CACHE_NAME)
+
     def calculate_statistics(self, structure: Dict = None) -> Dict:
         """
         Calculate statistics from the structure
@@ -310,6 +370,7 @@ class DashboardManager:
         """Invalidate all caches to force data reload"""
         self._structure_cache = None
         self._statistics_cache = None
+        self._dirty_category_ids.clear()
         logger.info("Dashboard caches invalidated")
 
     def refresh_data(self) -> Dict:
@@ -0,0 +1,501 @@
+"""
+Element View Assembler
+Árbol de la vista completa de un proyecto / área (tags -> grupos -> items)
+
+Loads relations, element-tag associations, tag orders, filtered orders and
+every referenced item in a fixed number of bulk queries (one per table and
+entity type, whatever the size of the project) and builds the tree in memory.
+Assembled views are cached per project/area and evicted through the
+DataChangeBus: relation or element-tag writes drop only their owner, item /
+catalog writes drop every view. Cached views keep sensitive content
+encrypted; it is decrypted on every read.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.cache_invalidation import (
+    get_data_change_bus, get_cache_metrics, DataChangeEvent,
+    TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS, TABLE_CATEGORIES, TABLE_LISTAS,
+    TABLE_TABLES, TABLE_PROCESSES, TABLE_PROJECTS, TABLE_PROJECT_RELATIONS,
+    TABLE_PROJECT_ELEMENT_TAGS, TABLE_AREAS, TABLE_AREA_RELATIONS, TABLE_AREA_ELEMENT_TAGS
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Tablas cuyo contenido aparece en cualquier vista: invalidan todo
+_CONTENT_TABLES = (
+    TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS, TABLE_CATEGORIES,
+    TABLE_LISTAS, TABLE_TABLES, TABLE_PROCESSES
+)
+
+# Orden de tag por defecto (tags sin orden definido van al final)
+_NO_ORDER = 999999
+
+_ITEM_COLUMNS = "i.id, i.label, i.content, i.type, i.description, i.is_sensitive"
+
+# Items de cada tipo de relación: (SQL con {ids}, orden dentro del grupo)
+_GROUP_ITEM_QUERIES = {
+    'category': f"""
+        SELECT i.category_id AS group_id, {_ITEM_COLUMNS}
+        FROM items i WHERE i.category_id IN ({{ids}})
+        ORDER BY i.category_id, i.created_at
+    """,
+    'list': f"""
+        SELECT i.list_id AS group_id, {_ITEM_COLUMNS}
+        FROM items i WHERE i.list_id IN ({{ids}})
+        ORDER BY i.list_id, i.orden_lista ASC
+    """,
+    'tag': f"""
+        SELECT it.tag_id AS group_id, {_ITEM_COLUMNS}
+        FROM items i
+        JOIN item_tags it ON i.id = it.item_id
+        JOIN categories c ON i.category_id = c.id
+        WHERE it.tag_id IN ({{ids}})
+        ORDER BY it.tag_id, i.last_used DESC
+    """,
+    'table': f"""
+        SELECT i.table_id AS group_id, {_ITEM_COLUMNS}
+        FROM items i WHERE i.table_id IN ({{ids}})
+        ORDER BY i.table_id, i.table_row ASC, i.table_col ASC, i.created_at ASC
+    """,
+    'item': f"""
+        SELECT i.id AS group_id, {_ITEM_COLUMNS}
+        FROM items i WHERE i.id IN ({{ids}})
+    """,
+}
+
+# Nombre por defecto de un grupo cuyo elemento no existe
+_FALLBACK_NAMES = {
+    'category': 'Categoría {}',
+    'list': 'Lista {}',
+    'tag': 'Tag {}',
+    'table': 'Tabla {}',
+    'item': 'Item {}',
+    'process': 'Proceso {}',
+}
+
+
+@dataclass(frozen=True)
+class _ViewSpec:
+    """Tablas y claves de resultado de un tipo de contenedor (proyecto / área)"""
+    kind: str
+    owner_table: str
+    owner_column: str
+    relations_table: str
+    associations_table: str
+    association_column: str
+    tags_table: str
+    tag_orders_table: str
+    filtered_order_table: str
+    published_tables: tuple
+    default_name: str
+    default_icon: str
+
+
+PROJECT_VIEW = _ViewSpec(
+    kind='project', owner_table='proyectos', owner_column='project_id',
+    relations_table='project_relations',
+    associations_table='project_element_tag_associations',
+    association_column='project_relation_id',
+    tags_table='project_element_tags', tag_orders_table='project_tag_orders',
+    filtered_order_table='project_filtered_order',
+    published_tables=(TABLE_PROJECTS, TABLE_PROJECT_RELATIONS, TABLE_PROJECT_ELEMENT_TAGS),
+    default_name='Proyecto sin nombre', default_icon='📁'
+)
+
+AREA_VIEW = _ViewSpec(
+    kind='area', owner_table='areas', owner_column='area_id',
+    relations_table='area_relations',
+    associations_table='area_element_tag_associations',
+    association_column='area_relation_id',
+    tags_table='area_element_tags', tag_orders_table='area_tag_orders',
+    filtered_order_table='area_filtered_order',
+    published_tables=(TABLE_AREAS, TABLE_AREA_RELATIONS, TABLE_AREA_ELEMENT_TAGS),
+    default_name='Área sin nombre', default_icon='🏢'
+)
+
+
+class ElementViewAssembler:
+    """
+    Builds and caches full views of projects or areas
+
+    Usage:
+        assembler = get_element_view_assembler(db_manager, 'project')
+        data = assembler.get_view(project_id)
+        # {'project_id', 'project_name', 'project_icon', 'tags',
+        #  'unclassified_elements', 'ungrouped_items'}
+
+    Returned views share unchanged parts with the cache and must be treated
+    as read-only.
+    """
+
+    def __init__(self, db_manager, spec: _ViewSpec):
+        """
+        Initialize Element View Assembler
+
+        Args:
+            db_manager: Database manager instance
+            spec: PROJECT_VIEW or AREA_VIEW
+        """
+        self.db = db_manager
+        self.spec = spec
+        self.cache_name = f"{spec.kind}_views"
+
+        self._views: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._metrics = get_cache_metrics()
+
+        get_data_change_bus().subscribe(
+            self._on_data_changed,
+            tables=list(_CONTENT_TABLES) + list(spec.published_tables)
+        )
+
+    # ==================== CACHE ====================
+
+    def get_view(self, owner_id: int) -> Optional[Dict]:
+        """
+        Full view of a project/area (cached)
+
+        Args:
+            owner_id: Project or area ID
+
+        Returns:
+            Dict with the view, or None if the project/area does not exist
+        """
+        with self._lock:
+            view = self._views.get(owner_id)
+        if view is not None:
+            self._metrics.record_hit(self.cache_name)
+            return self._decrypt_view(view)
+
+        self._metrics.record_miss(self.cache_name)
+        generation = self.db.data_generation
+        view = self._assemble_view(owner_id)
+        if view is None:
+            return None
+        # Un write durante la construcción deja la vista sin cachear
+        if self.db.data_generation == generation:
+            with self._lock:
+                self._views[owner_id] = view
+        return self._decrypt_view(view)
+
+    def invalidate(self, owner_ids: Iterable[int] = ()) -> None:
+        """Drop cached views (all of them if owner_ids is empty)"""
+        with self._lock:
+            if owner_ids:
+                dropped = sum(1 for owner_id in owner_ids if self._views.pop(owner_id, None) is not None)
+            else:
+                dropped = len(self._views)
+                self._views.clear()
+        self._metrics.record_eviction(self.cache_name, dropped)
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Evict the owners named by relation/tag events; anything else drops every view"""
+        if event.table in self.spec.published_tables and event.ids:
+            self.invalidate(event.ids)
+        else:
+            self.invalidate()
+
+    # ==================== BULK LOADING ====================
+
+    def _load_relations(self, conn, owner_id: int) -> List[Dict]:
+        cursor = conn.execute(f"""
+            SELECT * FROM {self.spec.relations_table}
+            WHERE {self.spec.owner_column} = ?
+            ORDER BY order_index ASC
+        """, (owner_id,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _load_tag_associations(self, conn, owner_id: int) -> List[Dict]:
+        """Element tags of every relation with the owner's tag order"""
+        spec = self.spec
+        cursor = conn.execute(f"""
+            SELECT ta.{spec.association_column} AS relation_id,
+                   t.id, t.name, t.color,
+                   COALESCE(o.order_index, {_NO_ORDER}) AS tag_order
+            FROM {spec.associations_table} ta
+            JOIN {spec.tags_table} t ON ta.tag_id = t.id
+            JOIN {spec.relations_table} r ON ta.{spec.association_column} = r.id
+            LEFT JOIN {spec.tag_orders_table} o
+                ON o.{spec.owner_column} = r.{spec.owner_column} AND o.tag_id = t.id
+            WHERE r.{spec.owner_column} = ?
+        """, (owner_id,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _load_filtered_orders(self, conn, owner_id: int) -> Dict[int, Dict[int, int]]:
+        """filter_tag_id -> {relation_id: order_index}"""
+        orders: Dict[int, Dict[int, int]] = defaultdict(dict)
+        try:
+            cursor = conn.execute(f"""
+                SELECT filter_tag_id, element_id, order_index
+                FROM {self.spec.filtered_order_table}
+                WHERE {self.spec.owner_column} = ? AND element_type = 'relation'
+            """, (owner_id,))
+            for tag_id, relation_id, order_index in cursor.fetchall():
+                orders[tag_id][relation_id] = order_index
+        except Exception as e:
+            logger.error(f"Error getting {self.spec.kind} filtered orders: {e}")
+        return orders
+
+    def _load_group_items(self, conn, relations: List[Dict]) -> Dict[str, Dict[int, List[Dict]]]:
+        """entity_type -> entity_id -> formatted items (one query per type and batch)"""
+        ids_by_type: Dict[str, List[int]] = defaultdict(list)
+        for rel in relations:
+            if rel['entity_type'] in _GROUP_ITEM_QUERIES:
+                ids_by_type[rel['entity_type']].append(rel['entity_id'])
+
+        batch_size = self.db._TAG_BATCH_SIZE
+        grouped: Dict[str, Dict[int, List[Dict]]] = {}
+        for entity_type, ids in ids_by_type.items():
+            ids = list(dict.fromkeys(ids))
+            groups: Dict[int, List[Dict]] = defaultdict(list)
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start:start + batch_size]
+                sql = _GROUP_ITEM_QUERIES[entity_type].format(ids=','.join('?' * len(batch)))
+                for row in conn.execute(sql, batch).fetchall():
+                    item = {
+                        'id': row['id'],
+                        'label': row['label'],
+                        'content': row['content'],
+                        'type': row['type'],
+                        'description': row['description'],
+                        'is_sensitive': row['is_sensitive']
+                    }
+                    groups[row['group_id']].append(item)
+            grouped[entity_type] = groups
+        return grouped
+
+    def _load_names(self, relations: List[Dict]) -> Dict[str, Dict[int, Dict]]:
+        """entity_type -> entity_id -> row with name (one query per type)"""
+        ids_by_type: Dict[str, List[int]] = defaultdict(list)
+        for rel in relations:
+            if rel['entity_type'] in ('category', 'list', 'tag', 'table', 'process'):
+                ids_by_type[rel['entity_type']].append(rel['entity_id'])
+        return {
+            entity_type: self.db.get_entities_by_ids(entity_type, ids)
+            for entity_type, ids in ids_by_type.items()
+        }
+
+    # ==================== DECRYPTION ====================
+
+    @staticmethod
+    def _decrypt_view(view: Dict) -> Dict:
+        """
+        Copy of a view with the content of sensitive items decrypted
+
+        The cached view keeps the ciphertext, so locking the app
+        (purge_decrypted_cache) leaves no plaintext behind.
+        """
+        decrypted: Dict[int, Dict] = {}
+        encryption_manager = None
+
+        def item_for_read(item: Dict) -> Dict:
+            nonlocal encryption_manager
+            if not (item['is_sensitive'] and item['content']):
+                return item
+            # El mismo item puede aparecer en varios grupos: se descifra una vez
+            copy = decrypted.get(id(item))
+            if copy is None:
+                if encryption_manager is None:
+                    from src.core.encryption_manager import get_encryption_manager
+                    encryption_manager = get_encryption_manager()
+                copy = dict(item)
+                try:
+                    copy['content'] = encryption_manager.decrypt_cached(item['content'])
+                except Exception as e:
+                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                    copy['content'] = "[DECRYPTION ERROR]"
+                decrypted[id(item)] = copy
+            return copy
+
+        def group_for_read(group: Dict) -> Dict:
+            return {**group, 'items': [item_for_read(item) for item in group['items']]}
+
+        result = dict(view)
+        result['tags'] = [
+            {**tag, 'groups': [group_for_read(group) for group in tag['groups']]}
+            for tag in view['tags']
+        ]
+        result['unclassified_elements'] = [group_for_read(group) for group in view['unclassified_elements']]
+        result['ungrouped_items'] = [item_for_read(item) for item in view['ungrouped_items']]
+        return result
+
+    # ==================== ASSEMBLY ====================
+
+    @staticmethod
+    def _apply_filtered_order(relations: List[Dict], filtered: Dict[int, int]) -> List[Dict]:
+        """Relations with a filtered order first (by that order), then the rest by global order"""
+        ordered = sorted((rel for rel in relations if rel['id'] in filtered),
+                         key=lambda rel: filtered[rel['id']])
+        unordered = sorted((rel for rel in relations if rel['id'] not in filtered),
+                           key=lambda rel: rel.get('order_index', 0))
+        return ordered + unordered
+
+    def _element(self, rel: Dict, items: Dict[str, Dict[int, List[Dict]]],
+                 names: Dict[str, Dict[int, Dict]], keep_missing_process: bool = False) -> Optional[Dict]:
+        """
+        Group of one relation
+
+        Args:
+            keep_missing_process: Return a group for a deleted process
+                (the "Sin clasificar" section lists it under its ID)
+
+        Returns:
+            Dict with type, name and items; None if the element is missing
+            or empty (processes never have items)
+        """
+        entity_type = rel['entity_type']
+        entity_id = rel['entity_id']
+        fallback = _FALLBACK_NAMES.get(entity_type, '{}').format(entity_id)
+
+        if entity_type == 'process':
+            process = names.get('process', {}).get(entity_id)
+            if process is None and not keep_missing_process:
+                return None
+            return {
+                'type': 'process',
+                'name': (process.get('name') or 'Proceso sin nombre') if process else fallback,
+                'items': []
+            }
+
+        group_items = items.get(entity_type, {}).get(entity_id)
+        if not group_items:
+            return None
+
+        if entity_type == 'item':
+            name = group_items[0]['label']
+        else:
+            entity = names.get(entity_type, {}).get(entity_id)
+            name = entity.get('name') if entity else None
+            if not name:
+                name = 'Lista sin nombre' if entity_type == 'list' and entity else fallback
+        return {'type': entity_type, 'name': name, 'items': list(group_items)}
+
+    def build_view(self, owner_id: int) -> Optional[Dict]:
+        """
+        Assemble a view from the database (uncached)
+
+        Args:
+            owner_id: Project or area ID
+
+        Returns:
+            Dict with the view, or None if the project/area does not exist
+        """
+        view = self._assemble_view(owner_id)
+        return self._decrypt_view(view) if view is not None else None
+
+    def _assemble_view(self, owner_id: int) -> Optional[Dict]:
+        """Assemble a view with the content of sensitive items still encrypted"""
+        spec = self.spec
+        conn = self.db.connect()
+
+        owner = conn.execute(
+            f"SELECT * FROM {spec.owner_table} WHERE id = ?", (owner_id,)
+        ).fetchone()
+        if owner is None:
+            return None
+        owner = dict(owner)
+
+        relations = self._load_relations(conn, owner_id)
+        associations = self._load_tag_associations(conn, owner_id)
+        filtered_orders = self._load_filtered_orders(conn, owner_id)
+        items = self._load_group_items(conn, relations)
+        names = self._load_names(relations)
+
+        # Tags ordenados por el orden del usuario y luego por nombre
+        tags: Dict[int, Dict] = {}
+        tagged_relation_ids: Dict[int, set] = defaultdict(set)
+        for assoc in associations:
+            tags.setdefault(assoc['id'], assoc)
+            tagged_relation_ids[assoc['id']].add(assoc['relation_id'])
+        ordered_tags = sorted(tags.values(), key=lambda tag: (tag['tag_order'], tag['name']))
+
+        tags_data = []
+        for tag in ordered_tags:
+            tag_relations = [rel for rel in relations if rel['id'] in tagged_relation_ids[tag['id']]]
+            tag_relations = self._apply_filtered_order(tag_relations, filtered_orders.get(tag['id'], {}))
+
+            groups = []
+            for rel in tag_relations:
+                element = self._element(rel, items, names)
+                if element is not None:
+                    groups.append(element)
+
+            if groups:
+                tags_data.append({
+                    'tag_name': tag['name'],
+                    'tag_color': tag.get('color') or '#808080',
+                    'groups': groups
+                })
+
+        # Elementos sin tag de elemento ("Sin clasificar"), en orden de creación
+        associated = {assoc['relation_id'] for assoc in associations}
+        unclassified = []
+        for rel in sorted(relations, key=lambda rel: rel['id']):
+            if rel['id'] in associated:
+                continue
+            element = self._element(rel, items, names, keep_missing_process=True)
+            if element is not None:
+                unclassified.append(element)
+
+        # Items de categorías y listas del contenedor que no aparecen bajo ningún tag
+        grouped_ids = {item['id'] for tag in tags_data for group in tag['groups'] for item in group['items']}
+        ungrouped = []
+        seen = set()
+        for entity_type in ('category', 'list'):
+            for rel in relations:
+                if rel['entity_type'] != entity_type:
+                    continue
+                for item in items.get(entity_type, {}).get(rel['entity_id'], []):
+                    if item['id'] not in grouped_ids and item['id'] not in seen:
+                        seen.add(item['id'])
+                        ungrouped.append(item)
+
+        return {
+            f'{spec.kind}_id': owner_id,
+            f'{spec.kind}_name': owner.get('name') or spec.default_name,
+            f'{spec.kind}_icon': owner.get('icon') or spec.default_icon,
+            'tags': tags_data,
+            'unclassified_elements': unclassified,
+            'ungrouped_items': ungrouped
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cached views and hit/miss counters"""
+        with self._lock:
+            stats = {'views': len(self._views)}
+        stats.update(self._metrics.get_stats(self.cache_name))
+        return stats
+
+
+# === SINGLETON PATTERN ===
+# One assembler per database file and container kind
+
+_SPECS = {'project': PROJECT_VIEW, 'area': AREA_VIEW}
+_instances: Dict[tuple, ElementViewAssembler] = {}
+_instances_lock = threading.Lock()
+
+
+def get_element_view_assembler(db_manager, kind: str) -> ElementViewAssembler:
+    """
+    Get the shared ElementViewAssembler for a database
+
+    Args:
+        db_manager: Database manager instance
+        kind: 'project' or 'area'
+
+    Returns:
+        ElementViewAssembler: Assembler shared by every full view panel
+    """
+    key = (str(db_manager.db_path), kind)
+    with _instances_lock:
+        assembler = _instances.get(key)
+        if assembler is None:
+            assembler = _instances[key] = ElementViewAssembler(db_manager, _SPECS[kind])
+            logger.info(f"ElementViewAssembler ({kind}) created for {key[0]}")
+    return assembler
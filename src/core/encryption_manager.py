@@ -5,6 +5,8 @@ Maneja el cifrado y descifrado de datos sensibles usando AES-256 (Fernet)
 
 import os
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 from cryptography.fernet import Fernet, InvalidToken
@@ -19,6 +21,9 @@ class EncryptionManager:
     Utiliza Fernet (AES-256) para cifrar/descifrar contraseñas
     """
 
+    # Máximo de valores descifrados que se mantienen en memoria (LRU)
+    DECRYPT_CACHE_SIZE = 256
+
     def __init__(self, env_file: str = ".env"):
         """
         Initialize encryption manager
@@ -28,6 +33,8 @@ class EncryptionManager:
         """
         self.env_file = Path(env_file)
         self.cipher_suite: Optional[Fernet] = None
+        self._decrypted_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._initialize()
 
     def _initialize(self):
@@ -180,3 +187,87 @@ class EncryptionManager:
             return test_data == decrypted
         except Exception:
             return False
+
+    def decrypt_cached(self, encrypted_text: str) -> str:
+        """
+        Decrypt text using an in-memory LRU of recently decrypted values
+
+        Args:
+            encrypted_text: Encrypted text (base64-encoded)
+
+        Returns:
+            str: Decrypted plaintext
+        """
+        if not encrypted_text:
+            return ""
+
+        with self._cache_lock:
+            plaintext = self._decrypted_cache.get(encrypted_text)
+            if plaintext is not None:
+                self._decrypted_cache.move_to_end(encrypted_text)
+                return plaintext
+
+        plaintext = self.decrypt(encrypted_text)
+
+        with self._cache_lock:
+            self._decrypted_cache[encrypted_text] = plaintext
+            self._decrypted_cache.move_to_end(encrypted_text)
+            while len(self._decrypted_cache) > self.DECRYPT_CACHE_SIZE:
+                self._decrypted_cache.popitem(last=False)
+
+        return plaintext
+
+    def purge_decrypted_cache(self):
+        """
+        Drop every decrypted value kept in memory
+
+        Called on master password cache invalidation (lock) and logout.
+        """
+        with self._cache_lock:
+            purged = len(self._decrypted_cache)
+            self._decrypted_cache.clear()
+
+        if purged:
+            logger.info(f"Decrypted value cache purged ({purged} entries)")
+
+
+# === SINGLETON PATTERN ===
+# Single cipher instance for the entire application (avoids reloading .env
+# and rebuilding the Fernet cipher on every database read)
+
+_encryption_manager_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_encryption_manager() -> EncryptionManager:
+    """
+    Get singleton instance of EncryptionManager
+
+    Returns:
+        Global EncryptionManager instance
+
+    Example:
+        from src.core.encryption_manager import get_encryption_manager
+
+        plaintext = get_encryption_manager().decrypt(item['content'])
+    """
+    global _encryption_manager_instance
+
+    if _encryption_manager_instance is None:
+        with _instance_lock:
+            if _encryption_manager_instance is None:
+                _encryption_manager_instance = EncryptionManager()
+                logger.info("Global EncryptionManager instance created")
+
+    return _encryption_manager_instance
+
+
+def purge_decrypted_cache():
+    """
+    Purge decrypted values held by the global instance
+
+    Convenience function for lock/logout paths. Does nothing if the global
+    instance was never created.
+    """
+    if _encryption_manager_instance is not None:
+        _encryption_manager_instance.purge_decrypted_cache()
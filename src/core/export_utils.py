@@ -0,0 +1,239 @@
+"""
+Export Utils - Piezas compartidas por los exportadores JSON
+
+- JSONStreamWriter: escribe un objeto JSON campo a campo; las listas se
+  escriben elemento a elemento sin construir el documento completo en memoria
+- atomic_write: escribe en "<ruta>.tmp" y lo renombra al final, así un error
+  a mitad de exportación no deja un archivo truncado en el destino
+- iter_relation_records: relaciones de un proyecto/área con los datos de cada
+  elemento, obtenidos en lotes por tipo (pocas consultas IN en total)
+- existing_relation_keys: qué elementos referenciados existen (importación)
+- run_export_pool: exporta varias entidades en paralelo con progreso
+"""
+
+import json
+import logging
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Callback de progreso: (completados, total, nombre de la entidad)
+ProgressCallback = Callable[[int, int, str], None]
+
+# Datos que se guardan de cada tipo de elemento relacionado
+_ENTITY_DATA = {
+    'tag': lambda e: {'name': e.get('name', '')},
+    'item': lambda e: {
+        'label': e.get('label', ''),
+        'content': e.get('content', ''),
+        'item_type': e.get('type') or 'TEXT',
+    },
+    'category': lambda e: {'name': e.get('name', ''), 'icon': e.get('icon') or '📂'},
+    'list': lambda e: {'name': e.get('name', '')},
+    'table': lambda e: {'name': e.get('name', '')},
+    'process': lambda e: {'name': e.get('name', '')},
+}
+
+
+class JSONStreamWriter:
+    """
+    Streaming writer for one JSON object
+
+    The output is the same document json.dump(obj, f, indent=indent) would
+    produce for the fields written (indent=None gives the compact form), but
+    list fields are serialized one element at a time from any iterable.
+
+    Usage:
+        with open(path, 'w', encoding='utf-8') as f, JSONStreamWriter(f) as writer:
+            writer.write_field('version', '1.0')
+            writer.write_list('relations', iter_relations())
+    """
+
+    def __init__(self, file_obj: TextIO, indent: Optional[int] = 2):
+        self.file = file_obj
+        self.indent_size = indent
+        self.indent = ' ' * (indent or 0)
+        # Con indent=None todo va en una línea y los elementos se separan con ', '
+        self.newline = '\n' if indent is not None else ''
+        self._fields = 0
+
+    def __enter__(self) -> 'JSONStreamWriter':
+        self.file.write('{')
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            return  # Sin cerrar el objeto: el documento incompleto no debe parecer válido
+        self.file.write(f"{self.newline}}}{self.newline}" if self._fields else f"}}{self.newline}")
+
+    def _separator(self, first: bool) -> str:
+        return self.newline if first else ',' + (self.newline or ' ')
+
+    def _dumps(self, value: Any, level: int) -> str:
+        text = json.dumps(value, indent=self.indent_size, ensure_ascii=False)
+        return text.replace('\n', '\n' + self.indent * level) if self.newline else text
+
+    def _start_field(self, key: str) -> None:
+        self.file.write(self._separator(not self._fields))
+        self.file.write(f"{self.indent}{json.dumps(key, ensure_ascii=False)}: ")
+        self._fields += 1
+
+    def write_field(self, key: str, value: Any) -> None:
+        """Write a key with any JSON-serializable value"""
+        self._start_field(key)
+        self.file.write(self._dumps(value, 1))
+
+    def write_list(self, key: str, items: Iterable[Any]) -> int:
+        """
+        Write a key whose value is a list, consuming items lazily
+
+        Returns:
+            int: Number of elements written
+        """
+        self._start_field(key)
+        count = 0
+        for item in items:
+            self.file.write('[' + self.newline if not count else self._separator(False))
+            self.file.write(self.indent * 2 + self._dumps(item, 2))
+            count += 1
+        self.file.write(f"{self.newline}{self.indent}]" if count else '[]')
+        return count
+
+
+def remove_partial_file(path: str) -> None:
+    """Delete a partially written export file (ignores a missing file)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"No se pudo borrar el archivo temporal '{path}': {e}")
+
+
+@contextmanager
+def atomic_write(file_path: str, encoding: str = 'utf-8', newline: Optional[str] = None) -> Iterator[TextIO]:
+    """
+    Open a text file that only replaces file_path if the block succeeds
+
+    Usage:
+        with atomic_write(path) as f, JSONStreamWriter(f) as writer:
+            writer.write_list('relations', iter_relations())
+
+    The data goes to "<file_path>.tmp", which is renamed over file_path on
+    success and deleted if the block raises.
+    """
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding=encoding, newline=newline) as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        remove_partial_file(tmp_path)
+        raise
+
+
+def iter_relation_records(db_manager, relations: List[Dict]) -> Iterator[Dict]:
+    """
+    Export records of project/area relations, in their original order
+
+    Entity data is fetched once per entity type (batched IN queries) instead
+    of one lookup per relation.
+
+    Args:
+        db_manager: DBManager instance
+        relations: Rows from get_project_relations() / get_area_relations()
+
+    Yields:
+        Dict with entity_type, entity_id, description, order_index and
+        entity_data (None if the element no longer exists or failed to load)
+    """
+    ids_by_type: Dict[str, List[int]] = defaultdict(list)
+    for relation in relations:
+        ids_by_type[relation['entity_type']].append(relation['entity_id'])
+
+    entities: Dict[str, Dict[int, Dict]] = {}
+    for entity_type, ids in ids_by_type.items():
+        try:
+            entities[entity_type] = db_manager.get_entities_by_ids(entity_type, ids)
+        except Exception as e:
+            logger.warning(f"Error obteniendo datos de {entity_type} ({len(ids)} elementos): {e}")
+            entities[entity_type] = {}
+
+    for relation in relations:
+        entity_type = relation['entity_type']
+        entity = entities.get(entity_type, {}).get(relation['entity_id'])
+        to_data = _ENTITY_DATA.get(entity_type)
+        yield {
+            'entity_type': entity_type,
+            'entity_id': relation['entity_id'],
+            'description': relation.get('description', ''),
+            'order_index': relation.get('order_index', 0),
+            'entity_data': to_data(entity) if entity and to_data else None,
+        }
+
+
+def existing_relation_keys(db_manager, relations: List[Dict]) -> Set[Tuple[str, int]]:
+    """
+    (entity_type, entity_id) pairs of relations whose element exists
+
+    Args:
+        db_manager: DBManager instance
+        relations: Relations from an import file
+
+    Returns:
+        Set of existing (entity_type, entity_id)
+    """
+    ids_by_type: Dict[str, List[int]] = defaultdict(list)
+    for relation in relations:
+        ids_by_type[relation['entity_type']].append(relation['entity_id'])
+
+    existing = set()
+    for entity_type, ids in ids_by_type.items():
+        try:
+            existing.update((entity_type, entity_id)
+                            for entity_id in db_manager.get_existing_entity_ids(entity_type, ids))
+        except Exception as e:
+            logger.warning(f"Error verificando {entity_type} ({len(ids)} elementos): {e}")
+    return existing
+
+
+def run_export_pool(db_manager, entities: List[Dict], export_one: Callable[[Dict], Optional[str]],
+                    max_workers: int = 4,
+                    progress_callback: Optional[ProgressCallback] = None) -> List[str]:
+    """
+    Export entities in a thread pool
+
+    Each worker thread reads through its own pooled connection. In-memory
+    databases share a single connection, so they are exported sequentially.
+
+    Args:
+        db_manager: DBManager instance
+        entities: Rows to export (need 'name')
+        export_one: Exports one entity, returns the file path or None
+        max_workers: Maximum worker threads
+        progress_callback: Called as (completed, total, name) after each export
+
+    Returns:
+        List[str]: Created files, in the order of entities
+    """
+    if getattr(db_manager, '_pool', None) is None:
+        max_workers = 1
+
+    total = len(entities)
+    results: List[Optional[str]] = [None] * total
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total or 1))) as executor:
+        futures = {executor.submit(export_one, entity): index for index, entity in enumerate(entities)}
+        for completed, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.error(f"Error exportando '{entities[index].get('name')}': {e}")
+            if progress_callback:
+                progress_callback(completed, total, entities[index].get('name', ''))
+
+    return [path for path in results if path]
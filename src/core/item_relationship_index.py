@@ -0,0 +1,404 @@
+"""
+Item Relationship Index
+Mapa en memoria item_id -> relaciones (categoría, lista, tabla, proyectos, áreas, procesos)
+
+Loaded in a few bulk queries (one per relation table plus one per name table)
+instead of one join per item. Records keep only IDs; names are resolved
+through small per-table name maps, so renaming a project touches one dict
+entry. Kept current through the DataChangeBus: each write marks the affected
+items/projects/areas/processes and the changes are applied on the next lookup.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.cache_invalidation import (
+    get_data_change_bus, DataChangeEvent,
+    TABLE_ITEMS, TABLE_CATEGORIES, TABLE_PROCESS_ITEMS, TABLE_PROCESSES,
+    TABLE_PROJECTS, TABLE_PROJECT_RELATIONS, TABLE_AREAS, TABLE_AREA_RELATIONS,
+    TABLE_LISTAS, TABLE_TABLES
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Tablas de nombres que resuelven los IDs de cada registro
+_NAME_TABLES = (
+    TABLE_CATEGORIES, TABLE_LISTAS, TABLE_TABLES,
+    TABLE_PROJECTS, TABLE_AREAS, TABLE_PROCESSES
+)
+
+# Relaciones N:M: tabla publicada -> (SQL owner_id/item_id, columna del owner)
+_MEMBERSHIP_QUERIES = {
+    TABLE_PROJECT_RELATIONS: (
+        "SELECT project_id, entity_id FROM project_relations WHERE entity_type = 'item'",
+        'project_id'
+    ),
+    TABLE_AREA_RELATIONS: (
+        "SELECT area_id, entity_id FROM area_relations WHERE entity_type = 'item'",
+        'area_id'
+    ),
+    TABLE_PROCESS_ITEMS: (
+        "SELECT process_id, item_id FROM process_items",
+        'process_id'
+    ),
+}
+
+
+class _ItemRecord:
+    """Compact relationship record of one item (IDs only)"""
+    __slots__ = ('category_id', 'list_id', 'table_id', 'owners')
+
+    def __init__(self, category_id=None, list_id=None, table_id=None):
+        self.category_id = category_id
+        self.list_id = list_id
+        self.table_id = table_id
+        # tabla de relación -> IDs de proyectos/áreas/procesos que contienen el item
+        self.owners: Dict[str, Tuple[int, ...]] = {}
+
+
+class ItemRelationshipIndex:
+    """
+    In-memory item -> relationships map for search results and filters
+
+    Usage:
+        index = get_item_relationship_index(db_manager)
+        index.get_relationships(42)
+        # {'categoria': 'Git', 'lista': None, 'tabla': None,
+        #  'proyectos': ['Web'], 'areas': [], 'procesos': ['Deploy']}
+    """
+
+    def __init__(self, db_manager):
+        """
+        Initialize Item Relationship Index
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db = db_manager
+
+        self._records: Dict[int, _ItemRecord] = {}
+        # tabla de relación -> owner_id -> item_ids (para quitar miembros al recargar)
+        self._members: Dict[str, Dict[int, Set[int]]] = {table: {} for table in _MEMBERSHIP_QUERIES}
+        self._names: Dict[str, Dict[int, str]] = {table: {} for table in _NAME_TABLES}
+
+        self._built = False
+        self._dirty_items: Set[int] = set()
+        self._dirty_owners: Dict[str, Optional[Set[int]]] = {}   # None = todos
+        self._dirty_names: Set[str] = set()
+        self._lock = threading.RLock()
+
+        get_data_change_bus().subscribe(
+            self._on_data_changed,
+            tables=[TABLE_ITEMS, *_NAME_TABLES, *_MEMBERSHIP_QUERIES]
+        )
+
+    # ==================== LOAD ====================
+
+    def _load_names(self, table: str) -> Dict[int, str]:
+        """id -> name of one name table"""
+        try:
+            return dict(self.db.connect().execute(f"SELECT id, name FROM {table}").fetchall())
+        except sqlite3.OperationalError as e:
+            # Tabla inexistente en bases antiguas
+            logger.debug(f"Skipping {table} names: {e}")
+            return {}
+
+    def _load_items(self, item_ids: Optional[List[int]] = None) -> Dict[int, Tuple]:
+        """item_id -> (category_id, list_id, table_id)"""
+        conn = self.db.connect()
+        sql = "SELECT id, category_id, list_id, table_id FROM items"
+        if item_ids is None:
+            return {row[0]: tuple(row[1:]) for row in conn.execute(sql)}
+
+        rows = {}
+        size = self.db._TAG_BATCH_SIZE
+        for start in range(0, len(item_ids), size):
+            batch = item_ids[start:start + size]
+            placeholders = ','.join('?' * len(batch))
+            for row in conn.execute(f"{sql} WHERE id IN ({placeholders})", batch):
+                rows[row[0]] = tuple(row[1:])
+        return rows
+
+    def _load_members(self, table: str, owner_ids: Optional[List[int]] = None) -> Dict[int, Set[int]]:
+        """owner_id -> item_ids of one relation table"""
+        sql, owner_column = _MEMBERSHIP_QUERIES[table]
+        conn = self.db.connect()
+        if owner_ids is None:
+            batches = [None]
+        else:
+            size = self.db._TAG_BATCH_SIZE
+            batches = [owner_ids[i:i + size] for i in range(0, len(owner_ids), size)]
+
+        members: Dict[int, Set[int]] = {}
+        try:
+            for batch in batches:
+                if batch is None:
+                    cursor = conn.execute(sql)
+                else:
+                    joiner = ' AND ' if ' WHERE ' in sql else ' WHERE '
+                    placeholders = ','.join('?' * len(batch))
+                    cursor = conn.execute(f"{sql}{joiner}{owner_column} IN ({placeholders})", batch)
+                for owner_id, item_id in cursor:
+                    members.setdefault(owner_id, set()).add(item_id)
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Skipping {table} relations: {e}")
+        return members
+
+    def build(self) -> None:
+        """(Re)build the whole index from the database"""
+        start_time = time.time()
+        with self._lock:
+            self._records = {
+                item_id: _ItemRecord(*columns)
+                for item_id, columns in self._load_items().items()
+            }
+            self._names = {table: self._load_names(table) for table in _NAME_TABLES}
+            self._members = {table: {} for table in _MEMBERSHIP_QUERIES}
+            for table in _MEMBERSHIP_QUERIES:
+                for owner_id, item_ids in self._load_members(table).items():
+                    self._set_members(table, owner_id, item_ids)
+
+            self._built = True
+            self._dirty_items.clear()
+            self._dirty_owners.clear()
+            self._dirty_names.clear()
+
+        elapsed = (time.time() - start_time) * 1000
+        logger.info(f"Item relationship index built: {len(self._records)} items in {elapsed:.1f}ms")
+
+    def _set_members(self, table: str, owner_id: int, item_ids: Set[int]) -> None:
+        """Replace the items of one project/area/process and update their records"""
+        members = self._members[table]
+        previous = members.pop(owner_id, set())
+        if item_ids:
+            members[owner_id] = item_ids
+
+        for item_id in previous - item_ids:
+            record = self._records.get(item_id)
+            if record is not None:
+                remaining = tuple(o for o in record.owners.get(table, ()) if o != owner_id)
+                if remaining:
+                    record.owners[table] = remaining
+                else:
+                    record.owners.pop(table, None)
+
+        for item_id in item_ids - previous:
+            record = self._records.get(item_id)
+            if record is not None:
+                record.owners[table] = record.owners.get(table, ()) + (owner_id,)
+
+    def _reload_owners(self, table: str, owner_ids: Optional[Set[int]]) -> None:
+        """Reload the memberships of some (None = all) owners of a relation table"""
+        if owner_ids is None:
+            loaded = self._load_members(table)
+            owner_ids = set(self._members[table]) | set(loaded)
+        else:
+            loaded = self._load_members(table, list(owner_ids))
+        for owner_id in owner_ids:
+            self._set_members(table, owner_id, loaded.get(owner_id, set()))
+
+    def _ensure_current(self) -> None:
+        """Build the index or apply changes published since the last lookup"""
+        with self._lock:
+            if not self._built:
+                self.build()
+                return
+
+            for table in self._dirty_names:
+                self._names[table] = self._load_names(table)
+            self._dirty_names.clear()
+
+            if self._dirty_items:
+                dirty = list(self._dirty_items)
+                self._dirty_items.clear()
+                rows = self._load_items(dirty)
+                for item_id in dirty:
+                    columns = rows.get(item_id)
+                    if columns is None:
+                        self._records.pop(item_id, None)
+                        continue
+                    record = self._records.get(item_id)
+                    if record is None:
+                        # Item nuevo: sus relaciones N:M se añaden con su evento
+                        self._records[item_id] = _ItemRecord(*columns)
+                    else:
+                        record.category_id, record.list_id, record.table_id = columns
+
+            for table, owner_ids in self._dirty_owners.items():
+                self._reload_owners(table, owner_ids)
+            self._dirty_owners.clear()
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next lookup"""
+        with self._lock:
+            self._built = False
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Mark what a database write touched for reloading"""
+        with self._lock:
+            if not self._built:
+                return
+
+            if event.table == TABLE_ITEMS:
+                if not event.ids:
+                    # Escritura en bloque (listas, tablas): número desconocido de items
+                    self._built = False
+                else:
+                    self._dirty_items.update(event.ids)
+                return
+
+            if event.table in _NAME_TABLES:
+                self._dirty_names.add(event.table)
+                if event.action == 'delete' and event.table in (TABLE_PROJECTS, TABLE_PROCESSES):
+                    # Las relaciones se borran en cascada
+                    relation_table = (TABLE_PROJECT_RELATIONS if event.table == TABLE_PROJECTS
+                                      else TABLE_PROCESS_ITEMS)
+                    self._mark_owners(relation_table, event.ids)
+
+            if event.table in _MEMBERSHIP_QUERIES:
+                self._mark_owners(event.table, event.ids)
+
+    def _mark_owners(self, table: str, owner_ids: Tuple[int, ...]) -> None:
+        """Queue owners of a relation table for reloading (empty = all)"""
+        if not owner_ids:
+            self._dirty_owners[table] = None
+            return
+        pending = self._dirty_owners.setdefault(table, set())
+        if pending is not None:
+            pending.update(owner_ids)
+
+    # ==================== LOOKUP ====================
+
+    def _names_of(self, table: str, ids: Tuple[int, ...]) -> List[str]:
+        names = self._names[table]
+        return [names[owner_id] for owner_id in ids if owner_id in names]
+
+    def _to_dict(self, record: _ItemRecord) -> Dict[str, Any]:
+        """Resolve a record into names (same keys as ItemRelationships)"""
+        owners = record.owners
+        return {
+            'categoria': self._names[TABLE_CATEGORIES].get(record.category_id),
+            'lista': self._names[TABLE_LISTAS].get(record.list_id),
+            'tabla': self._names[TABLE_TABLES].get(record.table_id),
+            'proyectos': self._names_of(TABLE_PROJECTS, owners.get(TABLE_PROJECT_RELATIONS, ())),
+            'areas': self._names_of(TABLE_AREAS, owners.get(TABLE_AREA_RELATIONS, ())),
+            'procesos': self._names_of(TABLE_PROCESSES, owners.get(TABLE_PROCESS_ITEMS, ())),
+        }
+
+    def get_relationships(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Relationships of one item
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Dict with categoria, lista, tabla (names or None) and proyectos,
+            areas, procesos (lists of names), or None if the item does not exist
+        """
+        return self.get_many([item_id]).get(item_id)
+
+    def get_many(self, item_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Relationships of several items
+
+        Args:
+            item_ids: Item IDs
+
+        Returns:
+            Dict[int, Dict]: item_id -> relationships (missing items are omitted)
+        """
+        self._ensure_current()
+        with self._lock:
+            result = {}
+            for item_id in item_ids:
+                record = self._records.get(item_id)
+                if record is not None:
+                    result[item_id] = self._to_dict(record)
+            return result
+
+    def filter_item_ids(self, item_ids: Iterable[int], entity_filters: Dict[str, bool]) -> List[int]:
+        """
+        Keep the items related to any of the active entity types
+
+        Same rules as SearchResult.matches_entity_filter, without hydrating.
+
+        Args:
+            item_ids: Item IDs (order is preserved)
+            entity_filters: {'proyectos': bool, 'areas': bool, 'categorias': bool,
+                             'tablas': bool, 'procesos': bool}
+
+        Returns:
+            List[int]: IDs passing the filter
+        """
+        item_ids = list(item_ids)
+        if not any(entity_filters.values()):
+            return item_ids
+
+        self._ensure_current()
+        with self._lock:
+            checks = self._entity_checks(entity_filters)
+            records = self._records
+            return [
+                item_id for item_id in item_ids
+                if item_id in records and any(check(records[item_id]) for check in checks)
+            ]
+
+    def _entity_checks(self, entity_filters: Dict[str, bool]) -> List:
+        """Record predicates for the active entity filters"""
+        checks = []
+        if entity_filters.get('proyectos'):
+            checks.append(lambda r: TABLE_PROJECT_RELATIONS in r.owners)
+        if entity_filters.get('areas'):
+            checks.append(lambda r: TABLE_AREA_RELATIONS in r.owners)
+        if entity_filters.get('procesos'):
+            checks.append(lambda r: TABLE_PROCESS_ITEMS in r.owners)
+        if entity_filters.get('categorias'):
+            categories = self._names[TABLE_CATEGORIES]
+            checks.append(lambda r: r.category_id in categories)
+        if entity_filters.get('tablas'):
+            tables = self._names[TABLE_TABLES]
+            checks.append(lambda r: r.table_id in tables)
+        return checks
+
+    def get_stats(self) -> Dict:
+        """Index size statistics"""
+        with self._lock:
+            return {
+                'built': self._built,
+                'items': len(self._records),
+                'project_relations': sum(map(len, self._members.get(TABLE_PROJECT_RELATIONS, {}).values())),
+                'area_relations': sum(map(len, self._members.get(TABLE_AREA_RELATIONS, {}).values())),
+                'process_items': sum(map(len, self._members.get(TABLE_PROCESS_ITEMS, {}).values())),
+                'pending_items': len(self._dirty_items)
+            }
+
+
+# === SINGLETON PATTERN ===
+# One relationship index per database file
+
+_instances: Dict[str, ItemRelationshipIndex] = {}
+_instances_lock = threading.Lock()
+
+
+def get_item_relationship_index(db_manager) -> ItemRelationshipIndex:
+    """
+    Get the shared ItemRelationshipIndex for a database
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        ItemRelationshipIndex: Index shared by search engines and panels
+    """
+    key = str(db_manager.db_path)
+    with _instances_lock:
+        index = _instances.get(key)
+        if index is None:
+            index = _instances[key] = ItemRelationshipIndex(db_manager)
+            logger.info(f"ItemRelationshipIndex created for {key}")
+    return index
@@ -0,0 +1,599 @@
+"""
+Item Search Index
+Índice en memoria para búsqueda y filtrado instantáneo de items
+
+Built once from the items loaded by a panel (e.g. GlobalSearchPanel) so that
+each keystroke is answered with set operations instead of lowercasing every
+field of every item:
+- Pre-lowercased haystack per item (label, content, tags, description, category)
+- Word postings (word -> positions) plus an n-gram map over the word
+  vocabulary (1/2/3-gram -> words) to find substring candidates, a bitset
+  per character for one-letter queries and a lazily cached bitset per 2/3-gram
+- Bitsets (Python ints) for type, favorite, sensitive, has_tags, is_list,
+  tags, use_count values and active/archived state
+- Results are a bitset too: SearchResults materializes the Items page by page,
+  so a one-letter query over 50k items does not build a 45k-item list
+"""
+
+import logging
+import operator
+import sys
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import compress
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from models.item import Item
+
+logger = logging.getLogger(__name__)
+
+
+# Separador de campos en el haystack: la barra de búsqueda es de una sola
+# línea, así que "needle in haystack" equivale a buscar campo por campo
+_FIELD_SEPARATOR = '\n'
+
+# '0'/'1' <-> 0/1: convierte entre bin(mask) y un byte por posición
+_BIT_FLAGS = bytes.maketrans(b'01', b'\x00\x01')
+_FLAG_BITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# Coste relativo de comprobar "needle in haystack" frente a unir un posting
+_SCAN_COST = 16
+
+_GRAM_SIZE = 3
+
+# Posiciones por página de SearchResults
+_PAGE_SIZE = 4096
+
+_USE_COUNT_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '=': operator.eq,
+}
+
+
+def _word_grams(word: str) -> Set[str]:
+    """Distinct substrings of 1 to 3 characters of a word"""
+    return {
+        word[i:i + size]
+        for size in range(1, _GRAM_SIZE + 1)
+        for i in range(len(word) - size + 1)
+    }
+
+
+class SearchResults(Sequence):
+    """
+    Read-only sequence of the items selected by a bitset
+
+    len() is a popcount; items are looked up when a row is requested, one
+    page of positions at a time (a view only asks for the visible rows).
+    """
+
+    def __init__(self, items: List[Optional[Item]], mask: int):
+        """
+        Args:
+            items: Snapshot of the index items by position
+            mask: Bitset of the selected positions
+        """
+        self._items = items
+        self._mask = mask
+        self._length = bin(mask).count('1') if mask > 0 else 0
+        self._flags: Optional[bytes] = None
+        self._page_starts: List[int] = []
+        self._pages: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('SearchResults index out of range')
+        self._ensure_pages()
+        page = bisect_right(self._page_starts, index) - 1
+        return self._items[self._page_positions(page)[index - self._page_starts[page]]]
+
+    def __iter__(self):
+        if not self._length:
+            return
+        self._ensure_pages()
+        items = self._items
+        for page in range(len(self._page_starts)):
+            for position in self._page_positions(page):
+                yield items[position]
+
+    def _ensure_pages(self) -> None:
+        """Number of selected positions before each page"""
+        if self._flags is not None:
+            return
+        flags = ItemSearchIndex._mask_flags(self._mask)
+        starts = []
+        count = 0
+        for start in range(0, len(flags), _PAGE_SIZE):
+            starts.append(count)
+            count += flags.count(1, start, start + _PAGE_SIZE)
+        self._flags = flags
+        self._page_starts = starts
+
+    def _page_positions(self, page: int) -> List[int]:
+        """Selected positions of a page (materialized on first access)"""
+        positions = self._pages.get(page)
+        if positions is None:
+            start = page * _PAGE_SIZE
+            end = min(start + _PAGE_SIZE, len(self._flags))
+            positions = list(compress(range(start, end), self._flags[start:end]))
+            self._pages[page] = positions
+        return positions
+
+
+class ItemSearchIndex:
+    """
+    In-memory query engine over a list of Item objects
+
+    Item positions are stable: removing an item only clears its bits, so
+    results always come back in the order the items were indexed. The text
+    postings are built on the first text search, not when loading items.
+    """
+
+    # Filtros de AdvancedFilterEngine resueltos por el índice; el resto
+    # (fechas, sort_by, top_n) se delega al motor original
+    INDEXED_FILTERS = ('type', 'is_favorite', 'is_sensitive', 'has_tags', 'is_list', 'tags', 'use_count')
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop every indexed item"""
+        self._items: List[Optional[Item]] = []
+        self._positions: Dict[str, int] = {}
+        self._haystacks: List[str] = []
+        self._use_counts: List[int] = []
+        self._row_keys: List[tuple] = []   # (type_key, tag_keys) de cada posición
+        self._snapshot: Optional[List[Optional[Item]]] = None  # copia de _items para SearchResults
+
+        # Texto (lazy): palabra -> posiciones, n-grama -> palabras, carácter -> bitset
+        # y n-grama de 2/3 caracteres -> bitset (se calcula en la primera consulta)
+        self._words: Optional[Dict[str, Set[int]]] = None
+        self._grams: Dict[str, Set[str]] = {}
+        self._char_bits: Dict[str, int] = {}
+        self._gram_bits: Dict[str, int] = {}
+
+        self._alive = 0
+        self._favorite = 0
+        self._sensitive = 0
+        self._has_tags = 0
+        self._is_list = 0
+        self._active = 0
+        self._archived = 0
+        self._type_bits: Dict[str, int] = {}
+        self._tag_bits: Dict[str, int] = {}
+        self._use_count_bits: Dict[int, int] = {}
+
+        # Resultado de filtros con top_n (no depende del texto): se reutiliza
+        # entre pulsaciones mientras no cambien los filtros ni los items
+        self._generation = 0
+        self._top_n_cache = None
+
+    # ==================== BUILD / UPDATE ====================
+
+    def build(self, items: Iterable[Item]) -> None:
+        """
+        Rebuild the index from scratch
+
+        Args:
+            items: Items in display order
+        """
+        self._reset()
+        for item in items:
+            self._add(item)
+        logger.debug(f"ItemSearchIndex built with {len(self._items)} items")
+
+    def update_item(self, item: Item) -> None:
+        """
+        Add or replace an item (matched by item.id)
+
+        Args:
+            item: Current version of the item
+        """
+        position = self._positions.get(item.id)
+        if position is None:
+            self._add(item)
+            return
+
+        self._clear_position(position)
+        self._items[position] = item
+        self._index_position(position, item)
+
+    def remove_item(self, item_id: str) -> None:
+        """
+        Remove an item from every result
+
+        Args:
+            item_id: Item ID
+        """
+        position = self._positions.pop(str(item_id), None)
+        if position is not None:
+            self._clear_position(position)
+            self._items[position] = None
+
+    def _add(self, item: Item) -> None:
+        """Append an item at a new position"""
+        position = len(self._items)
+        self._items.append(item)
+        self._haystacks.append('')
+        self._use_counts.append(None)
+        self._row_keys.append((None, ()))
+        self._positions[item.id] = position
+        self._index_position(position, item)
+
+    def _index_position(self, position: int, item: Item) -> None:
+        """Set the bits, column values and postings of an item"""
+        self._generation += 1
+        self._snapshot = None
+        bit = 1 << position
+        self._alive |= bit
+
+        type_key = sys.intern(item.type.value.upper())
+        self._type_bits[type_key] = self._type_bits.get(type_key, 0) | bit
+
+        tag_keys = tuple(sys.intern(tag) for tag in (item.tags or []))
+        for tag in tag_keys:
+            self._tag_bits[tag] = self._tag_bits.get(tag, 0) | bit
+        self._row_keys[position] = (type_key, tag_keys)
+
+        if item.is_favorite:
+            self._favorite |= bit
+        if item.is_sensitive:
+            self._sensitive |= bit
+        if tag_keys:
+            self._has_tags |= bit
+        if item.is_list_item():
+            self._is_list |= bit
+        if getattr(item, 'is_active', True):
+            self._active |= bit
+        if getattr(item, 'is_archived', False):
+            self._archived |= bit
+
+        use_count = getattr(item, 'use_count', 0) or 0
+        self._use_counts[position] = use_count
+        self._use_count_bits[use_count] = self._use_count_bits.get(use_count, 0) | bit
+
+        haystack = self._build_haystack(item)
+        self._haystacks[position] = haystack
+        if self._words is not None:
+            self._add_words(position, haystack)
+            for char in set(haystack):
+                self._char_bits[char] = self._char_bits.get(char, 0) | bit
+            if self._gram_bits:
+                for gram in self._haystack_grams(haystack):
+                    if gram in self._gram_bits:
+                        self._gram_bits[gram] |= bit
+
+    def _add_words(self, position: int, haystack: str) -> None:
+        """Add the words of a haystack to the text postings"""
+        words = self._words
+        for word in set(haystack.split()):
+            postings = words.get(word)
+            if postings is None:
+                words[word] = {position}
+                for gram in _word_grams(word):
+                    gram_words = self._grams.get(gram)
+                    if gram_words is None:
+                        self._grams[gram] = {word}
+                    else:
+                        gram_words.add(word)
+            else:
+                postings.add(position)
+
+    def _clear_position(self, position: int) -> None:
+        """Remove every bit and posting of a position"""
+        self._generation += 1
+        self._snapshot = None
+        keep = ~(1 << position)
+
+        self._alive &= keep
+        self._favorite &= keep
+        self._sensitive &= keep
+        self._has_tags &= keep
+        self._is_list &= keep
+        self._active &= keep
+        self._archived &= keep
+
+        type_key, tag_keys = self._row_keys[position]
+        if type_key is not None:
+            self._type_bits[type_key] &= keep
+        for tag in tag_keys:
+            self._tag_bits[tag] &= keep
+        self._row_keys[position] = (None, ())
+
+        use_count = self._use_counts[position]
+        if use_count is not None:
+            self._use_count_bits[use_count] &= keep
+            self._use_counts[position] = None
+
+        if self._words is not None:
+            # Las palabras sin posiciones se quedan en el vocabulario (inofensivas)
+            for word in set(self._haystacks[position].split()):
+                postings = self._words.get(word)
+                if postings is not None:
+                    postings.discard(position)
+            for char in set(self._haystacks[position]):
+                if char in self._char_bits:
+                    self._char_bits[char] &= keep
+            if self._gram_bits:
+                for gram in self._haystack_grams(self._haystacks[position]):
+                    if gram in self._gram_bits:
+                        self._gram_bits[gram] &= keep
+        self._haystacks[position] = ''
+
+    @staticmethod
+    def _haystack_grams(haystack: str) -> Set[str]:
+        """2/3-grams of the words of a haystack"""
+        grams = set()
+        for word in set(haystack.split()):
+            grams |= _word_grams(word)
+        return {gram for gram in grams if len(gram) > 1}
+
+    @staticmethod
+    def _build_haystack(item: Item) -> str:
+        """Lowercased searchable text (same fields as the old linear scan)"""
+        fields = [item.label or '']
+        if not item.is_sensitive:
+            fields.append(item.content or '')
+        fields.extend(item.tags or [])
+        if item.description:
+            fields.append(item.description)
+        category_name = getattr(item, 'category_name', None)
+        if category_name:
+            fields.append(category_name)
+        return _FIELD_SEPARATOR.join(fields).lower()
+
+    def _ensure_text_index(self) -> None:
+        """Build the word postings and n-gram map on first text search"""
+        if self._words is not None:
+            return
+        self._words = {}
+        self._grams = {}
+        self._gram_bits = {}
+        char_flags: Dict[str, bytearray] = {}
+        size = len(self._haystacks)
+        for position, haystack in enumerate(self._haystacks):
+            if haystack:
+                self._add_words(position, haystack)
+                for char in set(haystack):
+                    flags = char_flags.get(char)
+                    if flags is None:
+                        flags = char_flags[char] = bytearray(size)
+                    flags[position] = 1
+        # bytearray 0/1 por posición -> bitset (bit 0 = posición 0)
+        self._char_bits = {
+            char: int(bytes(flags[::-1]).translate(_FLAG_BITS), 2)
+            for char, flags in char_flags.items()
+        }
+        logger.debug(f"ItemSearchIndex text postings built: {len(self._words)} words, "
+                     f"{len(self._grams)} n-grams")
+
+    # ==================== QUERY ====================
+
+    def search(self, query: str, filters: Optional[Dict[str, Any]] = None,
+               state_filter: str = 'normal', filter_engine=None) -> Sequence:
+        """
+        Items matching the advanced filters, the state filter and the text
+
+        Args:
+            query: Text to find in label, content (non-sensitive), tags,
+                description or category name (case-insensitive substring)
+            filters: AdvancedFilterEngine filters dictionary
+            state_filter: 'normal', 'archived', 'inactive' or 'all'
+            filter_engine: AdvancedFilterEngine for the filters not resolved
+                by the index (date filters, sort_by, top_n)
+
+        Returns:
+            Sequence[Item]: Matching items in index order (SearchResults), or a
+            list in filter sort order when the filter engine had to run
+        """
+        filters = filters or {}
+        mask = self._alive & self._filter_mask(filters)
+        state_mask = self._state_mask(state_filter)
+        needle = query.lower() if query and query.strip() else ''
+
+        residual = {
+            key: value for key, value in filters.items()
+            if key not in self.INDEXED_FILTERS
+        }
+        if residual and filter_engine is not None and residual.get('top_n'):
+            # top_n se aplica antes que estado y texto (mismo orden que antes)
+            cache_key = (repr(sorted(filters.items(), key=lambda entry: entry[0])), self._generation)
+            if self._top_n_cache is not None and self._top_n_cache[0] == cache_key:
+                items = self._top_n_cache[1]
+            else:
+                positions = self._mask_positions(mask & self._use_count_mask(filters))
+                items = filter_engine.apply_filters(self._items_at(positions), residual)
+                self._top_n_cache = (cache_key, items)
+            state_flags = self._mask_flags(state_mask)
+            return [
+                item for item in items
+                if self._flag_at(state_flags, self._positions[item.id])
+                and (not needle or needle in self._haystacks[self._positions[item.id]])
+            ]
+
+        mask &= state_mask & self._use_count_mask(filters)
+        if needle:
+            mask = self._match_text(needle, mask)
+
+        if residual and filter_engine is not None:
+            # Fechas y sort_by: solo sobre los items que ya pasaron el índice
+            return filter_engine.apply_filters(self._items_at(self._mask_positions(mask)), residual)
+        return SearchResults(self._items_snapshot(), mask)
+
+    def filter_by_state(self, items: List[Item], state_filter: str) -> List[Item]:
+        """
+        Keep the items whose indexed state matches state_filter
+
+        Args:
+            items: Items (must be indexed)
+            state_filter: 'normal', 'archived', 'inactive' or 'all'
+
+        Returns:
+            List[Item]: Filtered items, same order
+        """
+        state_flags = self._mask_flags(self._state_mask(state_filter))
+        return [
+            item for item in items
+            if item.id in self._positions and self._flag_at(state_flags, self._positions[item.id])
+        ]
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> int:
+        """Bitset of the items passing the bitset-backed advanced filters"""
+        mask = self._alive
+
+        if filters.get('type'):
+            type_mask = 0
+            for type_name in filters['type']:
+                type_mask |= self._type_bits.get(type_name.upper(), 0)
+            mask &= type_mask
+
+        for key, bits in (('is_favorite', self._favorite),
+                          ('is_sensitive', self._sensitive),
+                          ('has_tags', self._has_tags),
+                          ('is_list', self._is_list)):
+            value = filters.get(key)
+            if value is not None:
+                mask &= bits if value else ~bits
+
+        tag_filter = filters.get('tags')
+        if tag_filter and 'values' in tag_filter:
+            values = tag_filter['values']
+            if tag_filter.get('mode', 'OR').upper() == 'AND':
+                tag_mask = self._has_tags
+                for tag in values:
+                    tag_mask &= self._tag_bits.get(tag, 0)
+            else:
+                tag_mask = 0
+                for tag in values:
+                    tag_mask |= self._tag_bits.get(tag, 0)
+            mask &= tag_mask
+
+        return mask
+
+    def _use_count_mask(self, filters: Dict[str, Any]) -> int:
+        """Bitset of the items passing the use_count filter (one bitset per value)"""
+        count_filter = filters.get('use_count')
+        if not count_filter:
+            return self._alive
+        compare = _USE_COUNT_OPERATORS.get(count_filter.get('operator', '>'))
+        if compare is None:
+            return 0
+        value = count_filter.get('value', 0)
+        mask = 0
+        for use_count, bits in self._use_count_bits.items():
+            if compare(use_count, value):
+                mask |= bits
+        return mask
+
+    def _state_mask(self, state_filter: str) -> int:
+        """Bitset of the items in a state ('normal', 'archived', 'inactive', 'all')"""
+        if state_filter == 'all':
+            return self._alive
+        if state_filter == 'normal':
+            return self._active & ~self._archived
+        if state_filter == 'archived':
+            return self._archived
+        if state_filter == 'inactive':
+            return self._alive & ~self._active & ~self._archived
+        return 0
+
+    def _match_text(self, needle: str, mask: int) -> int:
+        """Bitset of the positions within mask whose haystack contains needle"""
+        haystacks = self._haystacks
+        pieces = needle.split()
+        if not pieces:
+            return self._positions_mask(p for p in self._mask_positions(mask) if needle in haystacks[p])
+
+        self._ensure_text_index()
+
+        # Candidatos: items con alguna palabra que contiene el fragmento más largo
+        key = max(pieces, key=len)
+        if len(key) == 1:
+            matched = mask & self._char_bits.get(key, 0)
+        elif len(key) <= _GRAM_SIZE:
+            matched = mask & self._gram_mask(key)
+        else:
+            gram_sets = []
+            for i in range(len(key) - _GRAM_SIZE + 1):
+                gram_words = self._grams.get(key[i:i + _GRAM_SIZE])
+                if not gram_words:
+                    return 0
+                gram_sets.append(gram_words)
+            gram_sets.sort(key=len)
+            words = [word for word in gram_sets[0].intersection(*gram_sets[1:]) if key in word]
+
+            # Fragmentos comunes con una máscara pequeña: recorrer la máscara
+            # sale más barato que unir miles de postings
+            scan_budget = bin(mask).count('1') * _SCAN_COST
+            postings = [self._words[word] for word in words] if len(words) <= scan_budget else None
+            if postings is None or sum(map(len, postings)) > scan_budget:
+                return self._positions_mask(p for p in self._mask_positions(mask) if needle in haystacks[p])
+            matched = mask & self._positions_mask(set().union(*postings))
+
+        if needle != key and matched:
+            # Consulta con espacios: los candidatos solo garantizan el fragmento más largo
+            matched = self._positions_mask(p for p in self._mask_positions(matched) if needle in haystacks[p])
+        return matched
+
+    def _gram_mask(self, gram: str) -> int:
+        """Bitset of the items with a word containing a 2/3-character gram"""
+        bits = self._gram_bits.get(gram)
+        if bits is None:
+            words = self._words
+            bits = self._positions_mask(set().union(*(words[word] for word in self._grams.get(gram, ()))))
+            self._gram_bits[gram] = bits
+        return bits
+
+    def _positions_mask(self, positions: Iterable[int]) -> int:
+        """Bitset with the bits of the given positions set"""
+        flags = bytearray(len(self._items))
+        for position in positions:
+            flags[position] = 1
+        if not flags:
+            return 0
+        # bytearray 0/1 por posición -> bitset (bit 0 = posición 0)
+        return int(bytes(flags[::-1]).translate(_FLAG_BITS), 2)
+
+    def _items_snapshot(self) -> List[Optional[Item]]:
+        """Copy of the items by position, shared by results until the index changes"""
+        if self._snapshot is None:
+            self._snapshot = list(self._items)
+        return self._snapshot
+
+    def _items_at(self, positions: List[int]) -> List[Item]:
+        """Items at the given positions"""
+        items = self._items
+        return [items[p] for p in positions]
+
+    @staticmethod
+    def _mask_flags(mask: int) -> bytes:
+        """Bitset as one byte (0/1) per position, for fast indexed tests"""
+        if mask <= 0:
+            return b''
+        return bin(mask)[:1:-1].encode().translate(_BIT_FLAGS)
+
+    @staticmethod
+    def _flag_at(flags: bytes, position: int) -> bool:
+        """Test a position against flags from _mask_flags()"""
+        return position < len(flags) and flags[position] == 1
+
+    def _mask_positions(self, mask: int) -> List[int]:
+        """Ascending positions of the bits set in mask"""
+        flags = self._mask_flags(mask)
+        return list(compress(range(len(flags)), flags))
+
+    def __len__(self) -> int:
+        return len(self._positions)
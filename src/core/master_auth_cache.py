@@ -77,6 +77,10 @@ class MasterAuthCache:
         self._authenticated = False
         self._auth_timestamp = 0
 
+        # Drop decrypted sensitive values kept in memory
+        from src.core.encryption_manager import purge_decrypted_cache
+        purge_decrypted_cache()
+
         if was_authenticated:
             logger.info("Master password cache invalidated")
         else:
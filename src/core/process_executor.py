@@ -2,18 +2,18 @@
 Process Executor - Executes processes and manages execution flow
 
 Responsabilidades:
-- Ejecutar procesos secuencialmente
-- Gestionar delays entre steps
+- Ejecutar procesos paso a paso sin bloquear el event loop de Qt
+- Gestionar delays entre steps (QTimer, no time.sleep)
 - Tracking de ejecucion
 - Manejo de errores
 - Pausar/reanudar/cancelar ejecucion
+- Ejecutar varios procesos independientes en paralelo
 """
 
 import logging
 import sys
 from pathlib import Path
-import time
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List
 from datetime import datetime
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
@@ -26,14 +26,43 @@ from database.db_manager import DBManager
 logger = logging.getLogger(__name__)
 
 
+class ProcessRun:
+    """Estado de una ejecución en curso (un proceso)"""
+
+    def __init__(self, process: Process, steps: List[ProcessStep], timer: QTimer):
+        self.process = process
+        self.steps = steps
+        self.timer = timer
+        self.next_index = 0
+        self.completed_steps = 0
+        self.failed_steps = 0
+        self.is_paused = False
+        self.is_cancelled = False
+        self.execution_id = None
+        self.start_time = datetime.now()
+
+    @property
+    def total_steps(self) -> int:
+        return len(self.steps)
+
+
 class ProcessExecutor(QObject):
-    """Executor para procesos con soporte de señales Qt"""
+    """
+    Executor para procesos con soporte de señales Qt
+
+    Cada ejecución es una máquina de estados dirigida por un QTimer de un solo
+    disparo: un step por tick y el delay entre steps es el intervalo del timer.
+    El event loop nunca se bloquea, pause/resume/cancel actúan en el siguiente
+    tick y varios procesos pueden ejecutarse a la vez (las señales llevan el
+    process_id). El resultado se notifica con execution_completed.
+    """
 
     # Signals
     execution_started = pyqtSignal(int, str)  # process_id, process_name
     step_started = pyqtSignal(int, int, str)  # process_id, step_order, step_label
     step_completed = pyqtSignal(int, int, bool, str)  # process_id, step_order, success, message
     execution_completed = pyqtSignal(int, bool, str)  # process_id, success, message
+    execution_cancelled = pyqtSignal(int)  # process_id (emitted just before execution_completed)
     execution_progress = pyqtSignal(int, int, int)  # process_id, completed_steps, total_steps
 
     def __init__(self, db_manager: DBManager, clipboard_manager=None):
@@ -48,122 +77,138 @@ class ProcessExecutor(QObject):
         self.db = db_manager
         self.clipboard = clipboard_manager
 
-        # Execution state
-        self.is_executing = False
-        self.is_paused = False
-        self.is_cancelled = False
+        # Execution state (process_id -> ProcessRun)
+        self._runs: Dict[int, ProcessRun] = {}
         self.current_process_id = None
-        self.current_execution_id = None
-        self.completed_steps = 0
-        self.failed_steps = 0
 
         logger.info("ProcessExecutor initialized")
 
+    # ==================== STATE ====================
+
+    @property
+    def is_executing(self) -> bool:
+        """True while at least one process is running"""
+        return bool(self._runs)
+
+    @property
+    def is_paused(self) -> bool:
+        """True if every running process is paused"""
+        return bool(self._runs) and all(run.is_paused for run in self._runs.values())
+
+    @property
+    def completed_steps(self) -> int:
+        return sum(run.completed_steps for run in self._runs.values())
+
+    @property
+    def failed_steps(self) -> int:
+        return sum(run.failed_steps for run in self._runs.values())
+
     # ==================== EXECUTION ====================
 
     def execute_process(self, process: Process) -> bool:
         """
-        Execute a process sequentially
+        Start executing a process (non-blocking)
+
+        Steps run on the Qt event loop; listen to execution_completed for the
+        final result.
 
         Args:
             process: Process object to execute
 
         Returns:
-            Success status
+            True if execution started
         """
-        if self.is_executing:
-            logger.warning("Cannot execute process: another process is already running")
-            return False
-
         if not process or not process.id:
             logger.error("Cannot execute: invalid process")
             return False
 
-        try:
-            self.is_executing = True
-            self.is_paused = False
-            self.is_cancelled = False
-            self.current_process_id = process.id
-            self.completed_steps = 0
-            self.failed_steps = 0
-
-            # Get enabled steps only
-            enabled_steps = process.get_enabled_steps()
-            total_steps = len(enabled_steps)
-
-            if total_steps == 0:
-                logger.warning(f"Process {process.id} has no enabled steps")
-                self.is_executing = False
-                return False
+        if process.id in self._runs:
+            logger.warning(f"Cannot execute process {process.id}: it is already running")
+            return False
+
+        # Get enabled steps only
+        enabled_steps = process.get_enabled_steps()
+        if not enabled_steps:
+            logger.warning(f"Process {process.id} has no enabled steps")
+            return False
+
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        run = ProcessRun(process, enabled_steps, timer)
+        timer.timeout.connect(lambda: self._run_next_step(run))
 
+        self._runs[process.id] = run
+        self.current_process_id = process.id
+
+        try:
             # Emit execution started
             self.execution_started.emit(process.id, process.name)
-            logger.info(f"Starting execution of process: {process.name} ({total_steps} steps)")
+            logger.info(f"Starting execution of process: {process.name} ({run.total_steps} steps)")
 
             # Start execution tracking in database
-            start_time = datetime.now()
-            self.current_execution_id = self.db.add_execution_history(
+            run.execution_id = self.db.add_execution_history(
                 process_id=process.id,
-                total_steps=total_steps
+                total_steps=run.total_steps
             )
+        except Exception as e:
+            logger.error(f"Error starting process execution: {e}", exc_info=True)
+            self._complete_execution(run, False, f"Error: {str(e)}")
+            return False
 
-            # Execute each step
-            for step in enabled_steps:
-                # Check if cancelled
-                if self.is_cancelled:
-                    logger.info("Process execution cancelled by user")
-                    self._complete_execution(process.id, False, "Cancelled by user", start_time)
-                    return False
+        # First step on the next event loop iteration
+        timer.start(0)
+        return True
 
-                # Wait if paused
-                while self.is_paused and not self.is_cancelled:
-                    time.sleep(0.1)
+    def _run_next_step(self, run: ProcessRun):
+        """Execute the next step of a run and schedule the following one"""
+        if run.process.id not in self._runs:
+            return
 
-                # Execute step
-                success, message = self.execute_step(step, process)
+        if run.is_cancelled:
+            logger.info("Process execution cancelled by user")
+            self._complete_execution(run, False, "Cancelled by user")
+            return
 
-                if success:
-                    self.completed_steps += 1
-                else:
-                    self.failed_steps += 1
-
-                    # Check if step is optional
-                    if not step.is_optional:
-                        logger.error(f"Required step failed, stopping execution: {message}")
-                        self._complete_execution(
-                            process.id,
-                            False,
-                            f"Failed at step {step.step_order}: {message}",
-                            start_time
-                        )
-                        return False
-
-                # Emit progress
-                self.execution_progress.emit(process.id, self.completed_steps, total_steps)
-
-                # Apply delay between steps (if not the last step)
-                if step != enabled_steps[-1] and process.delay_between_steps > 0:
-                    time.sleep(process.delay_between_steps / 1000.0)  # Convert ms to seconds
-
-            # Execution completed successfully
-            logger.info(f"Process {process.name} completed: {self.completed_steps}/{total_steps} steps successful")
-            self._complete_execution(process.id, True, "Completed successfully", start_time)
-            return True
+        # Paused: resume_execution() restarts the timer
+        if run.is_paused:
+            return
+
+        process = run.process
+        step = run.steps[run.next_index]
+        run.next_index += 1
 
+        try:
+            success, message = self.execute_step(step, process)
         except Exception as e:
             logger.error(f"Error executing process: {e}", exc_info=True)
-            self._complete_execution(
-                process.id,
-                False,
-                f"Error: {str(e)}",
-                datetime.now()
-            )
-            return False
+            self._complete_execution(run, False, f"Error: {str(e)}")
+            return
+
+        if success:
+            run.completed_steps += 1
+        else:
+            run.failed_steps += 1
+
+            # Check if step is optional
+            if not step.is_optional:
+                logger.error(f"Required step failed, stopping execution: {message}")
+                self._complete_execution(
+                    run,
+                    False,
+                    f"Failed at step {step.step_order}: {message}"
+                )
+                return
+
+        # Emit progress
+        self.execution_progress.emit(process.id, run.completed_steps, run.total_steps)
+
+        if run.next_index >= run.total_steps:
+            logger.info(f"Process {process.name} completed: {run.completed_steps}/{run.total_steps} steps successful")
+            self._complete_execution(run, True, "Completed successfully")
+            return
 
-        finally:
-            self.is_executing = False
-            self.current_process_id = None
-            self.current_execution_id = None
+        # Apply delay between steps without blocking the event loop
+        run.timer.start(max(0, process.delay_between_steps or 0))
 
     def execute_step(self, step: ProcessStep, process: Process) -> tuple:
         """
@@ -217,31 +262,37 @@ class ProcessExecutor(QObject):
             self.step_completed.emit(process.id, step.step_order, False, message)
             return False, message
 
-    def _complete_execution(self, process_id: int, success: bool, message: str, start_time: datetime):
+    def _complete_execution(self, run: ProcessRun, success: bool, message: str):
         """
         Complete execution and update database
 
         Args:
-            process_id: Process ID
+            run: Finished run
             success: Whether execution was successful
             message: Completion message
-            start_time: Execution start time
         """
+        process_id = run.process.id
+        run.timer.stop()
+        run.timer.deleteLater()
+        self._runs.pop(process_id, None)
+        if self.current_process_id == process_id:
+            self.current_process_id = next(reversed(self._runs), None) if self._runs else None
+
         try:
             # Calculate duration
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            duration_ms = int((datetime.now() - run.start_time).total_seconds() * 1000)
 
             # Update execution history
-            if self.current_execution_id:
+            if run.execution_id:
                 status = 'completed' if success else 'failed'
-                if self.is_cancelled:
+                if run.is_cancelled:
                     status = 'cancelled'
 
                 self.db.update_execution_history(
-                    self.current_execution_id,
+                    run.execution_id,
                     status=status,
-                    completed_steps=self.completed_steps,
-                    failed_steps=self.failed_steps,
+                    completed_steps=run.completed_steps,
+                    failed_steps=run.failed_steps,
                     duration_ms=duration_ms,
                     error_message=message if not success else None
                 )
@@ -259,94 +310,189 @@ class ProcessExecutor(QObject):
                 last_used=datetime.now().isoformat()
             )
 
-            # Emit execution completed
-            self.execution_completed.emit(process_id, success, message)
             logger.info(f"Execution completed: {message} (Duration: {duration_ms}ms)")
 
         except Exception as e:
             logger.error(f"Error completing execution: {e}", exc_info=True)
 
+        # Emit execution completed
+        if run.is_cancelled:
+            self.execution_cancelled.emit(process_id)
+        self.execution_completed.emit(process_id, success, message)
+
     # ==================== EXECUTION CONTROL ====================
 
-    def pause_execution(self):
-        """Pause current execution"""
-        if self.is_executing and not self.is_paused:
-            self.is_paused = True
-            logger.info("Execution paused")
-
-    def resume_execution(self):
-        """Resume paused execution"""
-        if self.is_executing and self.is_paused:
-            self.is_paused = False
-            logger.info("Execution resumed")
-
-    def cancel_execution(self):
-        """Cancel current execution"""
-        if self.is_executing:
-            self.is_cancelled = True
-            self.is_paused = False
-            logger.info("Execution cancelled")
-
-    def is_running(self) -> bool:
-        """Check if executor is currently running"""
-        return self.is_executing
+    def _target_runs(self, process_id: Optional[int]) -> List[ProcessRun]:
+        """Runs affected by a control action (all of them if process_id is None)"""
+        if process_id is None:
+            return list(self._runs.values())
+        run = self._runs.get(process_id)
+        return [run] if run else []
+
+    def pause_execution(self, process_id: Optional[int] = None):
+        """Pause current execution (or every running process)"""
+        for run in self._target_runs(process_id):
+            if not run.is_paused:
+                run.is_paused = True
+                run.timer.stop()
+                logger.info(f"Execution paused (process {run.process.id})")
+
+    def resume_execution(self, process_id: Optional[int] = None):
+        """Resume paused execution (or every paused process)"""
+        for run in self._target_runs(process_id):
+            if run.is_paused:
+                run.is_paused = False
+                run.timer.start(0)
+                logger.info(f"Execution resumed (process {run.process.id})")
+
+    def cancel_execution(self, process_id: Optional[int] = None):
+        """Cancel current execution (or every running process)"""
+        for run in self._target_runs(process_id):
+            run.is_cancelled = True
+            run.is_paused = False
+            # Complete on the next tick so signals are not emitted re-entrantly
+            run.timer.start(0)
+            logger.info(f"Execution cancelled (process {run.process.id})")
+
+    def is_running(self, process_id: Optional[int] = None) -> bool:
+        """Check if executor (or a given process) is currently running"""
+        if process_id is None:
+            return self.is_executing
+        return process_id in self._runs
 
     def get_current_process_id(self) -> Optional[int]:
-        """Get ID of currently executing process"""
+        """Get ID of the most recently started running process"""
         return self.current_process_id
 
-    def get_progress(self) -> tuple:
+    def get_running_process_ids(self) -> List[int]:
+        """Get IDs of every running process"""
+        return list(self._runs)
+
+    def get_progress(self, process_id: Optional[int] = None) -> tuple:
         """
         Get current execution progress
 
+        Args:
+            process_id: Process ID (None = current process)
+
         Returns:
             Tuple of (completed_steps, total_steps)
         """
-        return (self.completed_steps, self.completed_steps + self.failed_steps)
+        run = self._runs.get(process_id if process_id is not None else self.current_process_id)
+        if not run:
+            return (0, 0)
+        return (run.completed_steps, run.total_steps)
 
     # ==================== BATCH EXECUTION ====================
 
-    def execute_multiple_processes(self, processes: list, on_complete: Callable = None) -> bool:
+    def execute_multiple_processes(self, processes: list, on_complete: Callable = None,
+                                   concurrent: bool = True, on_failure: Callable = None) -> bool:
         """
-        Execute multiple processes sequentially
+        Execute multiple processes (non-blocking)
 
         Args:
             processes: List of Process objects
-            on_complete: Callback function called after each process
+            on_complete: Callback(process, success, index, total) called after each process
+            concurrent: Run independent processes at the same time; if False,
+                each process starts when the previous one completes
+            on_failure: Sequential mode only: Callback(process) -> bool called
+                after a failed process; False stops the batch (the remaining
+                processes are reported to on_complete as not successful)
 
         Returns:
-            Success status
+            True if the batch started
         """
         if not processes:
             logger.warning("No processes to execute")
             return False
 
-        logger.info(f"Starting batch execution of {len(processes)} processes")
-
+        total = len(processes)
+        pending = {process.id: (i, process) for i, process in enumerate(processes, start=1)}
         failed_processes = []
-        for i, process in enumerate(processes, start=1):
-            logger.info(f"Executing process {i}/{len(processes)}: {process.name}")
-
-            success = self.execute_process(process)
+        cancelled_ids = set()
+        queue = list(processes)
+        # start_next() es el único sitio que avanza la cola; mientras corre, una
+        # finalización emitida desde execute_process() no arranca otro proceso
+        state = {'starting': False}
+
+        logger.info(f"Starting batch execution of {total} processes "
+                    f"({'concurrent' if concurrent else 'sequential'})")
+
+        def start_next() -> bool:
+            state['starting'] = True
+            try:
+                while queue:
+                    process = queue.pop(0)
+                    logger.info(f"Executing process {pending[process.id][0]}/{total}: {process.name}")
+                    if self.execute_process(process):
+                        return True
+                    # No arrancó; si ya emitió execution_completed, on_execution_completed lo registró
+                    if process.id in pending:
+                        process_done(process.id, False, cancelled=False)
+                return False
+            finally:
+                state['starting'] = False
 
+        def finish(process_id: int, success: bool):
+            if process_id not in pending:
+                return
+            index, process = pending.pop(process_id)
             if not success:
                 failed_processes.append(process.name)
                 logger.warning(f"Process '{process.name}' failed")
 
             if on_complete:
-                on_complete(process, success, i, len(processes))
-
-            # Check if user cancelled
-            if self.is_cancelled:
-                logger.info("Batch execution cancelled")
-                break
+                on_complete(process, success, index, total)
 
-        if failed_processes:
-            logger.warning(f"Batch execution completed with {len(failed_processes)} failures: {failed_processes}")
-            return False
+            if not pending:
+                self.execution_completed.disconnect(on_execution_completed)
+                self.execution_cancelled.disconnect(on_execution_cancelled)
+                if failed_processes:
+                    logger.warning(f"Batch execution completed with {len(failed_processes)} failures: {failed_processes}")
+                else:
+                    logger.info("Batch execution completed successfully")
+
+        def stop_batch(reason: str):
+            logger.info(reason)
+            remaining = list(queue)
+            queue.clear()
+            for process in remaining:
+                finish(process.id, False)
+
+        def process_done(process_id: int, success: bool, cancelled: bool):
+            process = pending[process_id][1]
+            finish(process_id, success)
+            if concurrent:
+                return
+            if cancelled:
+                stop_batch("Batch execution cancelled")
+            elif not success and queue and on_failure and not on_failure(process):
+                stop_batch("Batch execution stopped after a failure")
+
+        def on_execution_cancelled(process_id: int):
+            if process_id in pending:
+                cancelled_ids.add(process_id)
+
+        def on_execution_completed(process_id: int, success: bool, message: str):
+            if process_id not in pending:
+                return
+            cancelled = process_id in cancelled_ids
+            cancelled_ids.discard(process_id)
+            process_done(process_id, success, cancelled)
+
+            if not concurrent and not state['starting']:
+                start_next()
+
+        self.execution_cancelled.connect(on_execution_cancelled)
+        self.execution_completed.connect(on_execution_completed)
+
+        if concurrent:
+            while queue:
+                start_next()
         else:
-            logger.info("Batch execution completed successfully")
-            return True
+            start_next()
+
+        return True
 
     # ==================== UTILITIES ====================
 
@@ -10,8 +10,10 @@ Responsabilidades:
 
 import logging
 import sys
+import threading
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 # Add parent directories to path
@@ -19,6 +21,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models.process import Process, ProcessStep
 from database.db_manager import DBManager
+from src.core.cache_invalidation import (
+    get_data_change_bus, get_cache_metrics, DataChangeEvent,
+    TABLE_ITEMS, TABLE_PROCESS_ITEMS, ACTION_INSERT
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,8 @@ logger = logging.getLogger(__name__)
 class ProcessManager:
     """Manager para operaciones CRUD de procesos"""
 
+    CACHE_NAME = 'process_steps'
+
     def __init__(self, db_manager: DBManager):
         """
         Initialize ProcessManager
@@ -34,8 +42,99 @@ class ProcessManager:
             db_manager: Database manager instance
         """
         self.db = db_manager
+
+        # Cache de ProcessStep por proceso, invalidado por el DataChangeBus
+        self._steps_cache: Dict[int, List[ProcessStep]] = {}
+        self._item_processes: Dict[int, Set[int]] = {}  # item_id -> process IDs que lo usan
+        self._cache_lock = threading.Lock()
+        self._metrics = get_cache_metrics()
+        get_data_change_bus().subscribe(
+            self._on_data_changed, tables=[TABLE_PROCESS_ITEMS, TABLE_ITEMS]
+        )
+
         logger.info("ProcessManager initialized")
 
+    # ==================== STEP CACHE ====================
+
+    def _get_steps(self, process_ids: List[int]) -> Dict[int, List[ProcessStep]]:
+        """
+        Get ProcessStep objects for many processes
+
+        Cached processes are served from memory; the rest are loaded with a
+        single set-based query. Callers get copies, so editing a step does not
+        alter the cache.
+
+        Args:
+            process_ids: Process IDs
+
+        Returns:
+            Dict[int, List[ProcessStep]]: Mapping process_id -> steps
+        """
+        result: Dict[int, List[ProcessStep]] = {}
+        missing = []
+        with self._cache_lock:
+            for process_id in process_ids:
+                cached = self._steps_cache.get(process_id)
+                if cached is None:
+                    missing.append(process_id)
+                else:
+                    result[process_id] = cached
+
+        for _ in range(len(result)):
+            self._metrics.record_hit(self.CACHE_NAME)
+        for _ in range(len(missing)):
+            self._metrics.record_miss(self.CACHE_NAME)
+
+        if missing:
+            steps_by_process = self.db.get_process_steps_by_processes(missing)
+            with self._cache_lock:
+                for process_id, steps_data in steps_by_process.items():
+                    steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+                    self._steps_cache[process_id] = steps
+                    for step in steps:
+                        self._item_processes.setdefault(step.item_id, set()).add(process_id)
+                    result[process_id] = steps
+
+        return {
+            process_id: [replace(step) for step in steps]
+            for process_id, steps in result.items()
+        }
+
+    def _evict_processes(self, process_ids) -> None:
+        """Drop cached steps of the given processes"""
+        with self._cache_lock:
+            evicted = 0
+            for process_id in process_ids:
+                if self._steps_cache.pop(process_id, None) is not None:
+                    evicted += 1
+        self._metrics.record_eviction(self.CACHE_NAME, evicted)
+
+    def clear_cache(self) -> None:
+        """Drop every cached step"""
+        with self._cache_lock:
+            evicted = len(self._steps_cache)
+            self._steps_cache.clear()
+            self._item_processes.clear()
+        self._metrics.record_eviction(self.CACHE_NAME, evicted)
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Invalidate cached steps affected by a database write"""
+        if event.table == TABLE_PROCESS_ITEMS:
+            if event.ids:
+                self._evict_processes(event.ids)
+            else:
+                self.clear_cache()
+        elif event.action != ACTION_INSERT:
+            # Steps embed item label/content: evict processes that use the item
+            if not event.ids:
+                self.clear_cache()
+                return
+            with self._cache_lock:
+                affected = set()
+                for item_id in event.ids:
+                    affected |= self._item_processes.pop(item_id, set())
+            self._evict_processes(affected)
+
     # ==================== CRUD OPERATIONS ====================
 
     def create_process(self, process: Process) -> Tuple[bool, str, Optional[int]]:
@@ -106,8 +205,7 @@ class ProcessManager:
                 return None
 
             # Get process steps
-            steps_data = self.db.get_process_steps(process_id)
-            steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+            steps = self._get_steps([process_id])[process_id]
 
             # Create Process object
             process = Process.from_dict(process_data, steps=steps)
@@ -138,16 +236,15 @@ class ProcessManager:
                 include_inactive=include_inactive
             )
 
+            # Get steps for every process at once (cached or one query)
+            steps_by_process = self._get_steps([p['id'] for p in processes_data])
+
             processes = []
             for process_data in processes_data:
-                process_id = process_data['id']
-
-                # Get steps for this process
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
-
                 # Create Process object
-                process = Process.from_dict(process_data, steps=steps)
+                process = Process.from_dict(
+                    process_data, steps=steps_by_process[process_data['id']]
+                )
                 processes.append(process)
 
             logger.info(f"Retrieved {len(processes)} processes")
@@ -375,16 +472,15 @@ class ProcessManager:
         try:
             processes_data = self.db.search_processes(query)
 
+            # Get steps for every process at once (cached or one query)
+            steps_by_process = self._get_steps([p['id'] for p in processes_data])
+
             processes = []
             for process_data in processes_data:
-                process_id = process_data['id']
-
-                # Get steps
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
-
                 # Create Process object
-                process = Process.from_dict(process_data, steps=steps)
+                process = Process.from_dict(
+                    process_data, steps=steps_by_process[process_data['id']]
+                )
                 processes.append(process)
 
             logger.info(f"Search '{query}' found {len(processes)} processes")
@@ -404,16 +500,15 @@ class ProcessManager:
         try:
             processes_data = self.db.get_pinned_processes()
 
+            # Get steps for every process at once (cached or one query)
+            steps_by_process = self._get_steps([p['id'] for p in processes_data])
+
             processes = []
             for process_data in processes_data:
-                process_id = process_data['id']
-
-                # Get steps
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
-
                 # Create Process object
-                process = Process.from_dict(process_data, steps=steps)
+                process = Process.from_dict(
+                    process_data, steps=steps_by_process[process_data['id']]
+                )
                 processes.append(process)
 
             logger.info(f"Retrieved {len(processes)} pinned processes")
@@ -3,15 +3,19 @@ Project Filter Engine - Filtrado global por proyecto
 
 Responsabilidades:
 - Filtrado de categorías, items y tags por proyecto activo
-- Caché LRU de resultados
+- Caché de IDs por tipo de entidad, actualizada por las escrituras de relaciones
+- Filtrado en SQL (el conjunto de IDs se pasa a la consulta)
 - Integración con filtros existentes
 """
 
 import logging
+import threading
 from typing import List, Dict, Optional, Set
-from functools import lru_cache
 
 from src.database.db_manager import DBManager
+from src.core.cache_invalidation import (
+    get_data_change_bus, DataChangeEvent, TABLE_PROJECT_RELATIONS, TABLE_PROJECTS, ACTION_DELETE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +30,13 @@ class ProjectFilterEngine:
     def __init__(self, db_manager: DBManager):
         self.db = db_manager
         self._active_project_filter: Optional[int] = None
-        self._entity_cache: Dict[str, Set[int]] = {}
+        # project_id -> entity_type -> IDs; las escrituras de relaciones marcan el proyecto
+        self._entity_sets: Dict[int, Dict[str, Set[int]]] = {}
+        self._dirty_projects: Set[int] = set()
+        self._lock = threading.Lock()
+
+        get_data_change_bus().subscribe(self._on_relations_changed, tables=[TABLE_PROJECT_RELATIONS])
+        get_data_change_bus().subscribe(self._on_projects_changed, tables=[TABLE_PROJECTS])
         logger.info("ProjectFilterEngine initialized")
 
     # ==================== PROYECTO ACTIVO ====================
@@ -40,7 +50,6 @@ class ProjectFilterEngine:
         """
         if self._active_project_filter != project_id:
             self._active_project_filter = project_id
-            self.clear_cache()
             logger.info(f"Active project filter set to: {project_id}")
 
     def get_active_project(self) -> Optional[int]:
@@ -59,21 +68,55 @@ class ProjectFilterEngine:
 
     def clear_cache(self):
         """Limpia el caché de entidades"""
-        self._entity_cache.clear()
+        with self._lock:
+            self._entity_sets.clear()
+            self._dirty_projects.clear()
         logger.debug("Filter cache cleared")
 
-    def _get_cached_entities(self, entity_type: str) -> Optional[Set[int]]:
-        """Obtiene IDs de entidades del caché"""
-        if not self._active_project_filter:
-            return None
-        cache_key = f"{self._active_project_filter}_{entity_type}"
-        return self._entity_cache.get(cache_key)
+    def _on_relations_changed(self, event: DataChangeEvent):
+        """Marca para recarga solo los proyectos cuyas relaciones cambiaron"""
+        with self._lock:
+            if event.ids:
+                self._dirty_projects.update(i for i in event.ids if i in self._entity_sets)
+            else:
+                self._entity_sets.clear()
+                self._dirty_projects.clear()
+
+    def _on_projects_changed(self, event: DataChangeEvent):
+        """Descarta los conjuntos de los proyectos borrados (sus relaciones se borran con ellos)"""
+        if event.action != ACTION_DELETE:
+            return
+        with self._lock:
+            if event.ids:
+                for project_id in event.ids:
+                    self._entity_sets.pop(project_id, None)
+                    self._dirty_projects.discard(project_id)
+            else:
+                self._entity_sets.clear()
+                self._dirty_projects.clear()
+
+    def _get_entity_sets(self, project_id: int) -> Dict[str, Set[int]]:
+        """
+        Conjuntos de IDs por tipo de entidad de un proyecto (cacheados)
 
-    def _cache_entities(self, entity_type: str, entity_ids: Set[int]):
-        """Guarda IDs de entidades en caché"""
-        if self._active_project_filter:
-            cache_key = f"{self._active_project_filter}_{entity_type}"
-            self._entity_cache[cache_key] = entity_ids
+        Se cargan con una sola consulta y se recargan solo cuando una escritura
+        de relaciones afecta a ese proyecto.
+        """
+        with self._lock:
+            sets = self._entity_sets.get(project_id)
+            if sets is not None and project_id not in self._dirty_projects:
+                return sets
+
+        sets: Dict[str, Set[int]] = {}
+        for row in self.db.connect().execute(
+            "SELECT entity_type, entity_id FROM project_relations WHERE project_id = ?", (project_id,)
+        ).fetchall():
+            sets.setdefault(row[0], set()).add(row[1])
+
+        with self._lock:
+            self._entity_sets[project_id] = sets
+            self._dirty_projects.discard(project_id)
+        return sets
 
     # ==================== OBTENER ENTIDADES FILTRADAS ====================
 
@@ -91,47 +134,29 @@ class ProjectFilterEngine:
         if not self._active_project_filter:
             return set()
 
-        # Intentar desde caché
-        cached = self._get_cached_entities(entity_type)
-        if cached is not None:
-            return cached
-
-        # Obtener desde BD
-        relations = self.db.get_project_relations(
-            self._active_project_filter,
-            entity_type=entity_type
-        )
+        return self._get_entity_sets(self._active_project_filter).get(entity_type, set())
 
-        entity_ids = {rel['entity_id'] for rel in relations}
+    def _get_filtered_entities(self, entity_type: str) -> List[Dict]:
+        """Filas del tipo indicado que pertenecen al proyecto activo (filtradas en SQL)"""
+        if not self._active_project_filter:
+            return []
 
-        # Guardar en caché
-        self._cache_entities(entity_type, entity_ids)
+        entity_ids = self.get_entity_ids_in_project(entity_type)
+        if not entity_ids:
+            return []
 
-        return entity_ids
+        filtered = self.db.get_entities_in_id_set(entity_type, entity_ids)
+        logger.debug(f"Filtered {len(filtered)} {entity_type} rows for project {self._active_project_filter}")
+        return filtered
 
     def get_filtered_items(self) -> List[Dict]:
         """
         Obtiene items filtrados por proyecto activo
 
         Returns:
-            Lista de items que pertenecen al proyecto activo
+            Lista de items activos que pertenecen al proyecto activo
         """
-        if not self._active_project_filter:
-            return []
-
-        item_ids = self.get_entity_ids_in_project('item')
-
-        if not item_ids:
-            return []
-
-        # Obtener items desde BD
-        all_items = self.db.get_all_items(active_only=True)
-
-        # Filtrar por IDs del proyecto
-        filtered = [item for item in all_items if item['id'] in item_ids]
-
-        logger.debug(f"Filtered {len(filtered)} items for project {self._active_project_filter}")
-        return filtered
+        return self._get_filtered_entities('item')
 
     def get_filtered_categories(self) -> List[Dict]:
         """
@@ -140,22 +165,7 @@ class ProjectFilterEngine:
         Returns:
             Lista de categorías que pertenecen al proyecto activo
         """
-        if not self._active_project_filter:
-            return []
-
-        category_ids = self.get_entity_ids_in_project('category')
-
-        if not category_ids:
-            return []
-
-        # Obtener categorías desde BD
-        all_categories = self.db.get_categories(include_inactive=False)
-
-        # Filtrar por IDs del proyecto
-        filtered = [cat for cat in all_categories if cat['id'] in category_ids]
-
-        logger.debug(f"Filtered {len(filtered)} categories for project {self._active_project_filter}")
-        return filtered
+        return self._get_filtered_entities('category')
 
     def get_filtered_tags(self) -> List[str]:
         """
@@ -164,83 +174,19 @@ class ProjectFilterEngine:
         Returns:
             Lista de nombres de tags que pertenecen al proyecto activo
         """
-        if not self._active_project_filter:
-            return []
-
-        tag_ids = self.get_entity_ids_in_project('tag')
-
-        if not tag_ids:
-            return []
-
-        # Obtener tags desde BD
-        all_tags = self.db.get_all_tags()
-
-        # Filtrar por IDs del proyecto
-        filtered_tags = [tag['name'] for tag in all_tags if tag['id'] in tag_ids]
-
-        logger.debug(f"Filtered {len(filtered_tags)} tags for project {self._active_project_filter}")
-        return filtered_tags
+        return [tag['name'] for tag in self._get_filtered_entities('tag')]
 
     def get_filtered_lists(self) -> List[Dict]:
         """Obtiene listas filtradas por proyecto activo"""
-        if not self._active_project_filter:
-            return []
-
-        list_ids = self.get_entity_ids_in_project('list')
-
-        if not list_ids:
-            return []
-
-        # Obtener todas las listas
-        all_lists = []
-        categories = self.db.get_categories()
-        for cat in categories:
-            lists = self.db.get_listas_by_category_new(cat['id'])
-            all_lists.extend(lists)
-
-        # Filtrar por IDs del proyecto
-        filtered = [lst for lst in all_lists if lst['id'] in list_ids]
-
-        logger.debug(f"Filtered {len(filtered)} lists for project {self._active_project_filter}")
-        return filtered
+        return self._get_filtered_entities('list')
 
     def get_filtered_processes(self) -> List[Dict]:
         """Obtiene procesos filtrados por proyecto activo"""
-        if not self._active_project_filter:
-            return []
-
-        process_ids = self.get_entity_ids_in_project('process')
-
-        if not process_ids:
-            return []
-
-        # Obtener procesos desde BD
-        all_processes = self.db.get_all_processes()
-
-        # Filtrar por IDs del proyecto
-        filtered = [proc for proc in all_processes if proc['id'] in process_ids]
-
-        logger.debug(f"Filtered {len(filtered)} processes for project {self._active_project_filter}")
-        return filtered
+        return self._get_filtered_entities('process')
 
     def get_filtered_tables(self) -> List[Dict]:
         """Obtiene tablas filtradas por proyecto activo"""
-        if not self._active_project_filter:
-            return []
-
-        table_ids = self.get_entity_ids_in_project('table')
-
-        if not table_ids:
-            return []
-
-        # Obtener tablas desde BD
-        all_tables = self.db.get_all_tables()
-
-        # Filtrar por IDs del proyecto
-        filtered = [tbl for tbl in all_tables if tbl['id'] in table_ids]
-
-        logger.debug(f"Filtered {len(filtered)} tables for project {self._active_project_filter}")
-        return filtered
+        return self._get_filtered_entities('table')
 
     # ==================== VERIFICACIÓN ====================
 
@@ -5,17 +5,32 @@ This module provides:
 - FTS5Manager: Full-text search with SQLite FTS5
 - IndexManager: B-Tree index management
 - FuzzySearchEngine: Levenshtein-based fuzzy search
+- AutocompleteService: In-memory prefix suggestions for search inputs
 - SearchCache: LRU cache for search results
+- UsageScoreManager: Precomputed usage scores for hybrid ranking
 - SearchHistoryManager: Search history tracking
 - AdvancedSearchEngine: Main orchestrator
 """
 
 from .fts5_manager import FTS5Manager
 from .index_manager import IndexManager
+from .fuzzy_search_engine import FuzzySearchEngine, get_fuzzy_search_engine
+from .autocomplete_service import AutocompleteService, get_autocomplete_service
+from .search_cache import SearchCache, get_search_cache
+from .usage_scores import UsageScoreManager, get_usage_score_manager, stop_usage_score_managers
 from .advanced_search_engine import AdvancedSearchEngine
 
 __all__ = [
     'FTS5Manager',
     'IndexManager',
+    'FuzzySearchEngine',
+    'get_fuzzy_search_engine',
+    'AutocompleteService',
+    'get_autocomplete_service',
+    'SearchCache',
+    'get_search_cache',
+    'UsageScoreManager',
+    'get_usage_score_manager',
+    'stop_usage_score_managers',
     'AdvancedSearchEngine',
 ]
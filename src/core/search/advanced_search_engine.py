@@ -3,6 +3,7 @@ Advanced Search Engine - Main orchestrator for all search capabilities
 
 Coordinates:
 - FTS5 full-text search
+- Trigram fuzzy search
 - Index-based filtering
 - Result ranking and aggregation
 """
@@ -13,6 +14,10 @@ import time
 
 from .fts5_manager import FTS5Manager
 from .index_manager import IndexManager
+from .fuzzy_search_engine import get_fuzzy_search_engine
+from .autocomplete_service import get_autocomplete_service
+from .search_cache import get_search_cache
+from .usage_scores import get_usage_score_manager
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +29,17 @@ class AdvancedSearchEngine:
     Provides unified interface for all search modes:
     - 'smart': FTS5 with intelligent fallbacks
     - 'fts5': Pure FTS5 search
+    - 'fuzzy': Typo-tolerant search over labels and tags
     - 'exact': Exact substring matching
     """
 
+    # Columnas devueltas por los modos basados en SQL directo (exact/fuzzy)
+    RESULT_COLUMNS = [
+        'id', 'category_id', 'label', 'content', 'type', 'description',
+        'is_favorite', 'is_sensitive', 'use_count', 'last_used', 'created_at',
+        'category_name', 'category_icon', 'rank_score'
+    ]
+
     def __init__(self, db_manager):
         """
         Initialize Advanced Search Engine
@@ -37,6 +50,11 @@ class AdvancedSearchEngine:
         self.db = db_manager
         self.fts5 = FTS5Manager(db_manager)
         self.index_manager = IndexManager(db_manager)
+        self.fuzzy = get_fuzzy_search_engine(db_manager)
+        self.cache = get_search_cache()
+        # Puntuaciones de uso precalculadas para el ranking híbrido (solo lectura:
+        # el hilo de refresco lo arranca MainController)
+        self.usage_scores = get_usage_score_manager(db_manager)
 
         logger.info("AdvancedSearchEngine initialized")
 
@@ -53,7 +71,7 @@ class AdvancedSearchEngine:
 
         Args:
             query: Search query string
-            mode: Search mode ('smart', 'fts5', 'exact')
+            mode: Search mode ('smart', 'fts5', 'fuzzy', 'exact')
             filters: Optional filters dictionary
                 {
                     'item_types': ['CODE', 'URL'],
@@ -88,6 +106,9 @@ class AdvancedSearchEngine:
                 filters={'item_types': ['CODE'], 'is_favorite': True}
             )
 
+            # Typo-tolerant
+            result = engine.search("dokcer compse", mode='fuzzy')
+
             # Exact substring
             result = engine.search("git st", mode='exact')
         """
@@ -110,20 +131,29 @@ class AdvancedSearchEngine:
             filters = {}
 
         try:
-            if mode == 'smart':
-                results, exec_time = self._search_smart(query, filters, limit, offset)
-                mode_used = 'smart'
-
-            elif mode == 'fts5':
-                results, exec_time = self._search_fts5(query, filters, limit, offset)
-                mode_used = 'fts5'
+            searchers = {
+                'smart': self._search_smart,
+                'fts5': self._search_fts5,
+                'fuzzy': self._search_fuzzy,
+                'exact': self._search_exact,
+            }
+            if mode not in searchers:
+                raise ValueError(f"Unknown search mode: {mode}")
 
-            elif mode == 'exact':
-                results, exec_time = self._search_exact(query, filters, limit, offset)
-                mode_used = 'exact'
+            # Resultados repetidos (misma query/filtros/página) salen de la caché
+            # mientras no haya escrituras (data_generation sin cambios).
+            # exact (y smart, que cae a exact) buscan la subcadena literal
+            cache_key = self.cache.make_key(
+                self.db, 'advanced', mode, query, filters, (limit, offset),
+                exact=mode in ('exact', 'smart')
+            )
+            generation = self.db.data_generation
+            results = self.cache.get(cache_key, generation)
+            cache_hit = results is not None
 
-            else:
-                raise ValueError(f"Unknown search mode: {mode}")
+            if not cache_hit:
+                results, exec_time = searchers[mode](query, filters, limit, offset)
+                self.cache.put(cache_key, generation, results)
 
             total_time = (time.time() - start_time) * 1000
 
@@ -131,8 +161,9 @@ class AdvancedSearchEngine:
                 'results': results,
                 'count': len(results),
                 'execution_time_ms': total_time,
-                'mode_used': mode_used,
-                'query': query
+                'mode_used': mode,
+                'query': query,
+                'cache_hit': cache_hit
             }
 
         except Exception as e:
@@ -230,65 +261,35 @@ class AdvancedSearchEngine:
 
         return results, exec_time
 
-    def _search_exact(
-        self,
-        query: str,
-        filters: Dict,
-        limit: int,
-        offset: int
-    ) -> Tuple[List[Dict], float]:
+    def _build_filter_clauses(self, filters: Dict) -> Tuple[List[str], List]:
         """
-        Exact substring search using LIKE
+        Build WHERE clauses (over alias i) for the filters dictionary
 
         Args:
-            query: Exact text to find
-            filters: Filter dictionary
-            limit: Result limit
-            offset: Result offset
+            filters: Filter dictionary (see search())
 
         Returns:
-            Tuple of (results, execution_time_ms)
+            Tuple of (clauses, params)
         """
-        start_time = time.time()
-
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        # Build WHERE clauses
-        where_clauses = ["i.is_active = 1"]
+        clauses = []
         params = []
 
-        # Text search in label, content, and tags (relational structure)
-        search_pattern = f"%{query}%"
-        where_clauses.append("""
-            (LOWER(i.label) LIKE LOWER(?)
-             OR LOWER(i.content) LIKE LOWER(?)
-             OR EXISTS (
-                 SELECT 1 FROM item_tags it
-                 JOIN tags t ON it.tag_id = t.id
-                 WHERE it.item_id = i.id
-                 AND LOWER(t.name) LIKE LOWER(?)
-             ))
-        """)
-        params.extend([search_pattern, search_pattern, search_pattern])
-
-        # Apply filters
         if filters.get('item_types'):
             placeholders = ','.join('?' * len(filters['item_types']))
-            where_clauses.append(f"i.type IN ({placeholders})")
+            clauses.append(f"i.type IN ({placeholders})")
             params.extend(filters['item_types'])
 
         if filters.get('categories'):
             placeholders = ','.join('?' * len(filters['categories']))
-            where_clauses.append(f"i.category_id IN ({placeholders})")
+            clauses.append(f"i.category_id IN ({placeholders})")
             params.extend(filters['categories'])
 
         if filters.get('is_favorite') is not None:
-            where_clauses.append("i.is_favorite = ?")
+            clauses.append("i.is_favorite = ?")
             params.append(1 if filters['is_favorite'] else 0)
 
         if filters.get('is_sensitive') is not None:
-            where_clauses.append("i.is_sensitive = ?")
+            clauses.append("i.is_sensitive = ?")
             params.append(1 if filters['is_sensitive'] else 0)
 
         # Handle date range filters (new format)
@@ -315,12 +316,149 @@ class AdvancedSearchEngine:
 
             # Combine with OR (item matches if ANY of the date fields match)
             if date_conditions:
-                where_clauses.append(f"({' OR '.join(date_conditions)})")
+                clauses.append(f"({' OR '.join(date_conditions)})")
 
         if filters.get('min_use_count') is not None:
-            where_clauses.append("i.use_count >= ?")
+            clauses.append("i.use_count >= ?")
             params.append(filters['min_use_count'])
 
+        return clauses, params
+
+    def _search_fuzzy(
+        self,
+        query: str,
+        filters: Dict,
+        limit: int,
+        offset: int
+    ) -> Tuple[List[Dict], float]:
+        """
+        Fuzzy search: trigram candidates ranked by edit distance
+
+        Candidates come from the in-memory FuzzySearchEngine; filters are
+        applied in SQL over the ranked IDs, one batch at a time, until the
+        requested page is filled.
+
+        Args:
+            query: Search text (typos allowed)
+            filters: Filter dictionary
+            limit: Result limit
+            offset: Result offset
+
+        Returns:
+            Tuple of (results, execution_time_ms)
+        """
+        start_time = time.time()
+
+        ranked = self.fuzzy.search(query)
+        if not ranked:
+            return [], (time.time() - start_time) * 1000
+
+        filter_clauses, filter_params = self._build_filter_clauses(filters)
+        where_clauses = ["i.is_active = 1"] + filter_clauses
+
+        conn = self.db.connect()
+        needed = offset + limit
+        batch_size = self.db._TAG_BATCH_SIZE
+        results_list = []
+
+        try:
+            for batch_start in range(0, len(ranked), batch_size):
+                batch = ranked[batch_start:batch_start + batch_size]
+                scores = dict(batch)
+                placeholders = ','.join('?' * len(batch))
+                where_sql = " AND ".join(where_clauses + [f"i.id IN ({placeholders})"])
+
+                # NOT INDEXED: buscar por rowid en vez de recorrer idx_items_active
+
+                rows = conn.execute(f"""
+                    SELECT
+                        i.id,
+                        i.category_id,
+                        i.label,
+                        i.content,
+                        i.type,
+                        i.description,
+                        i.is_favorite,
+                        i.is_sensitive,
+                        i.use_count,
+                        i.last_used,
+                        i.created_at,
+                        c.name as category_name,
+                        c.icon as category_icon,
+                        0 as rank_score
+                    FROM items i NOT INDEXED
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    WHERE {where_sql}
+                """, filter_params + list(scores)).fetchall()
+
+                batch_results = [dict(zip(self.RESULT_COLUMNS, row)) for row in rows]
+                for result in batch_results:
+                    result['rank_score'] = scores[result['id']]
+                # Mismo orden que el ranking (distancia, luego uso)
+                batch_results.sort(key=lambda r: (r['rank_score'], -(r['use_count'] or 0), r['id']))
+                results_list.extend(batch_results)
+
+                if len(results_list) >= needed:
+                    break
+
+            results_list = results_list[offset:needed]
+            self.db.attach_tags(results_list)
+
+            execution_time = (time.time() - start_time) * 1000
+            logger.info(f"Fuzzy search: '{query}' -> {len(results_list)} results in {execution_time:.2f}ms")
+
+            return results_list, execution_time
+
+        except Exception as e:
+            logger.error(f"Fuzzy search error: {e}")
+            return [], 0.0
+
+    def _search_exact(
+        self,
+        query: str,
+        filters: Dict,
+        limit: int,
+        offset: int
+    ) -> Tuple[List[Dict], float]:
+        """
+        Exact substring search using LIKE
+
+        Args:
+            query: Exact text to find
+            filters: Filter dictionary
+            limit: Result limit
+            offset: Result offset
+
+        Returns:
+            Tuple of (results, execution_time_ms)
+        """
+        start_time = time.time()
+
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        # Build WHERE clauses
+        where_clauses = ["i.is_active = 1"]
+        params = []
+
+        # Text search in label, content, and tags (relational structure)
+        search_pattern = f"%{query}%"
+        where_clauses.append("""
+            (LOWER(i.label) LIKE LOWER(?)
+             OR LOWER(i.content) LIKE LOWER(?)
+             OR EXISTS (
+                 SELECT 1 FROM item_tags it
+                 JOIN tags t ON it.tag_id = t.id
+                 WHERE it.item_id = i.id
+                 AND LOWER(t.name) LIKE LOWER(?)
+             ))
+        """)
+        params.extend([search_pattern, search_pattern, search_pattern])
+
+        filter_clauses, filter_params = self._build_filter_clauses(filters)
+        where_clauses.extend(filter_clauses)
+        params.extend(filter_params)
+
         where_sql = " AND ".join(where_clauses)
 
         try:
@@ -342,26 +480,18 @@ class AdvancedSearchEngine:
                     0 as rank_score
                 FROM items i
                 LEFT JOIN categories c ON i.category_id = c.id
+                LEFT JOIN item_usage_scores us ON us.item_id = i.id
                 WHERE {where_sql}
-                ORDER BY i.use_count DESC, i.last_used DESC
+                ORDER BY COALESCE(us.usage_score, 0) DESC, i.use_count DESC, i.last_used DESC
                 LIMIT ? OFFSET ?
             """, params + [limit, offset]).fetchall()
 
             execution_time = (time.time() - start_time) * 1000
 
             # Convert to dicts (removed 'tags' from columns)
-            columns = [
-                'id', 'category_id', 'label', 'content', 'type', 'description',
-                'is_favorite', 'is_sensitive', 'use_count', 'last_used', 'created_at',
-                'category_name', 'category_icon', 'rank_score'
-            ]
-
-            results_list = []
-            for row in results:
-                result_dict = dict(zip(columns, row))
-                # Load tags from relational structure
-                result_dict['tags'] = self.db.get_tags_by_item(result_dict['id'])
-                results_list.append(result_dict)
+            results_list = [dict(zip(self.RESULT_COLUMNS, row)) for row in results]
+            # Load tags from relational structure in a single bulk query
+            self.db.attach_tags(results_list)
 
             logger.info(f"Exact search: '{query}' -> {len(results_list)} results in {execution_time:.2f}ms")
 
@@ -373,20 +503,20 @@ class AdvancedSearchEngine:
 
     def autocomplete(self, prefix: str, limit: int = 10) -> List[str]:
         """
-        Get autocomplete suggestions
+        Get autocomplete suggestions from the in-memory AutocompleteService
 
         Args:
             prefix: Text prefix (min 2 characters)
             limit: Maximum suggestions
 
         Returns:
-            List of suggestion strings
+            List of suggestion strings (labels, tags, categories, projects, areas)
 
         Example:
             suggestions = engine.autocomplete("git pu")
             # Returns: ["git push", "git pull"]
         """
-        return self.fts5.search_autocomplete(prefix, limit=limit)
+        return get_autocomplete_service(self.db).suggest(prefix, limit=limit)
 
     def search_with_highlighting(
         self,
@@ -486,4 +616,8 @@ class AdvancedSearchEngine:
         stats['indexes_count'] = len(indexes)
         stats['indexes'] = indexes
 
+        # Result cache stats (hits/misses/hit_rate)
+        stats['result_cache'] = self.cache.get_stats()
+        stats['usage_scores'] = self.usage_scores.get_stats()
+
         return stats
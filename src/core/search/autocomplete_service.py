@@ -0,0 +1,437 @@
+"""
+Autocomplete Service - In-memory prefix suggestions for search inputs
+
+Keeps a sorted array of normalized keys (binary search with bisect) over:
+- Item labels (weighted by use_count and recency of use)
+- Tag names (weighted by number of tagged items)
+- Category, project and area names
+
+Every suggestion is indexed at each word start, so "pu" suggests "git push".
+The index is built lazily on first use and kept current through the
+DataChangeBus (only the changed items are re-indexed); repeated keystrokes
+are answered from a per-prefix cache.
+"""
+
+import bisect
+import heapq
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.core.cache_invalidation import (
+    get_data_change_bus, DataChangeEvent,
+    TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS, TABLE_CATEGORIES,
+    TABLE_PROJECTS, TABLE_AREAS
+)
+from .fuzzy_search_engine import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+# Tipos de sugerencia
+KIND_ITEM = 'item'
+KIND_TAG = 'tag'
+KIND_CATEGORY = 'category'
+KIND_PROJECT = 'project'
+KIND_AREA = 'area'
+
+_WORD_START_RE = re.compile(r'\w+')
+
+
+@dataclass
+class _Suggestion:
+    """One distinct suggestion text of a kind"""
+    text: str
+    kind: str
+    weight: float = 0.0
+    refs: int = 0
+
+
+class AutocompleteService:
+    """
+    Weighted prefix suggestions over labels, tags, categories, projects and areas
+
+    Usage:
+        service = get_autocomplete_service(db_manager)
+        service.suggest("git pu")  # ["git push", "git pull", ...]
+    """
+
+    MIN_PREFIX_LENGTH = 2
+    MAX_KEY_LENGTH = 64
+    RECENCY_HALF_LIFE_DAYS = 30
+    CACHE_SIZE = 512
+
+    # Peso base por tipo (a igualdad de uso, los labels van primero)
+    KIND_BASE_WEIGHT = {
+        KIND_ITEM: 1.0,
+        KIND_TAG: 0.8,
+        KIND_CATEGORY: 0.6,
+        KIND_PROJECT: 0.6,
+        KIND_AREA: 0.6,
+    }
+
+    _SECTION_QUERIES = {
+        KIND_TAG: """
+            SELECT t.name, COUNT(it.item_id)
+            FROM tags t
+            LEFT JOIN item_tags it ON it.tag_id = t.id
+            GROUP BY t.id
+        """,
+        KIND_CATEGORY: "SELECT name, item_count FROM categories WHERE is_active = 1",
+        KIND_PROJECT: "SELECT name, 0 FROM proyectos WHERE is_active = 1",
+        KIND_AREA: "SELECT name, 0 FROM areas WHERE is_active = 1",
+    }
+
+    def __init__(self, db_manager):
+        """
+        Initialize Autocomplete Service
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db = db_manager
+
+        self._suggestions: List[Optional[_Suggestion]] = []      # entry_id -> suggestion
+        self._entry_ids: Dict[Tuple[str, str], int] = {}         # (kind, text) -> entry_id
+        self._weights: List[float] = []                          # entry_id -> weight
+        # Array ordenado de claves y, en paralelo, el entry_id de cada clave
+        self._keys: List[str] = []
+        self._key_entries: List[int] = []
+        self._item_contrib: Dict[int, Tuple[str, float]] = {}    # item_id -> (label, weight)
+        self._section_contrib: Dict[str, List[Tuple[str, float]]] = {}
+
+        self._built = False
+        self._dirty_items: Set[int] = set()
+        self._dirty_sections: Set[str] = set()
+        self._cache: Dict[Tuple[str, int, Optional[Tuple[str, ...]]], List[str]] = {}
+        self._lock = threading.RLock()
+
+        get_data_change_bus().subscribe(
+            self._on_data_changed,
+            tables=[TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS, TABLE_CATEGORIES,
+                    TABLE_PROJECTS, TABLE_AREAS]
+        )
+
+    # ==================== INDEX MAINTENANCE ====================
+
+    @classmethod
+    def _keys_for(cls, text: str) -> List[str]:
+        """Normalized keys of a text: one per word start"""
+        normalized = normalize_text(text).strip()
+        return list(dict.fromkeys(
+            normalized[match.start():match.start() + cls.MAX_KEY_LENGTH]
+            for match in _WORD_START_RE.finditer(normalized)
+        ))
+
+    def _add(self, kind: str, text: str, weight: float, bulk: bool = False) -> None:
+        """Add one contribution to a suggestion (creating it if needed)"""
+        entry_id = self._entry_ids.get((kind, text))
+        if entry_id is None:
+            entry_id = len(self._suggestions)
+            self._suggestions.append(_Suggestion(text, kind))
+            self._weights.append(0.0)
+            self._entry_ids[(kind, text)] = entry_id
+            for key in self._keys_for(text):
+                position = len(self._keys) if bulk else bisect.bisect_right(self._keys, key)
+                self._keys.insert(position, key)
+                self._key_entries.insert(position, entry_id)
+
+        suggestion = self._suggestions[entry_id]
+        suggestion.refs += 1
+        suggestion.weight += weight
+        self._weights[entry_id] = suggestion.weight
+
+    def _remove(self, kind: str, text: str, weight: float) -> None:
+        """Remove one contribution (dropping the suggestion when unused)"""
+        entry_id = self._entry_ids.get((kind, text))
+        if entry_id is None:
+            return
+
+        suggestion = self._suggestions[entry_id]
+        suggestion.refs -= 1
+        suggestion.weight -= weight
+        self._weights[entry_id] = suggestion.weight
+        if suggestion.refs > 0:
+            return
+
+        for key in self._keys_for(text):
+            lo = bisect.bisect_left(self._keys, key)
+            hi = bisect.bisect_right(self._keys, key, lo)
+            try:
+                position = self._key_entries.index(entry_id, lo, hi)
+            except ValueError:
+                continue
+            del self._keys[position]
+            del self._key_entries[position]
+        self._suggestions[entry_id] = None
+        del self._entry_ids[(kind, text)]
+
+    def _item_weight(self, use_count: int, age_days: Optional[float]) -> float:
+        """Weight of an item label from its use count and last use"""
+        recency = 0.0
+        if age_days is not None:
+            recency = 1.0 / (1.0 + max(age_days, 0.0) / self.RECENCY_HALF_LIFE_DAYS)
+        return self.KIND_BASE_WEIGHT[KIND_ITEM] + math.log1p(use_count or 0) + recency
+
+    def _load_items(self, item_ids: Optional[List[int]] = None) -> Dict[int, Tuple[str, float]]:
+        """
+        Read label and weight of active items
+
+        Args:
+            item_ids: Items to read (None = all items)
+
+        Returns:
+            Dict[int, Tuple[str, float]]: item_id -> (label, weight)
+        """
+        conn = self.db.connect()
+        select = """
+            SELECT id, label, use_count,
+                   julianday('now') - julianday(COALESCE(last_used, updated_at, created_at))
+            FROM items
+            WHERE is_active = 1 AND label IS NOT NULL AND label != ''
+        """
+
+        if item_ids is None:
+            batches = [None]
+        else:
+            size = self.db._TAG_BATCH_SIZE
+            batches = [item_ids[i:i + size] for i in range(0, len(item_ids), size)]
+
+        contributions = {}
+        for batch in batches:
+            if batch is None:
+                rows = conn.execute(select)
+            else:
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(f"{select} AND id IN ({placeholders})", tuple(batch))
+            for item_id, label, use_count, age_days in rows:
+                contributions[item_id] = (label.strip(), self._item_weight(use_count, age_days))
+        return contributions
+
+    def _load_section(self, kind: str) -> List[Tuple[str, float]]:
+        """Read (name, weight) pairs of a non-item section"""
+        try:
+            rows = self.db.connect().execute(self._SECTION_QUERIES[kind]).fetchall()
+        except sqlite3.OperationalError as e:
+            # Tabla inexistente en bases antiguas
+            logger.debug(f"Autocomplete section '{kind}' unavailable: {e}")
+            return []
+
+        base = self.KIND_BASE_WEIGHT[kind]
+        return [
+            (name.strip(), base + math.log1p(count or 0))
+            for name, count in rows
+            if name and name.strip()
+        ]
+
+    def _reload_section(self, kind: str) -> None:
+        """Replace the contributions of one section"""
+        for text, weight in self._section_contrib.get(kind, ()):
+            self._remove(kind, text, weight)
+        contributions = self._load_section(kind)
+        for text, weight in contributions:
+            self._add(kind, text, weight)
+        self._section_contrib[kind] = contributions
+
+    def build(self) -> None:
+        """(Re)build the whole index from the database"""
+        start_time = time.time()
+        with self._lock:
+            self._suggestions = []
+            self._entry_ids = {}
+            self._weights = []
+            self._keys = []
+            self._key_entries = []
+            self._item_contrib = self._load_items()
+            self._section_contrib = {kind: self._load_section(kind) for kind in self._SECTION_QUERIES}
+
+            for label, weight in self._item_contrib.values():
+                self._add(KIND_ITEM, label, weight, bulk=True)
+            for kind, contributions in self._section_contrib.items():
+                for text, weight in contributions:
+                    self._add(kind, text, weight, bulk=True)
+            pairs = sorted(zip(self._keys, self._key_entries))
+            self._keys = [key for key, _entry_id in pairs]
+            self._key_entries = [entry_id for _key, entry_id in pairs]
+
+            self._built = True
+            self._dirty_items.clear()
+            self._dirty_sections.clear()
+            self._cache.clear()
+
+        elapsed = (time.time() - start_time) * 1000
+        logger.info(f"Autocomplete index built: {len(self._entry_ids)} suggestions, "
+                    f"{len(self._keys)} keys in {elapsed:.1f}ms")
+
+    def _ensure_current(self) -> None:
+        """Build the index or apply changes published since the last lookup"""
+        with self._lock:
+            if not self._built:
+                self.build()
+                return
+
+            if not self._dirty_items and not self._dirty_sections:
+                return
+
+            if self._dirty_items:
+                dirty = list(self._dirty_items)
+                self._dirty_items.clear()
+                contributions = self._load_items(dirty)
+                for item_id in dirty:
+                    old = self._item_contrib.pop(item_id, None)
+                    if old is not None:
+                        self._remove(KIND_ITEM, *old)
+                    new = contributions.get(item_id)
+                    if new is not None:
+                        self._add(KIND_ITEM, *new)
+                        self._item_contrib[item_id] = new
+
+            for kind in list(self._dirty_sections):
+                self._reload_section(kind)
+            self._dirty_sections.clear()
+            self._cache.clear()
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next lookup"""
+        with self._lock:
+            self._built = False
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Mark what a database write touched for re-indexing"""
+        with self._lock:
+            if not self._built:
+                return
+            if event.table == TABLE_TAGS:
+                self._dirty_sections.add(KIND_TAG)
+            elif event.table == TABLE_CATEGORIES:
+                self._dirty_sections.add(KIND_CATEGORY)
+            elif event.table == TABLE_PROJECTS:
+                self._dirty_sections.add(KIND_PROJECT)
+            elif event.table == TABLE_AREAS:
+                self._dirty_sections.add(KIND_AREA)
+            elif event.table == TABLE_ITEM_TAGS:
+                # Cambia el número de items por tag
+                self._dirty_sections.add(KIND_TAG)
+            elif not event.ids:
+                self._built = False
+            else:
+                self._dirty_items.update(event.ids)
+                # Los contadores de items por categoría también cambian
+                self._dirty_sections.add(KIND_CATEGORY)
+
+    # ==================== LOOKUP ====================
+
+    def suggest(self, prefix: str, limit: int = 10,
+                kinds: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Suggestions starting with a prefix (at any word of the suggestion)
+
+        Args:
+            prefix: Text typed by the user (min 2 characters)
+            limit: Maximum suggestions
+            kinds: Restrict to these kinds (KIND_ITEM, KIND_TAG...; None = all)
+
+        Returns:
+            List[str]: Suggestion texts, best weighted first, without duplicates
+        """
+        normalized = normalize_text(prefix).strip()
+        if len(normalized) < self.MIN_PREFIX_LENGTH:
+            return []
+
+        self._ensure_current()
+
+        kinds_key = tuple(sorted(kinds)) if kinds else None
+        cache_key = (normalized, limit, kinds_key)
+
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            # Rango [lo, hi) de claves que empiezan por el prefijo
+            lo = bisect.bisect_left(self._keys, normalized)
+            hi = bisect.bisect_left(self._keys, normalized + '\U0010ffff', lo)
+            candidates = set(self._key_entries[lo:hi])
+            if kinds_key:
+                suggestions_by_id = self._suggestions
+                candidates = {
+                    entry_id for entry_id in candidates
+                    if suggestions_by_id[entry_id].kind in kinds_key
+                }
+
+            suggestions = self._top_suggestions(candidates, limit)
+
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[cache_key] = suggestions
+
+        logger.debug(f"Autocomplete: '{prefix}' -> {len(suggestions)} suggestions "
+                     f"({len(candidates)} candidates)")
+        return list(suggestions)
+
+    def _top_suggestions(self, candidates: Set[int], limit: int) -> List[str]:
+        """Best weighted distinct texts (same text in several kinds counts once)"""
+        rank = self._weights.__getitem__
+        # Pocos duplicados en la práctica: basta con un margen sobre el límite
+        attempts = (
+            lambda: heapq.nlargest(limit * 2, candidates, key=rank),
+            lambda: sorted(candidates, key=rank, reverse=True),
+        )
+        suggestions = []
+        seen = set()
+        for attempt in attempts:
+            suggestions.clear()
+            seen.clear()
+            for entry_id in attempt():
+                text = self._suggestions[entry_id].text
+                folded = text.casefold()
+                if folded in seen:
+                    continue
+                seen.add(folded)
+                suggestions.append(text)
+                if len(suggestions) >= limit:
+                    return suggestions
+        return suggestions
+
+    def get_stats(self) -> Dict:
+        """Index size statistics"""
+        with self._lock:
+            return {
+                'built': self._built,
+                'suggestions': len(self._entry_ids),
+                'keys': len(self._keys),
+                'items': len(self._item_contrib),
+                'cached_prefixes': len(self._cache),
+                'pending_items': len(self._dirty_items)
+            }
+
+
+# === SINGLETON PATTERN ===
+# One autocomplete index per database file
+
+_instances: Dict[str, AutocompleteService] = {}
+_instances_lock = threading.Lock()
+
+
+def get_autocomplete_service(db_manager) -> AutocompleteService:
+    """
+    Get the shared AutocompleteService for a database
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        AutocompleteService: Service shared by every search input
+    """
+    key = str(db_manager.db_path)
+    with _instances_lock:
+        service = _instances.get(key)
+        if service is None:
+            service = _instances[key] = AutocompleteService(db_manager)
+            logger.info(f"AutocompleteService created for {key}")
+    return service
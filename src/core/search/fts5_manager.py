@@ -2,7 +2,7 @@
 FTS5 Manager - Full-Text Search engine using SQLite FTS5
 
 Provides ultra-fast text search with:
-- Basic search with BM25 ranking
+- Basic search with hybrid ranking (BM25 x precomputed usage score)
 - Boolean operators (AND, OR, NOT)
 - Wildcards (*)
 - Phrase search ("exact phrase")
@@ -44,7 +44,10 @@ class FTS5Manager:
         offset: int = 0
     ) -> Tuple[List[Dict], float]:
         """
-        Basic FTS5 search with BM25 ranking
+        Basic FTS5 search with hybrid ranking
+
+        Results are ordered by BM25 relevance boosted by the precomputed usage
+        score of each item (decayed usage, recency, favorite), entirely in SQL.
 
         Args:
             query: Search query (e.g., "git push")
@@ -63,7 +66,7 @@ class FTS5Manager:
         cursor = conn.cursor()
 
         try:
-            results = cursor.execute("""
+            results = cursor.execute(f"""
                 SELECT
                     i.id,
                     i.category_id,
@@ -79,10 +82,11 @@ class FTS5Manager:
                     c.name as category_name,
                     c.icon as category_icon,
                     c.color as category_color,
-                    bm25(items_fts, 10.0, 5.0, 3.0, 2.0, 1.0) as rank_score
+                    {self.db.HYBRID_RANK_SQL} as rank_score
                 FROM items_fts
                 JOIN items i ON items_fts.rowid = i.id
                 LEFT JOIN categories c ON i.category_id = c.id
+                LEFT JOIN item_usage_scores us ON us.item_id = i.id
                 WHERE items_fts MATCH ?
                   AND i.is_active = 1
                 ORDER BY rank_score
@@ -98,12 +102,9 @@ class FTS5Manager:
                 'category_name', 'category_icon', 'category_color', 'rank_score'
             ]
 
-            results_list = []
-            for row in results:
-                result_dict = dict(zip(columns, row))
-                # Load tags from relational structure
-                result_dict['tags'] = self.db.get_tags_by_item(result_dict['id'])
-                results_list.append(result_dict)
+            results_list = [dict(zip(columns, row)) for row in results]
+            # Load tags from relational structure in a single bulk query
+            self.db.attach_tags(results_list)
 
             logger.info(f"FTS5 basic search: '{query}' -> {len(results_list)} results in {execution_time:.2f}ms")
 
@@ -185,7 +186,7 @@ class FTS5Manager:
         cursor = conn.cursor()
 
         try:
-            results = cursor.execute("""
+            results = cursor.execute(f"""
                 SELECT
                     i.id,
                     i.category_id,
@@ -201,10 +202,11 @@ class FTS5Manager:
                     c.icon as category_icon,
                     snippet(items_fts, 1, '<mark>', '</mark>', '...', ?) as label_snippet,
                     snippet(items_fts, 2, '<mark>', '</mark>', '...', ?) as content_snippet,
-                    bm25(items_fts) as rank_score
+                    {self.db.HYBRID_RANK_SQL} as rank_score
                 FROM items_fts
                 JOIN items i ON items_fts.rowid = i.id
                 LEFT JOIN categories c ON i.category_id = c.id
+                LEFT JOIN item_usage_scores us ON us.item_id = i.id
                 WHERE items_fts MATCH ?
                   AND i.is_active = 1
                 ORDER BY rank_score
@@ -220,12 +222,9 @@ class FTS5Manager:
                 'category_name', 'category_icon', 'label_snippet', 'content_snippet', 'rank_score'
             ]
 
-            results_list = []
-            for row in results:
-                result_dict = dict(zip(columns, row))
-                # Load tags from relational structure
-                result_dict['tags'] = self.db.get_tags_by_item(result_dict['id'])
-                results_list.append(result_dict)
+            results_list = [dict(zip(columns, row)) for row in results]
+            # Load tags from relational structure in a single bulk query
+            self.db.attach_tags(results_list)
 
             logger.info(f"FTS5 search with highlighting: '{query}' -> {len(results_list)} results in {execution_time:.2f}ms")
 
@@ -302,6 +301,7 @@ class FTS5Manager:
         FTS5 search combined with SQL filters
 
         Combines power of full-text search with traditional filters
+        (same hybrid ranking as search_basic)
 
         Args:
             query: FTS5 search query
@@ -382,10 +382,11 @@ class FTS5Manager:
                     i.created_at,
                     c.name as category_name,
                     c.icon as category_icon,
-                    bm25(items_fts) as rank_score
+                    {self.db.HYBRID_RANK_SQL} as rank_score
                 FROM items_fts
                 JOIN items i ON items_fts.rowid = i.id
                 LEFT JOIN categories c ON i.category_id = c.id
+                LEFT JOIN item_usage_scores us ON us.item_id = i.id
                 WHERE {where_sql}
                 ORDER BY rank_score
                 LIMIT ?
@@ -400,12 +401,9 @@ class FTS5Manager:
                 'category_name', 'category_icon', 'rank_score'
             ]
 
-            results_list = []
-            for row in results:
-                result_dict = dict(zip(columns, row))
-                # Load tags from relational structure
-                result_dict['tags'] = self.db.get_tags_by_item(result_dict['id'])
-                results_list.append(result_dict)
+            results_list = [dict(zip(columns, row)) for row in results]
+            # Load tags from relational structure in a single bulk query
+            self.db.attach_tags(results_list)
 
             filter_info = {
                 'types': item_types,
@@ -513,3 +511,65 @@ class FTS5Manager:
                 'categories_indexed': 0,
                 'index_size_kb': 0
             }
+
+    def check_integrity(self) -> Dict:
+        """
+        Verify that items_fts matches the items table
+
+        Compares the rowids stored in the index with the items it should
+        contain and runs FTS5's own 'integrity-check' against the content
+        source, which detects stale tokens left by missed updates.
+
+        Returns:
+            Dictionary with ok, indexed, expected, missing, orphaned and error
+
+        Example:
+            report = fts5.check_integrity()
+            if not report['ok']:
+                fts5.rebuild_index()
+        """
+        conn = self.db.connect()
+        cursor = conn.cursor()
+
+        report = {
+            'ok': False,
+            'indexed': 0,
+            'expected': 0,
+            'missing': 0,
+            'orphaned': 0,
+            'error': None
+        }
+
+        try:
+            cursor.execute("SELECT COUNT(*) FROM items_fts_docsize")
+            report['indexed'] = cursor.fetchone()[0]
+
+            cursor.execute("SELECT COUNT(*) FROM items")
+            report['expected'] = cursor.fetchone()[0]
+
+            cursor.execute("""
+                SELECT COUNT(*) FROM items
+                WHERE id NOT IN (SELECT id FROM items_fts_docsize)
+            """)
+            report['missing'] = cursor.fetchone()[0]
+
+            cursor.execute("""
+                SELECT COUNT(*) FROM items_fts_docsize
+                WHERE id NOT IN (SELECT id FROM items)
+            """)
+            report['orphaned'] = cursor.fetchone()[0]
+
+            # rank = 1: compara también el índice con items_fts_source
+            cursor.execute("INSERT INTO items_fts(items_fts, rank) VALUES('integrity-check', 1)")
+
+            report['ok'] = report['missing'] == 0 and report['orphaned'] == 0
+
+        except sqlite3.Error as e:
+            report['error'] = str(e)
+            logger.error(f"FTS5 integrity check failed: {e}")
+
+        if report['ok']:
+            logger.info(f"FTS5 index OK ({report['indexed']} items)")
+        else:
+            logger.warning(f"FTS5 index out of sync: {report}")
+        return report
@@ -0,0 +1,400 @@
+"""
+Fuzzy Search Engine - Typo-tolerant search over item labels and tags
+
+Uses an in-memory trigram index over the vocabulary of label/tag words:
+- Trigram postings select candidate words (q-gram lemma: a word within edit
+  distance k of the query loses at most 3*k of its trigrams)
+- Query words too short for that filter ("gt" shares no trigram with "git")
+  are also compared against every vocabulary word of similar length
+- Bounded edit distance (with transpositions) ranks the candidates
+- Word -> item postings turn matched words into ranked item IDs
+
+The index is built lazily on first search and kept current through the
+DataChangeBus (only the changed items are re-indexed).
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.core.cache_invalidation import (
+    get_data_change_bus, DataChangeEvent,
+    TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS
+)
+
+logger = logging.getLogger(__name__)
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and strip diacritics ('Canción' -> 'cancion')"""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split normalized text into words of 2+ characters"""
+    return [word for word in _WORD_RE.findall(normalize_text(text)) if len(word) > 1]
+
+
+def trigrams(word: str) -> Set[str]:
+    """Trigrams of a word padded with one space on each side"""
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Edit distance with early exit
+
+    Optimal string alignment: an adjacent transposition ("gti" -> "git")
+    counts as a single edit, like an insertion, deletion or substitution.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Distances above this value are not computed exactly
+
+    Returns:
+        int: Edit distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) > len(b):
+        a, b = b, a
+
+    before_previous: List[int] = []
+    previous = list(range(len(a) + 1))
+    for j, char_b in enumerate(b, 1):
+        current = [j]
+        row_min = j
+        for i, char_a in enumerate(a, 1):
+            cost = min(
+                previous[i] + 1,
+                current[i - 1] + 1,
+                previous[i - 1] + (char_a != char_b)
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before_previous[i - 2] + 1)
+            current.append(cost)
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+def max_edits(word: str) -> int:
+    """Allowed typos for a query word of this length"""
+    if len(word) <= 4:
+        return 1
+    if len(word) <= 8:
+        return 2
+    return 3
+
+
+class FuzzySearchEngine:
+    """
+    Trigram + edit distance search over item labels and tags
+
+    Usage:
+        engine = get_fuzzy_search_engine(db_manager)
+        ranked = engine.search("dokcer compse")  # [(item_id, score), ...]
+    """
+
+    # Penalización para coincidencias por prefijo ('dock' -> 'docker')
+    PREFIX_PENALTY = 0.5
+    MIN_PREFIX_LENGTH = 3
+    # Palabras de consulta más cortas: escaneo por longitud además de trigramas
+    SHORT_QUERY_LENGTH = 4
+
+    def __init__(self, db_manager):
+        """
+        Initialize Fuzzy Search Engine
+
+        Args:
+            db_manager: Database manager instance
+        """
+        # Referencia débil: el registro de motores está indexado por el DBManager
+        self._db_ref = weakref.ref(db_manager)
+
+        self._words: List[str] = []                    # word_id -> word
+        self._word_ids: Dict[str, int] = {}            # word -> word_id
+        self._gram_words: Dict[str, Set[int]] = defaultdict(set)   # trigram -> word IDs
+        self._word_items: Dict[int, Set[int]] = defaultdict(set)   # word_id -> item IDs
+        self._item_words: Dict[int, Set[int]] = {}     # item_id -> word IDs
+        self._length_words: Dict[int, Set[int]] = defaultdict(set)  # longitud -> word IDs (cortas)
+
+        self._built = False
+        self._dirty_items: Set[int] = set()
+        self._lock = threading.RLock()
+
+        get_data_change_bus().subscribe(
+            self._on_data_changed, tables=[TABLE_ITEMS, TABLE_ITEM_TAGS, TABLE_TAGS]
+        )
+
+    @property
+    def db(self):
+        """DBManager this index belongs to"""
+        db_manager = self._db_ref()
+        if db_manager is None:
+            raise RuntimeError("FuzzySearchEngine used after its DBManager was released")
+        return db_manager
+
+    # ==================== INDEX MAINTENANCE ====================
+
+    def _load_item_texts(self, item_ids: Optional[List[int]] = None) -> Dict[int, List[str]]:
+        """
+        Read labels and tag names of items
+
+        Args:
+            item_ids: Items to read (None = all items)
+
+        Returns:
+            Dict[int, List[str]]: item_id -> texts to index
+        """
+        texts: Dict[int, List[str]] = {}
+        conn = self.db.connect()
+
+        if item_ids is None:
+            batches = [None]
+        else:
+            size = self.db._TAG_BATCH_SIZE
+            batches = [item_ids[i:i + size] for i in range(0, len(item_ids), size)]
+
+        for batch in batches:
+            if batch is None:
+                where, params = '', ()
+            else:
+                placeholders = ','.join('?' * len(batch))
+                where, params = f"WHERE id IN ({placeholders})", tuple(batch)
+
+            for row in conn.execute(f"SELECT id, label FROM items {where}", params):
+                texts[row[0]] = [row[1] or '']
+
+            tag_where = where.replace('id IN', 'it.item_id IN')
+            for row in conn.execute(f"""
+                SELECT it.item_id, t.name FROM item_tags it
+                JOIN tags t ON t.id = it.tag_id
+                {tag_where}
+            """, params):
+                if row[0] in texts:
+                    texts[row[0]].append(row[1] or '')
+
+        return texts
+
+    def _word_id(self, word: str) -> int:
+        """Get or register a vocabulary word"""
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = len(self._words)
+            self._words.append(word)
+            self._word_ids[word] = word_id
+            for gram in trigrams(word):
+                self._gram_words[gram].add(word_id)
+            # Consultas cortas (< SHORT_QUERY_LENGTH, 1 errata) alcanzan palabras de hasta esa longitud
+            if len(word) <= self.SHORT_QUERY_LENGTH:
+                self._length_words[len(word)].add(word_id)
+        return word_id
+
+    def _index_item(self, item_id: int, texts: List[str]) -> None:
+        """Add an item's words to the postings"""
+        word_ids = {self._word_id(word) for text in texts for word in tokenize(text)}
+        self._item_words[item_id] = word_ids
+        for word_id in word_ids:
+            self._word_items[word_id].add(item_id)
+
+    def _unindex_item(self, item_id: int) -> None:
+        """Remove an item from the postings (vocabulary words are kept)"""
+        for word_id in self._item_words.pop(item_id, ()):
+            self._word_items[word_id].discard(item_id)
+
+    def build(self) -> None:
+        """(Re)build the whole index from the database"""
+        start_time = time.time()
+        with self._lock:
+            self._words = []
+            self._word_ids = {}
+            self._gram_words = defaultdict(set)
+            self._word_items = defaultdict(set)
+            self._item_words = {}
+            self._length_words = defaultdict(set)
+
+            for item_id, texts in self._load_item_texts().items():
+                self._index_item(item_id, texts)
+
+            self._built = True
+            self._dirty_items.clear()
+
+        elapsed = (time.time() - start_time) * 1000
+        logger.info(f"Fuzzy index built: {len(self._item_words)} items, "
+                    f"{len(self._words)} words in {elapsed:.1f}ms")
+
+    def _ensure_current(self) -> None:
+        """Build the index or re-index items changed since the last search"""
+        with self._lock:
+            if not self._built:
+                self.build()
+                return
+            if not self._dirty_items:
+                return
+            dirty = list(self._dirty_items)
+            self._dirty_items.clear()
+
+            texts = self._load_item_texts(dirty)
+            for item_id in dirty:
+                self._unindex_item(item_id)
+                if item_id in texts:
+                    self._index_item(item_id, texts[item_id])
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next search"""
+        with self._lock:
+            self._built = False
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Mark items touched by a database write for re-indexing"""
+        with self._lock:
+            if not self._built:
+                return
+            if event.table == TABLE_TAGS or not event.ids:
+                # Renombrar/borrar un tag afecta a un número desconocido de items
+                self._built = False
+            else:
+                self._dirty_items.update(event.ids)
+
+    # ==================== SEARCH ====================
+
+    def _match_word(self, query_word: str) -> Dict[int, float]:
+        """
+        Find vocabulary words close to a query word
+
+        Args:
+            query_word: Normalized query word
+
+        Returns:
+            Dict[int, float]: word_id -> distance (prefix matches are penalized)
+        """
+        k = max_edits(query_word)
+        query_grams = trigrams(query_word)
+        allow_prefix = len(query_word) >= self.MIN_PREFIX_LENGTH
+
+        # Conteo de trigramas compartidos por palabra candidata
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for word_id in self._gram_words.get(gram, ()):
+                shared[word_id] += 1
+
+        # Un prefijo pierde además el trigrama final ("xy ")
+        min_shared = max(1, len(query_grams) - 3 * k - (1 if allow_prefix else 0))
+        query_len = len(query_word)
+        candidates = {word_id for word_id, count in shared.items() if count >= min_shared}
+
+        # Consultas cortas: una sola errata puede no dejar trigramas en común,
+        # así que se comparan también todas las palabras de longitud parecida
+        if query_len < self.SHORT_QUERY_LENGTH:
+            for length in range(query_len - k, query_len + k + 1):
+                candidates.update(self._length_words.get(length, ()))
+
+        matches: Dict[int, float] = {}
+        for word_id in candidates:
+            word = self._words[word_id]
+
+            distance = bounded_levenshtein(query_word, word, k)
+            if allow_prefix and len(word) > query_len:
+                prefix_distance = bounded_levenshtein(query_word, word[:query_len], k)
+                distance = min(distance, prefix_distance + self.PREFIX_PENALTY)
+
+            if distance <= k:
+                matches[word_id] = distance
+
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Rank items whose label/tags match every query word within the typo budget
+
+        Args:
+            query: Free text query
+            limit: Maximum number of item IDs (None = all matches)
+
+        Returns:
+            List[Tuple[int, float]]: (item_id, score) sorted by score, lower is better
+        """
+        query_words = list(dict.fromkeys(tokenize(query)))
+        if not query_words:
+            return []
+
+        self._ensure_current()
+
+        with self._lock:
+            scores: Optional[Dict[int, float]] = None
+            for query_word in query_words:
+                word_scores: Dict[int, float] = {}
+                for word_id, distance in self._match_word(query_word).items():
+                    for item_id in self._word_items.get(word_id, ()):
+                        if distance < word_scores.get(item_id, float('inf')):
+                            word_scores[item_id] = distance
+
+                if scores is None:
+                    scores = word_scores
+                else:
+                    # Todas las palabras de la consulta deben coincidir
+                    scores = {
+                        item_id: score + word_scores[item_id]
+                        for item_id, score in scores.items()
+                        if item_id in word_scores
+                    }
+                if not scores:
+                    return []
+
+        ranked = sorted(scores.items(), key=lambda entry: (entry[1], entry[0]))
+        return ranked[:limit] if limit is not None else ranked
+
+    def get_stats(self) -> Dict:
+        """Index size statistics"""
+        with self._lock:
+            return {
+                'built': self._built,
+                'items': len(self._item_words),
+                'words': len(self._words),
+                'trigrams': len(self._gram_words),
+                'pending_items': len(self._dirty_items)
+            }
+
+
+# === SINGLETON PATTERN ===
+# One fuzzy index per DBManager (every ":memory:" database is a different one);
+# the entry goes away with its manager
+
+_instances: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_instances_lock = threading.Lock()
+
+
+def get_fuzzy_search_engine(db_manager) -> FuzzySearchEngine:
+    """
+    Get the shared FuzzySearchEngine for a database
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        FuzzySearchEngine: Engine shared by every search window
+    """
+    with _instances_lock:
+        engine = _instances.get(db_manager)
+        if engine is None:
+            engine = _instances[db_manager] = FuzzySearchEngine(db_manager)
+            logger.info(f"FuzzySearchEngine created for {db_manager.db_path}")
+    return engine
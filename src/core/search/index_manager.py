@@ -92,7 +92,7 @@ class IndexManager:
             """,
         ]
 
-        cursor = self.db.connection.cursor()
+        cursor = self.db.connect().cursor()
 
         created_count = 0
         for index_sql in indexes_sql:
@@ -102,7 +102,7 @@ class IndexManager:
             except sqlite3.OperationalError as e:
                 logger.warning(f"Index creation skipped: {e}")
 
-        self.db.connection.commit()
+        self.db.connect().commit()
 
         logger.info(f"Created/verified {created_count} B-Tree indexes for search")
 
@@ -115,11 +115,11 @@ class IndexManager:
         Runs ANALYZE command to update SQLite query planner statistics
         Should be run periodically (e.g., after bulk operations)
         """
-        cursor = self.db.connection.cursor()
+        cursor = self.db.connect().cursor()
 
         try:
             cursor.execute("ANALYZE")
-            self.db.connection.commit()
+            self.db.connect().commit()
 
             logger.info("Index statistics updated successfully")
             return True
@@ -146,7 +146,7 @@ class IndexManager:
                 ...
             ]
         """
-        cursor = self.db.connection.cursor()
+        cursor = self.db.connect().cursor()
 
         try:
             # Get all indexes
@@ -179,7 +179,7 @@ class IndexManager:
         WARNING: This will slow down searches until indexes are recreated
         Use only for maintenance or migration purposes
         """
-        cursor = self.db.connection.cursor()
+        cursor = self.db.connect().cursor()
 
         # Get all search index names
         cursor.execute("""
@@ -200,7 +200,7 @@ class IndexManager:
             except Exception as e:
                 logger.error(f"Failed to drop index {index_name}: {e}")
 
-        self.db.connection.commit()
+        self.db.connect().commit()
 
         logger.info(f"Dropped {dropped_count} search indexes")
 
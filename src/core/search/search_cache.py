@@ -0,0 +1,265 @@
+"""
+Search Cache - Shared LRU cache for search results
+
+Entries are keyed by (database, engine, mode, normalized query, filters, page)
+and stamped with the DBManager data generation at the time they were computed.
+Any item/tag/category/relation write bumps the generation, so stale entries
+are detected on lookup without the engines having to track writes themselves.
+
+Bounded by entry count and by an estimate of the memory held, with a TTL as a
+safety net for writes made outside DBManager.
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.core.cache_invalidation import get_cache_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str, exact: bool = False) -> str:
+    """
+    Case-fold and collapse whitespace ('  Git   PUSH ' -> 'git push')
+
+    With exact=True inner whitespace is kept ('  Git   PUSH ' -> 'git   push'):
+    substring (LIKE) searches match it literally.
+    """
+    if exact:
+        return (query or '').strip().casefold()
+    return ' '.join((query or '').split()).casefold()
+
+
+def _filters_key(filters: Any) -> str:
+    """Stable, hashable representation of a filters dict"""
+    if not filters:
+        return ''
+    return json.dumps(filters, sort_keys=True, default=str)
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Approximate memory held by a result (lists/dicts of scalars and dataclasses)
+
+    Args:
+        value: Cached value
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+                    for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, _depth + 1) for v in value)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _depth + 1)
+    return size
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    generation: int
+    created_at: float
+    size: int
+
+
+class SearchCache:
+    """
+    LRU cache of search results validated by data generation and TTL
+
+    Usage:
+        cache = get_search_cache()
+        key = cache.make_key(db, 'universal', 'ids', query)
+        ids = cache.get_or_compute(key, db.data_generation, lambda: compute(query))
+    """
+
+    CACHE_NAME = 'search_results'
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024,
+                 ttl_seconds: float = 300.0):
+        """
+        Initialize Search Cache
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum estimated memory of all cached results
+            ttl_seconds: Maximum age of an entry
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._metrics = get_cache_metrics()
+
+    @staticmethod
+    def make_key(db_manager, engine: str, mode: str, query: str,
+                 filters: Any = None, page: Any = None, exact: bool = False) -> Tuple:
+        """
+        Build a cache key
+
+        Args:
+            db_manager: DBManager whose data the result comes from
+            engine: Engine name ('universal', 'advanced', 'fts5'...)
+            mode: Search mode or method name
+            query: Raw query text (normalized here)
+            filters: Filters dict (any JSON-serializable structure)
+            page: Page descriptor, e.g. (limit, offset)
+            exact: The search matches the query as a substring, so inner
+                whitespace is part of the key (see normalize_query)
+
+        Returns:
+            Tuple: Hashable key
+        """
+        return (
+            str(db_manager.db_path), engine, mode,
+            normalize_query(query, exact), _filters_key(filters), page
+        )
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def get(self, key: Hashable, generation: int) -> Optional[Any]:
+        """
+        Look up a result
+
+        Args:
+            key: Key from make_key()
+            generation: Current data generation of the database
+
+        Returns:
+            Cached value, or None if missing, stale or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expired = time.monotonic() - entry.created_at > self.ttl_seconds
+                if entry.generation != generation or expired:
+                    self._drop(key)
+                    self._metrics.record_eviction(self.CACHE_NAME)
+                    entry = None
+                else:
+                    self._entries.move_to_end(key)
+
+        if entry is None:
+            self._metrics.record_miss(self.CACHE_NAME)
+            return None
+
+        self._metrics.record_hit(self.CACHE_NAME)
+        # Copia superficial: el llamador puede reordenar/filtrar su lista
+        if isinstance(entry.value, list):
+            return list(entry.value)
+        return entry.value
+
+    def put(self, key: Hashable, generation: int, value: Any) -> None:
+        """
+        Store a result
+
+        Args:
+            key: Key from make_key()
+            generation: Data generation read BEFORE computing the value
+            value: Result to cache
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = _CacheEntry(value, generation, time.monotonic(), size)
+            self._total_bytes += size
+
+            evicted = 0
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._total_bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._drop(oldest_key)
+                evicted += 1
+
+        self._metrics.record_eviction(self.CACHE_NAME, evicted)
+
+    def get_or_compute(self, key: Hashable, generation: int, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result or compute and store it
+
+        Args:
+            key: Key from make_key()
+            generation: Current data generation of the database
+            compute: Callable producing the result on a miss
+
+        Returns:
+            Result
+        """
+        value = self.get(key, generation)
+        if value is not None:
+            return value
+
+        value = compute()
+        self.put(key, generation, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            evicted = len(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+        self._metrics.record_eviction(self.CACHE_NAME, evicted)
+
+    def get_stats(self) -> Dict:
+        """
+        Cache statistics
+
+        Returns:
+            Dict with entries, estimated bytes, limits and hits/misses/evictions/hit_rate
+        """
+        with self._lock:
+            stats = {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds
+            }
+        stats.update(self._metrics.get_stats(self.CACHE_NAME))
+        return stats
+
+
+# === SINGLETON PATTERN ===
+# Single result cache shared by every search engine
+
+_search_cache_instance = None
+
+
+def get_search_cache() -> SearchCache:
+    """
+    Get singleton instance of SearchCache
+
+    Example:
+        from src.core.search.search_cache import get_search_cache
+
+        cache = get_search_cache()
+        print(cache.get_stats()['hit_rate'])
+    """
+    global _search_cache_instance
+
+    if _search_cache_instance is None:
+        _search_cache_instance = SearchCache()
+        logger.info("Global SearchCache instance created")
+
+    return _search_cache_instance
@@ -0,0 +1,271 @@
+"""
+Usage Scores - Precomputed per-item usage signal for hybrid ranking
+
+Search ranking multiplies the BM25 relevance by (1 + usage_score), where
+usage_score in [0, 1] combines:
+- Decayed usage: executions in item_usage_history weighted by
+  0.5 ** (age_days / USAGE_HALF_LIFE_DAYS), plus a small share of use_count
+  for items used before the history table existed
+- Recency: 0.5 ** (days since last_used / RECENCY_HALF_LIFE_DAYS)
+- Favorites: flat boost for is_favorite
+
+Scores are stored in item_usage_scores so ranking stays a single SQL query.
+A background thread refreshes the items touched since the last pass and
+recomputes every score periodically (decay keeps running without writes).
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from src.core.cache_invalidation import get_data_change_bus, DataChangeEvent, TABLE_ITEMS
+
+logger = logging.getLogger(__name__)
+
+
+class UsageScoreManager:
+    """
+    Computes and persists item usage scores, refreshed in the background
+
+    Usage:
+        manager = get_usage_score_manager(db)
+        manager.start()              # once, at application startup
+        manager.refresh()            # full recompute (blocking)
+        manager.refresh([1, 2, 3])   # only these items
+    """
+
+    W_USAGE = 0.5
+    W_RECENCY = 0.3
+    W_FAVORITE = 0.2
+
+    USAGE_HALF_LIFE_DAYS = 30.0
+    RECENCY_HALF_LIFE_DAYS = 30.0
+    # Peso de use_count (contador histórico sin fecha) frente a item_usage_history
+    LEGACY_USE_COUNT_WEIGHT = 0.1
+
+    REFRESH_INTERVAL_SECONDS = 60.0
+    FULL_REFRESH_INTERVAL_SECONDS = 6 * 3600.0
+    _BATCH_SIZE = 900
+
+    def __init__(self, db_manager):
+        """
+        Initialize Usage Score Manager
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db = db_manager
+
+        # Máximo de uso decaído en el último refresco completo (normaliza a [0, 1])
+        self._usage_max: Optional[float] = None
+        self._last_history_id = 0
+        self._last_full_refresh = 0.0
+        self._dirty_items: Set[int] = set()
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'full_refreshes': 0, 'incremental_refreshes': 0,
+                       'items_scored': 0, 'last_refresh_ms': 0.0}
+
+        get_data_change_bus().subscribe(self._on_data_changed, tables=[TABLE_ITEMS])
+
+    # ==================== COMPUTATION ====================
+
+    def _compute(self, item_ids: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        """
+        Compute scores for the given items (all items if None)
+
+        Returns:
+            Dict[int, float]: item_id -> score (0 for items without signal)
+        """
+        conn = self.db.connect()
+        if item_ids is None:
+            batches = [None]
+        else:
+            ids = list(item_ids)
+            batches = [ids[i:i + self._BATCH_SIZE] for i in range(0, len(ids), self._BATCH_SIZE)]
+
+        rows = []
+        for batch in batches:
+            where = '' if batch is None else f"WHERE i.id IN ({','.join('?' * len(batch))})"
+            params = () if batch is None else batch
+            # El historial se agrega por (item, día) en SQL; aquí solo se aplica el decaimiento
+            rows.extend(conn.execute(f"""
+                SELECT i.id, i.is_favorite, i.use_count,
+                       julianday('now') - julianday(i.last_used) AS last_used_age,
+                       h.age_days, h.uses
+                FROM items i
+                LEFT JOIN (
+                    SELECT item_id,
+                           CAST(julianday('now') - julianday(used_at) AS INTEGER) AS age_days,
+                           COUNT(*) AS uses
+                    FROM item_usage_history
+                    GROUP BY item_id, age_days
+                ) h ON h.item_id = i.id
+                {where}
+            """, params).fetchall())
+
+        items: Dict[int, list] = {}
+        for item_id, is_favorite, use_count, last_used_age, age_days, uses in rows:
+            item = items.get(item_id)
+            if item is None:
+                item = items[item_id] = [is_favorite, use_count or 0, last_used_age, 0.0]
+            if uses:
+                item[3] += uses * 0.5 ** (max(age_days or 0, 0) / self.USAGE_HALF_LIFE_DAYS)
+
+        raw_usage = {
+            item_id: math.log1p(decayed + self.LEGACY_USE_COUNT_WEIGHT * use_count)
+            for item_id, (_, use_count, _, decayed) in items.items()
+        }
+        if item_ids is None or self._usage_max is None:
+            self._usage_max = max(raw_usage.values(), default=0.0)
+        usage_max = self._usage_max or 1.0
+
+        scores = {}
+        for item_id, (is_favorite, _, last_used_age, _) in items.items():
+            usage = min(raw_usage[item_id] / usage_max, 1.0)
+            recency = (0.5 ** (max(last_used_age, 0) / self.RECENCY_HALF_LIFE_DAYS)
+                       if last_used_age is not None else 0.0)
+            score = (self.W_USAGE * usage + self.W_RECENCY * recency
+                     + self.W_FAVORITE * (1 if is_favorite else 0))
+            scores[item_id] = round(score, 6)
+        return scores
+
+    def refresh(self, item_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recompute and store usage scores
+
+        Args:
+            item_ids: Items to refresh; None recomputes every item and
+                drops scores of deleted items
+
+        Returns:
+            int: Number of items scored
+        """
+        start = time.perf_counter()
+        full = item_ids is None
+        with self._lock:
+            history_id = self.db.connect().execute(
+                "SELECT COALESCE(MAX(id), 0) FROM item_usage_history"
+            ).fetchone()[0]
+            scores = self._compute(item_ids)
+            self.db.save_usage_scores(scores, replace_all=full)
+
+            self._last_history_id = max(self._last_history_id, history_id)
+            if full:
+                self._last_full_refresh = time.monotonic()
+                self._stats['full_refreshes'] += 1
+            else:
+                self._stats['incremental_refreshes'] += 1
+            self._stats['items_scored'] += len(scores)
+            self._stats['last_refresh_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+        logger.debug(f"Usage scores refreshed: {len(scores)} items (full={full})")
+        return len(scores)
+
+    def _pending_items(self) -> Set[int]:
+        """Items changed through DBManager or executed since the last pass"""
+        with self._lock:
+            pending, self._dirty_items = self._dirty_items, set()
+            last_id = self._last_history_id
+        rows = self.db.connect().execute(
+            "SELECT DISTINCT item_id FROM item_usage_history WHERE id > ?", (last_id,)
+        ).fetchall()
+        pending.update(row[0] for row in rows)
+        return pending
+
+    # ==================== BACKGROUND REFRESH ====================
+
+    def _on_data_changed(self, event: DataChangeEvent) -> None:
+        """Mark changed items dirty (favorite toggles, last_used updates...)"""
+        if event.ids:
+            with self._lock:
+                self._dirty_items.update(event.ids)
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Background loop: incremental passes, periodic full recompute"""
+        while not self._stop.is_set():
+            try:
+                full_due = (self._usage_max is None or time.monotonic() - self._last_full_refresh
+                            > self.FULL_REFRESH_INTERVAL_SECONDS)
+                if full_due:
+                    self.refresh()
+                else:
+                    pending = self._pending_items()
+                    if pending:
+                        self.refresh(pending)
+            except Exception as e:
+                logger.error(f"Error refreshing usage scores: {e}")
+
+            self._wakeup.wait(self.REFRESH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        """Start the background refresh thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="UsageScoreRefresh", daemon=True)
+        self._thread.start()
+        logger.info("Usage score refresh thread started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background refresh thread"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict:
+        """
+        Refresh statistics
+
+        Returns:
+            Dict with refresh counters, pending items and thread state
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending_items'] = len(self._dirty_items)
+        stats['running'] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+
+# === SINGLETON PATTERN ===
+# One score manager (and refresh thread) per database file
+
+_instances: Dict[str, UsageScoreManager] = {}
+_instances_lock = threading.Lock()
+
+
+def get_usage_score_manager(db_manager) -> UsageScoreManager:
+    """
+    Get the shared UsageScoreManager for a database
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        UsageScoreManager: Manager shared by every search engine
+    """
+    key = str(db_manager.db_path)
+    with _instances_lock:
+        manager = _instances.get(key)
+        if manager is None:
+            manager = _instances[key] = UsageScoreManager(db_manager)
+            logger.info(f"UsageScoreManager created for {key}")
+    return manager
+
+
+def stop_usage_score_managers(timeout: float = 5.0) -> None:
+    """Stop the refresh thread of every score manager"""
+    with _instances_lock:
+        managers = list(_instances.values())
+
+    for manager in managers:
+        manager.stop(timeout)
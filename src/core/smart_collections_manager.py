@@ -11,6 +11,8 @@ import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from src.database.connection_pool import get_connection_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,19 +27,17 @@ class SmartCollectionsManager:
             db_path: Ruta al archivo de base de datos SQLite
         """
         self.db_path = db_path
+        self._pool = get_connection_pool(db_path)
         logger.info("SmartCollectionsManager initialized")
 
     def _get_connection(self) -> sqlite3.Connection:
         """
-        Obtener conexión a la base de datos
+        Obtener la conexión del hilo actual desde el pool compartido
 
         Returns:
-            Conexión SQLite
+            Conexión SQLite (close() la devuelve al pool)
         """
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        return self._pool.get_connection()
 
     # ========== CREATE ==========
 
@@ -95,27 +95,25 @@ class SmartCollectionsManager:
                 logger.error(f"Invalid item_type: {item_type}")
                 return None
 
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._pool.writer() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                INSERT INTO smart_collections (
-                    name, description, icon, color,
+                cursor.execute("""
+                    INSERT INTO smart_collections (
+                        name, description, icon, color,
+                        tags_include, tags_exclude, category_id, item_type,
+                        is_favorite, is_sensitive, is_active_filter, is_archived_filter,
+                        search_text, date_from, date_to, is_active
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    name.strip(), description, icon, color,
                     tags_include, tags_exclude, category_id, item_type,
                     is_favorite, is_sensitive, is_active_filter, is_archived_filter,
                     search_text, date_from, date_to, is_active
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                name.strip(), description, icon, color,
-                tags_include, tags_exclude, category_id, item_type,
-                is_favorite, is_sensitive, is_active_filter, is_archived_filter,
-                search_text, date_from, date_to, is_active
-            ))
-
-            collection_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+                ))
+
+                collection_id = cursor.lastrowid
 
             logger.info(f"Smart collection created: {name} (ID: {collection_id})")
             return collection_id
@@ -322,20 +320,16 @@ class SmartCollectionsManager:
             # Agregar collection_id al final de los parámetros
             params.append(collection_id)
 
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = f"""
                 UPDATE smart_collections
                 SET {', '.join(updates)}
                 WHERE id = ?
             """
 
-            cursor.execute(query, params)
-            conn.commit()
-
-            rows_affected = cursor.rowcount
-            conn.close()
+            with self._pool.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows_affected = cursor.rowcount
 
             if rows_affected > 0:
                 logger.info(f"Smart collection updated: {collection_id}")
@@ -364,17 +358,13 @@ class SmartCollectionsManager:
             True si la eliminación fue exitosa, False en caso contrario
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                DELETE FROM smart_collections
-                WHERE id = ?
-            """, (collection_id,))
-
-            conn.commit()
-            rows_affected = cursor.rowcount
-            conn.close()
+            with self._pool.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM smart_collections
+                    WHERE id = ?
+                """, (collection_id,))
+                rows_affected = cursor.rowcount
 
             if rows_affected > 0:
                 logger.info(f"Smart collection deleted: {collection_id}")
@@ -9,6 +9,8 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from src.database.connection_pool import get_connection_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,11 +25,11 @@ class StatsManager:
             logger.error(f"Database not found: {self.db_path}")
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+        self._pool = get_connection_pool(self.db_path)
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Obtener la conexión del hilo actual desde el pool compartido"""
+        return self._pool.get_connection()
 
     # ==================== Items Populares ====================
 
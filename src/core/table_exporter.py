@@ -1,15 +1,22 @@
 """
 Table Exporter
 Utilidades para exportar tablas a diferentes formatos (CSV, JSON, Excel)
+
+Los exportadores consumen las filas de forma perezosa: table_data puede ser
+una lista o un generador (DBManager.iter_table_rows), así que una tabla se
+puede exportar desde la base de datos sin cargarla entera en memoria.
 """
 
 import csv
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any
 from datetime import datetime
 
+from src.core.export_utils import JSONStreamWriter, remove_partial_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,11 +28,15 @@ class TableExporter:
     - CSV (Comma Separated Values)
     - JSON (con estructura y metadatos)
     - TSV (Tab Separated Values)
+    - JSON Lines (un registro por línea)
     """
 
+    # Formatos de export_table_from_db
+    FORMATS = ('csv', 'tsv', 'json', 'json_records', 'jsonl')
+
     @staticmethod
     def export_to_csv(
-        table_data: List[List[str]],
+        table_data: Iterable[List[str]],
         column_names: List[str],
         output_path: str,
         include_headers: bool = True,
@@ -35,7 +46,7 @@ class TableExporter:
         Exporta tabla a archivo CSV.
 
         Args:
-            table_data: Matriz de datos
+            table_data: Filas de datos (lista o iterable)
             column_names: Nombres de columnas
             output_path: Ruta del archivo de salida
             include_headers: Si incluir fila de headers
@@ -68,7 +79,7 @@ class TableExporter:
 
     @staticmethod
     def export_to_tsv(
-        table_data: List[List[str]],
+        table_data: Iterable[List[str]],
         column_names: List[str],
         output_path: str,
         include_headers: bool = True
@@ -77,7 +88,7 @@ class TableExporter:
         Exporta tabla a archivo TSV (Tab Separated Values).
 
         Args:
-            table_data: Matriz de datos
+            table_data: Filas de datos (lista o iterable)
             column_names: Nombres de columnas
             output_path: Ruta del archivo de salida
             include_headers: Si incluir fila de headers
@@ -96,7 +107,7 @@ class TableExporter:
     @staticmethod
     def export_to_json(
         table_name: str,
-        table_data: List[List[str]],
+        table_data: Iterable[List[str]],
         column_names: List[str],
         output_path: str,
         include_metadata: bool = True,
@@ -122,7 +133,7 @@ class TableExporter:
 
         Args:
             table_name: Nombre de la tabla
-            table_data: Matriz de datos
+            table_data: Filas de datos (lista o iterable)
             column_names: Nombres de columnas
             output_path: Ruta del archivo de salida
             include_metadata: Si incluir metadatos
@@ -135,27 +146,20 @@ class TableExporter:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Construir estructura JSON
-            json_data = {
-                "table_name": table_name,
-                "columns": column_names,
-                "rows": table_data
-            }
-
-            # Agregar metadata
-            if include_metadata:
-                json_data["metadata"] = {
-                    "exported_at": datetime.now().isoformat(),
-                    "row_count": len(table_data),
-                    "column_count": len(column_names)
-                }
-
-            # Escribir archivo
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(json_data, f, ensure_ascii=False)
+            # Escribir archivo (las filas se escriben una a una)
+            with open(output_file, 'w', encoding='utf-8') as f, \
+                    JSONStreamWriter(f, indent=2 if pretty else None) as writer:
+                writer.write_field("table_name", table_name)
+                writer.write_field("columns", column_names)
+                row_count = writer.write_list("rows", table_data)
+
+                # Agregar metadata
+                if include_metadata:
+                    writer.write_field("metadata", {
+                        "exported_at": datetime.now().isoformat(),
+                        "row_count": row_count,
+                        "column_count": len(column_names)
+                    })
 
             logger.info(f"Table exported to JSON: {output_path}")
             return True
@@ -167,7 +171,7 @@ class TableExporter:
     @staticmethod
     def export_to_json_records(
         table_name: str,
-        table_data: List[List[str]],
+        table_data: Iterable[List[str]],
         column_names: List[str],
         output_path: str,
         include_metadata: bool = True,
@@ -188,7 +192,7 @@ class TableExporter:
 
         Args:
             table_name: Nombre de la tabla
-            table_data: Matriz de datos
+            table_data: Filas de datos (lista o iterable)
             column_names: Nombres de columnas
             output_path: Ruta del archivo de salida
             include_metadata: Si incluir metadatos
@@ -201,45 +205,146 @@ class TableExporter:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convertir filas a registros (objetos)
-            records = []
-            for row in table_data:
-                record = {}
-                for col_idx, col_name in enumerate(column_names):
-                    if col_idx < len(row):
-                        record[col_name] = row[col_idx]
-                    else:
-                        record[col_name] = ""
-                records.append(record)
-
-            # Construir estructura JSON
-            json_data = {
-                "table_name": table_name,
-                "records": records
+            # Escribir archivo (los registros se generan y escriben uno a uno)
+            with open(output_file, 'w', encoding='utf-8') as f, \
+                    JSONStreamWriter(f, indent=2 if pretty else None) as writer:
+                writer.write_field("table_name", table_name)
+                record_count = writer.write_list(
+                    "records", TableExporter._iter_records(table_data, column_names)
+                )
+
+                # Agregar metadata
+                if include_metadata:
+                    writer.write_field("metadata", {
+                        "exported_at": datetime.now().isoformat(),
+                        "record_count": record_count,
+                        "column_count": len(column_names)
+                    })
+
+            logger.info(f"Table exported to JSON (records): {output_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error exporting to JSON records: {e}", exc_info=True)
+            return False
+
+    @staticmethod
+    def _iter_records(table_data: Iterable[List[str]], column_names: List[str]) -> Iterator[Dict[str, str]]:
+        """Convierte filas a registros (objetos) {columna: valor}"""
+        for row in table_data:
+            yield {
+                col_name: row[col_idx] if col_idx < len(row) else ""
+                for col_idx, col_name in enumerate(column_names)
             }
 
-            # Agregar metadata
-            if include_metadata:
-                json_data["metadata"] = {
-                    "exported_at": datetime.now().isoformat(),
-                    "record_count": len(records),
-                    "column_count": len(column_names)
-                }
+    @staticmethod
+    def export_to_jsonl(
+        table_data: Iterable[List[str]],
+        column_names: List[str],
+        output_path: str
+    ) -> bool:
+        """
+        Exporta tabla a JSON Lines: un registro {columna: valor} por línea.
+
+        Args:
+            table_data: Filas de datos (lista o iterable)
+            column_names: Nombres de columnas
+            output_path: Ruta del archivo de salida
+
+        Returns:
+            bool: True si exportación exitosa
+        """
+        try:
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Escribir archivo
             with open(output_file, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(json_data, f, ensure_ascii=False)
+                for record in TableExporter._iter_records(table_data, column_names):
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write('\n')
 
-            logger.info(f"Table exported to JSON (records): {output_path}")
+            logger.info(f"Table exported to JSON Lines: {output_path}")
             return True
 
         except Exception as e:
-            logger.error(f"Error exporting to JSON records: {e}", exc_info=True)
+            logger.error(f"Error exporting to JSON Lines: {e}", exc_info=True)
+            return False
+
+    @staticmethod
+    def export_table_from_db(
+        db_manager,
+        table_name: str,
+        output_path: str,
+        format: str = 'csv',
+        include_headers: bool = True,
+        include_metadata: bool = True,
+        pretty: bool = True,
+        decrypt: bool = False,
+        chunk_size: int = None
+    ) -> bool:
+        """
+        Exporta una tabla leyendo sus filas de la base de datos por bloques.
+
+        Las celdas se leen en orden (fila, columna) en bloques de tamaño fijo
+        y se escriben directamente, así que la memoria no crece con el tamaño
+        de la tabla. Se escribe en "<output_path>.tmp", que solo reemplaza
+        output_path si la exportación termina bien.
+
+        Args:
+            db_manager: Instancia de DBManager
+            table_name: Nombre de la tabla
+            output_path: Ruta del archivo de salida
+            format: 'csv', 'tsv', 'json', 'json_records' o 'jsonl'
+            include_headers: Si incluir fila de headers (CSV/TSV)
+            include_metadata: Si incluir metadatos (JSON)
+            pretty: Si formatear JSON con indentación
+            decrypt: Si descifrar las celdas sensibles
+            chunk_size: Celdas por consulta (default del DBManager)
+
+        Returns:
+            bool: True si exportación exitosa
+        """
+        if format not in TableExporter.FORMATS:
+            logger.error(f"Unsupported export format: {format}")
             return False
 
+        shape = db_manager.get_table_shape(table_name)
+        if not shape:
+            logger.error(f"Table '{table_name}' not found")
+            return False
+
+        column_names = shape['columns']
+        rows = db_manager.iter_table_rows(table_name, chunk_size=chunk_size, decrypt=decrypt)
+        tmp_path = f"{output_path}.tmp"
+
+        try:
+            if format == 'csv':
+                exported = TableExporter.export_to_csv(rows, column_names, tmp_path, include_headers)
+            elif format == 'tsv':
+                exported = TableExporter.export_to_tsv(rows, column_names, tmp_path, include_headers)
+            elif format == 'json':
+                exported = TableExporter.export_to_json(table_name, rows, column_names, tmp_path,
+                                                        include_metadata, pretty)
+            elif format == 'json_records':
+                exported = TableExporter.export_to_json_records(table_name, rows, column_names, tmp_path,
+                                                                include_metadata, pretty)
+            else:
+                exported = TableExporter.export_to_jsonl(rows, column_names, tmp_path)
+
+            if not exported:
+                return False
+            os.replace(tmp_path, output_path)
+            logger.info(f"Table '{table_name}' exported to: {output_path}")
+            return True
+
+        except OSError as e:
+            logger.error(f"Error replacing {output_path}: {e}", exc_info=True)
+            return False
+
+        finally:
+            # Exportación fallida: no dejar el archivo parcial
+            remove_partial_file(tmp_path)
+
     @staticmethod
     def get_export_summary(
         table_name: str,
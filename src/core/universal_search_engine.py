@@ -5,9 +5,12 @@ Coordina búsquedas globales de items y tags mostrando todas sus relaciones
 
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, Tuple
 from enum import Enum
 
+from src.core.search.search_cache import get_search_cache
+from src.core.item_relationship_index import get_item_relationship_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -176,8 +179,55 @@ class UniversalSearchEngine:
             db_manager: Instancia de DBManager para acceso a base de datos
         """
         self.db = db_manager
+
+        # Caché compartida; las entradas se invalidan por data_generation
+        self._cache = get_search_cache()
+        # Relaciones de todos los items en memoria (sin JOIN por item)
+        self.relationships = get_item_relationship_index(db_manager)
+
         logger.info("UniversalSearchEngine initialized")
 
+    def get_item_ids(self, query: str) -> List[int]:
+        """
+        Lista ordenada de IDs que coinciden con la búsqueda (cacheada por query)
+
+        Args:
+            query: Texto de búsqueda
+
+        Returns:
+            List[int]: IDs en orden de ranking
+        """
+        # Sin FTS5 la búsqueda es LIKE sobre la subcadena literal: los espacios cuentan
+        key = self._cache.make_key(self.db, 'universal', 'ids', query, exact=True)
+        return self._cache.get_or_compute(
+            key, self.db.data_generation,
+            lambda: self.db.universal_search_item_ids(query.strip())
+        )
+
+    def search_items_page(self, query: str, limit: int = 100, offset: int = 0) -> Tuple[List[SearchResult], int]:
+        """
+        Página de resultados y total en una sola pasada
+
+        El ranking se calcula una vez por query; cada página solo hidrata
+        (y agrega relaciones de) sus propios IDs, y queda cacheada hasta
+        la siguiente escritura.
+
+        Args:
+            query: Texto de búsqueda
+            limit: Tamaño de página
+            offset: Número de resultados a saltar
+
+        Returns:
+            Tuple[List[SearchResult], int]: (resultados de la página, total de coincidencias)
+        """
+        generation = self.db.data_generation
+        item_ids = self.get_item_ids(query)
+        key = self._cache.make_key(self.db, 'universal', 'items', query, page=(limit, offset), exact=True)
+        page = self._cache.get_or_compute(
+            key, generation, lambda: self._hydrate_items(item_ids[offset:offset + limit])
+        )
+        return page, len(item_ids)
+
     def search_all(
         self,
         query: str,
@@ -222,12 +272,27 @@ class UniversalSearchEngine:
         Returns:
             Lista de SearchResult para items
         """
+        results = self._hydrate_items(self.get_item_ids(query)[offset:offset + limit])
+        logger.debug(f"Found {len(results)} items for query '{query}'")
+        return results
+
+    def _hydrate_items(self, item_ids: List[int]) -> List[SearchResult]:
+        """
+        Construye SearchResult (con relaciones) para una lista de IDs
+
+        Args:
+            item_ids: IDs en orden de ranking
+
+        Returns:
+            Lista de SearchResult en el mismo orden
+        """
         try:
-            # Obtener items usando búsqueda FTS5 del DBManager
-            raw_items = self.db.universal_search_items(query, limit=limit, offset=offset)
+            raw_items = self.db.get_universal_search_items_by_ids(item_ids, with_relations=False)
+            relationships = self.relationships.get_many(item_ids)
 
             results = []
             for item_data in raw_items:
+                relations = relationships.get(item_data['id'], {})
                 # Crear SearchResult con todas las relaciones
                 result = SearchResult(
                     result_type=SearchResultType.ITEM,
@@ -238,12 +303,12 @@ class UniversalSearchEngine:
                     color=item_data.get('color', ''),
                     description=item_data.get('description', ''),
 
-                    # Relaciones (vienen del query SQL)
-                    proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                    areas=self._parse_comma_separated(item_data.get('areas')),
+                    # Relaciones N:M desde el índice en memoria
+                    proyectos=relations.get('proyectos', []),
+                    areas=relations.get('areas', []),
                     categoria=item_data.get('categoria_name'),
                     tabla=item_data.get('tabla_name'),
-                    procesos=self._parse_comma_separated(item_data.get('procesos')),
+                    procesos=relations.get('procesos', []),
                     lista=item_data.get('lista_name'),
 
                     # Tags del item
@@ -259,7 +324,6 @@ class UniversalSearchEngine:
                 )
                 results.append(result)
 
-            logger.debug(f"Found {len(results)} items for query '{query}'")
             return results
 
         except Exception as e:
@@ -334,19 +398,12 @@ class UniversalSearchEngine:
             ItemRelationships con todas las relaciones
         """
         try:
-            item_data = self.db.get_item_relationships(item_id)
+            relations = self.relationships.get_relationships(item_id)
 
-            if not item_data:
+            if not relations:
                 return ItemRelationships()
 
-            return ItemRelationships(
-                proyectos=self._parse_comma_separated(item_data.get('proyectos')),
-                areas=self._parse_comma_separated(item_data.get('areas')),
-                categoria=item_data.get('categoria'),
-                tabla=item_data.get('tabla'),
-                procesos=self._parse_comma_separated(item_data.get('procesos')),
-                lista=item_data.get('lista')
-            )
+            return ItemRelationships(**relations)
 
         except Exception as e:
             logger.error(f"Error getting item relationships: {e}", exc_info=True)
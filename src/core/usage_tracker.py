@@ -4,16 +4,261 @@ Autor: Widget Sidebar Team
 Fecha: 2025-01-23
 """
 
+import atexit
+import queue
 import sqlite3
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+from src.core.cache_invalidation import get_data_change_bus, DataChangeEvent, TABLE_ITEMS, ACTION_UPDATE
+from src.database.connection_pool import get_connection_pool
 
 logger = logging.getLogger(__name__)
 
 
+# Evento de uso encolado: (item_id, used_at, execution_time_ms, success, error_message)
+UsageEvent = Tuple[int, str, int, int, Optional[str]]
+
+# Máximo de parámetros por consulta IN (...) (límite de SQLite antiguo: 999)
+_MAX_QUERY_PARAMS = 500
+
+_STOP = object()
+
+
+class UsageWriter:
+    """
+    Escritor en segundo plano de eventos de uso
+
+    track_usage() solo encola el evento; un hilo daemon los escribe en una
+    única transacción cada FLUSH_BATCH_SIZE eventos o FLUSH_INTERVAL_MS,
+    agregando los incrementos de use_count por item. Los eventos pendientes
+    se escriben al cerrar la aplicación (shutdown / atexit).
+    """
+
+    FLUSH_BATCH_SIZE = 50
+    FLUSH_INTERVAL_MS = 500
+
+    def __init__(self, db_path: Path):
+        """Inicializar writer y arrancar el hilo de escritura"""
+        self.db_path = Path(db_path)
+        self._pool = get_connection_pool(self.db_path)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._metrics_lock = threading.Lock()
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._last_batch_size = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._stopped = False
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"UsageWriter-{self.db_path.name}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        """True mientras el hilo de escritura acepta eventos"""
+        return not self._stopped and self._thread.is_alive()
+
+    def enqueue(self, event: UsageEvent) -> None:
+        """Encolar un evento de uso (no bloquea)"""
+        with self._metrics_lock:
+            self._enqueued += 1
+        self._queue.put(event)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Escribir de forma síncrona todos los eventos encolados hasta ahora
+
+        Returns:
+            True si el writer confirmó el flush antes del timeout
+        """
+        if not self.is_running:
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Vaciar la cola y detener el hilo de escritura"""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"UsageWriter did not stop in {timeout}s "
+                           f"({self._queue.qsize()} events pending)")
+        else:
+            logger.info(f"UsageWriter stopped ({self._written} events written)")
+
+    def get_metrics(self) -> Dict:
+        """Profundidad de cola, eventos escritos y latencia de flush"""
+        with self._metrics_lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'enqueued': self._enqueued,
+                'written': self._written,
+                'dropped': self._dropped,
+                'flushes': self._flushes,
+                'last_batch_size': self._last_batch_size,
+                'last_flush_ms': round(self._last_flush_ms, 2),
+                'avg_flush_ms': round(self._total_flush_ms / self._flushes, 2) if self._flushes else 0.0,
+                'max_flush_ms': round(self._max_flush_ms, 2)
+            }
+
+    def _run(self):
+        """Bucle del hilo: agrupa eventos por tamaño o por tiempo"""
+        interval = self.FLUSH_INTERVAL_MS / 1000
+        stopping = False
+
+        while not stopping:
+            batch: List[UsageEvent] = []
+            waiters: List[threading.Event] = []
+
+            item = self._queue.get()
+            deadline = time.monotonic() + interval
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                # Un flush explícito o el cierre escriben lo acumulado sin esperar
+                if stopping or waiters or len(batch) >= self.FLUSH_BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if stopping:
+                # Vaciar lo que quede en la cola antes de salir
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    elif item is not _STOP:
+                        batch.append(item)
+
+            if batch:
+                self._write_batch(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write_batch(self, batch: List[UsageEvent]):
+        """Escribir un lote de eventos en una sola transacción"""
+        # Agregar incrementos de use_count y último uso por item
+        increments: Dict[int, List] = {}
+        for item_id, used_at, _, _, _ in batch:
+            entry = increments.setdefault(item_id, [0, used_at])
+            entry[0] += 1
+            entry[1] = max(entry[1], used_at)
+
+        start = time.perf_counter()
+        try:
+            with self._pool.writer() as conn:
+                conn.executemany("""
+                    UPDATE items
+                    SET use_count = use_count + ?,
+                        last_used = ?,
+                        updated_at = datetime('now')
+                    WHERE id = ?
+                """, [(count, last_used, item_id)
+                      for item_id, (count, last_used) in increments.items()])
+
+                # Items borrados mientras el evento estaba en cola se ignoran
+                conn.executemany("""
+                    INSERT INTO item_usage_history
+                    (item_id, used_at, execution_time_ms, success, error_message)
+                    SELECT ?, ?, ?, ?, ?
+                    WHERE EXISTS (SELECT 1 FROM items WHERE id = ?)
+                """, [event + (event[0],) for event in batch])
+
+                item_ids = list(increments)
+                category_ids = set()
+                for i in range(0, len(item_ids), _MAX_QUERY_PARAMS):
+                    chunk = item_ids[i:i + _MAX_QUERY_PARAMS]
+                    placeholders = ','.join('?' * len(chunk))
+                    category_ids.update(row[0] for row in conn.execute(
+                        f"SELECT DISTINCT category_id FROM items WHERE id IN ({placeholders})", chunk
+                    ))
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._metrics_lock:
+                self._written += len(batch)
+                self._flushes += 1
+                self._last_batch_size = len(batch)
+                self._last_flush_ms = elapsed_ms
+                self._total_flush_ms += elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+
+            logger.debug(f"Flushed {len(batch)} usage events "
+                         f"({len(increments)} items) in {elapsed_ms:.1f}ms")
+
+            # use_count/last_used cambiaron: invalidar cachés y marcar los items
+            # para el recálculo de usage scores (mismo evento que DBManager).
+            # Hilo del writer: el evento se entrega en el hilo de la GUI (post)
+            self._pool.bump_data_generation()
+            get_data_change_bus().post(
+                DataChangeEvent(TABLE_ITEMS, ACTION_UPDATE, tuple(item_ids), tuple(category_ids))
+            )
+
+        except Exception as e:
+            with self._metrics_lock:
+                self._dropped += len(batch)
+            logger.error(f"Error flushing {len(batch)} usage events: {e}")
+
+
+# === SINGLETON PATTERN ===
+# Un writer por archivo de base de datos, compartido por todos los UsageTracker
+
+_writers: Dict[str, UsageWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_usage_writer(db_path) -> UsageWriter:
+    """Obtener (o arrancar) el writer compartido para una base de datos"""
+    key = str(Path(db_path).resolve())
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or not writer.is_running:
+            writer = _writers[key] = UsageWriter(db_path)
+            logger.info(f"UsageWriter started for {key}")
+        return writer
+
+
+def shutdown_usage_writers(timeout: float = 5.0):
+    """Escribir los eventos pendientes y detener todos los writers"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+
+    for writer in writers:
+        writer.shutdown(timeout)
+
+
+# Registrado después del pool de conexiones: atexit lo ejecuta antes de cerrarlo
+atexit.register(shutdown_usage_writers)
+
+
 class UsageTracker:
     """Gestor de tracking de uso de items"""
 
@@ -25,63 +270,37 @@ class UsageTracker:
             logger.error(f"Database not found: {self.db_path}")
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+        self._pool = get_connection_pool(self.db_path)
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Obtener conexión a la base de datos con timeout aumentado"""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)  # Aumentar timeout a 10 segundos
-        conn.row_factory = sqlite3.Row
-        # Configurar para mejorar concurrencia
-        conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging para mejor concurrencia
-        return conn
+        """Obtener la conexión del hilo actual desde el pool compartido (WAL, busy timeout)"""
+        return self._pool.get_connection()
 
     # ==================== Registro de Uso ====================
 
     def track_usage(self, item_id: int, execution_time_ms: int = 0,
                     success: bool = True, error_message: Optional[str] = None) -> bool:
-        """Registrar uso de un item con retry logic para evitar 'database is locked'"""
-        max_retries = 3
-        retry_delay = 0.1  # 100ms entre intentos
-
-        for attempt in range(max_retries):
-            try:
-                conn = self._get_connection()
-                cursor = conn.cursor()
-
-                # 1. Incrementar use_count y actualizar last_used en items
-                cursor.execute("""
-                    UPDATE items
-                    SET use_count = use_count + 1,
-                        last_used = datetime('now'),
-                        updated_at = datetime('now')
-                    WHERE id = ?
-                """, (item_id,))
-
-                # 2. Insertar registro en item_usage_history
-                cursor.execute("""
-                    INSERT INTO item_usage_history
-                    (item_id, used_at, execution_time_ms, success, error_message)
-                    VALUES (?, datetime('now'), ?, ?, ?)
-                """, (item_id, execution_time_ms, 1 if success else 0, error_message))
+        """Registrar uso de un item (se encola; el UsageWriter lo escribe en lote)"""
+        try:
+            used_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            get_usage_writer(self.db_path).enqueue(
+                (item_id, used_at, execution_time_ms, 1 if success else 0, error_message)
+            )
 
-                conn.commit()
-                conn.close()
+            logger.debug(f"Queued usage for item {item_id}: success={success}, time={execution_time_ms}ms")
+            return True
 
-                logger.info(f"Tracked usage for item {item_id}: success={success}, time={execution_time_ms}ms")
-                return True
+        except Exception as e:
+            logger.error(f"Error tracking usage for item {item_id}: {e}")
+            return False
 
-            except sqlite3.OperationalError as e:
-                if "database is locked" in str(e) and attempt < max_retries - 1:
-                    # Retry en caso de database locked
-                    logger.debug(f"Database locked, retry {attempt + 1}/{max_retries} for item {item_id}")
-                    time.sleep(retry_delay * (attempt + 1))  # Backoff exponencial
-                    continue
-                else:
-                    logger.error(f"Error tracking usage for item {item_id} after {attempt + 1} attempts: {e}")
-                    return False
-            except Exception as e:
-                logger.error(f"Error tracking usage for item {item_id}: {e}")
-                return False
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Escribir ya los eventos de uso pendientes"""
+        return get_usage_writer(self.db_path).flush(timeout)
 
-        return False
+    def get_writer_metrics(self) -> Dict:
+        """Métricas del writer en segundo plano (queue_depth, latencia de flush...)"""
+        return get_usage_writer(self.db_path).get_metrics()
 
     def track_execution_start(self, item_id: int) -> int:
         """Iniciar tracking de ejecución (retorna timestamp en ms)"""
@@ -424,26 +643,23 @@ class UsageTracker:
     def cleanup_old_history(self, days: int = 90) -> int:
         """Limpiar historial antiguo (retorna registros eliminados)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Contar antes de eliminar
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM item_usage_history
-                WHERE used_at < datetime('now', '-' || ? || ' days')
-            """, (days,))
+            with self._pool.writer() as conn:
+                cursor = conn.cursor()
 
-            count = cursor.fetchone()['count']
+                # Contar antes de eliminar
+                cursor.execute("""
+                    SELECT COUNT(*) as count
+                    FROM item_usage_history
+                    WHERE used_at < datetime('now', '-' || ? || ' days')
+                """, (days,))
 
-            # Eliminar registros antiguos
-            cursor.execute("""
-                DELETE FROM item_usage_history
-                WHERE used_at < datetime('now', '-' || ? || ' days')
-            """, (days,))
+                count = cursor.fetchone()['count']
 
-            conn.commit()
-            conn.close()
+                # Eliminar registros antiguos
+                cursor.execute("""
+                    DELETE FROM item_usage_history
+                    WHERE used_at < datetime('now', '-' || ? || ' days')
+                """, (days,))
 
             logger.info(f"Cleaned up {count} old history records")
             return count
@@ -455,6 +671,8 @@ class UsageTracker:
     def get_item_stats(self, item_id: int) -> Dict:
         """Estadísticas completas de un item"""
         try:
+            # Incluir los usos que aún están en la cola del writer
+            self.flush()
             return {
                 'use_count': self.get_use_count(item_id),
                 'last_used': self.get_last_used(item_id),
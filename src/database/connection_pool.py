@@ -0,0 +1,235 @@
+"""
+Connection Pool for Widget Sidebar
+Shares tuned SQLite connections (WAL, busy timeout, cache/mmap pragmas) between
+DBManager and the managers that used to open ad-hoc connections on every call
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3 connection owned by a ConnectionPool
+
+    close() does not close the underlying handle and does not touch the
+    current transaction: the connection is shared by every consumer on its
+    thread, so a reader calling close() in the middle of a
+    DBManager.transaction() must not roll back the writer's work.
+    Transactions are committed or rolled back by whoever opened them
+    (ConnectionPool.writer() / DBManager.transaction()).
+    """
+
+    # Hilo que abrió la conexión (solo ese hilo puede cerrarla)
+    owner_thread: int = 0
+
+    def close(self):
+        """Return the connection to the pool (no-op)"""
+
+    def close_physical(self):
+        """Really close the underlying SQLite handle"""
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Pool of per-thread SQLite connections with a serialized writer
+
+    - Each thread gets its own connection (no check_same_thread=False sharing)
+    - WAL journaling so readers never block the writer and vice versa
+    - Writes go through writer(), which holds a process-wide lock per database
+      so threads queue in Python instead of hitting "database is locked"
+    """
+
+    BUSY_TIMEOUT_MS = 5000
+    CACHE_SIZE_KB = 20000          # ~20 MB de page cache por conexión
+    MMAP_SIZE = 256 * 1024 * 1024  # 256 MB de memory-mapped I/O
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file (":memory:" is not supported)
+        """
+        self.db_path = Path(db_path)
+        self.write_lock = threading.RLock()
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        self._wal_enabled = False
+        # Contador de escrituras relevantes para cachés de resultados (ver DBManager)
+        self.data_generation = 0
+        self._generation_lock = threading.Lock()
+
+    def _open(self) -> PooledConnection:
+        """Open and configure a new connection"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+            factory=PooledConnection
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+        if not self._wal_enabled:
+            # journal_mode is persistent in the database file: set it once
+            mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            self._wal_enabled = True
+            logger.info(f"SQLite journal mode for {self.db_path}: {mode}")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.owner_thread = threading.get_ident()
+
+        with self._connections_lock:
+            self._connections.add(conn)
+        logger.debug(f"Opened pooled connection to {self.db_path} "
+                     f"(thread: {threading.current_thread().name})")
+        return conn
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Get the calling thread's connection, opening it on first use
+
+        Returns:
+            PooledConnection: Connection bound to the current thread
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._open()
+            self._local.connection = conn
+        return conn
+
+    @contextmanager
+    def writer(self):
+        """
+        Serialized write transaction
+
+        Usage:
+            with pool.writer() as conn:
+                conn.execute("UPDATE ...")
+        """
+        with self.write_lock:
+            conn = self.get_connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def bump_data_generation(self) -> int:
+        """
+        Increment the data generation of this database
+
+        Returns:
+            int: New generation
+        """
+        with self._generation_lock:
+            self.data_generation += 1
+            return self.data_generation
+
+    def close_thread_connection(self) -> bool:
+        """
+        Close the calling thread's connection (releases the database file)
+
+        The next get_connection() on this thread opens a new one.
+
+        Returns:
+            bool: True if the thread had an open connection
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            return False
+
+        self._local.connection = None
+        return self._close_connection(conn)
+
+    def _close_connection(self, conn: PooledConnection) -> bool:
+        """Close a connection owned by the calling thread (others are refused)"""
+        if conn.owner_thread != threading.get_ident():
+            logger.warning(f"Refusing to close a pooled connection of another thread "
+                           f"(owner: {conn.owner_thread})")
+            return False
+
+        with self._connections_lock:
+            self._connections.discard(conn)
+        try:
+            conn.close_physical()
+        except sqlite3.Error as e:
+            logger.warning(f"Error closing pooled connection: {e}")
+        return True
+
+    def close_all(self):
+        """
+        Close the pool's connections that belong to the calling thread
+
+        SQLite connections can only be closed by the thread that opened them:
+        connections of other threads are left to their thread-locals (they
+        are closed when the thread finishes or the interpreter exits).
+        """
+        closed = 1 if self.close_thread_connection() else 0
+
+        # Conexiones de este hilo que ya no están en su thread-local
+        current = threading.get_ident()
+        with self._connections_lock:
+            owned = [conn for conn in self._connections if conn.owner_thread == current]
+        closed += sum(1 for conn in owned if self._close_connection(conn))
+
+        with self._connections_lock:
+            others = len(self._connections)
+
+        logger.info(f"Connection pool closed: {self.db_path} ({closed} connections closed, "
+                    f"{others} owned by other threads)")
+
+
+# === SINGLETON PATTERN ===
+# One pool per database file for the entire application
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: Union[str, Path]) -> ConnectionPool:
+    """
+    Get the shared pool for a database file
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        ConnectionPool: Pool shared by every consumer of that file
+    """
+    key = str(Path(db_path).resolve())
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = ConnectionPool(db_path)
+                logger.info(f"Connection pool created for {key}")
+    return pool
+
+
+def close_all_pools():
+    """Close all pools (registered to run at interpreter exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_pools)
@@ -6,12 +6,16 @@ Manages SQLite database operations for settings, categories, items, and clipboar
 import sqlite3
 import json
 import logging
+import threading
 import uuid
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from contextlib import contextmanager
 
+from src.database.connection_pool import get_connection_pool
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,7 +33,15 @@ class DBManager:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
-        self.connection = None
+        self.connection = None  # Only used for ":memory:" databases
+        # File databases use the shared per-thread pool (WAL + serialized writer)
+        if str(self.db_path) == ":memory:":
+            self._pool = None
+            self._write_lock = threading.RLock()
+            self._memory_generation = 0
+        else:
+            self._pool = get_connection_pool(self.db_path)
+            self._write_lock = self._pool.write_lock
         self._fts5_available = None  # Caché para verificación de FTS5
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
@@ -43,14 +55,87 @@ class DBManager:
             self._create_database()
         else:
             logger.info("Database already exists")
+            self._ensure_indexes()
+        self._ensure_items_fts()
+        self._ensure_table_cells()
+
+    # Tablas e índices añadidos después del esquema v3.0.0 (el esquema embebido
+    # ya los incluye; aquí se crean en bases de datos existentes)
+    _ADDED_TABLES = [
+        """CREATE TABLE IF NOT EXISTS item_usage_scores (
+            item_id INTEGER PRIMARY KEY,
+            usage_score REAL NOT NULL DEFAULT 0,
+            computed_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+        )""",
+    ]
+    _ADDED_INDEXES = [
+        "CREATE INDEX IF NOT EXISTS idx_items_image_gallery ON items(type, file_extension, created_at)",
+    ]
+
+    # Ranking híbrido (menor = mejor, como bm25): la relevancia BM25 se amplifica
+    # hasta x2 con la puntuación de uso precalculada (alias us = item_usage_scores)
+    HYBRID_RANK_SQL = "bm25(items_fts, 10.0, 5.0, 3.0, 2.0, 1.0) * (1.0 + COALESCE(us.usage_score, 0))"
+
+    def _ensure_indexes(self):
+        """Create tables and indexes missing from databases created with an older schema"""
+        try:
+            with self.transaction() as conn:
+                for statement in self._ADDED_TABLES + self._ADDED_INDEXES:
+                    conn.execute(statement)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not create missing indexes: {e}")
+
+    def _ensure_items_fts(self):
+        """Create or upgrade items_fts to the trigger-maintained external-content index"""
+        conn = self.connect()
+        has_triggers = conn.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'trigger' AND name = 'items_fts_ai'
+        """).fetchone()
+        if has_triggers:
+            return
+
+        from src.database.migrations.items_fts_external_content import (
+            migration_007_items_fts_external_content
+        )
+        try:
+            migration_007_items_fts_external_content(self)
+        except sqlite3.Error as e:
+            # SQLite sin FTS5: la búsqueda universal usa LIKE como fallback
+            logger.warning(f"Could not set up items_fts: {e}")
+        self._fts5_available = None
+
+    def _ensure_table_cells(self):
+        """Add the integer table_row/table_col cell coordinates (from orden_table) if missing"""
+        conn = self.connect()
+        has_triggers = conn.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'trigger' AND name = 'items_table_cell_ai'
+        """).fetchone()
+        if has_triggers:
+            return
+
+        from src.database.migrations.items_table_cells import migration_008_items_table_cells
+        try:
+            migration_008_items_table_cells(self)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not migrate table cell coordinates: {e}")
 
     def connect(self) -> sqlite3.Connection:
         """
         Establish connection to the database
 
+        File databases return the calling thread's pooled connection.
+        In-memory databases keep a single shared connection (a new connection
+        would open a different, empty database).
+
         Returns:
             sqlite3.Connection: Database connection
         """
+        if self._pool is not None:
+            return self._pool.get_connection()
+
         if self.connection is None:
             self.connection = sqlite3.connect(
                 self.db_path,
@@ -62,7 +147,18 @@ class DBManager:
         return self.connection
 
     def close(self):
-        """Close database connection"""
+        """
+        Close database connection
+
+        For file databases this is a no-op: the calling thread's pooled
+        connection is shared with every other manager on that thread
+        (ConfigManager, search engines...). Pooled connections are closed by
+        close_all_pools() at exit.
+        """
+        if self._pool is not None:
+            logger.debug("Database connection released (pooled, left open)")
+            return
+
         if self.connection:
             self.connection.close()
             self.connection = None
@@ -77,14 +173,15 @@ class DBManager:
             with db.transaction() as conn:
                 conn.execute(...)
         """
-        conn = self.connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction failed: {e}")
-            raise
+        with self._write_lock:
+            conn = self.connect()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
+                raise
 
     def _create_database(self):
         """Create database schema with all tables and indices - COMPLETE SCHEMA"""
@@ -195,6 +292,8 @@ class DBManager:
                     file_hash TEXT,
                     table_id INTEGER,
                     orden_table TEXT,
+                    table_row INTEGER,
+                    table_col INTEGER,
                     is_component BOOLEAN DEFAULT 0,
                     name_component TEXT,
                     component_config TEXT,
@@ -226,6 +325,15 @@ class DBManager:
                     FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
                 );
 
+                -- Puntuación de uso precalculada por item (uso con decaimiento,
+                -- recencia y favorito) para el ranking híbrido con BM25
+                CREATE TABLE IF NOT EXISTS item_usage_scores (
+                    item_id INTEGER PRIMARY KEY,
+                    usage_score REAL NOT NULL DEFAULT 0,
+                    computed_at TEXT NOT NULL DEFAULT (datetime('now')),
+                    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+                );
+
                 -- Tabla de borradores de items
                 CREATE TABLE IF NOT EXISTS item_drafts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -827,14 +935,7 @@ class DBManager:
 
                 -- ========== BÚSQUEDA FTS5 (TABLAS VIRTUALES) ==========
 
-                -- Tabla virtual FTS5 para búsqueda de items
-                CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
-                    item_id,
-                    label,
-                    content,
-                    description,
-                    tags
-                );
+                -- items_fts (contenido externo + triggers) se crea en _ensure_items_fts()
 
                 -- Tabla virtual FTS5 para búsqueda de categorías
                 CREATE VIRTUAL TABLE IF NOT EXISTS categories_fts USING fts5(
@@ -865,10 +966,10 @@ class DBManager:
                 CREATE INDEX IF NOT EXISTS idx_items_is_list ON items(is_list) WHERE is_list = 1;
                 CREATE INDEX IF NOT EXISTS idx_items_list_group ON items(list_group) WHERE list_group IS NOT NULL;
                 CREATE INDEX IF NOT EXISTS idx_items_orden_lista ON items(category_id, list_group, orden_lista) WHERE is_list = 1;
-                CREATE INDEX IF NOT EXISTS idx_items_is_table ON items(is_table) WHERE is_table = 1;
-                CREATE INDEX IF NOT EXISTS idx_items_name_table ON items(name_table) WHERE name_table IS NOT NULL;
-                CREATE INDEX IF NOT EXISTS idx_items_table_orden ON items(name_table, orden_table) WHERE is_table = 1;
+                CREATE INDEX IF NOT EXISTS idx_items_table_id ON items(table_id) WHERE table_id IS NOT NULL;
+                CREATE INDEX IF NOT EXISTS idx_items_table_cell ON items(table_id, table_row, table_col) WHERE table_id IS NOT NULL;
                 CREATE INDEX IF NOT EXISTS idx_items_active ON items(is_active, is_archived);
+                CREATE INDEX IF NOT EXISTS idx_items_image_gallery ON items(type, file_extension, created_at);
 
                 -- Índices para historial
                 CREATE INDEX IF NOT EXISTS idx_clipboard_history_date ON clipboard_history(copied_at DESC);
@@ -988,7 +1089,7 @@ class DBManager:
             """)
 
         conn.commit()
-        # Don't close the connection - it's managed by self.connection
+        # Don't close the connection - it's managed by connect()
         logger.info("=" * 80)
         logger.info("DATABASE SCHEMA CREATED SUCCESSFULLY - COMPLETE SCHEMA v3.0.0")
         logger.info("=" * 80)
@@ -1038,11 +1139,12 @@ class DBManager:
             int: Last row ID for INSERT, or number of affected rows
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+            with self._write_lock:
+                conn = self.connect()
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                conn.commit()
+                return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution failed: {e}")
             logger.error(f"Query: {query}")
@@ -1066,6 +1168,86 @@ class DBManager:
             logger.error(f"Batch execution failed: {e}")
             raise
 
+    # ========== CHANGE EVENTS ==========
+
+    @property
+    def data_generation(self) -> int:
+        """
+        Monotonic counter of item/tag/category/relation writes to this database
+
+        Shared by every DBManager on the same file (it lives in the connection
+        pool). Result caches store it with each entry and treat entries from
+        an older generation as stale.
+        """
+        if self._pool is not None:
+            return self._pool.data_generation
+        return self._memory_generation
+
+    def _bump_data_generation(self) -> None:
+        """Invalidate cached search results after a committed write"""
+        if self._pool is not None:
+            self._pool.bump_data_generation()
+        else:
+            self._memory_generation += 1
+
+    def _publish_change(self, table: str, action: str, ids: List[int] = (),
+                        category_ids: List[int] = ()) -> None:
+        """
+        Publish a table-level change event so subscribed caches can evict entries
+
+        Also bumps data_generation, so generation-checked caches see the
+        write before any subscriber runs.
+
+        Args:
+            table: Table that changed (see core.cache_invalidation TABLE_*)
+            action: 'insert', 'update' or 'delete'
+            ids: IDs of the affected rows
+            category_ids: Categories affected by the change (for item writes)
+        """
+        from src.core.cache_invalidation import get_data_change_bus, DataChangeEvent
+        self._bump_data_generation()
+        get_data_change_bus().publish(
+            DataChangeEvent(table, action, tuple(ids), tuple(category_ids))
+        )
+
+    def _get_relation_owner_ids(self, relations_table: str, owner_column: str,
+                                relation_ids: List[int]) -> List[int]:
+        """
+        Get the projects/areas that own a set of relations
+
+        Args:
+            relations_table: 'project_relations' or 'area_relations'
+            owner_column: 'project_id' or 'area_id'
+            relation_ids: Relation IDs
+
+        Returns:
+            List[int]: Owner IDs
+        """
+        if not relation_ids:
+            return []
+        placeholders = ','.join('?' * len(relation_ids))
+        rows = self.connect().execute(
+            f"SELECT DISTINCT {owner_column} FROM {relations_table} WHERE id IN ({placeholders})",
+            list(relation_ids)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _get_item_category_ids(self, item_ids: List[int]) -> List[int]:
+        """
+        Get the distinct category IDs of a set of items
+
+        Args:
+            item_ids: Item IDs
+
+        Returns:
+            List[int]: Category IDs
+        """
+        if not item_ids:
+            return []
+        placeholders = ','.join('?' * len(item_ids))
+        query = f"SELECT DISTINCT category_id FROM items WHERE id IN ({placeholders})"
+        return [row['category_id'] for row in self.execute_query(query, tuple(item_ids))]
+
     # ========== SETTINGS ==========
 
     def get_setting(self, key: str, default: Any = None) -> Any:
@@ -1145,9 +1327,19 @@ class DBManager:
         """
         categories = self.execute_query(query, (include_inactive,))
 
-        # Load tags for each category from many-to-many relationship
+        # Load tags for all categories from many-to-many relationship in one query
+        tags_query = """
+            SELECT ctc.category_id, ct.name
+            FROM category_tags ct
+            INNER JOIN category_tags_category ctc ON ct.id = ctc.tag_id
+            ORDER BY ct.name ASC
+        """
+        tags_map: Dict[int, List[str]] = {}
+        for row in self.execute_query(tags_query):
+            tags_map.setdefault(row['category_id'], []).append(row['name'])
+
         for category in categories:
-            category['tags'] = self.get_category_tags(category['id'])
+            category['tags'] = tags_map.get(category['id'], [])
 
         return categories
 
@@ -1206,6 +1398,7 @@ class DBManager:
         if tags:
             self.set_category_tags(category_id, tags)
 
+        self._publish_change('categories', 'insert', [category_id])
         logger.info(f"Category added: {name} (ID: {category_id}, order_index: {order_index}, tags: {len(tags) if tags else 0})")
         return category_id
 
@@ -1254,6 +1447,8 @@ class DBManager:
         if tags is not None:
             self.set_category_tags(category_id, tags)
 
+        if updates:
+            self._publish_change('categories', 'update', [category_id])
         logger.info(f"Category updated: ID {category_id}")
 
     def delete_category(self, category_id: int) -> None:
@@ -1265,6 +1460,7 @@ class DBManager:
         """
         query = "DELETE FROM categories WHERE id = ?"
         self.execute_update(query, (category_id,))
+        self._publish_change('categories', 'delete', [category_id], [category_id])
 
     # ========== PROJECT TAG ORDERING ==========
 
@@ -1302,6 +1498,7 @@ class DBManager:
         """
         try:
             self.execute_update(query, (project_id, tag_id, order_index))
+            self._publish_change('project_element_tags', 'update', [project_id])
             return True
         except Exception as e:
             logger.error(f"Error updating tag order: {e}")
@@ -1403,6 +1600,7 @@ class DBManager:
         """
         try:
             self.execute_update(query, (project_id, filter_tag_id, element_type, element_id, order_index))
+            self._publish_change('project_element_tags', 'update', [project_id])
             return True
         except Exception as e:
             logger.error(f"Error updating filtered order: {e}")
@@ -1426,6 +1624,7 @@ class DBManager:
             else:
                 query = "DELETE FROM project_filtered_order WHERE project_id = ?"
                 self.execute_update(query, (project_id,))
+            self._publish_change('project_element_tags', 'delete', [project_id])
             return True
         except Exception as e:
             logger.error(f"Error clearing filtered order: {e}")
@@ -1540,6 +1739,7 @@ class DBManager:
         """
         try:
             self.execute_update(query, (area_id, filter_tag_id, element_type, element_id, order_index))
+            self._publish_change('area_element_tags', 'update', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error updating area filtered order: {e}")
@@ -1563,6 +1763,7 @@ class DBManager:
             else:
                 query = "DELETE FROM area_filtered_order WHERE area_id = ?"
                 self.execute_update(query, (area_id,))
+            self._publish_change('area_element_tags', 'delete', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error clearing area filtered order: {e}")
@@ -1681,6 +1882,7 @@ class DBManager:
         """
         try:
             self.execute_update(query, (area_id, tag_id, order_index))
+            self._publish_change('area_element_tags', 'update', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error updating area tag order: {e}")
@@ -1791,6 +1993,7 @@ class DBManager:
         updates = [(i, cat_id) for i, cat_id in enumerate(category_ids)]
         query = "UPDATE categories SET order_index = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_many(query, updates)
+        self._publish_change('categories', 'update', category_ids)
         logger.info(f"Categories reordered: {len(category_ids)} items")
 
     # ========== CATEGORY TAGS (Many-to-Many) ==========
@@ -1890,6 +2093,7 @@ class DBManager:
                     (category_id, tag_id)
                 )
 
+        self._publish_change('category_tags', 'update', [category_id])
         logger.debug(f"Category {category_id} tags set: {tags}")
 
     def add_category_tag(self, category_id: int, tag_name: str) -> None:
@@ -1904,6 +2108,7 @@ class DBManager:
 
         query = "INSERT OR IGNORE INTO category_tags_category (category_id, tag_id) VALUES (?, ?)"
         self.execute_update(query, (category_id, tag_id))
+        self._publish_change('category_tags', 'insert', [category_id])
         logger.debug(f"Tag '{tag_name}' added to category {category_id}")
 
     def remove_category_tag(self, category_id: int, tag_name: str) -> bool:
@@ -1933,6 +2138,7 @@ class DBManager:
         rows_affected = self.execute_update(query, (category_id, tag_id))
 
         if rows_affected > 0:
+            self._publish_change('category_tags', 'delete', [category_id])
             logger.debug(f"Tag '{tag_name}' removed from category {category_id}")
             return True
 
@@ -1960,12 +2166,14 @@ class DBManager:
 
     # ========== ITEMS ==========
 
-    def get_items_by_category(self, category_id: int) -> List[Dict]:
+    def get_items_by_category(self, category_id: int, decrypt: bool = True) -> List[Dict]:
         """
         Get all items for a specific category
 
         Args:
             category_id: Category ID
+            decrypt: If False, sensitive content is returned still encrypted
+                (callers decrypt lazily, e.g. through Item.content)
 
         Returns:
             List[Dict]: List of item dictionaries (content decrypted if sensitive)
@@ -1977,15 +2185,18 @@ class DBManager:
         """
         results = self.execute_query(query, (category_id,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from src.core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        # Load tags from relational structure (tags and item_tags tables) in bulk
+        self.attach_tags(results)
 
-        # Load tags from relational structure and decrypt sensitive content
-        for item in results:
-            # Load tags from relational structure (tags and item_tags tables)
-            item['tags'] = self.get_tags_by_item(item['id'])
+        if not decrypt:
+            return results
 
+        # Shared encryption manager for decrypting sensitive items
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
+
+        # Decrypt sensitive content
+        for item in results:
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -1997,6 +2208,60 @@ class DBManager:
 
         return results
 
+    def get_items_by_categories(self, category_ids: List[int],
+                                decrypt: bool = True) -> Dict[int, List[Dict]]:
+        """
+        Get items for many categories with a single set-based query
+
+        Equivalent to calling get_items_by_category() for each ID, but reads
+        all rows at once and hydrates tags in bulk.
+
+        Args:
+            category_ids: List of category IDs
+            decrypt: If False, sensitive content is returned still encrypted
+                (callers decrypt lazily, e.g. through Item.content)
+
+        Returns:
+            Dict[int, List[Dict]]: Mapping category_id -> items ordered by created_at
+                (content decrypted if sensitive). Categories without items map to [].
+        """
+        grouped: Dict[int, List[Dict]] = {cat_id: [] for cat_id in category_ids}
+        if not category_ids:
+            return grouped
+
+        unique_ids = list(grouped.keys())
+        results = []
+        for start in range(0, len(unique_ids), self._TAG_BATCH_SIZE):
+            batch = unique_ids[start:start + self._TAG_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            query = f"""
+                SELECT * FROM items
+                WHERE category_id IN ({placeholders})
+                ORDER BY category_id, created_at
+            """
+            results.extend(self.execute_query(query, tuple(batch)))
+
+        # Load tags from relational structure (tags and item_tags tables) in bulk
+        self.attach_tags(results)
+
+        encryption_manager = None
+        for item in results:
+            # Decrypt sensitive content
+            if decrypt and item.get('is_sensitive') and item.get('content'):
+                if encryption_manager is None:
+                    from src.core.encryption_manager import get_encryption_manager
+                    encryption_manager = get_encryption_manager()
+                try:
+                    item['content'] = encryption_manager.decrypt(item['content'])
+                except Exception as e:
+                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                    item['content'] = "[DECRYPTION ERROR]"
+
+            grouped[item['category_id']].append(item)
+
+        logger.debug(f"Retrieved {len(results)} items for {len(unique_ids)} categories")
+        return grouped
+
     def get_item(self, item_id: int) -> Optional[Dict]:
         """
         Get item by ID
@@ -2013,12 +2278,12 @@ class DBManager:
             item = result[0]
 
             # Load tags from relational structure (tags and item_tags tables)
-            item['tags'] = self.get_tags_by_item(item['id'])
+            self.attach_tags(result)
 
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
-                from src.core.encryption_manager import EncryptionManager
-                encryption_manager = EncryptionManager()
+                from src.core.encryption_manager import get_encryption_manager
+                encryption_manager = get_encryption_manager()
                 try:
                     item['content'] = encryption_manager.decrypt(item['content'])
                     logger.debug(f"Content decrypted for item ID: {item_id}")
@@ -2043,22 +2308,13 @@ class DBManager:
         result = self.execute_query(query, (file_hash,))
         if result:
             item = result[0]
-            # Parse tags
-            if item['tags']:
-                try:
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+            # Load tags from relational structure (tags and item_tags tables)
+            self.attach_tags(result)
 
             # Decrypt sensitive content if needed
             if item.get('is_sensitive') and item.get('content'):
-                from src.core.encryption_manager import EncryptionManager
-                encryption_manager = EncryptionManager()
+                from src.core.encryption_manager import get_encryption_manager
+                encryption_manager = get_encryption_manager()
                 try:
                     item['content'] = encryption_manager.decrypt(item['content'])
                     logger.debug(f"Content decrypted for item with hash: {file_hash[:16]}...")
@@ -2105,8 +2361,8 @@ class DBManager:
         results = self.execute_query(query, tuple(params)) if params else self.execute_query(query)
 
         # Initialize encryption manager for decrypting sensitive items
-        from src.core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
 
         # Parse tags and decrypt sensitive content
         for item in results:
@@ -2202,8 +2458,8 @@ class DBManager:
         """
         # Encrypt content if sensitive
         if is_sensitive and content:
-            from src.core.encryption_manager import EncryptionManager
-            encryption_manager = EncryptionManager()
+            from src.core.encryption_manager import get_encryption_manager
+            encryption_manager = get_encryption_manager()
             content = encryption_manager.encrypt(content)
             logger.info(f"Content encrypted for sensitive item: {label}")
 
@@ -2241,6 +2497,8 @@ class DBManager:
         if tags_to_create:
             self.set_item_tags(item_id, tags_to_create)
 
+        self._publish_change('items', 'insert', [item_id], [category_id])
+
         list_info = f", List: {list_group}[{orden_lista}]" if is_list else ""
         tags_info = f", Tags: {len(tags_to_create)}" if tags_to_create else ""
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info}{tags_info})")
@@ -2277,8 +2535,8 @@ class DBManager:
             if field in allowed_fields:
                 # Handle content encryption for sensitive items
                 if field == 'content' and will_be_sensitive and value:
-                    from src.core.encryption_manager import EncryptionManager
-                    encryption_manager = EncryptionManager()
+                    from src.core.encryption_manager import get_encryption_manager
+                    encryption_manager = get_encryption_manager()
                     # Only encrypt if not already encrypted
                     if not encryption_manager.is_encrypted(value):
                         value = encryption_manager.encrypt(value)
@@ -2292,6 +2550,7 @@ class DBManager:
             params.append(item_id)
             query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            self._publish_change('items', 'update', [item_id], [current_item['category_id']])
             logger.info(f"Item updated: ID {item_id}")
 
         # Update tags using relational structure
@@ -2306,6 +2565,8 @@ class DBManager:
         Args:
             item_id: Item ID to delete
         """
+        category_ids = self._get_item_category_ids([item_id])
+
         # Update usage_count for all tags associated with this item
         # (CASCADE will delete item_tags, but we need to update usage_count manually)
         query = """
@@ -2320,6 +2581,7 @@ class DBManager:
         # Delete item (CASCADE will remove item_tags relationships)
         query = "DELETE FROM items WHERE id = ?"
         self.execute_update(query, (item_id,))
+        self._publish_change('items', 'delete', [item_id], category_ids)
         logger.info(f"Item deleted: ID {item_id}")
 
     # ==================== Table CRUD Operations ====================
@@ -2409,6 +2671,7 @@ class DBManager:
         query = f"UPDATE tables SET {', '.join(updates)} WHERE id = ?"
         self.execute_update(query, tuple(params))
         logger.info(f"Table updated: ID {table_id}")
+        self._publish_change('tables', 'update', [table_id])
 
     def delete_table(self, table_id: int) -> None:
         """
@@ -2420,6 +2683,7 @@ class DBManager:
         query = "DELETE FROM tables WHERE id = ?"
         self.execute_update(query, (table_id,))
         logger.info(f"Table deleted: ID {table_id} (items CASCADE deleted)")
+        self._publish_change('items', 'delete')
 
     def get_items_by_table(self, table_id: int) -> list:
         """
@@ -2434,7 +2698,7 @@ class DBManager:
         query = """
             SELECT * FROM items
             WHERE table_id = ?
-            ORDER BY orden_table ASC, created_at ASC
+            ORDER BY table_row ASC, table_col ASC, created_at ASC
         """
         return self.execute_query(query, (table_id,))
 
@@ -2474,6 +2738,45 @@ class DBManager:
 
     # ==================== End Table CRUD ====================
 
+    def save_usage_scores(self, scores: Dict[int, float], replace_all: bool = False) -> None:
+        """
+        Store precomputed usage scores (item_usage_scores)
+
+        Scores of 0 are deleted instead of stored. Bumps data_generation (so
+        cached search rankings are recomputed) only if some score changed.
+
+        Args:
+            scores: item_id -> usage score
+            replace_all: If True, items missing from scores lose their score
+        """
+        with self.transaction() as conn:
+            changes_before = conn.total_changes
+            if replace_all:
+                # Solo las filas que desaparecen (un DELETE completo contaría todo como cambio)
+                conn.execute(
+                    "DELETE FROM item_usage_scores WHERE item_id NOT IN (SELECT value FROM json_each(?))",
+                    (json.dumps([item_id for item_id, score in scores.items() if score]),)
+                )
+            else:
+                conn.executemany(
+                    "DELETE FROM item_usage_scores WHERE item_id = ?",
+                    [(item_id,) for item_id, score in scores.items() if not score]
+                )
+            # Puntuaciones iguales no se reescriben
+            conn.executemany("""
+                INSERT INTO item_usage_scores (item_id, usage_score, computed_at)
+                VALUES (?, ?, datetime('now'))
+                ON CONFLICT(item_id) DO UPDATE SET
+                    usage_score = excluded.usage_score,
+                    computed_at = excluded.computed_at
+                WHERE usage_score IS NOT excluded.usage_score
+            """, [(item_id, score) for item_id, score in scores.items() if score])
+            changed = conn.total_changes - changes_before
+
+        if changed:
+            self._bump_data_generation()
+        logger.debug(f"Usage scores saved: {len(scores)} items, {changed} rows changed (replace_all={replace_all})")
+
     def update_last_used(self, item_id: int) -> None:
         """
         Update item's last_used timestamp
@@ -2483,14 +2786,17 @@ class DBManager:
         """
         query = "UPDATE items SET last_used = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_update(query, (item_id,))
+        self._publish_change('items', 'update', [item_id], self._get_item_category_ids([item_id]))
         logger.debug(f"Last used updated: ID {item_id}")
 
-    def get_all_items(self, include_inactive: bool = False) -> List[Dict]:
+    def get_all_items(self, include_inactive: bool = False, decrypt: bool = True) -> List[Dict]:
         """
         Get ALL items from ALL categories with category info
 
         Args:
             include_inactive: Include items from inactive categories
+            decrypt: If False, sensitive content is returned still encrypted
+                (callers decrypt lazily, e.g. through Item.content)
 
         Returns:
             List[Dict]: List of all items with category_name, category_icon, category_color
@@ -2509,15 +2815,18 @@ class DBManager:
         """
         results = self.execute_query(query, (include_inactive,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from src.core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        # Load tags from relational structure (tags and item_tags tables) in bulk
+        self.attach_tags(results)
 
-        # Load tags from relational structure and decrypt sensitive content
-        for item in results:
-            # Load tags from relational structure (tags and item_tags tables)
-            item['tags'] = self.get_tags_by_item(item['id'])
+        if not decrypt:
+            return results
 
+        # Shared encryption manager for decrypting sensitive items
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
+
+        # Decrypt sensitive content
+        for item in results:
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -2529,6 +2838,220 @@ class DBManager:
 
         return results
 
+    def get_items_by_ids(self, item_ids: List[int]) -> List[Dict]:
+        """
+        Get items by ID in the same shape as get_all_items(decrypt=False)
+
+        Used to refresh single entries of in-memory item lists without
+        reloading everything. Sensitive content is returned still encrypted.
+
+        Args:
+            item_ids: Item IDs
+
+        Returns:
+            List[Dict]: Items with category_name, category_icon, category_color and tags
+        """
+        results = []
+        for start in range(0, len(item_ids), self._TAG_BATCH_SIZE):
+            batch = list(item_ids[start:start + self._TAG_BATCH_SIZE])
+            placeholders = ','.join('?' * len(batch))
+            results.extend(self.execute_query(f"""
+                SELECT
+                    i.*,
+                    c.name as category_name,
+                    c.icon as category_icon,
+                    c.color as category_color,
+                    c.id as category_id
+                FROM items i
+                JOIN categories c ON i.category_id = c.id
+                WHERE i.id IN ({placeholders})
+            """, tuple(batch)))
+
+        self.attach_tags(results)
+        return results
+
+    # Tabla y columnas de cada tipo de entidad relacionable (proyectos/áreas)
+    _ENTITY_TABLES = {
+        'item': ('items', 'id, label, content, type, is_sensitive'),
+        'tag': ('tags', 'id, name'),
+        'category': ('categories', 'id, name, icon'),
+        'list': ('listas', 'id, name'),
+        'table': ('tables', 'id, name'),
+        'process': ('processes', 'id, name'),
+    }
+
+    def get_entities_by_ids(self, entity_type: str, entity_ids: List[int],
+                            decrypt: bool = True) -> Dict[int, Dict]:
+        """
+        Get many entities of one type with batched IN queries
+
+        Args:
+            entity_type: 'item', 'tag', 'category', 'list', 'table' or 'process'
+            entity_ids: Entity IDs (missing IDs are simply absent from the result)
+            decrypt: Decrypt sensitive item content
+
+        Returns:
+            Dict[int, Dict]: Mapping id -> entity row (only the columns exports need)
+        """
+        if entity_type not in self._ENTITY_TABLES:
+            return {}
+        table, columns = self._ENTITY_TABLES[entity_type]
+        ids = list(dict.fromkeys(entity_ids))
+
+        entities = {}
+        for start in range(0, len(ids), self._TAG_BATCH_SIZE):
+            batch = ids[start:start + self._TAG_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            for row in self.execute_query(
+                f"SELECT {columns} FROM {table} WHERE id IN ({placeholders})", tuple(batch)
+            ):
+                entities[row['id']] = row
+
+        if entity_type == 'item' and decrypt:
+            sensitive = [item for item in entities.values()
+                         if item.get('is_sensitive') and item.get('content')]
+            if sensitive:
+                from src.core.encryption_manager import get_encryption_manager
+                encryption_manager = get_encryption_manager()
+                for item in sensitive:
+                    try:
+                        item['content'] = encryption_manager.decrypt(item['content'])
+                    except Exception as e:
+                        logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                        item['content'] = "[DECRYPTION ERROR]"
+
+        return entities
+
+    def get_existing_entity_ids(self, entity_type: str, entity_ids: List[int]) -> Set[int]:
+        """
+        Subset of entity_ids that exist in the database (batched IN queries)
+
+        Args:
+            entity_type: 'item', 'tag', 'category', 'list', 'table' or 'process'
+            entity_ids: Entity IDs to check
+
+        Returns:
+            Set[int]: IDs that exist
+        """
+        if entity_type not in self._ENTITY_TABLES:
+            return set()
+        table = self._ENTITY_TABLES[entity_type][0]
+        ids = list(dict.fromkeys(entity_ids))
+
+        existing = set()
+        for start in range(0, len(ids), self._TAG_BATCH_SIZE):
+            batch = ids[start:start + self._TAG_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.connect().execute(
+                f"SELECT id FROM {table} WHERE id IN ({placeholders})", batch
+            ).fetchall()
+            existing.update(row[0] for row in rows)
+        return existing
+
+    # Filas visibles de cada tipo cuyo id está en un conjunto; el conjunto se
+    # pasa como un único parámetro JSON y se expande con json_each (sin lotes)
+    _ID_SET_QUERIES = {
+        'item': """
+            SELECT
+                i.*,
+                c.name as category_name,
+                c.icon as category_icon,
+                c.color as category_color,
+                c.id as category_id
+            FROM items i
+            JOIN categories c ON i.category_id = c.id
+            WHERE i.id IN (SELECT value FROM json_each(?))
+              AND i.is_active = 1 AND c.is_active = 1
+            ORDER BY i.created_at DESC
+        """,
+        'category': """
+            SELECT * FROM categories
+            WHERE id IN (SELECT value FROM json_each(?)) AND is_active = 1
+            ORDER BY order_index
+        """,
+        'tag': """
+            SELECT * FROM tags
+            WHERE id IN (SELECT value FROM json_each(?))
+            ORDER BY name ASC
+        """,
+        'list': """
+            SELECT
+                l.*,
+                COUNT(i.id) as item_count,
+                MAX(i.last_used) as last_item_used
+            FROM listas l
+            JOIN categories c ON l.category_id = c.id
+            LEFT JOIN items i ON i.list_id = l.id
+            WHERE l.id IN (SELECT value FROM json_each(?)) AND c.is_active = 1
+            GROUP BY l.id
+            ORDER BY c.order_index, l.created_at DESC
+        """,
+        'process': """
+            SELECT * FROM processes
+            WHERE id IN (SELECT value FROM json_each(?))
+              AND is_archived = 0 AND is_active = 1
+            ORDER BY pinned_order ASC, order_index ASC, name ASC
+        """,
+        'table': """
+            SELECT * FROM tables
+            WHERE id IN (SELECT value FROM json_each(?))
+            ORDER BY name
+        """,
+    }
+
+    def get_entities_in_id_set(self, entity_type: str, entity_ids: Set[int],
+                               decrypt: bool = True) -> List[Dict]:
+        """
+        Get the visible rows of one entity type restricted to a set of IDs
+
+        Same rows and order as the full listings (get_all_items,
+        get_categories, get_all_tags, listas per category, get_all_processes,
+        get_all_tables) filtered by ID, but the filter runs in SQL: only the
+        matching rows are read, tagged and decrypted.
+
+        Args:
+            entity_type: 'item', 'category', 'tag', 'list', 'process' or 'table'
+            entity_ids: IDs to keep
+            decrypt: Decrypt sensitive item content
+
+        Returns:
+            List[Dict]: Matching rows (items with category info and tags,
+                categories with their category tags)
+        """
+        if not entity_ids or entity_type not in self._ID_SET_QUERIES:
+            return []
+
+        id_set = json.dumps(sorted(entity_ids))
+        rows = self.execute_query(self._ID_SET_QUERIES[entity_type], (id_set,))
+
+        if entity_type == 'item':
+            self.attach_tags(rows)
+            if decrypt:
+                from src.core.encryption_manager import get_encryption_manager
+                encryption_manager = get_encryption_manager()
+                for item in rows:
+                    if item.get('is_sensitive') and item.get('content'):
+                        try:
+                            item['content'] = encryption_manager.decrypt(item['content'])
+                        except Exception as e:
+                            logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                            item['content'] = "[DECRYPTION ERROR]"
+
+        elif entity_type == 'category':
+            tags_map: Dict[int, List[str]] = {}
+            for row in self.execute_query("""
+                SELECT ctc.category_id, ct.name
+                FROM category_tags ct
+                INNER JOIN category_tags_category ctc ON ct.id = ctc.tag_id
+                WHERE ctc.category_id IN (SELECT value FROM json_each(?))
+                ORDER BY ct.name ASC
+            """, (id_set,)):
+                tags_map.setdefault(row['category_id'], []).append(row['name'])
+            for category in rows:
+                category['tags'] = tags_map.get(category['id'], [])
+
+        return rows
+
     def search_items(self, search_query: str, limit: int = 50) -> List[Dict]:
         """
         Search items by label, content, or tags (using relational structure)
@@ -2558,9 +3081,8 @@ class DBManager:
             (search_pattern, search_pattern, search_pattern, limit)
         )
 
-        # Load tags from relational structure for each item
-        for item in results:
-            item['tags'] = self.get_tags_by_item(item['id'])
+        # Load tags from relational structure in bulk
+        self.attach_tags(results)
 
         return results
 
@@ -2673,6 +3195,7 @@ class DBManager:
             params.append(tag_id)
             query = f"UPDATE tags SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            self._publish_change('tags', 'update', [tag_id])
             logger.info(f"Tag updated: ID {tag_id}")
 
     def delete_tag(self, tag_id: int) -> None:
@@ -2684,6 +3207,7 @@ class DBManager:
         """
         query = "DELETE FROM tags WHERE id = ?"
         self.execute_update(query, (tag_id,))
+        self._publish_change('tags', 'delete', [tag_id])
         logger.info(f"Tag deleted: ID {tag_id} (CASCADE removed item relationships)")
 
     def get_tags_by_item(self, item_id: int) -> List[str]:
@@ -2706,6 +3230,57 @@ class DBManager:
         results = self.execute_query(query, (item_id,))
         return [row['name'] for row in results]
 
+    # Máximo de parámetros por IN (...) para no superar SQLITE_MAX_VARIABLE_NUMBER
+    # en builds antiguos de SQLite (límite histórico: 999)
+    _TAG_BATCH_SIZE = 900
+
+    def get_tags_by_items(self, item_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Get tag names for many items in a single round-trip per batch
+
+        Args:
+            item_ids: List of item IDs
+
+        Returns:
+            Dict[int, List[str]]: Mapping item_id -> tag names (sorted alphabetically).
+                Items without tags map to an empty list.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        tags_map: Dict[int, List[str]] = {item_id: [] for item_id in unique_ids}
+
+        for start in range(0, len(unique_ids), self._TAG_BATCH_SIZE):
+            batch = unique_ids[start:start + self._TAG_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            query = f"""
+                SELECT it.item_id, t.name
+                FROM item_tags it
+                JOIN tags t ON it.tag_id = t.id
+                WHERE it.item_id IN ({placeholders})
+                ORDER BY it.item_id, t.name
+            """
+            for row in self.execute_query(query, tuple(batch)):
+                tags_map[row['item_id']].append(row['name'])
+
+        return tags_map
+
+    def attach_tags(self, items: List[Dict]) -> List[Dict]:
+        """
+        Hydrate the 'tags' key of every item dict using one bulk query
+
+        Args:
+            items: Item dictionaries (must contain 'id')
+
+        Returns:
+            List[Dict]: The same list, with item['tags'] populated
+        """
+        if not items:
+            return items
+
+        tags_map = self.get_tags_by_items([item['id'] for item in items])
+        for item in items:
+            item['tags'] = tags_map.get(item['id'], [])
+        return items
+
     def add_tag_to_item(self, item_id: int, tag_name: str) -> None:
         """
         Add tag to item (get_or_create tag)
@@ -2741,6 +3316,7 @@ class DBManager:
         """
         self.execute_update(query, (tag_id,))
 
+        self._publish_change('item_tags', 'insert', [item_id], self._get_item_category_ids([item_id]))
         logger.debug(f"Tag '{tag_name}' added to item {item_id}")
 
     def remove_tag_from_item(self, item_id: int, tag_name: str) -> None:
@@ -2771,6 +3347,7 @@ class DBManager:
         """
         self.execute_update(query, (tag_id,))
 
+        self._publish_change('item_tags', 'delete', [item_id], self._get_item_category_ids([item_id]))
         logger.debug(f"Tag '{tag_name}' removed from item {item_id}")
 
     def set_item_tags(self, item_id: int, tag_names: List[str]) -> None:
@@ -2822,9 +3399,8 @@ class DBManager:
         """
         results = self.execute_query(query, (tag_name_normalized,))
 
-        # Load tags for each item
-        for item in results:
-            item['tags'] = self.get_tags_by_item(item['id'])
+        # Load tags in bulk
+        self.attach_tags(results)
 
         return results
 
@@ -2848,14 +3424,15 @@ class DBManager:
         """
         results = self.execute_query(query, (tag_id,))
 
+        # Load tags in bulk
+        self.attach_tags(results)
+
         # Initialize encryption manager for decrypting sensitive items
-        from src.core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
 
-        # Load tags for each item and decrypt sensitive content
+        # Decrypt sensitive content
         for item in results:
-            item['tags'] = self.get_tags_by_item(item['id'])
-
             # Decrypt sensitive content
             if item.get('is_sensitive') and item.get('content'):
                 try:
@@ -3146,10 +3723,11 @@ class DBManager:
             )
             updated = cursor.rowcount > 0
 
-            if updated:
-                logger.info(f"Lista {lista_id} actualizada: {updates}")
+        if updated:
+            logger.info(f"Lista {lista_id} actualizada: {updates}")
+            self._publish_change('listas', 'update', [lista_id])
 
-            return updated
+        return updated
 
     def delete_lista(self, lista_id: int) -> bool:
         """
@@ -3165,10 +3743,11 @@ class DBManager:
             cursor = conn.execute("DELETE FROM listas WHERE id = ?", (lista_id,))
             deleted = cursor.rowcount > 0
 
-            if deleted:
-                logger.info(f"Lista {lista_id} eliminada (items eliminados en cascada)")
+        if deleted:
+            logger.info(f"Lista {lista_id} eliminada (items eliminados en cascada)")
+            self._publish_change('items', 'delete')
 
-            return deleted
+        return deleted
 
     def is_lista_name_unique(self, category_id: int, name: str, exclude_id: int = None) -> bool:
         """
@@ -3211,11 +3790,16 @@ class DBManager:
         '''
         results = self.execute_query(query, (lista_id,))
 
+        # Cargar tags desde estructura relacional en bloque
+        self.attach_tags(results)
+
         # Descifrar contenido si es necesario
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
         for item in results:
             if item.get('is_sensitive'):
                 try:
-                    item['content'] = self.encryption_manager.decrypt(item['content'])
+                    item['content'] = encryption_manager.decrypt(item['content'])
                 except Exception as e:
                     logger.error(f"Error al descifrar item {item['id']}: {e}")
                     item['content'] = '[ERROR: No se pudo descifrar]'
@@ -3339,8 +3923,8 @@ class DBManager:
         results = self.execute_query(query, (category_id, list_group))
 
         # Desencriptar y parsear tags (mismo proceso que en get_items_by_category)
-        from src.core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        from src.core.encryption_manager import get_encryption_manager
+        encryption_manager = get_encryption_manager()
 
         for item in results:
             # Parse tags
@@ -3397,6 +3981,15 @@ class DBManager:
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
+                # Items cuyo orden cambia (el movido y los desplazados)
+                cursor.execute("""
+                    SELECT id FROM items
+                    WHERE category_id = ?
+                    AND list_group = ?
+                    AND orden_lista BETWEEN ? AND ?
+                """, (category_id, list_group, min(old_orden, new_orden), max(old_orden, new_orden)))
+                moved_ids = [row[0] for row in cursor.fetchall()]
+
                 # Si movemos hacia arriba (new_orden < old_orden)
                 # Incrementar orden de los items entre new_orden y old_orden
                 if new_orden < old_orden:
@@ -3428,8 +4021,9 @@ class DBManager:
                     WHERE id = ?
                 """, (new_orden, item_id))
 
-                logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
-                return True
+            self._publish_change('items', 'update', moved_ids or [item_id], [category_id])
+            logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
+            return True
 
         except Exception as e:
             logger.error(f"Error al reordenar item {item_id}: {e}")
@@ -3458,8 +4052,10 @@ class DBManager:
                 cursor.execute(query, (category_id, list_group))
                 deleted_count = cursor.rowcount
 
-                logger.info(f"Lista '{list_group}' eliminada ({deleted_count} items) de categoría {category_id}")
-                return True
+            # Borrado en bloque: sin IDs, los suscriptores reconstruyen
+            self._publish_change('items', 'delete', [], [category_id])
+            logger.info(f"Lista '{list_group}' eliminada ({deleted_count} items) de categoría {category_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error al eliminar lista '{list_group}': {e}")
@@ -3483,6 +4079,7 @@ class DBManager:
         Returns:
             bool: True si se actualizó exitosamente
         """
+        renamed_ids = []
         try:
             with self.transaction() as conn:
                 # Caso 1: Solo renombrar
@@ -3492,6 +4089,14 @@ class DBManager:
                         raise ValueError(f"El nombre '{new_list_group}' ya existe en esta categoría")
 
                     cursor = conn.cursor()
+                    cursor.execute("""
+                        SELECT id FROM items
+                        WHERE category_id = ?
+                        AND list_group = ?
+                        AND is_list = 1
+                    """, (category_id, old_list_group))
+                    renamed_ids = [row[0] for row in cursor.fetchall()]
+
                     cursor.execute("""
                         UPDATE items
                         SET list_group = ?
@@ -3513,7 +4118,10 @@ class DBManager:
 
                     logger.info(f"Lista '{final_list_name}' actualizada con {len(items_data)} items")
 
-                return True
+            # delete_list/create_list publican sus propios cambios; el renombrado no
+            if renamed_ids:
+                self._publish_change('items', 'update', renamed_ids, [category_id])
+            return True
 
         except Exception as e:
             logger.error(f"Error al actualizar lista '{old_list_group}': {e}")
@@ -3603,7 +4211,10 @@ class DBManager:
 
     # ========== IMAGE GALLERY ==========
 
-    def get_image_items(
+    # Extensiones de imagen soportadas
+    _IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+
+    def _build_image_filters(
         self,
         category_id: Optional[int] = None,
         search_text: Optional[str] = None,
@@ -3612,39 +4223,25 @@ class DBManager:
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         min_size: Optional[int] = None,
-        max_size: Optional[int] = None,
-        limit: int = 50,
-        offset: int = 0
-    ) -> List[Dict]:
+        max_size: Optional[int] = None
+    ) -> Tuple[str, List]:
         """
-        Obtener items de tipo PATH que son imágenes con filtros opcionales
+        Construir el WHERE compartido por get_image_items y get_image_count
 
-        Args:
-            category_id: Filtrar por categoría específica (opcional)
-            search_text: Búsqueda en nombre/descripción (opcional)
-            tags: Lista de tags para filtrar (opcional)
-            is_favorite: Filtrar solo favoritos (opcional)
-            date_from: Fecha desde (formato: YYYY-MM-DD, opcional)
-            date_to: Fecha hasta (formato: YYYY-MM-DD, opcional)
-            min_size: Tamaño mínimo en bytes (opcional)
-            max_size: Tamaño máximo en bytes (opcional)
-            limit: Máximo de resultados (default: 50)
-            offset: Offset para paginación (default: 0)
+        Todos los filtros (incluidos los tags) se resuelven en SQL, de modo que
+        LIMIT y COUNT operan sobre el mismo conjunto de filas.
 
         Returns:
-            List[Dict]: Lista de items de imagen con metadatos completos
+            Tuple[str, List]: (where_clause sobre el alias "i", parámetros)
         """
-        # Extensiones de imagen soportadas
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
-
         # Construcción dinámica de query con filtros
         conditions = ["i.type = 'PATH'"]
         params = []
 
         # Filtro por extensiones de imagen
-        ext_placeholders = ','.join(['?' for _ in image_extensions])
+        ext_placeholders = ','.join(['?' for _ in self._IMAGE_EXTENSIONS])
         conditions.append(f"i.file_extension IN ({ext_placeholders})")
-        params.extend(image_extensions)
+        params.extend(self._IMAGE_EXTENSIONS)
 
         # Filtro por categoría
         if category_id is not None:
@@ -3657,18 +4254,28 @@ class DBManager:
             search_pattern = f"%{search_text}%"
             params.extend([search_pattern, search_pattern])
 
+        # Filtro por tags: al menos uno de los tags indicados (sin distinguir mayúsculas)
+        if tags:
+            tag_placeholders = ','.join(['?' for _ in tags])
+            conditions.append(f"""EXISTS (
+                SELECT 1 FROM item_tags it
+                JOIN tags t ON it.tag_id = t.id
+                WHERE it.item_id = i.id AND t.name IN ({tag_placeholders})
+            )""")
+            params.extend(tag.strip().lower() for tag in tags)
+
         # Filtro por favoritos
         if is_favorite is not None:
             conditions.append("i.is_favorite = ?")
             params.append(1 if is_favorite else 0)
 
-        # Filtro por rango de fechas
+        # Filtro por rango de fechas (comparación sobre la columna para usar el índice)
         if date_from:
-            conditions.append("DATE(i.created_at) >= ?")
+            conditions.append("i.created_at >= ?")
             params.append(date_from)
 
         if date_to:
-            conditions.append("DATE(i.created_at) <= ?")
+            conditions.append("i.created_at < date(?, '+1 day')")
             params.append(date_to)
 
         # Filtro por tamaño de archivo
@@ -3680,42 +4287,9 @@ class DBManager:
             conditions.append("i.file_size <= ?")
             params.append(max_size)
 
-        # Construir query principal
-        where_clause = " AND ".join(conditions)
-        query = f"""
-            SELECT
-                i.*,
-                c.name as category_name,
-                c.icon as category_icon,
-                c.color as category_color
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE {where_clause}
-            ORDER BY i.created_at DESC
-            LIMIT ? OFFSET ?
-        """
-        params.extend([limit, offset])
+        return " AND ".join(conditions), params
 
-        results = self.execute_query(query, tuple(params))
-
-        # Cargar tags desde estructura relacional y filtrar por tags si se especificaron
-        filtered_results = []
-        for item in results:
-            # Cargar tags desde estructura relacional
-            item['tags'] = self.get_tags_by_item(item['id'])
-
-            # Filtrar por tags si se especificaron
-            if tags:
-                # Verificar que al menos uno de los tags especificados esté presente
-                if any(tag.lower() in [t.lower() for t in item['tags']] for tag in tags):
-                    filtered_results.append(item)
-            else:
-                filtered_results.append(item)
-
-        logger.debug(f"Retrieved {len(filtered_results)} image items")
-        return filtered_results
-
-    def get_image_count(
+    def get_image_items(
         self,
         category_id: Optional[int] = None,
         search_text: Optional[str] = None,
@@ -3724,89 +4298,95 @@ class DBManager:
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         min_size: Optional[int] = None,
-        max_size: Optional[int] = None
-    ) -> int:
+        max_size: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[Tuple[str, int]] = None
+    ) -> List[Dict]:
         """
-        Contar items de imagen que coinciden con los filtros
+        Obtener items de tipo PATH que son imágenes con filtros opcionales
 
         Args:
-            Mismos parámetros que get_image_items (excepto limit/offset)
+            category_id: Filtrar por categoría específica (opcional)
+            search_text: Búsqueda en nombre/descripción (opcional)
+            tags: Lista de tags para filtrar, basta con uno (opcional)
+            is_favorite: Filtrar solo favoritos (opcional)
+            date_from: Fecha desde (formato: YYYY-MM-DD, opcional)
+            date_to: Fecha hasta (formato: YYYY-MM-DD, opcional)
+            min_size: Tamaño mínimo en bytes (opcional)
+            max_size: Tamaño máximo en bytes (opcional)
+            limit: Máximo de resultados (default: 50)
+            offset: Offset para paginación (default: 0, ignorado si hay cursor)
+            cursor: (created_at, id) del último item de la página anterior.
+                Paginación keyset: coste constante en páginas profundas.
 
         Returns:
-            int: Número total de imágenes que coinciden con filtros
+            List[Dict]: Lista de items de imagen con metadatos completos,
+                ordenada por created_at DESC, id DESC
         """
-        # Extensiones de imagen soportadas
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+        where_clause, params = self._build_image_filters(
+            category_id, search_text, tags, is_favorite,
+            date_from, date_to, min_size, max_size
+        )
 
-        # Construcción dinámica de query con filtros
-        conditions = ["type = 'PATH'"]
-        params = []
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            where_clause += " AND (i.created_at < ? OR (i.created_at = ? AND i.id < ?))"
+            params.extend([cursor_created_at, cursor_created_at, cursor_id])
+            offset = 0
 
-        # Filtro por extensiones de imagen
-        ext_placeholders = ','.join(['?' for _ in image_extensions])
-        conditions.append(f"file_extension IN ({ext_placeholders})")
-        params.extend(image_extensions)
-
-        # Filtro por categoría
-        if category_id is not None:
-            conditions.append("category_id = ?")
-            params.append(category_id)
-
-        # Filtro por búsqueda de texto
-        if search_text:
-            conditions.append("(label LIKE ? OR description LIKE ?)")
-            search_pattern = f"%{search_text}%"
-            params.extend([search_pattern, search_pattern])
+        # Construir query principal
+        query = f"""
+            SELECT
+                i.*,
+                c.name as category_name,
+                c.icon as category_icon,
+                c.color as category_color
+            FROM items i
+            LEFT JOIN categories c ON i.category_id = c.id
+            WHERE {where_clause}
+            ORDER BY i.created_at DESC, i.id DESC
+            LIMIT ? OFFSET ?
+        """
+        params.extend([limit, offset])
 
-        # Filtro por favoritos
-        if is_favorite is not None:
-            conditions.append("is_favorite = ?")
-            params.append(1 if is_favorite else 0)
+        results = self.execute_query(query, tuple(params))
 
-        # Filtro por rango de fechas
-        if date_from:
-            conditions.append("DATE(created_at) >= ?")
-            params.append(date_from)
+        # Cargar tags desde estructura relacional (una sola consulta para toda la página)
+        self.attach_tags(results)
 
-        if date_to:
-            conditions.append("DATE(created_at) <= ?")
-            params.append(date_to)
+        logger.debug(f"Retrieved {len(results)} image items")
+        return results
 
-        # Filtro por tamaño de archivo
-        if min_size is not None:
-            conditions.append("file_size >= ?")
-            params.append(min_size)
+    def get_image_count(
+        self,
+        category_id: Optional[int] = None,
+        search_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        is_favorite: Optional[bool] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
+    ) -> int:
+        """
+        Contar items de imagen que coinciden con los filtros
 
-        if max_size is not None:
-            conditions.append("file_size <= ?")
-            params.append(max_size)
+        Args:
+            Mismos parámetros que get_image_items (excepto limit/offset/cursor)
 
-        # Construir query
-        where_clause = " AND ".join(conditions)
-        query = f"SELECT COUNT(*) as count FROM items WHERE {where_clause}"
+        Returns:
+            int: Número total de imágenes que coinciden con filtros
+        """
+        where_clause, params = self._build_image_filters(
+            category_id, search_text, tags, is_favorite,
+            date_from, date_to, min_size, max_size
+        )
 
+        query = f"SELECT COUNT(*) as count FROM items i WHERE {where_clause}"
         result = self.execute_query(query, tuple(params))
         count = result[0]['count'] if result else 0
 
-        # Si hay filtro de tags, necesitamos obtener items y filtrar usando la tabla tags
-        if tags:
-            # Construir query con JOINs a tags e item_tags
-            tag_placeholders = ','.join(['?' for _ in tags])
-            tags_query = f"""
-                SELECT COUNT(DISTINCT i.id) as count
-                FROM items i
-                JOIN item_tags it ON i.id = it.item_id
-                JOIN tags t ON it.tag_id = t.id
-                WHERE {where_clause}
-                AND t.name IN ({tag_placeholders})
-            """
-
-            # Combinar parámetros
-            tag_params = list(params) + [tag.lower() for tag in tags]
-
-            tag_result = self.execute_query(tags_query, tuple(tag_params))
-            count = tag_result[0]['count'] if tag_result else 0
-
         logger.debug(f"Image count: {count}")
         return count
 
@@ -3817,7 +4397,7 @@ class DBManager:
         Returns:
             List[Dict]: Lista de categorías con conteo de imágenes
         """
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+        image_extensions = self._IMAGE_EXTENSIONS
         ext_placeholders = ','.join(['?' for _ in image_extensions])
 
         query = f"""
@@ -3847,7 +4427,7 @@ class DBManager:
         Returns:
             List[str]: Lista de tags únicos ordenados alfabéticamente
         """
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+        image_extensions = self._IMAGE_EXTENSIONS
         ext_placeholders = ','.join(['?' for _ in image_extensions])
 
         query = f"""
@@ -5361,6 +5941,7 @@ class DBManager:
                     (count, category_id)
                 )
 
+            self._publish_change('categories', 'update', [category_id])
             logger.info(f"Updated item_count for category {category_id}: {count} items")
 
         except Exception as e:
@@ -5369,29 +5950,39 @@ class DBManager:
 
     # ==================== Table Operations ====================
 
-    def add_table_items(self, category_id: str, table_name: str, table_data: list,
+    # Filas de tabla por lote en add_table_items (executemany + un SELECT de IDs por lote)
+    _TABLE_IMPORT_BATCH_ROWS = 500
+
+    def add_table_items(self, category_id: str, table_name: str, table_data: Iterable[List[str]],
                        column_names: list, tags: list = None, sensitive_columns: list = None,
-                       url_columns: list = None) -> dict:
+                       url_columns: list = None, batch_size: int = None) -> dict:
         """
         Create all items for a table in a single transaction
 
+        Rows are consumed lazily and inserted in batches (items and item_tags
+        with executemany), so table_data can be a generator such as a CSV
+        reader and memory stays flat for very large tables.
+
         Args:
             category_id: Category ID where table belongs
             table_name: Unique name for the table
-            table_data: 2D list of cell values [[row1_col1, row1_col2], [row2_col1, row2_col2]]
+            table_data: Rows of cell values (list or any iterable) [[row1_col1, row1_col2], ...]
             column_names: List of column names
             tags: Optional list of tags to apply to all items
             sensitive_columns: Optional list of column indices that should be marked as sensitive
             url_columns: Optional list of column indices that should be marked as type URL
+            batch_size: Rows per insert batch (default _TABLE_IMPORT_BATCH_ROWS)
 
         Returns:
             dict with 'success', 'items_created', 'table_name', 'errors'
         """
         try:
-            logger.info(f"Creating table '{table_name}' in category {category_id}")
-            logger.info(f"  Rows: {len(table_data)}, Columns: {len(column_names)}")
+            logger.info(f"Creating table '{table_name}' in category {category_id} ({len(column_names)} columns)")
 
+            batch_size = batch_size or self._TABLE_IMPORT_BATCH_ROWS
+            category_id = int(category_id)
             items_created = 0
+            rows_read = 0
             errors = []
 
             with self.transaction() as conn:
@@ -5418,129 +6009,92 @@ class DBManager:
                 )
                 table_id = cursor.lastrowid
 
-                # Preparar tags base (los que vienen del usuario)
-                base_tags = tags if tags else []
+                # Tags comunes a todas las celdas (los de la fila se resuelven por lote)
+                base_tags = ["tabla", "lista", table_name] + [tag for tag in (tags or []) if tag]
 
-                # Prepare sensitive columns set for fast lookup
+                # Prepare sensitive/URL columns sets for fast lookup
                 sensitive_cols_set = set(sensitive_columns) if sensitive_columns else set()
-
-                # Prepare URL columns set for fast lookup
                 url_cols_set = set(url_columns) if url_columns else set()
-
-                # Insert each cell as an item
-                for row_idx, row_data in enumerate(table_data):
-                    # Obtener el valor de la primera celda (nombre de fila)
-                    first_cell_value = ""
-                    first_cell_original = ""  # Valor original sin sanitizar para el tag
-
-                    if len(row_data) > 0 and row_data[0]:
-                        first_cell_original = str(row_data[0]).strip()
-                        first_cell_value = first_cell_original
-
-                        # Sanitizar el valor para usarlo en list_group (remover caracteres especiales)
-                        first_cell_value = first_cell_value.replace(' ', '_')
-                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
-                        # Limitar longitud
-                        if len(first_cell_value) > 50:
-                            first_cell_value = first_cell_value[:50]
-
-                    # Si la primera celda está vacía, usar row_N como fallback
-                    if not first_cell_value:
-                        first_cell_value = f"row_{row_idx}"
-                        first_cell_original = f"row_{row_idx}"
-
-                    # Generar list_group: solo el nombre de la primera celda (sin prefijo de tabla)
-                    list_group_name = first_cell_value
-
-                    for col_idx, cell_value in enumerate(row_data):
-                        # Skip empty cells
-                        if not cell_value or str(cell_value).strip() == '':
-                            continue
-
-                        try:
-                            # Create item for this cell
-                            column_name = column_names[col_idx] if col_idx < len(column_names) else f"COL_{col_idx}"
-
-                            # Generar tags automáticos para esta celda
-                            # Formato: ["tabla", "lista", "nombre_tabla", "nombre_fila", "nombre_columna"]
-                            # Nota: Se incluye "lista" porque cada fila de una tabla también es una lista
-                            cell_tags = ["tabla", "lista", table_name, first_cell_original, column_name]
-
-                            # Agregar tags base del usuario (si existen)
-                            for tag in base_tags:
-                                if tag and tag not in cell_tags:
-                                    cell_tags.append(tag)
-
-                            # Determinar si esta columna es sensible
-                            is_sensitive = 1 if col_idx in sensitive_cols_set else 0
-
-                            # Determinar el tipo de item
-                            item_type = 'URL' if col_idx in url_cols_set else 'TEXT'
-
-                            # Cifrar contenido si es sensible
-                            content_to_store = str(cell_value)
-                            if is_sensitive and content_to_store:
-                                from src.core.encryption_manager import EncryptionManager
-                                encryption_manager = EncryptionManager()
-                                content_to_store = encryption_manager.encrypt(content_to_store)
-                                logger.debug(f"Content encrypted for sensitive column '{column_name}' at [{row_idx}, {col_idx}]")
-
-                            cursor.execute("""
-                                INSERT INTO items (
-                                    category_id, label, content, type,
-                                    table_id, orden_table,
-                                    is_list, list_group, orden_lista,
-                                    is_sensitive, created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-                            """, (
-                                int(category_id),  # Convert to INTEGER
-                                column_name,  # Label = column name
-                                content_to_store,  # Content = cell value (cifrado si es sensible)
-                                item_type,  # Type (URL si está en url_columns, TEXT por defecto)
-                                table_id,  # table_id (FK a tabla tables)
-                                json.dumps([row_idx, col_idx]),  # orden_table as JSON [row, col]
-                                1,  # is_list = True (for row grouping)
-                                list_group_name,  # list_group = {table_name}_{primera_celda}
-                                col_idx + 1,  # orden_lista = column index + 1 (empieza en 1)
-                                is_sensitive  # is_sensitive (1 si columna marcada como sensible)
-                            ))
-
-                            item_id = cursor.lastrowid
-                            items_created += 1
-
-                            # Crear relaciones en item_tags para cada tag
-                            # Usar la función set_item_tags que ya maneja la tabla tags y item_tags
-                            if cell_tags:
-                                # Necesitamos hacer esto fuera de la transacción actual
-                                # porque set_item_tags usa su propia transacción
-                                # Guardar para procesarlos después
-                                if not hasattr(self, '_pending_tags'):
-                                    self._pending_tags = []
-                                self._pending_tags.append((item_id, cell_tags))
-
-                        except Exception as e:
-                            error_msg = f"Error creating item at [{row_idx}, {col_idx}]: {e}"
-                            logger.error(error_msg)
-                            errors.append(error_msg)
+                encryption_manager = None
+                if sensitive_cols_set:
+                    from src.core.encryption_manager import get_encryption_manager
+                    encryption_manager = get_encryption_manager()
+
+                rows = iter(table_data)
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+
+                    item_rows = []
+                    cell_tags = {}  # (row, col) -> tags normalizados
+                    for row_idx, row_data in enumerate(batch, rows_read):
+                        # La primera celda da nombre a la fila (list_group y tag)
+                        first_cell_original = str(row_data[0]).strip() if len(row_data) > 0 and row_data[0] else ""
+                        list_group_name = self._table_row_list_group(first_cell_original)
+                        if not list_group_name:
+                            list_group_name = f"row_{row_idx}"
+                            first_cell_original = f"row_{row_idx}"
+
+                        for col_idx, cell_value in enumerate(row_data):
+                            # Skip empty cells
+                            if not cell_value or str(cell_value).strip() == '':
+                                continue
+
+                            try:
+                                column_name = column_names[col_idx] if col_idx < len(column_names) else f"COL_{col_idx}"
+                                is_sensitive = 1 if col_idx in sensitive_cols_set else 0
+
+                                # Cifrar contenido si es sensible
+                                content_to_store = str(cell_value)
+                                if is_sensitive:
+                                    content_to_store = encryption_manager.encrypt(content_to_store)
+
+                                item_rows.append((
+                                    category_id,
+                                    column_name,  # Label = column name
+                                    content_to_store,
+                                    'URL' if col_idx in url_cols_set else 'TEXT',
+                                    table_id,
+                                    json.dumps([row_idx, col_idx]),  # orden_table as JSON [row, col]
+                                    row_idx,  # table_row
+                                    col_idx,  # table_col
+                                    1,  # is_list = True (for row grouping)
+                                    list_group_name,
+                                    col_idx + 1,  # orden_lista = column index + 1 (empieza en 1)
+                                    is_sensitive
+                                ))
+                                # Formato: ["tabla", "lista", nombre_tabla, nombre_fila, nombre_columna, ...tags del usuario]
+                                cell_tags[(row_idx, col_idx)] = {
+                                    tag.strip().lower()
+                                    for tag in base_tags + [first_cell_original, column_name]
+                                    if tag.strip()
+                                }
+                            except Exception as e:
+                                error_msg = f"Error creating item at [{row_idx}, {col_idx}]: {e}"
+                                logger.error(error_msg)
+                                errors.append(error_msg)
+
+                    cursor.executemany("""
+                        INSERT INTO items (
+                            category_id, label, content, type,
+                            table_id, orden_table, table_row, table_col,
+                            is_list, list_group, orden_lista,
+                            is_sensitive, created_at, updated_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+                    """, item_rows)
+                    items_created += len(item_rows)
+
+                    self._insert_table_cell_tags(cursor, table_id, rows_read, rows_read + len(batch) - 1, cell_tags)
+                    rows_read += len(batch)
 
             # Update category item_count (outside transaction)
             self.update_category_item_count(category_id)
+            self._publish_change('items', 'insert', [], [category_id])
+            self._publish_change('item_tags', 'insert', [], [category_id])
+            self._publish_change('tags', 'insert')
 
-            # Procesar tags pendientes (fuera de la transacción principal)
-            if hasattr(self, '_pending_tags') and self._pending_tags:
-                logger.info(f"Processing {len(self._pending_tags)} pending tag associations...")
-                for item_id, tags_list in self._pending_tags:
-                    try:
-                        self.set_item_tags(item_id, tags_list)
-                    except Exception as e:
-                        error_msg = f"Error setting tags for item {item_id}: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-
-                # Limpiar tags pendientes
-                self._pending_tags = []
-
-            logger.info(f"Table '{table_name}' created: {items_created} items")
+            logger.info(f"Table '{table_name}' created: {rows_read} rows, {items_created} items")
 
             return {
                 'success': items_created > 0,
@@ -5558,6 +6112,52 @@ class DBManager:
                 'errors': [str(e)]
             }
 
+    def _insert_table_cell_tags(self, cursor: sqlite3.Cursor, table_id: int, first_row: int,
+                                last_row: int, cell_tags: Dict[Tuple[int, int], Set[str]]) -> None:
+        """
+        Create tags and item_tags for a batch of table cells just inserted
+
+        Args:
+            cursor: Cursor of the open add_table_items transaction
+            table_id: Table ID
+            first_row: First row index of the batch
+            last_row: Last row index of the batch
+            cell_tags: (row, col) -> normalized tag names
+        """
+        if not cell_tags:
+            return
+
+        names = sorted(set().union(*cell_tags.values()))
+        cursor.executemany("""
+            INSERT OR IGNORE INTO tags (name, usage_count, created_at, updated_at)
+            VALUES (?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        """, [(name,) for name in names])
+        tag_ids = dict(cursor.execute(
+            "SELECT name, id FROM tags WHERE name IN (SELECT value FROM json_each(?))",
+            (json.dumps(names),)
+        ).fetchall())
+
+        item_tags = []
+        usage = {}
+        for item_id, row, col in cursor.execute("""
+            SELECT id, table_row, table_col FROM items
+            WHERE table_id = ? AND table_row BETWEEN ? AND ?
+        """, (table_id, first_row, last_row)).fetchall():
+            for name in cell_tags.get((row, col), ()):
+                tag_id = tag_ids[name]
+                item_tags.append((item_id, tag_id))
+                usage[tag_id] = usage.get(tag_id, 0) + 1
+
+        cursor.executemany("""
+            INSERT OR IGNORE INTO item_tags (item_id, tag_id, created_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """, item_tags)
+        cursor.executemany("""
+            UPDATE tags
+            SET usage_count = usage_count + ?, last_used = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, [(count, tag_id) for tag_id, count in usage.items()])
+
     def get_table_items(self, table_name: str) -> list:
         """
         Retrieve all items belonging to a specific table
@@ -5575,7 +6175,7 @@ class DBManager:
                 SELECT i.* FROM items i
                 INNER JOIN tables t ON i.table_id = t.id
                 WHERE t.name = ?
-                ORDER BY i.orden_table
+                ORDER BY i.table_row, i.table_col
             """
             results = self.execute_query(query, (table_name,))
 
@@ -5634,22 +6234,15 @@ class DBManager:
                     table_name = row['name']
                     table_id = row['id']
 
-                    # Get dimensions (max row and col from orden_table)
+                    # Get dimensions (max row and col)
                     cursor.execute("""
-                        SELECT orden_table FROM items
+                        SELECT MAX(table_row) + 1 AS rows, MAX(table_col) + 1 AS cols
+                        FROM items
                         WHERE table_id = ?
                     """, (table_id,))
-
-                    coords = []
-                    for item_row in cursor.fetchall():
-                        try:
-                            coord = json.loads(item_row['orden_table'])
-                            coords.append(coord)
-                        except:
-                            continue
-
-                    max_row = max([c[0] for c in coords]) + 1 if coords else 0
-                    max_col = max([c[1] for c in coords]) + 1 if coords else 0
+                    dimensions = cursor.fetchone()
+                    max_row = dimensions['rows'] or 0
+                    max_col = dimensions['cols'] or 0
 
                     tables.append({
                         'name': table_name,
@@ -5666,6 +6259,13 @@ class DBManager:
             logger.error(f"Error getting tables for category {category_id}: {e}")
             return []
 
+    @staticmethod
+    def _table_row_list_group(first_cell: str) -> str:
+        """list_group de una fila de tabla a partir del valor de su primera celda ('' si no es usable)"""
+        value = (first_cell or '').strip().replace(' ', '_')
+        value = ''.join(c for c in value if c.isalnum() or c in ('_', '-'))
+        return value[:50]
+
     def update_table_cell(self, table_name: str, row: int, col: int, new_content: str) -> bool:
         """
         Update content of a specific table cell
@@ -5682,23 +6282,22 @@ class DBManager:
         try:
             logger.info(f"Updating table '{table_name}' cell [{row}, {col}]")
 
-            orden_json = json.dumps([row, col])
-
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
                 # Find item at this position
                 cursor.execute("""
-                    SELECT i.id FROM items i
+                    SELECT i.id, i.table_id, i.category_id FROM items i
                     INNER JOIN tables t ON i.table_id = t.id
-                    WHERE t.name = ? AND i.orden_table = ?
-                """, (table_name, orden_json))
+                    WHERE t.name = ? AND i.table_row = ? AND i.table_col = ?
+                """, (table_name, row, col))
 
                 result = cursor.fetchone()
 
                 if result:
                     # Update existing item
                     item_id = result['id']
+                    changed_ids = [item_id]
                     cursor.execute("""
                         UPDATE items
                         SET content = ?, updated_at = datetime('now')
@@ -5706,37 +6305,130 @@ class DBManager:
                     """, (new_content, item_id))
 
                     # Si se actualizó la primera columna, actualizar list_group de toda la fila
-                    if col == 0 and new_content and new_content.strip():
-                        # Sanitizar el nuevo valor para list_group
-                        first_cell_value = new_content.strip()
-                        first_cell_value = first_cell_value.replace(' ', '_')
-                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
-                        if len(first_cell_value) > 50:
-                            first_cell_value = first_cell_value[:50]
-
-                        if first_cell_value:
-                            new_list_group = first_cell_value  # Solo el valor de la primera celda
-
-                            # Actualizar list_group de todos los items de esta fila
+                    if col == 0:
+                        new_list_group = self._table_row_list_group(new_content)
+                        if new_list_group:
                             cursor.execute("""
                                 UPDATE items
                                 SET list_group = ?, updated_at = datetime('now')
-                                WHERE table_id = (SELECT id FROM tables WHERE name = ?)
-                                AND json_extract(orden_table, '$[0]') = ?
-                            """, (new_list_group, table_name, row))
+                                WHERE table_id = ? AND table_row = ?
+                            """, (new_list_group, result['table_id'], row))
+                            cursor.execute(
+                                "SELECT id FROM items WHERE table_id = ? AND table_row = ?",
+                                (result['table_id'], row)
+                            )
+                            changed_ids = [cell['id'] for cell in cursor.fetchall()]
 
                             logger.info(f"Updated list_group for row {row} to '{new_list_group}'")
 
-                    logger.info(f"✓ Cell updated successfully")
-                    return True
-                else:
-                    logger.warning(f"No item found at table '{table_name}' position [{row}, {col}]")
-                    return False
+            if not result:
+                logger.warning(f"No item found at table '{table_name}' position [{row}, {col}]")
+                return False
+
+            self._publish_change('items', 'update', changed_ids, [result['category_id']])
+            logger.info(f"✓ Cell updated successfully")
+            return True
 
         except Exception as e:
             logger.error(f"Error updating table cell: {e}")
             return False
 
+    def update_table_cells(self, table_name: str, table_data: List[List[str]]) -> Dict[str, Any]:
+        """
+        Update a whole table grid, writing only the cells that changed
+
+        The current cells are read once, compared with the new grid and the
+        changed ones are written with executemany in a single transaction.
+        Sensitive cells are compared decrypted and stored encrypted.
+
+        Args:
+            table_name: Name of the table
+            table_data: New grid (rows of cell values)
+
+        Returns:
+            Dict with 'success', 'updated', 'unchanged' and 'missing'
+            (positions [row, col] with a value but no cell item)
+        """
+        result = {'success': False, 'updated': 0, 'unchanged': 0, 'missing': []}
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                table = cursor.execute(
+                    "SELECT id FROM tables WHERE name = ?", (table_name,)
+                ).fetchone()
+                if not table:
+                    logger.warning(f"Table '{table_name}' not found")
+                    return result
+                table_id = table['id']
+
+                cells = {
+                    (row['table_row'], row['table_col']): row
+                    for row in cursor.execute("""
+                        SELECT id, category_id, table_row, table_col, content, is_sensitive
+                        FROM items
+                        WHERE table_id = ? AND table_row IS NOT NULL
+                    """, (table_id,))
+                }
+
+                encryption_manager = None
+                if any(cell['is_sensitive'] for cell in cells.values()):
+                    from src.core.encryption_manager import get_encryption_manager
+                    encryption_manager = get_encryption_manager()
+
+                updates = []
+                list_groups = []
+                category_ids = set()
+                for row_idx, row_data in enumerate(table_data):
+                    for col_idx, value in enumerate(row_data):
+                        value = '' if value is None else str(value)
+                        cell = cells.get((row_idx, col_idx))
+                        if cell is None:
+                            if value.strip():
+                                result['missing'].append([row_idx, col_idx])
+                            continue
+
+                        current = cell['content']
+                        if cell['is_sensitive'] and current:
+                            current = encryption_manager.decrypt(current)
+
+                        if current == value:
+                            result['unchanged'] += 1
+                            continue
+
+                        stored = value
+                        if cell['is_sensitive'] and value:
+                            stored = encryption_manager.encrypt(value)
+                        updates.append((stored, cell['id']))
+                        category_ids.add(cell['category_id'])
+
+                        # La primera columna da nombre a la fila (list_group)
+                        if col_idx == 0:
+                            list_group = self._table_row_list_group(value)
+                            if list_group:
+                                list_groups.append((list_group, table_id, row_idx))
+
+                cursor.executemany("""
+                    UPDATE items SET content = ?, updated_at = datetime('now') WHERE id = ?
+                """, updates)
+                cursor.executemany("""
+                    UPDATE items SET list_group = ?, updated_at = datetime('now')
+                    WHERE table_id = ? AND table_row = ?
+                """, list_groups)
+
+            result['updated'] = len(updates)
+            result['success'] = True
+            if updates:
+                self._publish_change('items', 'update', [item_id for _, item_id in updates], category_ids)
+
+            logger.info(f"Table '{table_name}' cells updated: {result['updated']} changed, "
+                        f"{result['unchanged']} unchanged, {len(result['missing'])} missing")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error updating cells of table '{table_name}': {e}")
+            result['error'] = str(e)
+            return result
+
     def delete_table_by_name(self, table_name: str) -> bool:
         """
         Delete all items belonging to a table (legacy method)
@@ -5783,6 +6475,105 @@ class DBManager:
             logger.error(f"Error deleting table '{table_name}': {e}")
             return False
 
+    # Celdas leídas por consulta en iter_table_rows
+    _TABLE_EXPORT_CHUNK_CELLS = 1000
+
+    def get_table_shape(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Dimensions and column names of a table, without loading its cells
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Dict with 'table_id', 'columns', 'total_rows', 'total_cols',
+            'total_items' and 'created_at', or None if the table doesn't exist
+        """
+        conn = self.connect()
+        shape = conn.execute("""
+            SELECT t.id, COUNT(i.id) AS total_items,
+                   COALESCE(MAX(i.table_row) + 1, 0) AS total_rows,
+                   COALESCE(MAX(i.table_col) + 1, 0) AS total_cols,
+                   MIN(i.created_at) AS created_at
+            FROM tables t
+            LEFT JOIN items i ON i.table_id = t.id AND i.table_row IS NOT NULL
+            WHERE t.name = ?
+            GROUP BY t.id
+        """, (table_name,)).fetchone()
+        if not shape:
+            return None
+
+        # Nombres de columna: label de las celdas de la fila 0 (o COL_n)
+        labels = dict(conn.execute("""
+            SELECT table_col, label FROM items
+            WHERE table_id = ? AND table_row = 0
+        """, (shape['id'],)).fetchall())
+
+        return {
+            'table_id': shape['id'],
+            'columns': [labels.get(col, f"COL_{col}") for col in range(shape['total_cols'])],
+            'total_rows': shape['total_rows'],
+            'total_cols': shape['total_cols'],
+            'total_items': shape['total_items'],
+            'created_at': shape['created_at']
+        }
+
+    def iter_table_rows(self, table_name: str, chunk_size: int = None,
+                        decrypt: bool = False) -> Iterator[List[str]]:
+        """
+        Stream the rows of a table in order, reading cells in fixed-size chunks
+
+        Cells are paged by (table_row, table_col) on idx_items_table_cell, so
+        only one chunk is held in memory. Missing cells (and rows) come back
+        as '' so every row has the table width.
+
+        Args:
+            table_name: Name of the table
+            chunk_size: Cells per query (default _TABLE_EXPORT_CHUNK_CELLS)
+            decrypt: Decrypt sensitive cells (stored content is returned otherwise)
+
+        Yields:
+            List[str]: Cell contents of each row
+        """
+        shape = self.get_table_shape(table_name)
+        if not shape or not shape['total_items']:
+            return
+
+        chunk_size = chunk_size or self._TABLE_EXPORT_CHUNK_CELLS
+        width = shape['total_cols']
+        encryption_manager = None
+        if decrypt:
+            from src.core.encryption_manager import get_encryption_manager
+            encryption_manager = get_encryption_manager()
+
+        current_row = 0
+        row = [''] * width
+        position = (-1, -1)
+        while True:
+            cells = self.connect().execute("""
+                SELECT table_row, table_col, content, is_sensitive FROM items
+                WHERE table_id = ? AND (table_row, table_col) > (?, ?)
+                ORDER BY table_row, table_col
+                LIMIT ?
+            """, (shape['table_id'], position[0], position[1], chunk_size)).fetchall()
+            if not cells:
+                break
+
+            for cell_row, cell_col, content, is_sensitive in cells:
+                while current_row < cell_row:
+                    yield row
+                    row = [''] * width
+                    current_row += 1
+                if cell_col >= len(row):
+                    row.extend([''] * (cell_col + 1 - len(row)))
+                if encryption_manager and is_sensitive and content:
+                    content = encryption_manager.decrypt(content)
+                row[cell_col] = content or ''
+
+            position = (cells[-1][0], cells[-1][1])
+
+        yield row
+
     def export_table_to_dict(self, table_name: str) -> dict:
         """
         Export table structure and data to dictionary
@@ -5807,9 +6598,8 @@ class DBManager:
         try:
             logger.info(f"Exporting table '{table_name}' to dict")
 
-            items = self.get_table_items(table_name)
-
-            if not items:
+            shape = self.get_table_shape(table_name)
+            if not shape or not shape['total_items']:
                 logger.warning(f"No items found for table '{table_name}'")
                 return {
                     'table_name': table_name,
@@ -5823,61 +6613,19 @@ class DBManager:
                     }
                 }
 
-            # Build coordinate map
-            cells = {}  # {(row, col): {'label': str, 'content': str}}
-            max_row = 0
-            max_col = 0
-            created_at = None
-
-            for item in items:
-                try:
-                    coord = json.loads(item['orden_table'])
-                    row, col = coord[0], coord[1]
-                    cells[(row, col)] = {
-                        'label': item['label'],
-                        'content': item['content']
-                    }
-                    max_row = max(max_row, row)
-                    max_col = max(max_col, col)
-
-                    if created_at is None or item['created_at'] < created_at:
-                        created_at = item['created_at']
-                except Exception as e:
-                    logger.warning(f"Error parsing item coordinates: {e}")
-                    continue
-
-            # Extract column names (from row 0 labels or generate)
-            columns = []
-            for col in range(max_col + 1):
-                if (0, col) in cells:
-                    columns.append(cells[(0, col)]['label'])
-                else:
-                    columns.append(f"COL_{col}")
-
-            # Build rows matrix
-            rows = []
-            for row in range(max_row + 1):
-                row_data = []
-                for col in range(max_col + 1):
-                    if (row, col) in cells:
-                        row_data.append(cells[(row, col)]['content'])
-                    else:
-                        row_data.append('')  # Empty cell
-                rows.append(row_data)
-
             result = {
                 'table_name': table_name,
-                'columns': columns,
-                'rows': rows,
+                'columns': shape['columns'],
+                'rows': list(self.iter_table_rows(table_name)),
                 'metadata': {
-                    'created_at': str(created_at) if created_at else None,
-                    'total_rows': max_row + 1,
-                    'total_cols': max_col + 1,
-                    'total_items': len(items)
+                    'created_at': str(shape['created_at']) if shape['created_at'] else None,
+                    'total_rows': shape['total_rows'],
+                    'total_cols': shape['total_cols'],
+                    'total_items': shape['total_items']
                 }
             }
 
-            logger.info(f"✓ Table '{table_name}' exported: {len(rows)} rows × {len(columns)} cols")
+            logger.info(f"✓ Table '{table_name}' exported: {shape['total_rows']} rows × {shape['total_cols']} cols")
             return result
 
         except Exception as e:
@@ -6004,6 +6752,7 @@ class DBManager:
             """, values)
 
         logger.info(f"Process {process_id} updated: {list(kwargs.keys())}")
+        self._publish_change('processes', 'update', [process_id])
         return True
 
     def delete_process(self, process_id: int) -> bool:
@@ -6020,6 +6769,7 @@ class DBManager:
             conn.execute("DELETE FROM processes WHERE id = ?", (process_id,))
 
         logger.info(f"Process {process_id} deleted")
+        self._publish_change('process_items', 'delete', [process_id])
         return True
 
     def search_processes(self, query: str) -> List[Dict[str, Any]]:
@@ -6096,7 +6846,9 @@ class DBManager:
 
             step_id = cursor.lastrowid
             logger.info(f"Step added to process {process_id}: item {item_id} at order {step_order}")
-            return step_id
+
+        self._publish_change('process_items', 'insert', [process_id])
+        return step_id
 
     def get_process_steps(self, process_id: int) -> List[Dict[str, Any]]:
         """
@@ -6125,6 +6877,64 @@ class DBManager:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_process_steps_by_processes(self, process_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get steps of many processes with item details in a single set-based query
+
+        Equivalent to calling get_process_steps() for each ID.
+
+        Args:
+            process_ids: Process IDs
+
+        Returns:
+            Dict[int, List[Dict]]: Mapping process_id -> steps ordered by step_order.
+                Processes without steps map to [].
+        """
+        grouped: Dict[int, List[Dict[str, Any]]] = {process_id: [] for process_id in process_ids}
+        if not process_ids:
+            return grouped
+
+        unique_ids = list(grouped.keys())
+        conn = self.connect()
+        for start in range(0, len(unique_ids), self._TAG_BATCH_SIZE):
+            batch = unique_ids[start:start + self._TAG_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            cursor = conn.execute(f"""
+                SELECT
+                    pi.*,
+                    i.label as item_label,
+                    i.content as item_content,
+                    i.type as item_type,
+                    i.icon as item_icon,
+                    i.is_sensitive as item_is_sensitive
+                FROM process_items pi
+                JOIN items i ON pi.item_id = i.id
+                WHERE pi.process_id IN ({placeholders})
+                ORDER BY pi.process_id, pi.step_order ASC
+            """, tuple(batch))
+
+            for row in cursor.fetchall():
+                grouped[row['process_id']].append(dict(row))
+
+        logger.debug(f"Retrieved steps for {len(unique_ids)} processes")
+        return grouped
+
+    def _get_step_process_ids(self, step_ids: List[int]) -> List[int]:
+        """
+        Get the distinct process IDs of a set of process steps
+
+        Args:
+            step_ids: Process step IDs
+
+        Returns:
+            List[int]: Process IDs
+        """
+        if not step_ids:
+            return []
+        placeholders = ','.join('?' * len(step_ids))
+        query = f"SELECT DISTINCT process_id FROM process_items WHERE id IN ({placeholders})"
+        return [row['process_id'] for row in self.execute_query(query, tuple(step_ids))]
+
     def update_process_step(self, step_id: int, **kwargs) -> bool:
         """
         Update a process step
@@ -6148,6 +6958,7 @@ class DBManager:
             """, values)
 
         logger.info(f"Process step {step_id} updated")
+        self._publish_change('process_items', 'update', self._get_step_process_ids([step_id]))
         return True
 
     def delete_process_step(self, step_id: int) -> bool:
@@ -6160,10 +6971,12 @@ class DBManager:
         Returns:
             bool: Success status
         """
+        process_ids = self._get_step_process_ids([step_id])
         with self.transaction() as conn:
             conn.execute("DELETE FROM process_items WHERE id = ?", (step_id,))
 
         logger.info(f"Process step {step_id} deleted")
+        self._publish_change('process_items', 'delete', process_ids)
         return True
 
     def delete_process_steps(self, process_id: int) -> bool:
@@ -6181,6 +6994,7 @@ class DBManager:
             deleted_count = cursor.rowcount
 
         logger.info(f"Deleted {deleted_count} steps for process {process_id}")
+        self._publish_change('process_items', 'delete', [process_id])
         return True
 
     def reorder_process_steps(self, process_id: int, step_ids_in_order: List[int]) -> bool:
@@ -6203,6 +7017,7 @@ class DBManager:
                 """, (new_order, step_id, process_id))
 
         logger.info(f"Reordered {len(step_ids_in_order)} steps for process {process_id}")
+        self._publish_change('process_items', 'update', [process_id])
         return True
 
     # ==================== PROCESS EXECUTION HISTORY ====================
@@ -6527,6 +7342,7 @@ class DBManager:
                     VALUES (?, ?, ?, ?)
                 """, (name, description, color, icon))
                 project_id = cursor.lastrowid
+            self._publish_change('proyectos', 'insert', [project_id])
 
             logger.info(f"Proyecto creado: {name} (ID: {project_id})")
             return project_id
@@ -6627,6 +7443,7 @@ class DBManager:
                     SET {set_clause}
                     WHERE id = ?
                 """, values)
+            self._publish_change('proyectos', 'update', [project_id])
 
             logger.info(f"Proyecto {project_id} actualizado")
             return True
@@ -6649,6 +7466,7 @@ class DBManager:
             with self.transaction() as conn:
                 # Las relaciones y componentes se eliminan automáticamente por CASCADE
                 conn.execute("DELETE FROM proyectos WHERE id = ?", (project_id,))
+            self._publish_change('proyectos', 'delete', [project_id])
 
             logger.info(f"Proyecto {project_id} eliminado")
             return True
@@ -6684,6 +7502,7 @@ class DBManager:
                     UPDATE proyectos SET is_active = ?, updated_at = ?
                     WHERE id = ?
                 """, (new_state, datetime.now().isoformat(), project_id))
+            self._publish_change('proyectos', 'update', [project_id])
 
             logger.info(f"Proyecto {project_id} estado: {new_state}")
             return new_state
@@ -6718,6 +7537,7 @@ class DBManager:
                 """, (project_id, entity_type, entity_id, description, order_index))
 
                 relation_id = cursor.lastrowid
+            self._publish_change('project_relations', 'insert', [project_id])
 
             logger.info(f"Relación creada: {entity_type}#{entity_id} -> Proyecto#{project_id}")
             return relation_id
@@ -6740,8 +7560,10 @@ class DBManager:
             True si se eliminó correctamente
         """
         try:
+            project_ids = self._get_relation_owner_ids('project_relations', 'project_id', [relation_id])
             with self.transaction() as conn:
                 conn.execute("DELETE FROM project_relations WHERE id = ?", (relation_id,))
+            self._publish_change('project_relations', 'delete', project_ids)
 
             logger.info(f"Relación {relation_id} eliminada")
             return True
@@ -6769,6 +7591,7 @@ class DBManager:
                     DELETE FROM project_relations
                     WHERE project_id = ? AND entity_type = ? AND entity_id = ?
                 """, (project_id, entity_type, entity_id))
+            self._publish_change('project_relations', 'delete', [project_id])
 
             logger.info(f"Relación eliminada: {entity_type}#{entity_id} del proyecto {project_id}")
             return True
@@ -7450,6 +8273,7 @@ class DBManager:
                     WHERE id = ?
                 """, values)
 
+            self._publish_change('project_element_tags', 'update')
             logger.info(f"Tag {tag_id} actualizado")
             return True
 
@@ -7475,6 +8299,7 @@ class DBManager:
                 # Las asociaciones se eliminan automáticamente por CASCADE
                 conn.execute("DELETE FROM project_element_tags WHERE id = ?", (tag_id,))
 
+            self._publish_change('project_element_tags', 'delete')
             logger.info(f"Tag {tag_id} eliminado")
             return True
 
@@ -7528,6 +8353,8 @@ class DBManager:
                     VALUES (?, ?)
                 """, (relation_id, tag_id))
 
+            self._publish_change('project_element_tags', 'insert',
+                                 self._get_relation_owner_ids('project_relations', 'project_id', [relation_id]))
             logger.info(f"Tag {tag_id} asociado a relación {relation_id}")
             return True
 
@@ -7553,6 +8380,8 @@ class DBManager:
                     WHERE project_relation_id = ? AND tag_id = ?
                 """, (relation_id, tag_id))
 
+            self._publish_change('project_element_tags', 'delete',
+                                 self._get_relation_owner_ids('project_relations', 'project_id', [relation_id]))
             logger.info(f"Tag {tag_id} removido de relación {relation_id}")
             return True
 
@@ -7642,6 +8471,8 @@ class DBManager:
                         VALUES (?, ?)
                     """, (relation_id, tag_id))
 
+            self._publish_change('project_element_tags', 'update',
+                                 self._get_relation_owner_ids('project_relations', 'project_id', [relation_id]))
             logger.info(f"Tags actualizados para relación {relation_id}: {len(tag_ids)} tags")
             return True
 
@@ -7860,7 +8691,9 @@ class DBManager:
             INSERT INTO areas (name, description, color, icon)
             VALUES (?, ?, ?, ?)
         """
-        return self.execute_update(query, (name, description, color, icon))
+        area_id = self.execute_update(query, (name, description, color, icon))
+        self._publish_change('areas', 'insert', [area_id])
+        return area_id
 
     def get_area(self, area_id: int) -> Optional[Dict]:
         """
@@ -7923,6 +8756,7 @@ class DBManager:
 
         try:
             self.execute_update(query, tuple(values))
+            self._publish_change('areas', 'update', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error actualizando área {area_id}: {e}")
@@ -7941,6 +8775,7 @@ class DBManager:
         query = "UPDATE areas SET is_active = 0 WHERE id = ?"
         try:
             self.execute_update(query, (area_id,))
+            self._publish_change('areas', 'delete', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error eliminando área {area_id}: {e}")
@@ -8219,7 +9054,9 @@ class DBManager:
             INSERT INTO area_relations (area_id, entity_type, entity_id, description, order_index)
             VALUES (?, ?, ?, ?, ?)
         """
-        return self.execute_update(query, (area_id, entity_type, entity_id, description, order_index))
+        relation_id = self.execute_update(query, (area_id, entity_type, entity_id, description, order_index))
+        self._publish_change('area_relations', 'insert', [area_id])
+        return relation_id
 
     def get_area_relations(self, area_id: int) -> List[Dict]:
         """
@@ -8250,7 +9087,9 @@ class DBManager:
         """
         query = "DELETE FROM area_relations WHERE id = ?"
         try:
+            area_ids = self._get_relation_owner_ids('area_relations', 'area_id', [relation_id])
             self.execute_update(query, (relation_id,))
+            self._publish_change('area_relations', 'delete', area_ids)
             return True
         except Exception as e:
             logger.error(f"Error eliminando relación {relation_id}: {e}")
@@ -8275,6 +9114,7 @@ class DBManager:
         """
         try:
             self.execute_update(query, (area_id, entity_type, entity_id))
+            self._publish_change('area_relations', 'delete', [area_id])
             return True
         except Exception as e:
             logger.error(f"Error eliminando relación: {e}")
@@ -8623,6 +9463,7 @@ class DBManager:
 
         try:
             self.execute_update(query, tuple(values))
+            self._publish_change('area_element_tags', 'update')
             return True
         except Exception as e:
             logger.error(f"Error actualizando tag {tag_id}: {e}")
@@ -8641,6 +9482,7 @@ class DBManager:
         query = "DELETE FROM area_element_tags WHERE id = ?"
         try:
             self.execute_update(query, (tag_id,))
+            self._publish_change('area_element_tags', 'delete')
             return True
         except Exception as e:
             logger.error(f"Error eliminando tag {tag_id}: {e}")
@@ -8664,6 +9506,8 @@ class DBManager:
         """
         try:
             self.execute_update(query, (relation_id, tag_id))
+            self._publish_change('area_element_tags', 'insert',
+                                 self._get_relation_owner_ids('area_relations', 'area_id', [relation_id]))
             return True
         except Exception as e:
             logger.error(f"Error asignando tag a relación: {e}")
@@ -8709,6 +9553,8 @@ class DBManager:
         """
         try:
             self.execute_update(query, (relation_id, tag_id))
+            self._publish_change('area_element_tags', 'delete',
+                                 self._get_relation_owner_ids('area_relations', 'area_id', [relation_id]))
             return True
         except Exception as e:
             logger.error(f"Error removiendo tag de relación: {e}")
@@ -8821,7 +9667,9 @@ class DBManager:
                         VALUES (?, ?)
                     """, (relation_id, tag_id))
 
-                return True
+            self._publish_change('area_element_tags', 'update',
+                                 self._get_relation_owner_ids('area_relations', 'area_id', [relation_id]))
+            return True
 
         except Exception as e:
             logger.error(f"Error actualizando tags de relación {relation_id}: {e}")
@@ -9181,212 +10029,175 @@ class DBManager:
             self._fts5_available = False
             return False
 
-    def universal_search_items(self, query: str, limit: int = 1000, offset: int = 0) -> List[Dict]:
+    def universal_search_item_ids(self, query: str) -> List[int]:
         """
-        Búsqueda universal de items con FTS5 incluyendo TODAS las relaciones
+        IDs de los items activos que coinciden con la búsqueda universal, ya ordenados
+
+        Solo toca la tabla items (sin joins de relaciones), por lo que el
+        resultado sirve a la vez de conteo total y de base para paginar.
 
         Args:
             query: Texto de búsqueda (usa FTS5 si disponible, sino LIKE)
-            limit: Límite de resultados
-            offset: Número de resultados a saltar (para paginación)
 
         Returns:
-            List[Dict]: Items con todas sus relaciones (proyectos, areas, categorias, etc.)
+            List[int]: IDs ordenados por ranking híbrido (BM25 x puntuación de uso);
+                sin FTS5, por puntuación de uso, use_count y updated_at
         """
         try:
             conn = self.connect()
-            cursor = conn.cursor()
 
-            # Verificar si existe FTS5 (con caché)
-            has_fts = self._check_fts5_available()
-
-            if has_fts and query.strip():
-                # Usar FTS5 para búsqueda rápida
-                # Usar búsqueda sin comillas para permitir coincidencias parciales
-                search_query = f'{query}*'  # Búsqueda flexible (sin comillas)
-
-                query_sql = """
-                WITH item_results AS (
-                    SELECT DISTINCT
-                        i.id,
-                        i.label,
-                        i.content,
-                        i.icon,
-                        i.type,
-                        i.use_count,
-                        i.created_at,
-                        i.updated_at,
-                        i.last_used,
-                        i.tags,
-                        i.description,
-                        i.color,
-                        i.is_sensitive,
-                        i.is_favorite,
-                        -- Relación directa con categoría
-                        c.name as categoria_name,
-                        c.id as categoria_id,
-                        -- Relación directa con lista
-                        l.name as lista_name,
-                        l.id as lista_id,
-                        -- Relación directa con tabla
-                        t.name as tabla_name,
-                        t.id as tabla_id
-                    FROM items i
-                    LEFT JOIN categories c ON i.category_id = c.id
-                    LEFT JOIN listas l ON i.list_id = l.id
-                    LEFT JOIN tables t ON i.table_id = t.id
-                    WHERE i.id IN (
-                        SELECT item_id FROM items_fts
-                        WHERE items_fts MATCH ?
-                    )
-                    AND i.is_active = 1
-                )
-                SELECT
-                    ir.*,
-                    -- Proyectos vinculados
-                    GROUP_CONCAT(DISTINCT p.name) as proyectos,
-                    -- Áreas vinculadas
-                    GROUP_CONCAT(DISTINCT a.name) as areas,
-                    -- Procesos vinculados
-                    GROUP_CONCAT(DISTINCT proc.name) as procesos
-                FROM item_results ir
-                -- Join con proyectos vía project_relations
-                LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
-                LEFT JOIN proyectos p ON pr.project_id = p.id
-                -- Join con áreas vía area_relations
-                LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
-                LEFT JOIN areas a ON ar.area_id = a.id
-                -- Join con procesos vía process_items
-                LEFT JOIN process_items pi ON pi.item_id = ir.id
-                LEFT JOIN processes proc ON pi.process_id = proc.id
-                GROUP BY ir.id
-                ORDER BY ir.use_count DESC, ir.updated_at DESC
-                LIMIT ? OFFSET ?
-                """
+            if self._check_fts5_available() and query.strip():
+                # Búsqueda flexible (sin comillas) para permitir coincidencias parciales
                 try:
-                    cursor.execute(query_sql, (search_query, limit, offset))
+                    rows = conn.execute(f"""
+                        SELECT i.id
+                        FROM items_fts
+                        JOIN items i ON i.id = items_fts.rowid
+                        LEFT JOIN item_usage_scores us ON us.item_id = i.id
+                        WHERE items_fts MATCH ?
+                        AND i.is_active = 1
+                        ORDER BY {self.HYBRID_RANK_SQL}, i.id
+                    """, (f'{query}*',)).fetchall()
+                    return [row[0] for row in rows]
                 except sqlite3.OperationalError as e:
                     # Si hay error de sintaxis FTS5, hacer fallback a LIKE
                     logger.warning(f"FTS5 query error, fallback to LIKE: {e}")
-                    has_fts = False  # Forzar uso de LIKE
-
-            if not has_fts or not query.strip():
-                # Fallback a búsqueda LIKE si no hay FTS5 o query vacío
-                search_pattern = f"%{query}%" if query.strip() else "%"
-
-                query_sql = """
-                WITH item_results AS (
-                    SELECT DISTINCT
-                        i.id,
-                        i.label,
-                        i.content,
-                        i.icon,
-                        i.type,
-                        i.use_count,
-                        i.created_at,
-                        i.updated_at,
-                        i.last_used,
-                        i.tags,
-                        i.description,
-                        i.color,
-                        i.is_sensitive,
-                        i.is_favorite,
-                        c.name as categoria_name,
-                        c.id as categoria_id,
-                        l.name as lista_name,
-                        l.id as lista_id,
-                        t.name as tabla_name,
-                        t.id as tabla_id
-                    FROM items i
-                    LEFT JOIN categories c ON i.category_id = c.id
-                    LEFT JOIN listas l ON i.list_id = l.id
-                    LEFT JOIN tables t ON i.table_id = t.id
-                    WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
-                    AND i.is_active = 1
-                )
-                SELECT
-                    ir.*,
-                    GROUP_CONCAT(DISTINCT p.name) as proyectos,
-                    GROUP_CONCAT(DISTINCT a.name) as areas,
-                    GROUP_CONCAT(DISTINCT proc.name) as procesos
-                FROM item_results ir
-                LEFT JOIN project_relations pr ON pr.entity_type = 'item' AND pr.entity_id = ir.id
-                LEFT JOIN proyectos p ON pr.project_id = p.id
-                LEFT JOIN area_relations ar ON ar.entity_type = 'item' AND ar.entity_id = ir.id
-                LEFT JOIN areas a ON ar.area_id = a.id
-                LEFT JOIN process_items pi ON pi.item_id = ir.id
-                LEFT JOIN processes proc ON pi.process_id = proc.id
-                GROUP BY ir.id
-                ORDER BY ir.use_count DESC, ir.updated_at DESC
-                LIMIT ? OFFSET ?
-                """
-                cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern, limit, offset))
-
-            # Convertir a dict
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                item_dict = dict(zip(columns, row))
-                results.append(item_dict)
 
-            logger.debug(f"Universal search found {len(results)} items for query '{query}'")
-            return results
+            search_pattern = f"%{query}%" if query.strip() else "%"
+            rows = conn.execute("""
+                SELECT i.id FROM items i
+                LEFT JOIN item_usage_scores us ON us.item_id = i.id
+                WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
+                AND i.is_active = 1
+                ORDER BY COALESCE(us.usage_score, 0) DESC, i.use_count DESC, i.updated_at DESC, i.id
+            """, (search_pattern, search_pattern, search_pattern)).fetchall()
+            return [row[0] for row in rows]
 
         except Exception as e:
-            logger.error(f"Error en universal_search_items: {e}", exc_info=True)
+            logger.error(f"Error en universal_search_item_ids: {e}", exc_info=True)
             return []
 
-    def universal_search_items_count(self, query: str) -> int:
+    def get_universal_search_items_by_ids(self, item_ids: List[int],
+                                          with_relations: bool = True) -> List[Dict]:
         """
-        Obtiene el conteo total de items que coinciden con la búsqueda
+        Hidrata items de la búsqueda universal con TODAS sus relaciones
+
+        Las relaciones (proyectos, areas, procesos) se agregan solo para los
+        IDs recibidos, normalmente los de la página visible.
 
         Args:
-            query: Texto de búsqueda
+            item_ids: IDs en el orden en que deben devolverse
+            with_relations: False para omitir las consultas de proyectos/areas/procesos
+                (el llamador las resuelve con ItemRelationshipIndex)
 
         Returns:
-            int: Número total de items encontrados
+            List[Dict]: Mismo formato que universal_search_items (orden de item_ids)
         """
+        if not item_ids:
+            return []
+
         try:
             conn = self.connect()
-            cursor = conn.cursor()
+            rows_by_id = {}
 
-            # Verificar si existe FTS5 (con caché)
-            has_fts = self._check_fts5_available()
+            for start in range(0, len(item_ids), self._TAG_BATCH_SIZE):
+                batch = list(item_ids[start:start + self._TAG_BATCH_SIZE])
+                placeholders = ','.join('?' * len(batch))
 
-            if has_fts and query.strip():
-                # Usar FTS5 para búsqueda rápida
-                search_query = f'"{query}"*'
+                cursor = conn.execute(f"""
+                    SELECT
+                        i.id, i.label, i.content, i.icon, i.type, i.use_count,
+                        i.created_at, i.updated_at, i.last_used, i.tags,
+                        i.description, i.color, i.is_sensitive, i.is_favorite,
+                        c.name as categoria_name, c.id as categoria_id,
+                        l.name as lista_name, l.id as lista_id,
+                        t.name as tabla_name, t.id as tabla_id
+                    FROM items i
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    LEFT JOIN listas l ON i.list_id = l.id
+                    LEFT JOIN tables t ON i.table_id = t.id
+                    WHERE i.id IN ({placeholders})
+                """, batch)
+                columns = [desc[0] for desc in cursor.description]
+                for row in cursor.fetchall():
+                    item_dict = dict(zip(columns, row))
+                    item_dict['proyectos'] = None
+                    item_dict['areas'] = None
+                    item_dict['procesos'] = None
+                    rows_by_id[item_dict['id']] = item_dict
+
+                # Una consulta agregada por tipo de relación (evita el producto
+                # cartesiano proyectos x areas x procesos del join único)
+                relation_queries = {
+                    'proyectos': f"""
+                        SELECT pr.entity_id, GROUP_CONCAT(DISTINCT p.name)
+                        FROM project_relations pr
+                        JOIN proyectos p ON pr.project_id = p.id
+                        WHERE pr.entity_type = 'item' AND pr.entity_id IN ({placeholders})
+                        GROUP BY pr.entity_id
+                    """,
+                    'areas': f"""
+                        SELECT ar.entity_id, GROUP_CONCAT(DISTINCT a.name)
+                        FROM area_relations ar
+                        JOIN areas a ON ar.area_id = a.id
+                        WHERE ar.entity_type = 'item' AND ar.entity_id IN ({placeholders})
+                        GROUP BY ar.entity_id
+                    """,
+                    'procesos': f"""
+                        SELECT pi.item_id, GROUP_CONCAT(DISTINCT proc.name)
+                        FROM process_items pi
+                        JOIN processes proc ON pi.process_id = proc.id
+                        WHERE pi.item_id IN ({placeholders})
+                        GROUP BY pi.item_id
+                    """,
+                }
+                if not with_relations:
+                    continue
+                for key, relation_sql in relation_queries.items():
+                    try:
+                        for entity_id, names in conn.execute(relation_sql, batch):
+                            if entity_id in rows_by_id:
+                                rows_by_id[entity_id][key] = names
+                    except sqlite3.OperationalError as e:
+                        # Tabla de relaciones inexistente en bases antiguas
+                        logger.debug(f"Skipping {key} relations: {e}")
 
-                query_sql = """
-                SELECT COUNT(DISTINCT i.id)
-                FROM items i
-                WHERE i.id IN (
-                    SELECT item_id FROM items_fts
-                    WHERE items_fts MATCH ?
-                )
-                AND i.is_active = 1
-                """
-                cursor.execute(query_sql, (search_query,))
-            else:
-                # Fallback a LIKE
-                search_pattern = f"%{query}%" if query.strip() else "%"
+            return [rows_by_id[item_id] for item_id in item_ids if item_id in rows_by_id]
 
-                query_sql = """
-                SELECT COUNT(DISTINCT i.id)
-                FROM items i
-                WHERE (i.label LIKE ? OR i.content LIKE ? OR i.description LIKE ?)
-                AND i.is_active = 1
-                """
-                cursor.execute(query_sql, (search_pattern, search_pattern, search_pattern))
+        except Exception as e:
+            logger.error(f"Error en get_universal_search_items_by_ids: {e}", exc_info=True)
+            return []
 
-            result = cursor.fetchone()
-            count = result[0] if result else 0
-            logger.debug(f"Universal search count: {count} items for query '{query}'")
-            return count
+    def universal_search_items(self, query: str, limit: int = 1000, offset: int = 0) -> List[Dict]:
+        """
+        Búsqueda universal de items con FTS5 incluyendo TODAS las relaciones
 
-        except Exception as e:
-            logger.error(f"Error en universal_search_items_count: {e}", exc_info=True)
-            return 0
+        Args:
+            query: Texto de búsqueda (usa FTS5 si disponible, sino LIKE)
+            limit: Límite de resultados
+            offset: Número de resultados a saltar (para paginación)
+
+        Returns:
+            List[Dict]: Items con todas sus relaciones (proyectos, areas, categorias, etc.)
+        """
+        item_ids = self.universal_search_item_ids(query)
+        results = self.get_universal_search_items_by_ids(item_ids[offset:offset + limit])
+        logger.debug(f"Universal search found {len(results)} items for query '{query}'")
+        return results
+
+    def universal_search_items_count(self, query: str) -> int:
+        """
+        Obtiene el conteo total de items que coinciden con la búsqueda
+
+        Args:
+            query: Texto de búsqueda
+
+        Returns:
+            int: Número total de items encontrados
+        """
+        count = len(self.universal_search_item_ids(query))
+        logger.debug(f"Universal search count: {count} items for query '{query}'")
+        return count
 
     def universal_search_tags(self, query: str, limit: int = 1000) -> List[Dict]:
         """
@@ -0,0 +1,234 @@
+"""
+Migración: items_fts como índice FTS5 de contenido externo mantenido por triggers
+
+La tabla items_fts original era una tabla FTS5 independiente que nadie
+actualizaba al crear, editar o borrar items, así que la búsqueda universal
+devolvía resultados obsoletos y el texto se guardaba dos veces.
+
+Esta migración:
+1. Elimina la tabla items_fts anterior (y triggers/vista si ya existían)
+2. Crea la vista items_fts_source (tags desde item_tags, sin contenido sensible)
+3. Crea items_fts con content='items_fts_source' y tokenizer porter/unicode61
+4. Crea los triggers de sincronización sobre items, item_tags y tags
+5. Reconstruye el índice desde los datos actuales
+
+DBManager la ejecuta automáticamente si falta el trigger items_fts_ai.
+
+Uso manual:
+    python -m src.database.migrations.items_fts_external_content --check
+    python -m src.database.migrations.items_fts_external_content --rebuild
+"""
+
+import logging
+import sqlite3
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+ITEMS_FTS_SCHEMA = """
+    -- Fuente de contenido de items_fts: tags desde item_tags en orden estable y
+    -- sin el texto cifrado de los items sensibles
+    CREATE VIEW IF NOT EXISTS items_fts_source AS
+    SELECT
+        i.id AS id,
+        i.id AS item_id,
+        i.label AS label,
+        CASE WHEN i.is_sensitive THEN '' ELSE i.content END AS content,
+        i.description AS description,
+        (SELECT group_concat(name, ' ') FROM (
+            SELECT t.name FROM item_tags it
+            JOIN tags t ON t.id = it.tag_id
+            WHERE it.item_id = i.id
+            ORDER BY t.name
+        )) AS tags
+    FROM items i;
+
+    -- Tabla virtual FTS5 de contenido externo (no duplica el texto de items)
+    CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+        item_id UNINDEXED,
+        label,
+        content,
+        description,
+        tags,
+        content='items_fts_source',
+        content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 1'
+    );
+
+    -- Sincronización incremental: items
+    CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT id, item_id, label, content, description, tags
+        FROM items_fts_source WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_bd BEFORE DELETE ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        SELECT 'delete', id, item_id, label, content, description, tags
+        FROM items_fts_source WHERE id = OLD.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_au
+    AFTER UPDATE OF label, content, description, is_sensitive ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        VALUES (
+            'delete', OLD.id, OLD.id, OLD.label,
+            CASE WHEN OLD.is_sensitive THEN '' ELSE OLD.content END,
+            OLD.description,
+            (SELECT tags FROM items_fts_source WHERE id = NEW.id)
+        );
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT id, item_id, label, content, description, tags
+        FROM items_fts_source WHERE id = NEW.id;
+    END;
+
+    -- Sincronización incremental: columna tags (item_tags / tags)
+    CREATE TRIGGER IF NOT EXISTS items_fts_item_tags_ai AFTER INSERT ON item_tags
+    WHEN EXISTS (SELECT 1 FROM items WHERE id = NEW.item_id)
+    BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        SELECT 'delete', s.id, s.item_id, s.label, s.content, s.description,
+            (SELECT group_concat(name, ' ') FROM (
+                SELECT t.name FROM item_tags it
+                JOIN tags t ON t.id = it.tag_id
+                WHERE it.item_id = NEW.item_id AND it.tag_id != NEW.tag_id
+                ORDER BY t.name
+            ))
+        FROM items_fts_source s WHERE s.id = NEW.item_id;
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT id, item_id, label, content, description, tags
+        FROM items_fts_source WHERE id = NEW.item_id;
+    END;
+
+    -- Si el item o el tag se están borrando, items_fts_bd / items_fts_tags_bd ya lo resolvieron
+    CREATE TRIGGER IF NOT EXISTS items_fts_item_tags_ad AFTER DELETE ON item_tags
+    WHEN EXISTS (SELECT 1 FROM items WHERE id = OLD.item_id)
+        AND EXISTS (SELECT 1 FROM tags WHERE id = OLD.tag_id)
+    BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        SELECT 'delete', s.id, s.item_id, s.label, s.content, s.description,
+            (SELECT group_concat(name, ' ') FROM (
+                SELECT name FROM (
+                    SELECT t.name AS name FROM item_tags it
+                    JOIN tags t ON t.id = it.tag_id
+                    WHERE it.item_id = OLD.item_id
+                    UNION ALL
+                    SELECT name FROM tags WHERE id = OLD.tag_id
+                )
+                ORDER BY name
+            ))
+        FROM items_fts_source s WHERE s.id = OLD.item_id;
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT id, item_id, label, content, description, tags
+        FROM items_fts_source WHERE id = OLD.item_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_tags_au AFTER UPDATE OF name ON tags BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        SELECT 'delete', s.id, s.item_id, s.label, s.content, s.description,
+            (SELECT group_concat(name, ' ') FROM (
+                SELECT CASE WHEN t.id = NEW.id THEN OLD.name ELSE t.name END AS name
+                FROM item_tags it
+                JOIN tags t ON t.id = it.tag_id
+                WHERE it.item_id = s.id
+                ORDER BY name
+            ))
+        FROM items_fts_source s
+        WHERE s.id IN (SELECT item_id FROM item_tags WHERE tag_id = NEW.id);
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT id, item_id, label, content, description, tags
+        FROM items_fts_source
+        WHERE id IN (SELECT item_id FROM item_tags WHERE tag_id = NEW.id);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_tags_bd BEFORE DELETE ON tags BEGIN
+        INSERT INTO items_fts(items_fts, rowid, item_id, label, content, description, tags)
+        SELECT 'delete', id, item_id, label, content, description, tags
+        FROM items_fts_source
+        WHERE id IN (SELECT item_id FROM item_tags WHERE tag_id = OLD.id);
+        INSERT INTO items_fts(rowid, item_id, label, content, description, tags)
+        SELECT s.id, s.item_id, s.label, s.content, s.description,
+            (SELECT group_concat(name, ' ') FROM (
+                SELECT t.name FROM item_tags it
+                JOIN tags t ON t.id = it.tag_id
+                WHERE it.item_id = s.id AND it.tag_id != OLD.id
+                ORDER BY t.name
+            ))
+        FROM items_fts_source s
+        WHERE s.id IN (SELECT item_id FROM item_tags WHERE tag_id = OLD.id);
+    END;
+"""
+
+ITEMS_FTS_TRIGGERS = (
+    'items_fts_ai', 'items_fts_bd', 'items_fts_au',
+    'items_fts_item_tags_ai', 'items_fts_item_tags_ad',
+    'items_fts_tags_au', 'items_fts_tags_bd',
+)
+
+
+def _split_statements(script: str) -> List[str]:
+    """Split a SQL script with trigger bodies into complete statements"""
+    statements = []
+    current = ''
+    for line in script.splitlines(True):
+        if not current.strip() and line.strip().startswith('--'):
+            continue
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ''
+    return statements
+
+
+def migration_007_items_fts_external_content(db):
+    """
+    Migración 007: items_fts de contenido externo con triggers
+
+    Args:
+        db: DBManager instance
+    """
+    logger.info("Migración 007: items_fts con contenido externo y triggers")
+
+    with db.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name IN ('items', 'tags', 'item_tags')
+        """)
+        if len(cursor.fetchall()) < 3:
+            logger.warning("Migración 007 omitida: faltan las tablas items/tags/item_tags")
+            return
+
+        for trigger in ITEMS_FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute("DROP TABLE IF EXISTS items_fts")
+        cursor.execute("DROP VIEW IF EXISTS items_fts_source")
+
+        for statement in _split_statements(ITEMS_FTS_SCHEMA):
+            cursor.execute(statement)
+
+        cursor.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild')")
+
+    logger.info("Migración 007 completada: items_fts reconstruido")
+
+
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+    from src.database.db_manager import DBManager
+    from src.core.search.fts5_manager import FTS5Manager
+
+    logging.basicConfig(level=logging.INFO)
+
+    fts = FTS5Manager(DBManager())
+    if '--rebuild' in sys.argv:
+        fts.rebuild_index()
+
+    report = fts.check_integrity()
+    for key, value in report.items():
+        print(f"  {key}: {value}")
+    sys.exit(0 if report['ok'] else 1)
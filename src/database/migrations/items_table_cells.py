@@ -0,0 +1,85 @@
+"""
+Migración: coordenadas de celdas de tabla como columnas enteras
+
+Las celdas de una tabla son filas de items con orden_table = "[fila, columna]"
+(texto JSON). Ordenar por ese texto pone "[10,0]" antes de "[2,0]" y no
+permite buscar una celda por índice.
+
+Esta migración:
+1. Añade items.table_row e items.table_col (INTEGER)
+2. Las rellena desde orden_table
+3. Crea el índice (table_id, table_row, table_col) y elimina el índice sobre orden_table
+4. Crea triggers que mantienen las columnas cuando se escribe solo orden_table
+   (add_item/update_item y el modelo Item siguen usando orden_table)
+
+DBManager la ejecuta automáticamente si falta el trigger items_table_cell_ai.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+TABLE_CELL_TRIGGERS = """
+    CREATE TRIGGER IF NOT EXISTS items_table_cell_ai AFTER INSERT ON items
+    WHEN NEW.table_row IS NULL AND json_valid(NEW.orden_table)
+    BEGIN
+        UPDATE items
+        SET table_row = json_extract(NEW.orden_table, '$[0]'),
+            table_col = json_extract(NEW.orden_table, '$[1]')
+        WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_table_cell_au AFTER UPDATE OF orden_table ON items
+    BEGIN
+        UPDATE items
+        SET table_row = CASE WHEN json_valid(NEW.orden_table) THEN json_extract(NEW.orden_table, '$[0]') END,
+            table_col = CASE WHEN json_valid(NEW.orden_table) THEN json_extract(NEW.orden_table, '$[1]') END
+        WHERE id = NEW.id;
+    END;
+"""
+
+
+def migration_008_items_table_cells(db):
+    """
+    Migración 008: columnas table_row/table_col en items
+
+    Args:
+        db: DBManager instance
+    """
+    logger.info("Migración 008: coordenadas de celdas de tabla como columnas enteras")
+
+    with db.transaction() as conn:
+        cursor = conn.cursor()
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(items)")}
+        if not columns:
+            logger.warning("Migración 008 omitida: falta la tabla items")
+            return
+
+        for column in ('table_row', 'table_col'):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE items ADD COLUMN {column} INTEGER")
+
+        cursor.execute("""
+            UPDATE items
+            SET table_row = json_extract(orden_table, '$[0]'),
+                table_col = json_extract(orden_table, '$[1]')
+            WHERE orden_table IS NOT NULL AND json_valid(orden_table)
+        """)
+        migrated = cursor.rowcount
+
+        cursor.execute("DROP INDEX IF EXISTS idx_items_table_orden")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_items_table_cell
+            ON items(table_id, table_row, table_col) WHERE table_id IS NOT NULL
+        """)
+
+        statement = ''
+        for line in TABLE_CELL_TRIGGERS.splitlines(True):
+            statement += line
+            if sqlite3.complete_statement(statement):
+                cursor.execute(statement)
+                statement = ''
+
+    logger.info(f"Migración 008 completada: {migrated} celdas migradas")
@@ -1,10 +1,16 @@
 """
 Item Model
 """
+import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Prefijo de los tokens Fernet (ver EncryptionManager.is_encrypted)
+_ENCRYPTED_PREFIX = "gAAAAA"
+
 
 class ItemType(Enum):
     """Enum for different types of items"""
@@ -88,6 +94,34 @@ class Item:
         self.created_at = datetime.now()
         self.last_used = datetime.now()
 
+    @property
+    def content(self) -> str:
+        """
+        Item content, decrypted on first read for sensitive items
+
+        Sensitive items loaded from list/search queries keep their content
+        encrypted until something actually reads it. Decrypted values are
+        served from the EncryptionManager LRU, which is purged on lock/logout.
+        """
+        value = self._content
+        if self.is_sensitive and isinstance(value, str) and value.startswith(_ENCRYPTED_PREFIX):
+            from src.core.encryption_manager import get_encryption_manager
+            try:
+                return get_encryption_manager().decrypt_cached(value)
+            except Exception as e:
+                logger.error(f"Failed to decrypt item {self.id}: {e}")
+                return "[DECRYPTION ERROR]"
+        return value
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
+    @property
+    def raw_content(self) -> str:
+        """Content as stored (still encrypted for lazily-loaded sensitive items)"""
+        return self._content
+
     def update_last_used(self) -> None:
         """Update the last used timestamp"""
         self.last_used = datetime.now()
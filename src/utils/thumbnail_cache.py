@@ -3,39 +3,110 @@
 Thumbnail Cache Manager
 
 Sistema de caché multinivel para thumbnails de imágenes:
-- Caché en memoria (LRU) para acceso ultra-rápido
-- Caché en disco para persistencia entre sesiones
-- Generación automática de thumbnails con Pillow
+- Caché en memoria (LRU acotado por bytes) para acceso ultra-rápido
+- Caché en disco para persistencia entre sesiones (acotada por tamaño y edad)
+- Generación con Pillow en hilos de fondo (cola con prioridad)
+
+Las claves incluyen tamaño y mtime del archivo original, así que una imagen
+editada genera un thumbnail nuevo en lugar de servir uno obsoleto.
 """
 
 import logging
 import hashlib
+import io
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple
-from functools import lru_cache
+from typing import List, Optional, Tuple
 from PIL import Image
+from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QPixmap
 
 logger = logging.getLogger(__name__)
 
 
-class ThumbnailCache:
+def render_thumbnail_bytes(image_path: str, size: Tuple[int, int]) -> Optional[bytes]:
+    """
+    Generar thumbnail JPEG con Pillow
+
+    No usa Qt, por lo que puede ejecutarse en cualquier hilo (o proceso).
+
+    Args:
+        image_path: Ruta a imagen original
+        size: Tamaño máximo (ancho, alto)
+
+    Returns:
+        Bytes JPEG del thumbnail o None si falla
+    """
+    try:
+        # Abrir imagen con Pillow
+        with Image.open(image_path) as img:
+            # draft() permite al decodificador JPEG reducir la imagen al decodificar
+            img.draft('RGB', size)
+
+            # Convertir a RGB si es necesario (para PNGs con transparencia)
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Crear fondo blanco
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                img = background
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # Crear thumbnail (mantiene aspect ratio)
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+
+            buffer = io.BytesIO()
+            img.save(buffer, 'JPEG', quality=85)
+            return buffer.getvalue()
+
+    except Exception as e:
+        logger.error(f"Error generating thumbnail for {image_path}: {e}")
+        return None
+
+
+class ThumbnailCache(QObject):
     """
     Sistema de caché de thumbnails con dos niveles:
-    1. Memoria (LRU cache) - 100 thumbnails
+    1. Memoria (LRU acotado a MEMORY_LIMIT_BYTES)
     2. Disco (temp/thumbnails/) - Persistente
 
+    Los workers solo producen bytes JPEG; la conversión a QPixmap se hace
+    en el hilo de la GUI (thumbnail_ready se entrega por conexión encolada).
+
     Tamaños de thumbnail:
     - SMALL: 80x80 px (para grid compacto)
     - MEDIUM: 150x150 px (para grid normal)
     - LARGE: 300x300 px (para preview)
     """
 
+    # Señales
+    thumbnail_ready = pyqtSignal(str, object, QPixmap)  # (image_path, size, pixmap)
+    _bytes_ready = pyqtSignal(str, object, str, bytes)  # (image_path, size, cache_key, data) desde workers
+
     # Tamaños disponibles
     SIZE_SMALL = (80, 80)
     SIZE_MEDIUM = (150, 150)
     SIZE_LARGE = (300, 300)
 
+    # Prioridades de la cola (menor = antes)
+    PRIORITY_VISIBLE = 0
+    PRIORITY_PREFETCH = 10
+
+    MEMORY_LIMIT_BYTES = 64 * 1024 * 1024  # 64 MB de pixmaps en memoria
+    MAX_WORKERS = 4
+
+    # Límites de la caché en disco (se poda al arrancar y cada DISK_PRUNE_EVERY escrituras)
+    DISK_LIMIT_BYTES = 256 * 1024 * 1024
+    DISK_MAX_AGE_DAYS = 30
+    DISK_PRUNE_EVERY = 200
+
     def __init__(self, cache_dir: Optional[Path] = None):
         """
         Inicializar caché de thumbnails
@@ -43,6 +114,8 @@ class ThumbnailCache:
         Args:
             cache_dir: Directorio para caché en disco (opcional)
         """
+        super().__init__()
+
         # Directorio de caché
         if cache_dir:
             self.cache_dir = Path(cache_dir)
@@ -58,13 +131,34 @@ class ThumbnailCache:
         # Crear directorios si no existen
         self._ensure_cache_dirs()
 
-        # Estadísticas
+        # Caché en memoria: cache_key -> (QPixmap, bytes estimados)
+        self._memory_cache: "OrderedDict[str, Tuple[QPixmap, int]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # Cola de generación con prioridad
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending = set()  # cache_keys encolados o en proceso
+        self._pending_lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._bytes_ready.connect(self._on_bytes_ready)
+
+        # Estadísticas (los workers también las actualizan: usar _count)
+        # hits = memoria, disk_hits = disco, misses = hubo que generar desde el original
         self.stats = {
             'hits': 0,
             'misses': 0,
             'disk_hits': 0,
-            'generated': 0
+            'generated': 0,
+            'evictions': 0,
+            'disk_pruned': 0
         }
+        self._stats_lock = threading.Lock()
+        self._saves_since_prune = 0
+        self._prune_lock = threading.Lock()
+
+        # Podar la caché en disco de sesiones anteriores sin bloquear el arranque
+        threading.Thread(target=self.prune_disk_cache, name="ThumbnailDiskPrune", daemon=True).start()
 
         logger.info(f"ThumbnailCache initialized: {self.cache_dir}")
 
@@ -83,19 +177,39 @@ class ThumbnailCache:
         except Exception as e:
             logger.error(f"Error creating cache directories: {e}")
 
-    def _get_cache_path(self, image_path: str, size: Tuple[int, int]) -> Path:
+    def _count(self, key: str, amount: int = 1) -> None:
+        """Incrementar una estadística (thread-safe)"""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    # ==================== CLAVES ====================
+
+    def _make_cache_key(self, image_path: str, size: Tuple[int, int]) -> Optional[str]:
+        """
+        Construir clave de caché (path + tamaño/mtime del archivo + tamaño del thumbnail)
+
+        Returns:
+            Clave o None si el archivo no existe
+        """
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        return f"{image_path}|{stat.st_size}|{stat.st_mtime_ns}|{size[0]}x{size[1]}"
+
+    def _get_cache_path(self, cache_key: str, size: Tuple[int, int]) -> Path:
         """
         Obtener ruta de caché para thumbnail
 
         Args:
-            image_path: Ruta de imagen original
+            cache_key: Clave de caché (incluye mtime del original)
             size: Tamaño del thumbnail
 
         Returns:
             Path al archivo de caché
         """
-        # Hash del path de la imagen (para nombre único)
-        path_hash = hashlib.md5(image_path.encode()).hexdigest()
+        # Hash de la clave (para nombre único)
+        key_hash = hashlib.md5(cache_key.encode()).hexdigest()
 
         # Determinar subdirectorio por tamaño
         if size == self.SIZE_SMALL:
@@ -106,26 +220,54 @@ class ThumbnailCache:
             subdir = 'large'
 
         # Ruta completa: temp/thumbnails/{size}/{hash}.jpg
-        return self.cache_dir / subdir / f"{path_hash}.jpg"
+        return self.cache_dir / subdir / f"{key_hash}.jpg"
+
+    # ==================== CACHÉ EN MEMORIA ====================
 
-    @lru_cache(maxsize=100)
     def _load_from_memory(self, cache_key: str) -> Optional[QPixmap]:
         """
-        Caché en memoria usando LRU
+        Caché en memoria (LRU)
 
         Args:
-            cache_key: Clave única (path + size)
+            cache_key: Clave única
 
         Returns:
             QPixmap o None si no está en caché
         """
-        # Esta función es solo un wrapper para el decorador lru_cache
-        # El verdadero caché está en el decorador
-        return None
+        entry = self._memory_cache.get(cache_key)
+        if entry is None:
+            return None
+        self._memory_cache.move_to_end(cache_key)
+        return entry[0]
+
+    def _cache_in_memory(self, cache_key: str, pixmap: QPixmap) -> None:
+        """
+        Guardar thumbnail en caché de memoria, expulsando los menos usados
+        hasta quedar por debajo de MEMORY_LIMIT_BYTES
+
+        Args:
+            cache_key: Clave única
+            pixmap: QPixmap a cachear
+        """
+        size_bytes = pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+        previous = self._memory_cache.pop(cache_key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[1]
+
+        self._memory_cache[cache_key] = (pixmap, size_bytes)
+        self._memory_bytes += size_bytes
+
+        while self._memory_bytes > self.MEMORY_LIMIT_BYTES and len(self._memory_cache) > 1:
+            _, (_, evicted_bytes) = self._memory_cache.popitem(last=False)
+            self._memory_bytes -= evicted_bytes
+            self._count('evictions')
+
+    # ==================== ACCESO ====================
 
     def get_thumbnail(self, image_path: str, size: Tuple[int, int] = None) -> Optional[QPixmap]:
         """
-        Obtener thumbnail de imagen (desde caché o generando)
+        Obtener thumbnail de imagen de forma síncrona (desde caché o generando)
 
         Flujo:
         1. Verificar caché en memoria
@@ -133,6 +275,8 @@ class ThumbnailCache:
         3. Generar nuevo thumbnail
         4. Guardar en caché
 
+        Para no bloquear la GUI usar request_thumbnail().
+
         Args:
             image_path: Ruta completa a imagen original
             size: Tupla (ancho, alto) del thumbnail (default: MEDIUM)
@@ -147,101 +291,176 @@ class ThumbnailCache:
         if size is None:
             size = self.SIZE_MEDIUM
 
-        # Verificar que archivo existe
-        img_path = Path(image_path)
-        if not img_path.exists():
+        cache_key = self._make_cache_key(image_path, size)
+        if cache_key is None:
             logger.warning(f"Image file not found: {image_path}")
             return None
 
         # 1. Intentar cargar desde memoria
-        cache_key = f"{image_path}_{size[0]}x{size[1]}"
         memory_result = self._load_from_memory(cache_key)
         if memory_result:
-            self.stats['hits'] += 1
+            self._count('hits')
             return memory_result
 
         # 2. Intentar cargar desde disco
-        cache_path = self._get_cache_path(image_path, size)
+        cache_path = self._get_cache_path(cache_key, size)
         if cache_path.exists():
             try:
                 pixmap = QPixmap(str(cache_path))
                 if not pixmap.isNull():
                     # Guardar en caché de memoria para próxima vez
                     self._cache_in_memory(cache_key, pixmap)
-                    self.stats['disk_hits'] += 1
+                    self._count('disk_hits')
+                    self._touch(cache_path)
                     logger.debug(f"Thumbnail loaded from disk: {cache_path.name}")
                     return pixmap
             except Exception as e:
                 logger.error(f"Error loading cached thumbnail: {e}")
 
         # 3. Generar nuevo thumbnail
-        self.stats['misses'] += 1
-        thumbnail = self._generate_thumbnail(image_path, size)
+        self._count('misses')
+        data = render_thumbnail_bytes(image_path, size)
+        if not data:
+            return None
 
-        if thumbnail:
-            # Guardar en disco
-            self._save_to_disk(thumbnail, cache_path)
+        self._save_to_disk(data, cache_path)
+        self._count('generated')
+        logger.debug(f"Thumbnail generated: {Path(image_path).name}")
+        return self._pixmap_from_bytes(cache_key, data)
 
-            # Guardar en memoria
-            self._cache_in_memory(cache_key, thumbnail)
+    def get_cached_thumbnail(self, image_path: str, size: Tuple[int, int] = None) -> Optional[QPixmap]:
+        """
+        Obtener thumbnail solo si ya está en memoria (nunca bloquea)
 
-            self.stats['generated'] += 1
-            logger.debug(f"Thumbnail generated: {img_path.name}")
+        Args:
+            image_path: Ruta completa a imagen original
+            size: Tupla (ancho, alto) del thumbnail (default: MEDIUM)
 
-        return thumbnail
+        Returns:
+            QPixmap o None
+        """
+        cache_key = self._make_cache_key(image_path, size or self.SIZE_MEDIUM) if image_path else None
+        if cache_key is None:
+            return None
+        pixmap = self._load_from_memory(cache_key)
+        if pixmap:
+            self._count('hits')
+        return pixmap
 
-    def _generate_thumbnail(self, image_path: str, size: Tuple[int, int]) -> Optional[QPixmap]:
+    def request_thumbnail(self, image_path: str, size: Tuple[int, int] = None,
+                          priority: int = PRIORITY_VISIBLE) -> Optional[QPixmap]:
         """
-        Generar thumbnail desde imagen original
+        Obtener thumbnail sin bloquear
+
+        Si está en memoria se devuelve directamente; si no, se encola para
+        los workers y se emitirá thumbnail_ready cuando esté listo.
 
         Args:
-            image_path: Ruta a imagen original
-            size: Tamaño deseado (ancho, alto)
+            image_path: Ruta completa a imagen original
+            size: Tupla (ancho, alto) del thumbnail (default: MEDIUM)
+            priority: PRIORITY_VISIBLE (pantalla) o PRIORITY_PREFETCH (anticipado)
 
         Returns:
-            QPixmap con thumbnail o None si falla
+            QPixmap si ya estaba en memoria, None si se encoló
         """
-        try:
-            # Abrir imagen con Pillow
-            with Image.open(image_path) as img:
-                # Convertir a RGB si es necesario (para PNGs con transparencia)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Crear fondo blanco
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Crear thumbnail (mantiene aspect ratio)
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # Guardar temporalmente para cargar en QPixmap
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    img.save(tmp_path, 'JPEG', quality=85)
-
-                # Cargar en QPixmap
-                pixmap = QPixmap(tmp_path)
-
-                # Eliminar archivo temporal
-                Path(tmp_path).unlink(missing_ok=True)
-
-                return pixmap if not pixmap.isNull() else None
+        if not image_path:
+            return None
 
-        except Exception as e:
-            logger.error(f"Error generating thumbnail for {image_path}: {e}")
+        if size is None:
+            size = self.SIZE_MEDIUM
+
+        cache_key = self._make_cache_key(image_path, size)
+        if cache_key is None:
+            logger.warning(f"Image file not found: {image_path}")
+            return None
+
+        pixmap = self._load_from_memory(cache_key)
+        if pixmap:
+            self._count('hits')
+            return pixmap
+
+        with self._pending_lock:
+            if cache_key in self._pending:
+                # Ya encolado: si ahora es visible, re-encolar con más prioridad
+                if priority != self.PRIORITY_VISIBLE:
+                    return None
+            self._pending.add(cache_key)
+
+        self._ensure_workers()
+        self._queue.put((priority, next(self._sequence), image_path, size, cache_key))
+        return None
+
+    # ==================== WORKERS ====================
+
+    def _ensure_workers(self) -> None:
+        """Arrancar los hilos de generación la primera vez que se necesitan"""
+        if self._workers:
+            return
+        worker_count = max(1, min(self.MAX_WORKERS, (os.cpu_count() or 2) - 1))
+        for index in range(worker_count):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"ThumbnailWorker-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        logger.debug(f"Started {worker_count} thumbnail workers")
+
+    def _worker_loop(self) -> None:
+        """Bucle de worker: leer de disco o generar con Pillow, sin tocar Qt"""
+        while True:
+            _, _, image_path, size, cache_key = self._queue.get()
+
+            with self._pending_lock:
+                if cache_key not in self._pending:
+                    # Duplicado ya servido por otra entrada de mayor prioridad
+                    continue
+
+            cache_path = self._get_cache_path(cache_key, size)
+            data = None
+            from_disk = False
+            try:
+                if cache_path.exists():
+                    data = cache_path.read_bytes()
+                    from_disk = bool(data)
+            except OSError as e:
+                logger.error(f"Error loading cached thumbnail: {e}")
+
+            if from_disk:
+                self._count('disk_hits')
+                self._touch(cache_path)
+            else:
+                self._count('misses')
+                data = render_thumbnail_bytes(image_path, size)
+                if data:
+                    self._save_to_disk(data, cache_path)
+                    self._count('generated')
+
+            with self._pending_lock:
+                self._pending.discard(cache_key)
+
+            if data:
+                self._bytes_ready.emit(image_path, size, cache_key, data)
+
+    def _on_bytes_ready(self, image_path: str, size: Tuple[int, int], cache_key: str, data: bytes) -> None:
+        """Convertir bytes a QPixmap en el hilo de la GUI y notificar"""
+        pixmap = self._pixmap_from_bytes(cache_key, data)
+        if pixmap:
+            self.thumbnail_ready.emit(image_path, size, pixmap)
+
+    def _pixmap_from_bytes(self, cache_key: str, data: bytes) -> Optional[QPixmap]:
+        """Crear QPixmap desde bytes JPEG y guardarlo en memoria (hilo GUI)"""
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data, 'JPEG'):
             return None
+        self._cache_in_memory(cache_key, pixmap)
+        return pixmap
 
-    def _save_to_disk(self, pixmap: QPixmap, cache_path: Path) -> bool:
+    def _save_to_disk(self, data: bytes, cache_path: Path) -> bool:
         """
         Guardar thumbnail en caché de disco
 
         Args:
-            pixmap: QPixmap a guardar
+            data: Bytes JPEG
             cache_path: Ruta donde guardar
 
         Returns:
@@ -251,40 +470,97 @@ class ThumbnailCache:
             # Asegurar que el directorio padre existe
             cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Guardar como JPEG (mejor compresión)
-            success = pixmap.save(str(cache_path), 'JPEG', quality=85)
+            # Escribir a archivo temporal y renombrar (otro worker puede leerlo)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
 
-            if success:
-                logger.debug(f"Thumbnail saved to disk: {cache_path.name}")
+            logger.debug(f"Thumbnail saved to disk: {cache_path.name}")
 
-            return success
+            with self._stats_lock:
+                self._saves_since_prune += 1
+                prune_due = self._saves_since_prune >= self.DISK_PRUNE_EVERY
+                if prune_due:
+                    self._saves_since_prune = 0
+            if prune_due:
+                self.prune_disk_cache()
+            return True
 
         except Exception as e:
             logger.error(f"Error saving thumbnail to disk: {e}")
             return False
 
-    def _cache_in_memory(self, cache_key: str, pixmap: QPixmap) -> None:
+    @staticmethod
+    def _touch(cache_path: Path) -> None:
+        """Actualizar mtime de un thumbnail leído (la poda elimina primero los menos usados)"""
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+    # ==================== LIMPIEZA ====================
+
+    def prune_disk_cache(self, max_bytes: Optional[int] = None, max_age_days: Optional[float] = None) -> int:
         """
-        Guardar thumbnail en caché de memoria
+        Aplicar los límites de la caché en disco
+
+        Elimina los thumbnails no usados en max_age_days y, si el total sigue
+        por encima de max_bytes, los de uso más antiguo (mtime) primero.
 
         Args:
-            cache_key: Clave única
-            pixmap: QPixmap a cachear
+            max_bytes: Tamaño máximo (default: DISK_LIMIT_BYTES)
+            max_age_days: Edad máxima sin uso (default: DISK_MAX_AGE_DAYS)
+
+        Returns:
+            Número de archivos eliminados
         """
-        # El LRU cache está en _load_from_memory
-        # Aquí usamos un dict simple adicional para almacenar
-        if not hasattr(self, '_memory_cache'):
-            self._memory_cache = {}
+        max_bytes = self.DISK_LIMIT_BYTES if max_bytes is None else max_bytes
+        max_age_days = self.DISK_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        if not self._prune_lock.acquire(blocking=False):
+            return 0  # Otra poda en curso
+
+        deleted_count = 0
+        try:
+            files = []
+            for size_dir in ['small', 'medium', 'large']:
+                dir_path = self.cache_dir / size_dir
+                if dir_path.exists():
+                    for cache_file in dir_path.glob('*.jpg'):
+                        try:
+                            stat = cache_file.stat()
+                        except OSError:
+                            continue
+                        files.append((stat.st_mtime, stat.st_size, cache_file))
+
+            files.sort()  # Menos usados primero
+            total_size = sum(size for _, size, _ in files)
+            age_limit = time.time() - max_age_days * 86400
+
+            for mtime, size, cache_file in files:
+                if mtime >= age_limit and total_size <= max_bytes:
+                    break
+                try:
+                    cache_file.unlink()
+                    deleted_count += 1
+                    total_size -= size
+                except OSError as e:
+                    logger.error(f"Error deleting {cache_file}: {e}")
+
+            if deleted_count:
+                self._count('disk_pruned', deleted_count)
+                logger.info(f"Disk cache pruned: {deleted_count} files deleted")
 
-        self._memory_cache[cache_key] = pixmap
+        except Exception as e:
+            logger.error(f"Error pruning disk cache: {e}")
+        finally:
+            self._prune_lock.release()
+
+        return deleted_count
 
     def clear_memory_cache(self) -> None:
         """Limpiar caché en memoria"""
-        if hasattr(self, '_memory_cache'):
-            self._memory_cache.clear()
-
-        # Limpiar LRU cache
-        self._load_from_memory.cache_clear()
+        self._memory_cache.clear()
+        self._memory_bytes = 0
 
         logger.info("Memory cache cleared")
 
@@ -352,37 +628,46 @@ class ThumbnailCache:
         Returns:
             Dict con estadísticas
         """
-        total_requests = self.stats['hits'] + self.stats['misses']
-        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        cache_hits = stats['hits'] + stats['disk_hits']
+        total_requests = cache_hits + stats['misses']
+        hit_rate = (cache_hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
             'total_requests': total_requests,
-            'memory_hits': self.stats['hits'],
-            'disk_hits': self.stats['disk_hits'],
-            'misses': self.stats['misses'],
-            'generated': self.stats['generated'],
+            'memory_hits': stats['hits'],
+            'disk_hits': stats['disk_hits'],
+            'misses': stats['misses'],
+            'generated': stats['generated'],
+            'evictions': stats['evictions'],
+            'disk_pruned': stats['disk_pruned'],
             'hit_rate': f"{hit_rate:.1f}%",
+            'memory_cache_mb': self._memory_bytes / (1024 * 1024),
+            'memory_cache_items': len(self._memory_cache),
+            'queue_depth': self._queue.qsize(),
             'cache_size_mb': self.get_cache_size() / (1024 * 1024),
             'cache_dir': str(self.cache_dir)
         }
 
-    def preload_thumbnails(self, image_paths: list, size: Tuple[int, int] = None) -> None:
+    def preload_thumbnails(self, image_paths: list, size: Tuple[int, int] = None,
+                           priority: int = PRIORITY_PREFETCH) -> None:
         """
-        Pre-cargar thumbnails en background
+        Pre-cargar thumbnails en background (no bloquea)
 
         Útil para cargar thumbnails antes de mostrar la galería
 
         Args:
             image_paths: Lista de rutas de imágenes
             size: Tamaño de thumbnails (default: MEDIUM)
+            priority: Prioridad en la cola (default: PRIORITY_PREFETCH)
         """
         if size is None:
             size = self.SIZE_MEDIUM
 
-        logger.info(f"Preloading {len(image_paths)} thumbnails...")
+        logger.info(f"Queueing {len(image_paths)} thumbnails for preload...")
 
         for img_path in image_paths:
-            # Esto generará y cacheará los thumbnails
-            self.get_thumbnail(img_path, size)
-
-        logger.info("Thumbnails preloaded")
+            # Esto generará y cacheará los thumbnails en los workers
+            self.request_thumbnail(img_path, size, priority)
@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.search.advanced_search_engine import AdvancedSearchEngine
 from core.taskbar_minimizable_mixin import TaskbarMinimizableMixin
+from views.widgets.search_completer import SearchCompleter
 from .left_panel import LeftPanel
 
 logger = logging.getLogger(__name__)
@@ -65,7 +66,7 @@ class SearchInputPanel(QWidget):
 
         # Mode selector
         self.mode_selector = QComboBox()
-        self.mode_selector.addItems(['Smart', 'FTS5', 'Exact'])
+        self.mode_selector.addItems(['Smart', 'FTS5', 'Fuzzy', 'Exact'])
         self.mode_selector.setCurrentText('Smart')
         self.mode_selector.setFixedWidth(120)
         self.mode_selector.setStyleSheet("""
@@ -411,6 +412,12 @@ class AdvancedSearchWindow(QWidget, TaskbarMinimizableMixin):
 
         # Search input panel
         self.search_panel = SearchInputPanel()
+        if self.search_engine:
+            # Sugerencias en memoria (labels, tags, categorías, proyectos, áreas)
+            self.search_completer = SearchCompleter(
+                self.search_panel.search_input,
+                lambda prefix, limit: self.search_engine.autocomplete(prefix, limit=limit)
+            )
         self.search_panel.search_requested.connect(self._on_search_requested)
         main_layout.addWidget(self.search_panel)
 
@@ -1,13 +1,13 @@
 """
 Results List View - Display search results in a scrollable list
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from views.widgets.item_widget import ItemButton
+from views.widgets.item_list_view import ItemListView
 from models.item import Item
 
 import logging
@@ -18,7 +18,7 @@ class ResultsListView(QWidget):
     """
     List view for search results
 
-    Displays results as a vertical list of ItemButton widgets
+    Displays results in a virtualized ItemListView (rows painted on demand)
     """
 
     # Signal emitted when an item is clicked
@@ -30,7 +30,6 @@ class ResultsListView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.results = []
-        self.item_widgets = []
 
         self.init_ui()
 
@@ -40,61 +39,6 @@ class ResultsListView(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Scroll area for results
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #1e1e1e;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #3a3a3a;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #4a4a4a;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                background-color: #1e1e1e;
-                height: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #3a3a3a;
-                border-radius: 6px;
-                min-width: 30px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #4a4a4a;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-        """)
-
-        # Container widget for scroll area
-        self.scroll_widget = QWidget()
-        self.scroll_widget.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
-        self.scroll_layout = QVBoxLayout(self.scroll_widget)
-        self.scroll_layout.setContentsMargins(10, 10, 10, 10)
-        self.scroll_layout.setSpacing(8)
-
         # Empty state label
         self.empty_label = QLabel("No hay resultados")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -103,15 +47,17 @@ class ResultsListView(QWidget):
                 color: #888888;
                 font-size: 14px;
                 padding: 50px;
+                background-color: #1e1e1e;
             }
         """)
-        self.scroll_layout.addWidget(self.empty_label)
-
-        # Add stretch to push items to top
-        self.scroll_layout.addStretch()
+        layout.addWidget(self.empty_label)
 
-        self.scroll_area.setWidget(self.scroll_widget)
-        layout.addWidget(self.scroll_area)
+        # Lista virtual de resultados (con badge de categoría)
+        self.items_view = ItemListView(show_category=True)
+        self.items_view.item_clicked.connect(self._on_item_clicked)
+        self.items_view.url_open_requested.connect(self._on_url_open_requested)
+        self.items_view.setVisible(False)
+        layout.addWidget(self.items_view)
 
     def update_results(self, results):
         """
@@ -129,11 +75,14 @@ class ResultsListView(QWidget):
 
         if not results:
             self.empty_label.setVisible(True)
+            self.items_view.setVisible(False)
             return
 
         self.empty_label.setVisible(False)
+        self.items_view.setVisible(True)
 
-        # Create ItemButton for each result
+        # Convert each result to an Item (the rows are painted by the list view)
+        items = []
         for result in results:
             try:
                 # Convert result dict to Item object
@@ -167,31 +116,17 @@ class ResultsListView(QWidget):
                 item.last_used = result.get('last_used')
                 item.created_at = result.get('created_at')
 
-                # Create item widget with category badge
-                item_widget = ItemButton(item, show_category=True)
-                item_widget.item_clicked.connect(self._on_item_clicked)
-                item_widget.url_open_requested.connect(self._on_url_open_requested)
-
-                # Insert before stretch
-                self.scroll_layout.insertWidget(
-                    self.scroll_layout.count() - 1,
-                    item_widget
-                )
-
-                self.item_widgets.append(item_widget)
+                items.append(item)
 
             except Exception as e:
-                logger.error(f"Error creating item widget: {e}", exc_info=True)
+                logger.error(f"Error creating item from result: {e}", exc_info=True)
 
-        logger.debug(f"Created {len(self.item_widgets)} item widgets")
+        self.items_view.set_items(items)
+        logger.debug(f"Showing {len(items)} items in list view")
 
     def clear_results(self):
-        """Clear all result widgets"""
-        # Remove all item widgets
-        for widget in self.item_widgets:
-            widget.deleteLater()
-
-        self.item_widgets.clear()
+        """Clear all results"""
+        self.items_view.set_items([])
         self.results.clear()
 
     def _on_item_clicked(self, item):
@@ -200,7 +135,7 @@ class ResultsListView(QWidget):
         self.item_clicked.emit(item)
 
     def _on_url_open_requested(self, url: str):
-        """Handle URL open request from ItemButton"""
+        """Handle URL open request from ItemListView"""
         logger.info(f"URL open requested in list view: {url}")
         # Forward signal to parent
         self.url_open_requested.emit(url)
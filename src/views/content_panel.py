@@ -1,7 +1,7 @@
 """
 Content Panel View - Expandable panel with items
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt6.QtGui import QFont
 import sys
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
 from models.item import Item
-from views.widgets.item_widget import ItemButton
+from views.widgets.item_list_view import ItemListView
 from views.widgets.search_bar import SearchBar
 from core.search_engine import SearchEngine
 
@@ -84,40 +84,10 @@ class ContentPanel(QWidget):
         self.search_bar.search_changed.connect(self.on_search_changed)
         main_layout.addWidget(self.search_bar)
 
-        # Scroll area for items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #252525;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 10px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-        """)
-
-        # Container for items
-        self.items_container = QWidget()
-        self.items_layout = QVBoxLayout(self.items_container)
-        self.items_layout.setContentsMargins(0, 0, 0, 0)
-        self.items_layout.setSpacing(0)
-        self.items_layout.addStretch()
-
-        scroll_area.setWidget(self.items_container)
-        main_layout.addWidget(scroll_area)
+        # Items: lista virtual (solo se pintan las filas visibles, con su propio scroll)
+        self.items_view = ItemListView(show_category=False)
+        self.items_view.item_clicked.connect(self.on_item_clicked)
+        main_layout.addWidget(self.items_view)
 
         # Animation for expand/collapse
         self.animation = QPropertyAnimation(self, b"maximumWidth")
@@ -161,20 +131,13 @@ class ContentPanel(QWidget):
         self.clear_items()
 
         # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
-            item_button = ItemButton(item)
-            item_button.item_clicked.connect(self.on_item_clicked)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+        self.items_view.set_items(items)
 
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+        logger.info(f"Successfully added {len(items)} items to the list view")
 
     def clear_items(self):
-        """Clear all item buttons"""
-        while self.items_layout.count() > 1:  # Keep the stretch at the end
-            item = self.items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Clear the item list"""
+        self.items_view.set_items([])
 
     def expand(self):
         """Expand the panel with animation"""
@@ -27,11 +27,13 @@ class TableExportDialog(QDialog):
     Diálogo para exportar tabla a archivo.
 
     Features:
-    - Selección de formato (CSV, TSV, JSON, JSON Records)
+    - Selección de formato (CSV, TSV, JSON, JSON Records, JSON Lines)
     - Opciones por formato (headers, metadata, pretty print)
     - Selección de ubicación de archivo
     - Preview de nombre de archivo sugerido
     - Resumen de tabla antes de exportar
+    - Con db_manager, exporta leyendo la tabla de la BD por bloques
+      (TableExporter.export_table_from_db) sin cargarla en memoria
 
     Señales:
         export_completed(str): Emitida cuando se completa exportación (file_path)
@@ -39,26 +41,36 @@ class TableExportDialog(QDialog):
 
     export_completed = pyqtSignal(str)  # file_path
 
+    # ID del radio button -> formato de TableExporter.export_table_from_db
+    FORMAT_IDS = {1: 'csv', 2: 'tsv', 3: 'json', 4: 'json_records', 5: 'jsonl'}
+
     def __init__(
         self,
         table_name: str,
-        table_data: list,
-        column_names: list,
-        parent=None
+        table_data: list = None,
+        column_names: list = None,
+        parent=None,
+        db_manager=None
     ):
         """
         Inicializa el diálogo de exportación.
 
         Args:
             table_name: Nombre de la tabla
-            table_data: Matriz de datos
+            table_data: Matriz de datos (no se usa si hay db_manager)
             column_names: Nombres de columnas
             parent: Widget padre
+            db_manager: DBManager para exportar la tabla guardada en streaming
         """
         super().__init__(parent)
         self.table_name = table_name
         self.table_data = table_data
-        self.column_names = column_names
+        self.db = db_manager
+        # Dimensiones de la tabla en la BD (sin leer sus celdas)
+        self.table_shape = db_manager.get_table_shape(table_name) if db_manager else None
+        if column_names is None and self.table_shape:
+            column_names = self.table_shape['columns']
+        self.column_names = column_names or []
 
         # Default output path
         self.output_path = None
@@ -179,6 +191,10 @@ class TableExportDialog(QDialog):
         self.format_group.addButton(self.json_records_radio, 4)
         format_layout.addWidget(self.json_records_radio)
 
+        self.jsonl_radio = QRadioButton("JSON Lines (un registro por línea)")
+        self.format_group.addButton(self.jsonl_radio, 5)
+        format_layout.addWidget(self.jsonl_radio)
+
         format_group.setLayout(format_layout)
         layout.addWidget(format_group)
 
@@ -246,6 +262,15 @@ class TableExportDialog(QDialog):
 
     def update_summary(self):
         """Actualiza el resumen de la tabla."""
+        if self.db is not None:
+            shape = self.table_shape or {'total_rows': 0, 'total_cols': 0, 'total_items': 0}
+            self.summary_label.setText(
+                f"Filas: {shape['total_rows']} | "
+                f"Columnas: {shape['total_cols']} | "
+                f"Celdas: {shape['total_items']}"
+            )
+            return
+
         summary = TableExporter.get_export_summary(
             self.table_name,
             self.table_data,
@@ -271,6 +296,8 @@ class TableExportDialog(QDialog):
             format_ext = "tsv"
         elif format_id in [3, 4]:  # JSON
             format_ext = "json"
+        elif format_id == 5:  # JSON Lines
+            format_ext = "jsonl"
         else:
             format_ext = "csv"
 
@@ -297,6 +324,9 @@ class TableExportDialog(QDialog):
         elif format_id in [3, 4]:  # JSON
             file_filter = "JSON Files (*.json);;All Files (*.*)"
             default_ext = ".json"
+        elif format_id == 5:  # JSON Lines
+            file_filter = "JSON Lines Files (*.jsonl);;All Files (*.*)"
+            default_ext = ".jsonl"
         else:
             file_filter = "All Files (*.*)"
             default_ext = ""
@@ -332,10 +362,14 @@ class TableExportDialog(QDialog):
             return
 
         # Validar datos
-        is_valid, error_msg = TableExporter.validate_export_data(
-            self.table_data,
-            self.column_names
-        )
+        if self.db is not None:
+            is_valid = self.table_shape is not None
+            error_msg = f"La tabla '{self.table_name}' no existe"
+        else:
+            is_valid, error_msg = TableExporter.validate_export_data(
+                self.table_data,
+                self.column_names
+            )
 
         if not is_valid:
             QMessageBox.critical(
@@ -355,7 +389,19 @@ class TableExportDialog(QDialog):
         try:
             success = False
 
-            if format_id == 1:  # CSV
+            if self.db is not None:
+                # Lectura por bloques desde la BD (tablas grandes sin cargar en memoria)
+                success = TableExporter.export_table_from_db(
+                    self.db,
+                    self.table_name,
+                    self.output_path,
+                    self.FORMAT_IDS.get(format_id, 'csv'),
+                    include_headers=include_headers,
+                    include_metadata=include_metadata,
+                    pretty=pretty_json
+                )
+
+            elif format_id == 1:  # CSV
                 success = TableExporter.export_to_csv(
                     self.table_data,
                     self.column_names,
@@ -391,6 +437,13 @@ class TableExportDialog(QDialog):
                     pretty=pretty_json
                 )
 
+            elif format_id == 5:  # JSON Lines
+                success = TableExporter.export_to_jsonl(
+                    self.table_data,
+                    self.column_names,
+                    self.output_path
+                )
+
             if success:
                 QMessageBox.information(
                     self,
@@ -469,15 +469,12 @@ class TableViewDialog(QDialog):
     def export_table(self):
         """Abre diálogo de exportación."""
         try:
-            # Obtener datos de tabla
-            table_data = self.get_table_data()
-
-            # Abrir diálogo de exportación
+            # Abrir diálogo de exportación: lee la tabla de la BD por bloques
             dialog = TableExportDialog(
                 table_name=self.table_name,
-                table_data=table_data,
                 column_names=self.column_names,
-                parent=self
+                parent=self,
+                db_manager=self.db
             )
 
             dialog.export_completed.connect(self.on_export_completed)
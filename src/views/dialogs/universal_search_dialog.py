@@ -19,6 +19,8 @@ import re
 from datetime import datetime
 
 from src.core.universal_search_engine import UniversalSearchEngine, SearchResultType
+from src.core.search.autocomplete_service import get_autocomplete_service
+from src.views.widgets.search_completer import SearchCompleter
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +215,10 @@ class UniversalSearchDialog(QDialog):
         self.search_input.setFixedHeight(35)
         layout.addWidget(self.search_input)
 
+        # Autocompletado en memoria (labels, tags, categorías, proyectos, áreas)
+        autocomplete = get_autocomplete_service(self.db)
+        self.search_completer = SearchCompleter(self.search_input, autocomplete.suggest)
+
         # Botón de historial
         self.history_btn = QPushButton("📜")
         self.history_btn.setFixedSize(35, 35)
@@ -534,16 +540,14 @@ class UniversalSearchDialog(QDialog):
 
             logger.info(f"Buscando con query: '{search_query}'")
 
-            # Obtener conteo total
-            self.total_items = self.db.universal_search_items_count(search_query)
-            logger.info(f"Total items encontrados: {self.total_items}")
-
             # Calcular offset
             offset = (self.current_page - 1) * self.page_size
 
-            # Buscar items con paginación
-            results = self.search_engine.search_items(search_query, limit=self.page_size, offset=offset)
-            logger.info(f"Resultados obtenidos: {len(results)}")
+            # Página + total en una sola pasada (IDs ordenados cacheados por query)
+            results, self.total_items = self.search_engine.search_items_page(
+                search_query, limit=self.page_size, offset=offset
+            )
+            logger.info(f"Resultados obtenidos: {len(results)} de {self.total_items}")
 
             # Aplicar operadores de búsqueda solo si hay operadores
             if parsed_query['has_operators']:
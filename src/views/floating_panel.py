@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
 from models.item import Item
-from views.widgets.item_widget import ItemButton
+from views.widgets.item_list_view import ItemListView
 from views.widgets.list_widget import ListWidget
 from views.widgets.table_group_widget import TableGroupWidget
 from views.widgets.search_bar import SearchBar
@@ -513,6 +513,17 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.items_layout = QVBoxLayout(self.items_container)
         self.items_layout.setContentsMargins(PanelStyles.BODY_PADDING, PanelStyles.BODY_PADDING, PanelStyles.BODY_PADDING, PanelStyles.BODY_PADDING)
         self.items_layout.setSpacing(PanelStyles.ITEM_SPACING)
+
+        # Items: lista virtual (solo se pintan las filas visibles); las listas van debajo como widgets
+        self.items_view = ItemListView(show_category=False)
+        self.items_view.set_fit_to_contents(True)
+        self.items_view.item_clicked.connect(self.on_item_clicked)
+        self.items_view.url_open_requested.connect(self.on_url_open_requested)
+        self.items_view.table_view_requested.connect(self.on_table_view_requested)
+        self.items_view.web_static_render_requested.connect(self.on_web_static_render_requested)
+        self.items_view.item_edit_requested.connect(self.on_item_edit_requested)
+        self.items_view.setVisible(False)
+        self.items_layout.addWidget(self.items_view)
         self.items_layout.addStretch()
 
         self.scroll_area.setWidget(self.items_container)
@@ -600,22 +611,16 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.clear_items()
 
         # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
-            item_button = ItemButton(item)
-            item_button.item_clicked.connect(self.on_item_clicked)
-            item_button.url_open_requested.connect(self.on_url_open_requested)
-            item_button.table_view_requested.connect(self.on_table_view_requested)
-            item_button.web_static_render_requested.connect(self.on_web_static_render_requested)
-            item_button.item_edit_requested.connect(self.on_item_edit_requested)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
-
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+        self.items_view.set_items(items)
+        self.items_view.setVisible(len(items) > 0)
+
+        logger.info(f"Successfully added {len(items)} items to the list view")
 
     def display_items_and_lists(self, items, lists):
         """Display items and lists in separate sections
 
-        Limits display to maximum 100 items and 100 lists for performance
+        Items go to the virtualized list view (no limit); lists are limited
+        to 100 widgets for performance
 
         Args:
             items: List of Item objects (solo items normales, no items de listas)
@@ -632,59 +637,20 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         # Clear existing content
         self.clear_items()
 
-        # Límite de visualización
-        MAX_DISPLAY_ITEMS = 100
+        # Límite de visualización (los items no lo necesitan: solo se pintan las filas visibles)
         MAX_DISPLAY_LISTS = 100
 
         # === SECCIÓN DE ITEMS ===
+        self.items_view.set_display_options(
+            self.show_labels_checkbox.isChecked(),
+            self.show_tags_checkbox.isChecked(),
+            self.show_content_checkbox.isChecked(),
+            self.show_description_checkbox.isChecked()
+        )
         if items:
-            total_items = len(items)
-            items_to_display = items[:MAX_DISPLAY_ITEMS]  # Limitar a 100
-
             # Section header con conteo
-            if total_items > MAX_DISPLAY_ITEMS:
-                items_header_text = f"━━━ Items ({MAX_DISPLAY_ITEMS} de {total_items}) ━━━"
-            else:
-                items_header_text = f"━━━ Items ({total_items}) ━━━"
-
-            items_header = QLabel(items_header_text)
-            items_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            items_header.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10pt;
-                    font-weight: bold;
-                    padding: 8px;
-                    background-color: transparent;
-                }
-            """)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, items_header)
-
-            # Add items (solo los primeros 100)
-            for idx, item in enumerate(items_to_display):
-                logger.debug(f"Creating item button {idx+1}/{len(items_to_display)}: {item.label}")
-
-                # Get display options from checkboxes
-                show_labels = self.show_labels_checkbox.isChecked()
-                show_tags = self.show_tags_checkbox.isChecked()
-                show_content = self.show_content_checkbox.isChecked()
-                show_description = self.show_description_checkbox.isChecked()
-
-                # Create ItemButton with display options
-                item_button = ItemButton(
-                    item,
-                    show_category=False,
-                    show_labels=show_labels,
-                    show_tags=show_tags,
-                    show_content=show_content,
-                    show_description=show_description
-                )
-                item_button.item_clicked.connect(self.on_item_clicked)
-                item_button.url_open_requested.connect(self.on_url_open_requested)
-                item_button.table_view_requested.connect(self.on_table_view_requested)
-                item_button.web_static_render_requested.connect(self.on_web_static_render_requested)
-                item_button.item_edit_requested.connect(self.on_item_edit_requested)
-                self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+            self.items_view.set_sections([(f"━━━ Items ({len(items)}) ━━━", items)])
+        self.items_view.setVisible(bool(items))
 
         # === SECCIÓN DE LISTAS ===
         if lists:
@@ -744,12 +710,14 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
 
                 self.items_layout.insertWidget(self.items_layout.count() - 1, list_widget)
 
-        logger.info(f"Successfully displayed {len(items_to_display) if items else 0}/{len(items)} items and {len(lists_to_display) if lists else 0}/{len(lists)} lists")
+        logger.info(f"Successfully displayed {len(items)} items and {len(lists_to_display) if lists else 0}/{len(lists)} lists")
 
     def clear_items(self):
-        """Clear all item buttons"""
-        while self.items_layout.count() > 1:  # Keep the stretch at the end
-            item = self.items_layout.takeAt(0)
+        """Clear the item list and the list widgets"""
+        self.items_view.set_items([])
+        self.items_view.setVisible(False)
+        while self.items_layout.count() > 2:  # Keep the list view first and the stretch at the end
+            item = self.items_layout.takeAt(1)
             if item.widget():
                 item.widget().deleteLater()
 
@@ -759,13 +727,13 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.item_clicked.emit(item)
 
     def on_url_open_requested(self, url: str):
-        """Handle URL open request from ItemButton"""
+        """Handle URL open request from ItemListView"""
         logger.info(f"URL open requested: {url}")
         # Forward signal to parent (MainWindow)
         self.url_open_requested.emit(url)
 
     def on_table_view_requested(self, table_name: str):
-        """Handle table view request from ItemButton or TableGroupWidget"""
+        """Handle table view request from ItemListView or TableGroupWidget"""
         logger.info(f"Table view requested: {table_name}")
 
         try:
@@ -784,7 +752,7 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
             logger.error(f"Error opening table view: {e}", exc_info=True)
 
     def on_web_static_render_requested(self, item):
-        """Handle WEB_STATIC render request from ItemButton"""
+        """Handle WEB_STATIC render request from ItemListView"""
         logger.info(f"WEB_STATIC render requested: {item.label}")
 
         try:
@@ -807,7 +775,7 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
             )
 
     def on_item_edit_requested(self, item):
-        """Handle item edit request from ItemButton"""
+        """Handle item edit request from ItemListView"""
         logger.info(f"Edit requested for item: {item.label}")
 
         try:
@@ -1151,8 +1119,8 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.update_filter_badge()
 
     def on_display_options_changed(self):
-        """Handle changes in display options checkboxes - refresh item widgets"""
-        logger.info("Display options changed - refreshing items")
+        """Handle changes in display options checkboxes - repaint the item list"""
+        logger.info("Display options changed - repainting items")
 
         # Get current display state
         show_labels = self.show_labels_checkbox.isChecked()
@@ -1162,10 +1130,8 @@ class FloatingPanel(QWidget, TaskbarMinimizableMixin):
 
         logger.debug(f"Display options: labels={show_labels}, tags={show_tags}, content={show_content}, description={show_description}")
 
-        # Re-render all items with new display options
-        # This will recreate all ItemButton widgets with the updated display mode
-        current_query = self.search_bar.search_input.text()
-        self.on_search_changed(current_query)
+        # Solo cambia el pintado de las filas: no hace falta repetir la búsqueda
+        self.items_view.set_display_options(show_labels, show_tags, show_content, show_description)
 
     def on_filters_changed(self, filters: dict):
         """Handle cuando cambian los filtros avanzados"""
@@ -1,7 +1,7 @@
 """
 Global Search Panel Window - Independent window for searching all items across all categories
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QPushButton, QSizePolicy, QComboBox, QCheckBox
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QCheckBox
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QEvent, QTimer
 from PyQt6.QtGui import QFont, QCursor
 import sys
@@ -11,11 +11,12 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.item import Item, ItemType
-from views.widgets.item_widget import ItemButton
+from views.widgets.item_list_view import ItemListView
 from views.widgets.search_bar import SearchBar
 from views.advanced_filters_window import AdvancedFiltersWindow
 from core.search_engine import SearchEngine
 from core.advanced_filter_engine import AdvancedFilterEngine
+from core.item_search_index import ItemSearchIndex
 from core.pinned_panels_manager import PinnedPanelsManager
 from styles.panel_styles import PanelStyles
 from utils.panel_resizer import PanelResizer
@@ -48,6 +49,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.search_engine = SearchEngine()
         self.filter_engine = AdvancedFilterEngine()  # Motor de filtrado avanzado
         self.all_items = []  # Store all items before filtering
+        self.search_index = ItemSearchIndex()  # Índice de búsqueda/filtros sobre all_items
         self.current_filters = {}  # Filtros activos actuales
         self.current_state_filter = "normal"  # Filtro de estado actual: normal, archived, inactive, all
 
@@ -524,36 +526,29 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
         main_layout.addWidget(self.display_options_widget)
 
-        # Scroll area for items
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet(f"""
-            {PanelStyles.get_scroll_area_style()}
-            {PanelStyles.get_scrollbar_style()}
+        # Lista virtualizada de items (solo se pintan las filas visibles)
+        self.items_view = ItemListView(show_category=True)  # show_category=True for global search
+        self.items_view.item_clicked.connect(self.on_item_clicked)
+        self.items_view.url_open_requested.connect(self.on_url_open_requested)
+        self.items_view.item_edit_requested.connect(self.on_item_edit_requested)
+        main_layout.addWidget(self.items_view)
+
+        # Info message shown when results are limited
+        self.limited_info_label = QLabel()
+        self.limited_info_label.setWordWrap(True)
+        self.limited_info_label.setStyleSheet("""
+            QLabel {
+                color: #aaaaaa;
+                font-size: 10pt;
+                background-color: #2d2d2d;
+                border: 1px solid #4d4d4d;
+                border-radius: 4px;
+                padding: 10px;
+                margin: 5px;
+            }
         """)
-
-        # Container for items
-        self.items_container = QWidget()
-        self.items_container.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Preferred
-        )
-        self.items_container.setStyleSheet(PanelStyles.get_body_style())
-
-        self.items_layout = QVBoxLayout(self.items_container)
-        self.items_layout.setContentsMargins(
-            PanelStyles.BODY_PADDING,
-            PanelStyles.BODY_PADDING,
-            PanelStyles.BODY_PADDING,
-            PanelStyles.BODY_PADDING
-        )
-        self.items_layout.setSpacing(PanelStyles.ITEM_SPACING)
-        self.items_layout.addStretch()
-
-        self.scroll_area.setWidget(self.items_container)
-        main_layout.addWidget(self.scroll_area)
+        self.limited_info_label.hide()
+        main_layout.addWidget(self.limited_info_label)
 
     def load_all_items(self):
         """Load and display ALL items from ALL categories"""
@@ -563,74 +558,21 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
         logger.info("Loading all items for global search")
 
-        # Get all items from database
-        items_data = self.db_manager.get_all_items(include_inactive=False)
+        # Get all items from database (sensitive content decrypted lazily by Item.content)
+        items_data = self.db_manager.get_all_items(include_inactive=False, decrypt=False)
 
         # Convert dict items to Item objects
         self.all_items = []
         for item_dict in items_data:
             try:
-                # Convert type string to ItemType enum (handle both uppercase and lowercase)
-                type_str = item_dict['type'].lower() if item_dict['type'] else 'text'
-                item_type = ItemType(type_str)
-
-                item = Item(
-                    item_id=str(item_dict['id']),
-                    label=item_dict['label'],
-                    content=item_dict['content'],
-                    item_type=item_type,
-                    icon=item_dict.get('icon'),
-                    is_sensitive=bool(item_dict.get('is_sensitive', False)),
-                    is_favorite=bool(item_dict.get('is_favorite', False)),
-                    tags=item_dict.get('tags', []),
-                    description=item_dict.get('description')
-                )
-
-                # Store category info for display
-                item.category_name = item_dict.get('category_name', '')
-                item.category_icon = item_dict.get('category_icon', '')
-                item.category_color = item_dict.get('category_color', '')
-
-                # Parse date fields from database (SQLite returns strings)
-                from datetime import datetime
-                if item_dict.get('created_at'):
-                    try:
-                        # SQLite datetime format: 'YYYY-MM-DD HH:MM:SS' or ISO format
-                        created_at_str = item_dict['created_at']
-                        if 'T' in created_at_str:
-                            # ISO format
-                            item.created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                        else:
-                            # SQLite format
-                            item.created_at = datetime.strptime(created_at_str, '%Y-%m-%d %H:%M:%S')
-                        logger.debug(f"Parsed created_at for '{item.label}': {item.created_at}")
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Could not parse created_at '{item_dict.get('created_at')}': {e}")
-                        item.created_at = datetime.now()
-                else:
-                    logger.debug(f"Item '{item.label}' has no created_at in database")
-
-                if item_dict.get('last_used'):
-                    try:
-                        last_used_str = item_dict['last_used']
-                        if 'T' in last_used_str:
-                            # ISO format
-                            item.last_used = datetime.fromisoformat(last_used_str.replace('Z', '+00:00'))
-                        else:
-                            # SQLite format
-                            item.last_used = datetime.strptime(last_used_str, '%Y-%m-%d %H:%M:%S')
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"Could not parse last_used '{item_dict.get('last_used')}': {e}")
-                        item.last_used = datetime.now()
-
-                # Parse use_count
-                item.use_count = item_dict.get('use_count', 0)
-
-                self.all_items.append(item)
+                self.all_items.append(self._item_from_dict(item_dict))
             except Exception as e:
                 logger.error(f"Error converting item {item_dict.get('id')}: {e}")
                 continue
 
+        # Índice para búsqueda por tecla (filtros + texto con operaciones de conjuntos)
+        self.search_index.build(self.all_items)
+
         logger.info(f"Loaded {len(self.all_items)} items from database")
 
         # Update available tags in filters window
@@ -651,6 +593,69 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.raise_()
         self.activateWindow()
 
+    def _item_from_dict(self, item_dict: dict) -> Item:
+        """Convert a get_all_items() row into an Item with category and usage info"""
+        # Convert type string to ItemType enum (handle both uppercase and lowercase)
+        type_str = item_dict['type'].lower() if item_dict['type'] else 'text'
+        item_type = ItemType(type_str)
+
+        item = Item(
+            item_id=str(item_dict['id']),
+            label=item_dict['label'],
+            content=item_dict['content'],
+            item_type=item_type,
+            icon=item_dict.get('icon'),
+            is_sensitive=bool(item_dict.get('is_sensitive', False)),
+            is_favorite=bool(item_dict.get('is_favorite', False)),
+            tags=item_dict.get('tags', []),
+            description=item_dict.get('description'),
+            is_active=bool(item_dict.get('is_active', True)),
+            is_archived=bool(item_dict.get('is_archived', False)),
+            list_id=item_dict.get('list_id')
+        )
+
+        # Store category info for display
+        item.category_name = item_dict.get('category_name', '')
+        item.category_icon = item_dict.get('category_icon', '')
+        item.category_color = item_dict.get('category_color', '')
+
+        # Parse date fields from database (SQLite returns strings)
+        from datetime import datetime
+        if item_dict.get('created_at'):
+            try:
+                # SQLite datetime format: 'YYYY-MM-DD HH:MM:SS' or ISO format
+                created_at_str = item_dict['created_at']
+                if 'T' in created_at_str:
+                    # ISO format
+                    item.created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
+                else:
+                    # SQLite format
+                    item.created_at = datetime.strptime(created_at_str, '%Y-%m-%d %H:%M:%S')
+                logger.debug(f"Parsed created_at for '{item.label}': {item.created_at}")
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Could not parse created_at '{item_dict.get('created_at')}': {e}")
+                item.created_at = datetime.now()
+        else:
+            logger.debug(f"Item '{item.label}' has no created_at in database")
+
+        if item_dict.get('last_used'):
+            try:
+                last_used_str = item_dict['last_used']
+                if 'T' in last_used_str:
+                    # ISO format
+                    item.last_used = datetime.fromisoformat(last_used_str.replace('Z', '+00:00'))
+                else:
+                    # SQLite format
+                    item.last_used = datetime.strptime(last_used_str, '%Y-%m-%d %H:%M:%S')
+            except (ValueError, TypeError) as e:
+                logger.debug(f"Could not parse last_used '{item_dict.get('last_used')}': {e}")
+                item.last_used = datetime.now()
+
+        # Parse use_count
+        item.use_count = item_dict.get('use_count', 0)
+
+        return item
+
     def display_items(self, items, total_count=None):
         """Display a list of items
 
@@ -668,72 +673,29 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
             # Showing all results
             self.header_label.setText(f"🌐 Búsqueda Global ({len(items)} items)")
 
-        # Clear existing items
-        self.clear_items()
-
-        # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
-
-            # Get display options from checkboxes
-            show_labels = self.show_labels_checkbox.isChecked()
-            show_tags = self.show_tags_checkbox.isChecked()
-            show_content = self.show_content_checkbox.isChecked()
-            show_description = self.show_description_checkbox.isChecked()
-
-            item_button = ItemButton(
-                item,
-                show_category=True,  # show_category=True for global search
-                show_labels=show_labels,
-                show_tags=show_tags,
-                show_content=show_content,
-                show_description=show_description
-            )
-            item_button.item_clicked.connect(self.on_item_clicked)
-            item_button.url_open_requested.connect(self.on_url_open_requested)
-            item_button.item_edit_requested.connect(self.on_item_edit_requested)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+        # Display options from checkboxes
+        self.items_view.set_display_options(
+            show_labels=self.show_labels_checkbox.isChecked(),
+            show_tags=self.show_tags_checkbox.isChecked(),
+            show_content=self.show_content_checkbox.isChecked(),
+            show_description=self.show_description_checkbox.isChecked()
+        )
+        self.items_view.set_items(items)
 
         # Add info message if showing limited results
         if total_count and total_count > len(items):
-            info_widget = QWidget()
-            info_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #2d2d2d;
-                    border: 1px solid #4d4d4d;
-                    border-radius: 4px;
-                    padding: 10px;
-                    margin: 5px;
-                }
-            """)
-            info_layout = QVBoxLayout(info_widget)
-            info_layout.setContentsMargins(10, 10, 10, 10)
-
-            info_label = QLabel(
+            self.limited_info_label.setText(
                 f"ℹ️ Mostrando los primeros {len(items)} items de {total_count} totales.\n"
                 f"💡 Usa la búsqueda o filtros para encontrar items específicos."
             )
-            info_label.setWordWrap(True)
-            info_label.setStyleSheet("""
-                QLabel {
-                    color: #aaaaaa;
-                    font-size: 10pt;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-            info_layout.addWidget(info_label)
-
-            self.items_layout.insertWidget(self.items_layout.count() - 1, info_widget)
-
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+            self.limited_info_label.show()
+        else:
+            self.limited_info_label.hide()
 
     def clear_items(self):
-        """Clear all item buttons"""
-        while self.items_layout.count() > 1:  # Keep the stretch at the end
-            item = self.items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Clear all displayed items"""
+        self.items_view.set_items([])
+        self.limited_info_label.hide()
 
     def on_item_clicked(self, item: Item):
         """Handle item click"""
@@ -741,13 +703,13 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         self.item_clicked.emit(item)
 
     def on_url_open_requested(self, url: str):
-        """Handle URL open request from ItemButton"""
+        """Handle URL open request from the item list"""
         logger.info(f"URL open requested: {url}")
         # Forward signal to parent (MainWindow)
         self.url_open_requested.emit(url)
 
     def on_item_edit_requested(self, item):
-        """Handle item edit request from ItemButton"""
+        """Handle item edit request from the item list"""
         logger.info(f"Edit requested for item: {item.label}")
 
         try:
@@ -770,7 +732,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
             )
 
             # Connect signals to refresh panel after edit
-            dialog.item_updated.connect(lambda item_id, cat_id: self.reload_all_items())
+            dialog.item_updated.connect(lambda item_id, cat_id: self.on_item_state_changed(str(item_id)))
 
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 logger.info(f"Item '{item.label}' edited successfully from GlobalSearchPanel")
@@ -784,10 +746,26 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
     def on_item_state_changed(self, item_id: str):
         """Handle item state change (favorite/archived) from ItemDetailsDialog"""
         logger.info(f"Item {item_id} state changed, refreshing search results")
-        # Reload all items and re-apply current search
-        self.load_all_items()
-        if self.search_bar.text():
-            self.on_search_changed(self.search_bar.text())
+        if not self.db_manager:
+            return
+
+        # Refresh only this item in all_items and in the search index
+        rows = self.db_manager.get_items_by_ids([int(item_id)])
+        position = next((i for i, item in enumerate(self.all_items) if item.id == str(item_id)), None)
+        if rows:
+            item = self._item_from_dict(rows[0])
+            if position is None:
+                self.all_items.append(item)
+            else:
+                self.all_items[position] = item
+            self.search_index.update_item(item)
+        else:
+            if position is not None:
+                del self.all_items[position]
+            self.search_index.remove_item(item_id)
+
+        # Re-apply current search and filters
+        self.on_search_changed(self.search_bar.search_input.text())
 
     def on_search_changed(self, query: str):
         """Handle search query change with debouncing"""
@@ -799,10 +777,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
             self.update_timer.start(self.update_delay_ms)
 
     def on_display_options_changed(self):
-        """Handle changes in display options checkboxes - refresh item widgets"""
-        logger.info("Display options changed - refreshing items")
-
-        # Get current display state
+        """Handle changes in display options checkboxes - repaint visible rows"""
         show_labels = self.show_labels_checkbox.isChecked()
         show_tags = self.show_tags_checkbox.isChecked()
         show_content = self.show_content_checkbox.isChecked()
@@ -810,9 +785,8 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
         logger.debug(f"Display options: labels={show_labels}, tags={show_tags}, content={show_content}, description={show_description}")
 
-        # Re-render all items with new display options
-        # Trigger a new search with the current query
-        self._perform_search()
+        # Las filas se pintan bajo demanda: no hace falta repetir la búsqueda
+        self.items_view.set_display_options(show_labels, show_tags, show_content, show_description)
 
     def _perform_search(self):
         """Perform the actual search after debounce"""
@@ -821,61 +795,15 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         logger.debug(f"Total items before filter: {len(self.all_items)}")
         logger.debug(f"Current filters: {self.current_filters}")
 
-        # Aplicar filtros avanzados primero
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
-        logger.debug(f"Items after advanced filters: {len(filtered_items)}")
-
-        # Aplicar filtro de estado
-        filtered_items = self.filter_items_by_state(filtered_items)
-        logger.debug(f"Items after state filter: {len(filtered_items)}")
-
-        # Luego aplicar búsqueda si hay query
-        if query and query.strip():
-            # Search in labels, content, tags, description, and category name
-            search_results = []
-            query_lower = query.lower()
-
-            for item in filtered_items:
-                # Search in label
-                if query_lower in item.label.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in content (if not sensitive)
-                if not item.is_sensitive and query_lower in item.content.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in tags
-                if any(query_lower in tag.lower() for tag in item.tags):
-                    search_results.append(item)
-                    continue
-
-                # Search in description
-                if item.description and query_lower in item.description.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in category name
-                if hasattr(item, 'category_name') and item.category_name:
-                    if query_lower in item.category_name.lower():
-                        search_results.append(item)
-                        continue
-
-            filtered_items = search_results
-
-        # Apply initial display limit if no search/filters are active
-        # (for performance with large datasets)
-        if not query.strip() and not self.current_filters and self.current_state_filter == 'normal':
-            # No search, no advanced filters, no state filter -> limit to 100 items
-            initial_display_limit = 100
-            if len(filtered_items) > initial_display_limit:
-                self.display_items(filtered_items[:initial_display_limit], total_count=len(filtered_items))
-            else:
-                self.display_items(filtered_items)
-        else:
-            # Search or filters active -> show all results
-            self.display_items(filtered_items)
+        # Filtros avanzados, filtro de estado y texto resueltos por el índice
+        # (label, content no sensible, tags, descripción y categoría)
+        filtered_items = self.search_index.search(
+            query, self.current_filters, self.current_state_filter, self.filter_engine
+        )
+        logger.debug(f"Items after filters and search: {len(filtered_items)}")
+
+        # La lista es virtual: se muestran todos los resultados sin límite inicial
+        self.display_items(filtered_items)
 
         # Update filter badge when search changes
         self.update_filter_badge()
@@ -1438,12 +1366,8 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
     def on_copy_all_visible(self):
         """Copiar al portapapeles el contenido de todos los items visibles"""
-        # Obtener todos los widgets de items actualmente en el layout
-        visible_items = []
-        for i in range(self.items_layout.count() - 1):  # -1 para excluir el stretch
-            widget = self.items_layout.itemAt(i).widget()
-            if widget and hasattr(widget, 'item'):
-                visible_items.append(widget.item)
+        # Obtener todos los items actualmente en la lista
+        visible_items = self.items_view.get_items()
 
         if not visible_items:
             logger.warning("No visible items to copy")
@@ -1507,34 +1431,8 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         Returns:
             Lista filtrada de items
         """
-        if self.current_state_filter == "all":
-            # Mostrar todos los items
-            return items
-
-        filtered = []
-        for item in items:
-            # Verificar estado del item en la base de datos
-            if self.db_manager:
-                item_data = self.db_manager.get_item(int(item.id))
-                if item_data:
-                    is_active = item_data.get('is_active', True)
-                    is_archived = item_data.get('is_archived', False)
-
-                    # Aplicar filtro según selección
-                    if self.current_state_filter == "normal":
-                        # Solo items activos y no archivados
-                        if is_active and not is_archived:
-                            filtered.append(item)
-                    elif self.current_state_filter == "archived":
-                        # Solo items archivados
-                        if is_archived:
-                            filtered.append(item)
-                    elif self.current_state_filter == "inactive":
-                        # Solo items inactivos (no activos y no archivados)
-                        if not is_active and not is_archived:
-                            filtered.append(item)
-
-        return filtered
+        # Estado (is_active / is_archived) indexado al cargar los items
+        return self.search_index.filter_by_state(items, self.current_state_filter)
 
     def on_create_list_clicked(self):
         """Abrir diálogo para crear lista desde items visibles"""
@@ -1549,11 +1447,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
             return
 
         # Obtener items visibles
-        visible_items = []
-        for i in range(self.items_layout.count() - 1):
-            widget = self.items_layout.itemAt(i).widget()
-            if widget and hasattr(widget, 'item'):
-                visible_items.append(widget.item)
+        visible_items = self.items_view.get_items()
 
         if not visible_items:
             logger.warning("No visible items to create list from")
@@ -1775,11 +1669,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
         from PyQt6.QtWidgets import QMessageBox
 
         # Count visible items
-        visible_count = 0
-        for i in range(self.items_layout.count() - 1):
-            widget = self.items_layout.itemAt(i).widget()
-            if widget:
-                visible_count += 1
+        visible_count = self.items_view.item_count()
 
         # Build info message
         info_lines = [
@@ -1895,7 +1785,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
             value: Valor objetivo del scroll (0 = arriba, max = abajo)
             duration: Duración de la animación en milisegundos (default: 300ms)
         """
-        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar = self.items_view.verticalScrollBar()
         animation = PanelStyles.create_smooth_scroll_animation(scroll_bar, value, duration)
         animation.start()
         # Guardar referencia para que no se destruya
@@ -1907,7 +1797,7 @@ class GlobalSearchPanel(QWidget, TaskbarMinimizableMixin):
 
     def smooth_scroll_to_bottom(self, duration: int = 300):
         """Anima el scroll hacia abajo"""
-        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar = self.items_view.verticalScrollBar()
         self.smooth_scroll_to(scroll_bar.maximum(), duration)
 
     def showEvent(self, event):
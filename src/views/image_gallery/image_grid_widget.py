@@ -71,6 +71,7 @@ class ImageGridWidget(QWidget):
         super().__init__(parent)
 
         self.controller = controller
+        self.controller.thumbnail_ready.connect(self._on_thumbnail_ready)
         self.cards = []
         self.images_data = []
         self.card_width = 180
@@ -178,29 +179,39 @@ class ImageGridWidget(QWidget):
         return columns
 
     def _load_visible_thumbnails(self):
-        """Cargar thumbnails de cards visibles (lazy loading)"""
+        """Cargar thumbnails de cards (lazy loading, generados en background)"""
         try:
-            logger.debug("Loading visible thumbnails...")
+            logger.debug("Requesting thumbnails...")
 
             loaded_count = 0
 
-            for card in self.cards[:20]:  # Primeras 20 cards
+            # Se solicitan en orden: las primeras cards llegan antes a los workers
+            for card in self.cards:
                 item_data = card.get_item_data()
                 image_path = item_data.get('content')
 
                 if image_path:
-                    # Obtener thumbnail desde controller
-                    thumbnail = self.controller.get_thumbnail(image_path, size='medium')
+                    # Devuelve el pixmap si está en memoria; si no, llega por thumbnail_ready
+                    thumbnail = self.controller.request_thumbnail(image_path, size='medium')
 
                     if thumbnail:
                         card.set_thumbnail(thumbnail)
                         loaded_count += 1
 
-            logger.info(f"Loaded {loaded_count} thumbnails")
+            logger.info(f"Loaded {loaded_count} thumbnails from memory, "
+                        f"{len(self.cards) - loaded_count} queued")
 
         except Exception as e:
             logger.error(f"Error loading thumbnails: {e}", exc_info=True)
 
+    def _on_thumbnail_ready(self, image_path: str, size: str, pixmap: QPixmap):
+        """Asignar un thumbnail generado en background a sus cards"""
+        if size != 'medium':
+            return
+        for card in self.cards:
+            if card.get_item_data().get('content') == image_path:
+                card.set_thumbnail(pixmap)
+
     def load_more_thumbnails(self):
         """Cargar más thumbnails (para scroll infinito)"""
         # TODO: Implementar en versión futura
@@ -2454,6 +2454,10 @@ class MainWindow(QMainWindow):
             session_manager.invalidate_session()
             logger.info("Session invalidated")
 
+            # Drop decrypted sensitive values kept in memory
+            from src.core.encryption_manager import purge_decrypted_cache
+            purge_decrypted_cache()
+
             # Show notification
             if self.tray_manager:
                 self.tray_manager.show_message(
@@ -2479,6 +2483,12 @@ class MainWindow(QMainWindow):
         if self.tray_manager:
             self.tray_manager.cleanup()
 
+        # Flush pending usage events before the event loop stops
+        from src.core.usage_tracker import shutdown_usage_writers
+        from src.core.search.usage_scores import stop_usage_score_managers
+        shutdown_usage_writers()
+        stop_usage_score_managers()
+
         # Close window
         self.close()
 
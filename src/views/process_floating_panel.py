@@ -95,6 +95,13 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         self.minimized_to_taskbar.connect(self.on_minimized)
         self.restored_from_taskbar.connect(self.on_restored)
 
+        # Process started by "copy all" waiting for completion feedback
+        self._pending_execution_id = None
+        if self.process_controller:
+            self.process_controller.get_executor().execution_completed.connect(
+                self._on_execution_completed
+            )
+
         self.init_ui()
 
     def init_ui(self):
@@ -726,19 +733,11 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
         try:
             logger.info(f"Executing process: {self.current_process.name}")
 
-            # Execute process (copy all steps)
-            success = self.process_controller.executor.execute_process(self.current_process.id)
+            # Execute process (copy all steps); non-blocking, feedback in _on_execution_completed
+            started = self.process_controller.execute_process(self.current_process.id)
 
-            if success:
-                logger.info("Process executed successfully")
-                # Show visual feedback
-                QMessageBox.information(
-                    self,
-                    "Éxito",
-                    f"✓ Proceso '{self.current_process.name}' ejecutado\nTodo copiado al portapapeles"
-                )
-                # Emit signal
-                self.process_executed.emit(self.current_process.id)
+            if started:
+                self._pending_execution_id = self.current_process.id
             else:
                 logger.error("Process execution failed")
                 QMessageBox.warning(
@@ -758,6 +757,31 @@ class ProcessFloatingPanel(QWidget, TaskbarMinimizableMixin):
             # Uncheck button
             self.copy_all_button.setChecked(False)
 
+    def _on_execution_completed(self, process_id: int, success: bool, message: str):
+        """Show feedback once the process started by copy-all finishes"""
+        if process_id != self._pending_execution_id:
+            return
+        self._pending_execution_id = None
+
+        process_name = self.current_process.name if self.current_process else str(process_id)
+        if success:
+            logger.info("Process executed successfully")
+            # Show visual feedback
+            QMessageBox.information(
+                self,
+                "Éxito",
+                f"✓ Proceso '{process_name}' ejecutado\nTodo copiado al portapapeles"
+            )
+            # Emit signal
+            self.process_executed.emit(process_id)
+        else:
+            logger.error(f"Process execution failed: {message}")
+            QMessageBox.warning(
+                self,
+                "Error",
+                f"✗ Error al ejecutar proceso '{process_name}'"
+            )
+
     def on_pin_clicked(self):
         """Toggle pin state"""
         self.is_pinned = not self.is_pinned
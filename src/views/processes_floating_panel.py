@@ -91,6 +91,13 @@ class ProcessesFloatingPanel(QWidget):
         self.resize_start_width = 0
         self.resize_edge_width = 15
 
+        # Processes started from this panel waiting for completion feedback
+        self._pending_executions = set()
+        if self.process_controller:
+            self.process_controller.get_executor().execution_completed.connect(
+                self._on_execution_completed
+            )
+
         self.init_ui()
 
     def init_ui(self):
@@ -636,27 +643,50 @@ class ProcessesFloatingPanel(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Execute each process
-        for process in self.visible_processes:
-            try:
-                success = self.process_controller.execute_process(process.id)
-                if not success:
-                    logger.error(f"Failed to execute process {process.id}")
-                    # Ask if continue
-                    continue_reply = QMessageBox.question(
+        failed = []
+        stopped = []  # No vacío si el usuario detuvo el lote tras un error
+
+        def on_process_done(process, success, index, total):
+            # Los procesos no ejecutados tras detener el lote no cuentan como errores
+            if not success and not stopped:
+                logger.error(f"Failed to execute process {process.id}")
+                failed.append(process.name)
+
+            # Reload processes to update stats once the batch is done
+            if index == total:
+                self.reload_processes()
+                if failed:
+                    QMessageBox.warning(
                         self,
                         "Error",
-                        f"Error al ejecutar '{process.name}'. ¿Continuar con los siguientes?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                        "Error al ejecutar:\n" + "\n".join(failed)
                     )
-                    if continue_reply != QMessageBox.StandardButton.Yes:
-                        break
-            except Exception as e:
-                logger.error(f"Exception executing process {process.id}: {e}")
-                break
 
-        # Reload processes to update stats
-        self.reload_processes()
+        def on_process_failed(process):
+            # Ask if continue
+            continue_reply = QMessageBox.question(
+                self,
+                "Error",
+                f"Error al ejecutar '{process.name}'. ¿Continuar con los siguientes?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if continue_reply != QMessageBox.StandardButton.Yes:
+                stopped.append(process.name)
+                return False
+            return True
+
+        try:
+            # Steps copy to the clipboard: run one process after another
+            started = self.process_controller.execute_processes(
+                [process.id for process in self.visible_processes],
+                on_complete=on_process_done,
+                concurrent=False,
+                on_failure=on_process_failed
+            )
+            if not started:
+                QMessageBox.warning(self, "Error", "Error al ejecutar procesos")
+        except Exception as e:
+            logger.error(f"Exception executing processes: {e}")
 
     def on_process_executed(self, process_id: int):
         """Handle process execution request"""
@@ -667,20 +697,9 @@ class ProcessesFloatingPanel(QWidget):
             return
 
         try:
-            success = self.process_controller.execute_process(process_id)
-
-            if success:
-                # Reload to update stats
-                self.reload_processes()
-
-                # Feedback
-                process = next((p for p in self.all_processes if p.id == process_id), None)
-                if process:
-                    QMessageBox.information(
-                        self,
-                        "Proceso Completado",
-                        f"Proceso '{process.name}' ejecutado exitosamente"
-                    )
+            # Non-blocking: feedback is shown in _on_execution_completed
+            if self.process_controller.execute_process(process_id):
+                self._pending_executions.add(process_id)
             else:
                 QMessageBox.warning(
                     self,
@@ -691,6 +710,31 @@ class ProcessesFloatingPanel(QWidget):
             logger.error(f"Exception executing process: {e}")
             QMessageBox.critical(self, "Error", f"Error al ejecutar proceso: {str(e)}")
 
+    def _on_execution_completed(self, process_id: int, success: bool, message: str):
+        """Show feedback for a process started from this panel"""
+        if process_id not in self._pending_executions:
+            return
+        self._pending_executions.discard(process_id)
+
+        if success:
+            # Reload to update stats
+            self.reload_processes()
+
+            # Feedback
+            process = next((p for p in self.all_processes if p.id == process_id), None)
+            if process:
+                QMessageBox.information(
+                    self,
+                    "Proceso Completado",
+                    f"Proceso '{process.name}' ejecutado exitosamente"
+                )
+        else:
+            QMessageBox.warning(
+                self,
+                "Error",
+                f"Error al ejecutar proceso: {message}"
+            )
+
     def on_process_edited(self, process_id: int):
         """Handle process edit request"""
         self.process_edited.emit(process_id)
@@ -8,8 +8,13 @@ Autor: Widget Sidebar Team
 Versión: 1.0
 """
 
+import logging
 from typing import Dict, List, Optional
 
+from src.core.element_view_assembler import get_element_view_assembler
+
+logger = logging.getLogger(__name__)
+
 
 class ProjectDataManager:
     """
@@ -214,6 +219,10 @@ Python fue creado por Guido van Rossum y lanzado por primera vez en 1991. El nom
         """
         Obtener datos reales del proyecto desde la base de datos
 
+        El árbol se arma con un número fijo de consultas en bloque y se
+        cachea por proyecto (ver ElementViewAssembler); se invalida al cambiar
+        relaciones, tags de elementos, órdenes o el contenido de los items.
+
         Args:
             project_id: ID del proyecto
 
@@ -221,416 +230,13 @@ Python fue creado por Guido van Rossum y lanzado por primera vez en 1991. El nom
             Diccionario con estructura de datos del proyecto o None si no existe
         """
         try:
-            # 1. Obtener información básica del proyecto
-            project = self.db.get_project(project_id)
-            if not project:
-                return None
-
-            # 2. Obtener TODOS los tags que tienen elementos asociados al proyecto
-            # Ordenados según project_tag_orders (respetando el orden del usuario)
-            conn = self.db.connect()
-            cursor = conn.execute("""
-                SELECT DISTINCT pet.id, pet.name, pet.color
-                FROM project_element_tag_associations ta
-                JOIN project_element_tags pet ON ta.tag_id = pet.id
-                JOIN project_relations pr ON ta.project_relation_id = pr.id
-                LEFT JOIN project_tag_orders pto ON pto.project_id = pr.project_id AND pto.tag_id = pet.id
-                WHERE pr.project_id = ?
-                ORDER BY COALESCE(pto.order_index, 999999), pet.name ASC
-            """, (project_id,))
-            project_tags = [dict(row) for row in cursor.fetchall()]
-
-            # 3. Construir estructura de tags con sus grupos
-            tags_data = []
-
-            for project_tag in project_tags:
-                tag_id = project_tag['id']
-                tag_name = project_tag['name']
-                tag_color = project_tag.get('color', '#808080')
-
-                # Obtener todas las relaciones del proyecto
-                all_relations = self.db.get_project_relations(project_id)
-
-                # Filtrar relaciones que están asociadas a este tag
-                # (basado en la tabla project_element_tag_associations)
-                tag_relations = self._get_relations_for_tag(tag_id, all_relations)
-
-                # Aplicar orden filtrado si existe para este tag
-                tag_relations = self._apply_filtered_order(project_id, tag_id, tag_relations)
-
-                # Procesar relaciones en el orden correcto (después de aplicar filtrado)
-                groups_data = []
-
-                for rel in tag_relations:
-                    entity_type = rel['entity_type']
-                    entity_id = rel['entity_id']
-
-                    if entity_type == 'category':
-                        items = self.db.get_items_by_category(entity_id)
-                        if items:
-                            category_name = self._get_category_name(entity_id)
-                            groups_data.append({
-                                'type': 'category',
-                                'name': category_name,
-                                'items': self._format_items(items)
-                            })
-
-                    elif entity_type == 'list':
-                        items = self.db.get_items_by_lista(entity_id)
-                        if items:
-                            list_name = items[0].get('lista_name', 'Lista sin nombre') if items else 'Lista'
-                            groups_data.append({
-                                'type': 'list',
-                                'name': list_name,
-                                'items': self._format_items(items)
-                            })
-
-                    elif entity_type == 'tag':
-                        items = self.db.get_items_by_tag_id(entity_id)
-                        if items:
-                            tag_name_item = self._get_item_tag_name(entity_id)
-                            groups_data.append({
-                                'type': 'tag',
-                                'name': tag_name_item,
-                                'items': self._format_items(items)
-                            })
-
-                    elif entity_type == 'table':
-                        items = self.db.get_items_by_table(entity_id)
-                        if items:
-                            table_name = self._get_table_name(entity_id)
-                            groups_data.append({
-                                'type': 'table',
-                                'name': table_name,
-                                'items': self._format_items(items)
-                            })
-
-                    elif entity_type == 'item':
-                        item = self.db.get_item(entity_id)
-                        if item:
-                            groups_data.append({
-                                'type': 'item',
-                                'name': item.get('label', 'Item sin nombre'),
-                                'items': self._format_items([item])
-                            })
-
-                    elif entity_type == 'process':
-                        process = self.db.get_process(entity_id)
-                        if process:
-                            groups_data.append({
-                                'type': 'process',
-                                'name': process.get('name', 'Proceso sin nombre'),
-                                'items': []
-                            })
-
-                # Solo agregar el tag si tiene grupos con items
-                if groups_data:
-                    tags_data.append({
-                        'tag_name': tag_name,
-                        'tag_color': tag_color,
-                        'groups': groups_data
-                    })
-
-            # 4. Obtener elementos sin tag de proyecto (elementos "Sin clasificar")
-            unclassified_items = self._get_unclassified_elements(project_id)
-
-            # 5. Obtener items sin agrupar (items que no están en ningún elemento)
-            ungrouped_items = self._get_ungrouped_items(project_id, tags_data, unclassified_items)
-
-            # 6. Construir y retornar estructura final
-            return {
-                'project_id': project_id,
-                'project_name': project.get('name', 'Proyecto sin nombre'),
-                'project_icon': project.get('icon', '📁'),
-                'tags': tags_data,
-                'unclassified_elements': unclassified_items,
-                'ungrouped_items': ungrouped_items
-            }
+            return get_element_view_assembler(self.db, 'project').get_view(project_id)
 
         except Exception as e:
-            # Log del error
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error obteniendo datos reales del proyecto {project_id}: {e}")
             # Retornar datos mock en caso de error
             return self._get_mock_project_data(project_id)
 
-    def _get_relations_for_tag(self, tag_id: int, all_relations: List[Dict]) -> List[Dict]:
-        """
-        Obtiene las relaciones asociadas a un tag específico del proyecto
-
-        Args:
-            tag_id: ID del tag de proyecto
-            all_relations: Lista de todas las relaciones del proyecto
-
-        Returns:
-            Lista de relaciones asociadas al tag
-        """
-        # Obtener asociaciones del tag con relaciones
-        tag_associations = self.db.get_project_relations_by_tag(tag_id)
-
-        # Extraer IDs de relaciones
-        relation_ids = [assoc['id'] for assoc in tag_associations]
-
-        # Filtrar relaciones
-        return [rel for rel in all_relations if rel['id'] in relation_ids]
-
-    def _apply_filtered_order(self, project_id: int, filter_tag_id: int,
-                              tag_relations: List[Dict]) -> List[Dict]:
-        """
-        Aplica el orden filtrado a las relaciones de un tag si existe
-
-        Args:
-            project_id: ID del proyecto
-            filter_tag_id: ID del tag de proyecto
-            tag_relations: Lista de relaciones del tag
-
-        Returns:
-            Lista de relaciones ordenadas según orden filtrado o global
-        """
-        try:
-            # Obtener orden filtrado para este tag
-            filtered_orders = self.db.get_filtered_order(project_id, filter_tag_id)
-
-            if not filtered_orders:
-                # No hay orden personalizado, usar orden global
-                return sorted(tag_relations, key=lambda x: x.get('order_index', 0))
-
-            # Separar relaciones con orden personalizado de las que no
-            ordered_relations = []
-            unordered_relations = []
-
-            for rel in tag_relations:
-                element_type = 'relation'  # Las relaciones siempre son tipo 'relation'
-                element_id = rel['id']
-                key = (element_type, element_id)
-
-                if key in filtered_orders:
-                    ordered_relations.append((filtered_orders[key], rel))
-                else:
-                    unordered_relations.append(rel)
-
-            # Ordenar relaciones por order_index filtrado
-            ordered_relations.sort(key=lambda x: x[0])
-            result = [rel for _, rel in ordered_relations]
-
-            # Agregar relaciones sin orden al final (usando su orden global)
-            unordered_relations.sort(key=lambda x: x.get('order_index', 0))
-            result.extend(unordered_relations)
-
-            return result
-
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error aplicando orden filtrado: {e}")
-            # En caso de error, usar orden global
-            return sorted(tag_relations, key=lambda x: x.get('order_index', 0))
-
-    def _get_category_name(self, category_id: int) -> str:
-        """
-        Obtiene el nombre de una categoría
-
-        Args:
-            category_id: ID de la categoría
-
-        Returns:
-            Nombre de la categoría
-        """
-        try:
-            conn = self.db.connect()
-            cursor = conn.execute("SELECT name FROM categories WHERE id = ?", (category_id,))
-            row = cursor.fetchone()
-            return row['name'] if row else f'Categoría {category_id}'
-        except:
-            return f'Categoría {category_id}'
-
-    def _get_item_tag_name(self, tag_id: int) -> str:
-        """
-        Obtiene el nombre de un tag de item
-
-        Args:
-            tag_id: ID del tag
-
-        Returns:
-            Nombre del tag
-        """
-        try:
-            conn = self.db.connect()
-            cursor = conn.execute("SELECT name FROM tags WHERE id = ?", (tag_id,))
-            row = cursor.fetchone()
-            return row['name'] if row else f'Tag {tag_id}'
-        except:
-            return f'Tag {tag_id}'
-
-    def _get_table_name(self, table_id: int) -> str:
-        """
-        Obtiene el nombre de una tabla
-
-        Args:
-            table_id: ID de la tabla
-
-        Returns:
-            Nombre de la tabla
-        """
-        try:
-            conn = self.db.connect()
-            cursor = conn.execute("SELECT name FROM custom_tables WHERE id = ?", (table_id,))
-            row = cursor.fetchone()
-            return row['name'] if row else f'Tabla {table_id}'
-        except:
-            return f'Tabla {table_id}'
-
-    def _format_items(self, items: List[Dict]) -> List[Dict]:
-        """
-        Formatea items para la vista completa
-
-        Args:
-            items: Lista de items de la BD
-
-        Returns:
-            Lista de items formateados
-        """
-        formatted_items = []
-
-        for item in items:
-            formatted_items.append({
-                'id': item.get('id'),
-                'label': item.get('label', 'Item sin nombre'),
-                'content': item.get('content', ''),
-                'type': item.get('type', 'TEXT'),
-                'description': item.get('description', ''),
-                'is_sensitive': item.get('is_sensitive', False)
-            })
-
-        return formatted_items
-
-    def _get_unclassified_elements(self, project_id: int) -> List[Dict]:
-        """
-        Obtiene elementos del proyecto que NO tienen tag de proyecto asociado
-
-        Args:
-            project_id: ID del proyecto
-
-        Returns:
-            Lista de elementos sin clasificar con sus items
-        """
-        try:
-            conn = self.db.connect()
-
-            # Obtener relaciones sin tag de proyecto
-            cursor = conn.execute("""
-                SELECT pr.*
-                FROM project_relations pr
-                LEFT JOIN project_element_tag_associations ta ON pr.id = ta.project_relation_id
-                WHERE pr.project_id = ? AND ta.id IS NULL
-            """, (project_id,))
-
-            unclassified_relations = cursor.fetchall()
-
-            unclassified_elements = []
-
-            for rel in unclassified_relations:
-                rel_dict = dict(rel)
-                entity_type = rel_dict['entity_type']
-                entity_id = rel_dict['entity_id']
-
-                # Obtener nombre y items según el tipo
-                if entity_type == 'category':
-                    name = self._get_category_name(entity_id)
-                    items = self.db.get_items_by_category(entity_id)
-                elif entity_type == 'list':
-                    cursor2 = conn.execute("SELECT name FROM listas WHERE id = ?", (entity_id,))
-                    row = cursor2.fetchone()
-                    name = row['name'] if row else f'Lista {entity_id}'
-                    items = self.db.get_items_by_lista(entity_id)
-                elif entity_type == 'tag':
-                    name = self._get_item_tag_name(entity_id)
-                    items = self.db.get_items_by_tag_id(entity_id)
-                elif entity_type == 'table':
-                    name = self._get_table_name(entity_id)
-                    items = self.db.get_items_by_table(entity_id)
-                elif entity_type == 'item':
-                    item = self.db.get_item(entity_id)
-                    name = item.get('label', 'Item sin nombre') if item else f'Item {entity_id}'
-                    items = [item] if item else []
-                elif entity_type == 'process':
-                    process = self.db.get_process(entity_id)
-                    name = process.get('name', 'Proceso sin nombre') if process else f'Proceso {entity_id}'
-                    items = []  # Los procesos no tienen items
-                else:
-                    continue
-
-                if items or entity_type == 'process':  # Agregar si tiene items o es proceso
-                    unclassified_elements.append({
-                        'type': entity_type,
-                        'name': name,
-                        'items': self._format_items(items) if items else []
-                    })
-
-            return unclassified_elements
-
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error obteniendo elementos sin clasificar: {e}")
-            return []
-
-    def _get_ungrouped_items(self, project_id: int, tags_data: List[Dict], unclassified_elements: List[Dict] = None) -> List[Dict]:
-        """
-        Obtiene items del proyecto que no están bajo ningún tag
-
-        Args:
-            project_id: ID del proyecto
-            tags_data: Datos de tags ya procesados
-
-        Returns:
-            Lista de items sin agrupar
-        """
-        # Obtener todos los IDs de items que ya están en tags
-        grouped_item_ids = set()
-        for tag in tags_data:
-            for group in tag.get('groups', []):
-                for item in group.get('items', []):
-                    grouped_item_ids.add(item['id'])
-
-        # Obtener todas las relaciones del proyecto
-        all_relations = self.db.get_project_relations(project_id)
-
-        # Obtener todos los items del proyecto
-        all_project_items = []
-
-        # Items de categorías del proyecto
-        category_relations = [r for r in all_relations if r['entity_type'] == 'category']
-        for rel in category_relations:
-            items = self.db.get_items_by_category(rel['entity_id'])
-            all_project_items.extend(items)
-
-        # Items de listas del proyecto
-        list_relations = [r for r in all_relations if r['entity_type'] == 'list']
-        for rel in list_relations:
-            items = self.db.get_items_by_lista(rel['entity_id'])
-            all_project_items.extend(items)
-
-        # Filtrar items que no están en grouped_item_ids
-        ungrouped = []
-        seen_ids = set()
-
-        for item in all_project_items:
-            item_id = item.get('id')
-            if item_id not in grouped_item_ids and item_id not in seen_ids:
-                seen_ids.add(item_id)
-                ungrouped.append({
-                    'id': item_id,
-                    'label': item.get('label', 'Item sin nombre'),
-                    'content': item.get('content', ''),
-                    'type': item.get('type', 'TEXT'),
-                    'description': item.get('description', ''),
-                    'is_sensitive': item.get('is_sensitive', False)
-                })
-
-        return ungrouped
-
     def filter_by_project_tags(
         self,
         project_data: Dict,
@@ -9,7 +9,8 @@ import logging
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
-    QPushButton, QLabel, QWidget, QMessageBox, QInputDialog, QFrame
+    QPushButton, QLabel, QWidget, QMessageBox, QInputDialog, QFrame,
+    QFileDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
@@ -31,6 +32,7 @@ class TablesManagerWindow(QDialog):
     Features:
     - Lista de todas las tablas
     - Crear nueva tabla
+    - Importar tabla desde CSV/TSV (lectura en streaming)
     - Ver tabla completa
     - Editar/Renombrar/Eliminar desde aquí
     - Búsqueda de tablas
@@ -202,6 +204,11 @@ class TablesManagerWindow(QDialog):
         self.new_button.clicked.connect(self.on_create_table)
         actions_panel.addWidget(self.new_button)
 
+        self.import_button = QPushButton("📥 Importar CSV")
+        self.import_button.setToolTip("Crea una tabla desde un archivo CSV o TSV")
+        self.import_button.clicked.connect(self.on_import_table)
+        actions_panel.addWidget(self.import_button)
+
         self.view_button = QPushButton("👁️ Ver Tabla")
         self.view_button.setEnabled(False)
         self.view_button.setToolTip("Visualiza la tabla completa")
@@ -347,6 +354,58 @@ class TablesManagerWindow(QDialog):
             logger.error(f"Error opening table creator: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Error al abrir creador:\n{str(e)}")
 
+    def on_import_table(self):
+        """Importa una tabla desde un archivo CSV/TSV."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importar Tabla",
+            "",
+            "CSV/TSV Files (*.csv *.tsv *.txt);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+
+        try:
+            categories = self.db.get_categories()
+            if not categories:
+                QMessageBox.warning(self, "Sin Categorías", "Crea una categoría antes de importar una tabla.")
+                return
+
+            category_labels = [f"{cat.get('icon') or '📁'} {cat['name']}" for cat in categories]
+            category_label, ok = QInputDialog.getItem(
+                self, "Importar Tabla", "Categoría destino:", category_labels, 0, False
+            )
+            if not ok:
+                return
+            category_id = categories[category_labels.index(category_label)]['id']
+
+            table_name, ok = QInputDialog.getText(
+                self, "Importar Tabla", "Nombre de la tabla:", text=Path(file_path).stem
+            )
+            table_name = table_name.strip()
+            if not ok or not table_name:
+                return
+
+            delimiter = '\t' if Path(file_path).suffix.lower() == '.tsv' else ','
+            result = self.table_controller.import_table_from_csv(
+                category_id, table_name, file_path, delimiter=delimiter
+            )
+
+            if result['success']:
+                QMessageBox.information(
+                    self,
+                    "Importación Exitosa",
+                    f"Tabla '{table_name}' importada: {result['items_created']} celdas"
+                )
+                self.on_table_created(table_name, result['items_created'])
+            else:
+                errors = '\n'.join(result.get('errors', [])[:3])
+                QMessageBox.critical(self, "Error de Importación", f"No se pudo importar la tabla:\n{errors}")
+
+        except Exception as e:
+            logger.error(f"Error importing table: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Error al importar tabla:\n{str(e)}")
+
     def on_view_table(self):
         """Abre vista de tabla."""
         table_name = self.get_selected_table_name()
@@ -0,0 +1,661 @@
+"""
+Item List View - Virtualized item list for large result sets
+
+QListView + QAbstractListModel + QStyledItemDelegate replacement for a column
+of ItemButton widgets: rows are painted on demand and only for the visible
+viewport, so memory use does not grow with the number of results.
+"""
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView, QToolTip
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractListModel, QModelIndex, QRect, QSize, QTimer, QEvent
+)
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter, QPen
+import sys
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from models.item import Item, ItemType
+from src.core.usage_tracker import UsageTracker
+from styles.panel_styles import PanelStyles
+from views.widgets.item_widget import ItemButton, format_item_display_text, resolve_item_path
+
+logger = logging.getLogger(__name__)
+
+
+# Rol para obtener el objeto Item de una fila
+ITEM_ROLE = Qt.ItemDataRole.UserRole + 1
+# Rol para obtener el texto de una fila de cabecera de sección
+SECTION_ROLE = Qt.ItemDataRole.UserRole + 2
+
+ACTION_BUTTON_SIZE = 28
+ACTION_BUTTON_SPACING = 4
+
+
+class SectionHeader:
+    """Header row of ItemListModel (e.g. "━━━ Items (N) ━━━"), painted as centered text"""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class ItemListModel(QAbstractListModel):
+    """List model over Item objects (no widgets per row)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._header_count = 0
+
+    def set_items(self, items):
+        """
+        Replace the whole item list
+
+        Read-only sequences (e.g. SearchResults of ItemSearchIndex) are kept
+        as they are, so only the painted rows are materialized.
+        """
+        self.beginResetModel()
+        self._items = items if isinstance(items, Sequence) and not isinstance(items, list) else list(items)
+        self._header_count = 0
+        self.endResetModel()
+
+    def set_sections(self, sections):
+        """
+        Replace the whole list with sections
+
+        Args:
+            sections: list of (header_text, items); a falsy header_text adds
+                the items without a header row
+        """
+        rows = []
+        header_count = 0
+        for header_text, items in sections:
+            if header_text:
+                rows.append(SectionHeader(header_text))
+                header_count += 1
+            rows.extend(items)
+
+        self.beginResetModel()
+        self._items = rows
+        self._header_count = header_count
+        self.endResetModel()
+
+    def get_items(self):
+        """Items currently in the model (without section headers)"""
+        if self._header_count:
+            return [row for row in self._items if not isinstance(row, SectionHeader)]
+        return list(self._items)
+
+    def item_count(self) -> int:
+        """Number of item rows (section headers not counted)"""
+        return len(self._items) - self._header_count
+
+    def item_at(self, row: int):
+        """Item at a row (None if out of range or a section header)"""
+        if 0 <= row < len(self._items):
+            item = self._items[row]
+            return None if isinstance(item, SectionHeader) else item
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+
+        item = self._items[index.row()]
+
+        if isinstance(item, SectionHeader):
+            if role in (SECTION_ROLE, Qt.ItemDataRole.DisplayRole):
+                return item.text
+            return None
+
+        if role == ITEM_ROLE:
+            return item
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.label
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # Mismo tooltip que ItemButton
+            if not item.is_sensitive and item.content:
+                content_preview = item.content[:100]
+                if len(item.content) > 100:
+                    content_preview += "..."
+                tooltip_parts = []
+                if item.description:
+                    tooltip_parts.append(f"{item.description}")
+                tooltip_parts.append(f"\n{content_preview}")
+                tooltip_parts.append(f"\nTipo: {item.type}")
+                return "\n".join(tooltip_parts)
+            return item.label
+        return None
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """
+    Paints an item row with the ItemButton look: type icon, display text,
+    badges and action buttons. Action buttons are plain rectangles hit-tested
+    in editorEvent().
+    """
+
+    # Signals
+    item_pressed = pyqtSignal(object)  # click on the row body (copy)
+    action_triggered = pyqtSignal(str, object)  # action name, item
+
+    # (acción, emoji, color de fondo, tooltip)
+    _URL_ACTIONS = [
+        ('open_url', '🌐', '#007acc', "Abrir en navegador embebido"),
+        ('open_external', '🔗', '#0078d4', "Abrir en navegador predeterminado del sistema"),
+    ]
+    _CODE_ACTIONS = [('execute', '⚡', PanelStyles.ACCENT_WARNING, "Ejecutar comando")]
+    _WEB_STATIC_ACTIONS = [('render', '📱', '#4CAF50', "Renderizar aplicación web estática")]
+    _PATH_ACTIONS = [('open_explorer', '📁', '#2d7d2d', "Abrir en explorador")]
+    _OPEN_FILE_ACTIONS = [('open_file', '📝', '#cc7a00', "Abrir archivo")]
+    _TABLE_ACTIONS = [('view_table', '🗂️', '#007acc', "Ver tabla completa")]
+    _REVEAL_ACTIONS = [('reveal', '👁', '#cc0000', "Revelar/Ocultar contenido sensible")]
+    _HIDE_ACTIONS = [('reveal', '🙈', '#cc0000', "Ocultar contenido sensible")]
+    _COMMON_ACTIONS = [
+        ('edit', '✏️', None, "Editar item"),
+        ('details', 'ℹ️', None, "Ver detalles del item"),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.show_category = False
+        self.show_labels = True
+        self.show_tags = False
+        self.show_content = False
+        self.show_description = False
+        self.copied_item_id = None  # Fila con feedback de "copiado"
+        self.revealed_item_ids = set()  # Items sensibles revelados
+        self._is_file = {}  # (item_id, ruta) -> la ruta es un archivo existente
+
+    def set_display_options(self, show_labels: bool, show_tags: bool,
+                            show_content: bool, show_description: bool):
+        """Update the label/tags/content/description toggles"""
+        self.show_labels = show_labels
+        self.show_tags = show_tags
+        self.show_content = show_content
+        self.show_description = show_description
+
+    # ==================== LAYOUT ====================
+
+    def get_actions(self, item: Item):
+        """Action buttons shown for an item, left to right"""
+        actions = []
+        if item.type == ItemType.CODE:
+            actions.extend(self._CODE_ACTIONS)
+        elif item.type == 'WEB_STATIC' or item.type == ItemType.WEB_STATIC:
+            actions.extend(self._WEB_STATIC_ACTIONS)
+        elif item.type == ItemType.URL:
+            actions.extend(self._URL_ACTIONS)
+        elif item.type == ItemType.PATH:
+            actions.extend(self._PATH_ACTIONS)
+            # Solo para archivos, no directorios (como ItemButton)
+            if self.is_existing_file(item):
+                actions.extend(self._OPEN_FILE_ACTIONS)
+
+        if getattr(item, 'table_id', None):
+            actions.extend(self._TABLE_ACTIONS)
+
+        if getattr(item, 'is_sensitive', False):
+            actions.extend(self._HIDE_ACTIONS if item.id in self.revealed_item_ids else self._REVEAL_ACTIONS)
+
+        actions.extend(self._COMMON_ACTIONS)
+        return actions
+
+    def is_existing_file(self, item: Item) -> bool:
+        """True if a PATH item points to an existing file (cached: paint runs on every hover)"""
+        key = (item.id, item.content)
+        is_file = self._is_file.get(key)
+        if is_file is None:
+            try:
+                path = resolve_item_path(item.content)
+                is_file = path.exists() and path.is_file()
+            except Exception:
+                is_file = False
+            self._is_file[key] = is_file
+        return is_file
+
+    def clear_path_cache(self):
+        """Forget the file checks (the rows are about to change)"""
+        self._is_file.clear()
+
+    def _row_rect(self, rect: QRect) -> QRect:
+        """Row area without the spacing between items"""
+        return rect.adjusted(0, 0, 0, -PanelStyles.ITEM_SPACING)
+
+    def _action_rects(self, rect: QRect, item: Item):
+        """(action, emoji, color, tooltip, QRect) for each action button, right-aligned"""
+        row = self._row_rect(rect)
+        actions = self.get_actions(item)
+        top = row.top() + (row.height() - ACTION_BUTTON_SIZE) // 2
+        x = row.right() - PanelStyles.ITEM_PADDING_H - ACTION_BUTTON_SIZE + 1
+
+        rects = []
+        for action in reversed(actions):
+            rects.append((*action, QRect(x, top, ACTION_BUTTON_SIZE, ACTION_BUTTON_SIZE)))
+            x -= ACTION_BUTTON_SIZE + ACTION_BUTTON_SPACING
+        rects.reverse()
+        return rects
+
+    def action_at(self, rect: QRect, item: Item, pos):
+        """Action under a point of the row (None = row body)"""
+        for action, _emoji, _color, tooltip, action_rect in self._action_rects(rect, item):
+            if action_rect.contains(pos):
+                return action, tooltip
+        return None
+
+    def _get_badges(self, item: Item):
+        """Badge texts, in ItemButton order"""
+        badges = []
+        if getattr(item, 'is_favorite', False):
+            badges.append("⭐")
+        use_count = getattr(item, 'use_count', None)
+        if use_count and use_count > 50:
+            badges.append("🔥")
+        if use_count == 0:
+            badges.append("🆕")
+        if self.show_category and getattr(item, 'category_name', None):
+            badges.append(f"📁 {item.category_name}")
+        if item.type == ItemType.PATH and getattr(item, 'file_hash', None):
+            badges.append("📦")
+        if getattr(item, 'table_id', None):
+            badges.append("📊")
+        return badges
+
+    # ==================== PAINTING ====================
+
+    def sizeHint(self, option, index):
+        return QSize(300, PanelStyles.ITEM_HEIGHT + PanelStyles.ITEM_SPACING)
+
+    def paint(self, painter: QPainter, option, index):
+        item = index.data(ITEM_ROLE)
+        if item is None:
+            header_text = index.data(SECTION_ROLE)
+            if header_text:
+                self._paint_section_header(painter, option, header_text)
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        row = self._row_rect(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        is_sensitive = bool(getattr(item, 'is_sensitive', False))
+        has_file = item.type == ItemType.PATH and bool(getattr(item, 'file_hash', None))
+
+        # Fondo (mismos colores que ItemButton)
+        if self.copied_item_id is not None and item.id == self.copied_item_id:
+            background = QColor('#cc7a00' if is_sensitive else '#007acc')
+        elif is_sensitive:
+            background = QColor('#4d2525' if hovered else '#3d2020')
+        else:
+            background = QColor('#3d3d3d' if hovered else '#2d2d2d')
+        painter.fillRect(row, background)
+
+        painter.setPen(QPen(QColor('#1e1e1e'), 1))
+        painter.drawLine(row.bottomLeft(), row.bottomRight())
+
+        if is_sensitive or has_file:
+            painter.fillRect(QRect(row.left(), row.top(), 3, row.height()),
+                             QColor('#cc0000' if is_sensitive else '#4CAF50'))
+
+        # Icono de tipo
+        x = row.left() + PanelStyles.ITEM_PADDING_H
+        icon_font = QFont(option.font)
+        icon_font.setPixelSize(PanelStyles.ICON_SIZE)
+        painter.setFont(icon_font)
+        painter.setPen(QColor(PanelStyles.get_icon_type_color(item.type)))
+        icon_rect = QRect(x, row.top(), PanelStyles.ICON_SIZE, row.height())
+        painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, PanelStyles.get_icon_type_emoji(item.type))
+        x += PanelStyles.ICON_SIZE + PanelStyles.ICON_SPACING
+
+        # Botones de acción
+        action_rects = self._action_rects(option.rect, item)
+        cursor_pos = option.widget.viewport().mapFromGlobal(QCursor.pos()) if option.widget else None
+        button_font = QFont(option.font)
+        button_font.setPointSize(12)
+        painter.setFont(button_font)
+        for _action, emoji, color, _tooltip, action_rect in action_rects:
+            button_hovered = hovered and cursor_pos is not None and action_rect.contains(cursor_pos)
+            if color:
+                fill = QColor(color).darker(120) if button_hovered else QColor(color)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(fill)
+                painter.drawRoundedRect(action_rect, 3, 3)
+            elif button_hovered:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor('#3e3e42'))
+                painter.drawRoundedRect(action_rect, 3, 3)
+            painter.setPen(QColor('#ffffff'))
+            painter.drawText(action_rect, Qt.AlignmentFlag.AlignCenter, emoji)
+        right = action_rects[0][4].left() - PanelStyles.ICON_SPACING if action_rects else row.right()
+
+        # Badges (de derecha a izquierda, antes de los botones)
+        badge_font = QFont(option.font)
+        badge_font.setPointSizeF(PanelStyles.BADGE_FONT_SIZE)
+        painter.setFont(badge_font)
+        metrics = painter.fontMetrics()
+        badge_height = metrics.height() + 2 * PanelStyles.BADGE_PADDING_V
+        badge_top = row.top() + (row.height() - badge_height) // 2
+        for badge in reversed(self._get_badges(item)):
+            width = metrics.horizontalAdvance(badge) + 2 * PanelStyles.BADGE_PADDING_H
+            if right - width < x + 40:
+                break  # Sin espacio: la etiqueta tiene prioridad
+            badge_rect = QRect(right - width, badge_top, width, badge_height)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(PanelStyles.BACKGROUND_ACTIVE))
+            painter.drawRoundedRect(badge_rect, 3, 3)
+            painter.setPen(QColor(PanelStyles.TEXT_SECONDARY))
+            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge)
+            right -= width + PanelStyles.ICON_SPACING
+
+        # Texto del item (elidido)
+        text = format_item_display_text(
+            item,
+            show_labels=self.show_labels,
+            show_tags=self.show_tags,
+            show_content=self.show_content,
+            show_description=self.show_description,
+            is_revealed=item.id in self.revealed_item_ids
+        )
+        label_font = QFont(option.font)
+        label_font.setPointSizeF(PanelStyles.ITEM_FONT_SIZE)
+        painter.setFont(label_font)
+        text_rect = QRect(x, row.top(), max(0, right - x), row.height())
+        elided = painter.fontMetrics().elidedText(text, Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.setPen(QColor('#ffffff') if self.copied_item_id == item.id else QColor('#cccccc'))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided)
+
+        painter.restore()
+
+    def _paint_section_header(self, painter: QPainter, option, text: str):
+        """Section header row (same look as the QLabel headers of FloatingPanel)"""
+        painter.save()
+        header_font = QFont(option.font)
+        header_font.setPointSize(10)
+        header_font.setBold(True)
+        painter.setFont(header_font)
+        painter.setPen(QColor('#888888'))
+        painter.drawText(self._row_rect(option.rect), Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+    # ==================== INPUT ====================
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return super().editorEvent(event, model, option, index)
+
+        item = index.data(ITEM_ROLE)
+        if item is None:
+            return False
+
+        hit = self.action_at(option.rect, item, event.position().toPoint())
+        if hit:
+            self.action_triggered.emit(hit[0], item)
+        else:
+            self.item_pressed.emit(item)
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        # Tooltip del botón de acción bajo el cursor
+        item = index.data(ITEM_ROLE)
+        if item is not None and event.type() == QEvent.Type.ToolTip:
+            hit = self.action_at(option.rect, item, event.pos())
+            if hit:
+                QToolTip.showText(event.globalPos(), hit[1], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class ItemListView(QListView):
+    """
+    Virtualized list of items with the same signals as ItemButton
+
+    Click on a row copies the item (item_clicked); action buttons open URLs,
+    edit the item, show details, etc.
+    """
+
+    # Signals (mismos nombres que ItemButton)
+    item_clicked = pyqtSignal(object)
+    url_open_requested = pyqtSignal(str)
+    table_view_requested = pyqtSignal(str)
+    web_static_render_requested = pyqtSignal(object)
+    item_edit_requested = pyqtSignal(object)
+
+    COPIED_FEEDBACK_MS = 500
+    CLIPBOARD_CLEAR_MS = 30000
+    REVEAL_TIMEOUT_MS = 10000  # Auto-ocultar contenido sensible (como ItemButton)
+    # Tiempo de vida del ItemButton auxiliar tras una acción (sus timers de feedback)
+    ACTION_PROXY_TTL_MS = 3000
+
+    def __init__(self, show_category: bool = False, parent=None):
+        super().__init__(parent)
+
+        self.item_model = ItemListModel(self)
+        self.delegate = ItemDelegate(self)
+        self.delegate.show_category = show_category
+        self.setModel(self.item_model)
+        self.setItemDelegate(self.delegate)
+
+        # Filas de altura fija: el layout no recorre todos los items
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(200)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setStyleSheet(f"""
+            QListView {{
+                background-color: {PanelStyles.BACKGROUND_PRIMARY};
+                border: none;
+                padding: {PanelStyles.BODY_PADDING}px;
+            }}
+            {PanelStyles.get_scrollbar_style()}
+        """)
+
+        self.delegate.item_pressed.connect(self.on_item_pressed)
+        self.delegate.action_triggered.connect(self.on_action_triggered)
+
+        # Usage tracking
+        self.usage_tracker = UsageTracker()
+
+        self.copied_timer = QTimer(self)
+        self.copied_timer.setSingleShot(True)
+        self.copied_timer.timeout.connect(self._reset_copied_feedback)
+
+        self.clipboard_clear_timer = QTimer(self)
+        self.clipboard_clear_timer.setSingleShot(True)
+        self.clipboard_clear_timer.timeout.connect(self.clear_clipboard)
+
+        self._action_proxy = None
+        self._reveal_timers = {}  # item_id -> QTimer de auto-ocultado
+        self._fit_to_contents = False
+
+    def set_fit_to_contents(self, enabled: bool):
+        """
+        Grow to the height of all rows instead of scrolling
+
+        For a list placed inside an outer QScrollArea (e.g. above other
+        widgets of a panel): the view has no scrollbars of its own and wheel
+        events go to the outer area. Qt still paints only the exposed rows.
+        """
+        self._fit_to_contents = enabled
+        policy = Qt.ScrollBarPolicy.ScrollBarAlwaysOff if enabled else Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        self.setVerticalScrollBarPolicy(policy)
+        self.setHorizontalScrollBarPolicy(policy)
+        if enabled:
+            self.setStyleSheet("QListView { background-color: transparent; border: none; padding: 0px; }")
+        self._update_fit_height()
+
+    def _update_fit_height(self):
+        if not self._fit_to_contents:
+            return
+        row_height = PanelStyles.ITEM_HEIGHT + PanelStyles.ITEM_SPACING
+        self.setFixedHeight(self.item_model.rowCount() * row_height + 2 * self.frameWidth())
+
+    def set_items(self, items):
+        """Show a new list of items"""
+        self.delegate.clear_path_cache()
+        self.item_model.set_items(items)
+        self._update_fit_height()
+        self.scrollToTop()
+
+    def set_sections(self, sections):
+        """Show items grouped under section header rows ([(header_text, items), ...])"""
+        self.delegate.clear_path_cache()
+        self.item_model.set_sections(sections)
+        self._update_fit_height()
+        self.scrollToTop()
+
+    def get_items(self):
+        """Items currently shown (all rows, not only the painted ones)"""
+        return self.item_model.get_items()
+
+    def item_count(self) -> int:
+        return self.item_model.item_count()
+
+    def set_display_options(self, show_labels: bool, show_tags: bool,
+                            show_content: bool, show_description: bool):
+        """Change the label/tags/content/description toggles and repaint"""
+        self.delegate.set_display_options(show_labels, show_tags, show_content, show_description)
+        self.viewport().update()
+
+    def wheelEvent(self, event):
+        if self._fit_to_contents:
+            event.ignore()  # Lo desplaza el QScrollArea contenedor
+            return
+        super().wheelEvent(event)
+
+    def mouseMoveEvent(self, event):
+        # Repintar para el hover de los botones de acción
+        super().mouseMoveEvent(event)
+        self.viewport().update()
+
+    # ==================== ACTIONS ====================
+
+    def on_item_pressed(self, item: Item):
+        """Copy the item (same flow as ItemButton.on_clicked)"""
+        # Track clipboard copy (comando simple)
+        if item.type not in [ItemType.URL, ItemType.PATH]:
+            start_time = self.usage_tracker.track_execution_start(item.id)
+
+        self.item_clicked.emit(item)
+
+        # Feedback visual de copiado
+        self.delegate.copied_item_id = item.id
+        self.viewport().update()
+        self.copied_timer.start(self.COPIED_FEEDBACK_MS)
+
+        if item.type not in [ItemType.URL, ItemType.PATH]:
+            self.usage_tracker.track_execution_end(item.id, start_time, True, None)
+
+        # If sensitive item, start clipboard auto-clear timer
+        if getattr(item, 'is_sensitive', False):
+            self.clipboard_clear_timer.start(self.CLIPBOARD_CLEAR_MS)
+
+    def _reset_copied_feedback(self):
+        self.delegate.copied_item_id = None
+        self.viewport().update()
+
+    def clear_clipboard(self):
+        """Clear clipboard content"""
+        try:
+            import pyperclip
+            pyperclip.copy("")  # Clear clipboard
+        except Exception as e:
+            logger.error(f"Error clearing clipboard: {e}")
+
+    def _get_action_proxy(self, item: Item) -> ItemButton:
+        """
+        Hidden ItemButton for the item the action applies to
+
+        The action handlers (password checks, usage tracking, command
+        execution...) stay in ItemButton; only one is alive at a time.
+        """
+        proxy = self._action_proxy
+        if proxy is not None and proxy.item is item:
+            return proxy
+
+        if proxy is not None:
+            QTimer.singleShot(self.ACTION_PROXY_TTL_MS, proxy.deleteLater)
+
+        proxy = ItemButton(item, show_category=self.delegate.show_category, parent=self)
+        proxy.hide()
+        proxy.url_open_requested.connect(self.url_open_requested)
+        proxy.table_view_requested.connect(self.table_view_requested)
+        proxy.web_static_render_requested.connect(self.web_static_render_requested)
+        proxy.item_edit_requested.connect(self.item_edit_requested)
+        self._action_proxy = proxy
+        return proxy
+
+    def toggle_reveal(self, item: Item):
+        """Reveal/hide the content of a sensitive row (same flow as ItemButton.toggle_reveal)"""
+        if item.id in self.delegate.revealed_item_ids:
+            self._hide_revealed(item.id)
+            return
+
+        from views.dialogs.master_password_dialog import MasterPasswordDialog
+
+        verified = MasterPasswordDialog.verify(
+            title="Item Sensible",
+            message=f"Ingresa tu contraseña maestra para revelar:\n'{item.label}'",
+            parent=self.window()
+        )
+        if not verified:
+            logger.info(f"Master password verification cancelled for revealing item: {item.label}")
+            return  # Usuario canceló o contraseña incorrecta
+
+        self.delegate.revealed_item_ids.add(item.id)
+
+        # Auto-ocultar después de REVEAL_TIMEOUT_MS
+        timer = self._reveal_timers.get(item.id)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda item_id=item.id: self._hide_revealed(item_id))
+            self._reveal_timers[item.id] = timer
+        timer.start(self.REVEAL_TIMEOUT_MS)
+        self.viewport().update()
+
+    def _hide_revealed(self, item_id):
+        self.delegate.revealed_item_ids.discard(item_id)
+        timer = self._reveal_timers.pop(item_id, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        self.viewport().update()
+
+    def on_action_triggered(self, action: str, item: Item):
+        """Run an action button of a row"""
+        if action == 'reveal':
+            self.toggle_reveal(item)
+            return
+
+        handlers = {
+            'open_url': 'open_in_browser',
+            'open_external': 'open_in_system_browser',
+            'execute': 'execute_command',
+            'render': 'render_web_static',
+            'open_explorer': 'open_in_explorer',
+            'open_file': 'open_file',
+            'view_table': 'view_table',
+            'edit': 'edit_item',
+            'details': 'show_details',
+        }
+        method_name = handlers.get(action)
+        if method_name is None:
+            logger.warning(f"Unknown item action: {action}")
+            return
+
+        logger.debug(f"Item action '{action}' for item: {item.label}")
+        getattr(self._get_action_proxy(item), method_name)()
@@ -13,7 +13,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item, ItemType
-from core.usage_tracker import UsageTracker
+from src.core.usage_tracker import UsageTracker
 from core.favorites_manager import FavoritesManager
 from core.file_manager import FileManager
 from core.config_manager import ConfigManager
@@ -26,6 +26,110 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def format_item_display_text(item: Item, show_labels: bool = True, show_tags: bool = False,
+                              show_content: bool = False, show_description: bool = False,
+                              is_revealed: bool = False) -> str:
+    """Build the row text of an item from the display options (labels/tags/content/description)
+
+    Shared by ItemButton and the virtualized ItemListView delegate.
+    """
+    MAX_CONTENT_LENGTH = 100  # Max characters for content preview
+    MAX_DESCRIPTION_LENGTH = 80  # Max characters for description
+
+    display_parts = []
+
+    # Get file type icon if this is a PATH item with file metadata
+    file_icon = ""
+    if (item.type == ItemType.PATH and
+        hasattr(item, 'file_hash') and item.file_hash and
+        hasattr(item, 'get_file_type_icon')):
+        file_icon = item.get_file_type_icon() + " "
+
+    # 1. Show Labels (if enabled)
+    if show_labels:
+        display_parts.append(f"{file_icon}{item.label}")
+
+    # 2. Show Description (if enabled and item has description)
+    if show_description and hasattr(item, 'description') and item.description:
+        description = item.description[:MAX_DESCRIPTION_LENGTH]
+        if len(item.description) > MAX_DESCRIPTION_LENGTH:
+            description += "..."
+        display_parts.append(f"📝 {description}")
+
+    # 3. Show Tags (if enabled and item has tags)
+    if show_tags and hasattr(item, 'tags') and item.tags:
+        if isinstance(item.tags, list):
+            tags_text = ", ".join(item.tags)
+        else:
+            tags_text = str(item.tags)
+        display_parts.append(f"🏷️ {tags_text}")
+
+    # 4. Show Content (if enabled)
+    if show_content:
+        # Handle sensitive content
+        if hasattr(item, 'is_sensitive') and item.is_sensitive and not is_revealed:
+            # Obfuscate sensitive content
+            display_parts.append("🔒 ********")
+        elif hasattr(item, 'is_sensitive') and item.is_sensitive and is_revealed:
+            # Show revealed sensitive content (truncated)
+            content = item.content[:MAX_CONTENT_LENGTH]
+            if len(item.content) > MAX_CONTENT_LENGTH:
+                content += "..."
+            display_parts.append(f"🔓 {content}")
+        else:
+            # Show normal content (truncated)
+            if item.content:
+                content = item.content[:MAX_CONTENT_LENGTH]
+                if len(item.content) > MAX_CONTENT_LENGTH:
+                    content += "..."
+                display_parts.append(f"📄 {content}")
+
+    # Join all parts with separator
+    if display_parts:
+        return " | ".join(display_parts)
+    else:
+        # Fallback: show at least the label
+        return f"{file_icon}{item.label}"
+
+
+def resolve_item_path(content_path: str) -> Path:
+    """
+    Resuelve una ruta, convirtiendo rutas relativas a absolutas si es necesario
+
+    Shared by ItemButton and the virtualized ItemListView delegate.
+
+    Args:
+        content_path: Ruta desde item.content (puede ser relativa o absoluta)
+
+    Returns:
+        Path: Ruta absoluta resuelta
+    """
+    path = Path(content_path)
+
+    # Si la ruta es absoluta y existe, usarla directamente
+    if path.is_absolute():
+        return path
+
+    # Si es relativa, intentar construir ruta absoluta desde config
+    # Formato relativo: "IMAGENES/test.jpg" o "IMAGENES\test.jpg"
+    try:
+        # Intentar obtener FileManager para construir ruta absoluta
+        db_path = Path(__file__).parent.parent.parent.parent / "widget_sidebar.db"
+        config_manager = ConfigManager(str(db_path))
+        file_manager = FileManager(config_manager)
+
+        # Convertir ruta relativa a absoluta
+        absolute_path = file_manager.get_absolute_path(content_path)
+        config_manager.close()
+
+        return Path(absolute_path)
+
+    except Exception as e:
+        logger.warning(f"Could not resolve relative path '{content_path}': {e}")
+        # Fallback: asumir que es ruta absoluta
+        return path
+
+
 class ItemButton(QFrame):
     """Custom item button widget for content panel with tags support"""
 
@@ -61,39 +165,8 @@ class ItemButton(QFrame):
         self.init_ui()
 
     def _resolve_path(self, content_path: str) -> Path:
-        """
-        Resuelve una ruta, convirtiendo rutas relativas a absolutas si es necesario
-
-        Args:
-            content_path: Ruta desde item.content (puede ser relativa o absoluta)
-
-        Returns:
-            Path: Ruta absoluta resuelta
-        """
-        path = Path(content_path)
-
-        # Si la ruta es absoluta y existe, usarla directamente
-        if path.is_absolute():
-            return path
-
-        # Si es relativa, intentar construir ruta absoluta desde config
-        # Formato relativo: "IMAGENES/test.jpg" o "IMAGENES\test.jpg"
-        try:
-            # Intentar obtener FileManager para construir ruta absoluta
-            db_path = Path(__file__).parent.parent.parent.parent / "widget_sidebar.db"
-            config_manager = ConfigManager(str(db_path))
-            file_manager = FileManager(config_manager)
-
-            # Convertir ruta relativa a absoluta
-            absolute_path = file_manager.get_absolute_path(content_path)
-            config_manager.close()
-
-            return Path(absolute_path)
-
-        except Exception as e:
-            logger.warning(f"Could not resolve relative path '{content_path}': {e}")
-            # Fallback: asumir que es ruta absoluta
-            return path
+        """Resuelve una ruta (ver resolve_item_path)"""
+        return resolve_item_path(content_path)
 
     def init_ui(self):
         """Initialize button UI with new optimized design"""
@@ -842,63 +915,14 @@ class ItemButton(QFrame):
 
     def get_display_text(self):
         """Get display text based on selected display options (labels/tags/content/description)"""
-        MAX_CONTENT_LENGTH = 100  # Max characters for content preview
-        MAX_DESCRIPTION_LENGTH = 80  # Max characters for description
-
-        display_parts = []
-
-        # Get file type icon if this is a PATH item with file metadata
-        file_icon = ""
-        if (self.item.type == ItemType.PATH and
-            hasattr(self.item, 'file_hash') and self.item.file_hash and
-            hasattr(self.item, 'get_file_type_icon')):
-            file_icon = self.item.get_file_type_icon() + " "
-
-        # 1. Show Labels (if enabled)
-        if self.show_labels:
-            display_parts.append(f"{file_icon}{self.item.label}")
-
-        # 2. Show Description (if enabled and item has description)
-        if self.show_description and hasattr(self.item, 'description') and self.item.description:
-            description = self.item.description[:MAX_DESCRIPTION_LENGTH]
-            if len(self.item.description) > MAX_DESCRIPTION_LENGTH:
-                description += "..."
-            display_parts.append(f"📝 {description}")
-
-        # 3. Show Tags (if enabled and item has tags)
-        if self.show_tags and hasattr(self.item, 'tags') and self.item.tags:
-            if isinstance(self.item.tags, list):
-                tags_text = ", ".join(self.item.tags)
-            else:
-                tags_text = str(self.item.tags)
-            display_parts.append(f"🏷️ {tags_text}")
-
-        # 4. Show Content (if enabled)
-        if self.show_content:
-            # Handle sensitive content
-            if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and not self.is_revealed:
-                # Obfuscate sensitive content
-                display_parts.append("🔒 ********")
-            elif hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and self.is_revealed:
-                # Show revealed sensitive content (truncated)
-                content = self.item.content[:MAX_CONTENT_LENGTH]
-                if len(self.item.content) > MAX_CONTENT_LENGTH:
-                    content += "..."
-                display_parts.append(f"🔓 {content}")
-            else:
-                # Show normal content (truncated)
-                if self.item.content:
-                    content = self.item.content[:MAX_CONTENT_LENGTH]
-                    if len(self.item.content) > MAX_CONTENT_LENGTH:
-                        content += "..."
-                    display_parts.append(f"📄 {content}")
-
-        # Join all parts with separator
-        if display_parts:
-            return " | ".join(display_parts)
-        else:
-            # Fallback: show at least the label
-            return f"{file_icon}{self.item.label}"
+        return format_item_display_text(
+            self.item,
+            show_labels=self.show_labels,
+            show_tags=self.show_tags,
+            show_content=self.show_content,
+            show_description=self.show_description,
+            is_revealed=self.is_revealed
+        )
 
     def get_display_label(self):
         """Get display label (ofuscado si es sensible y no revelado) - DEPRECATED, use get_display_text()"""
@@ -0,0 +1,66 @@
+"""
+SearchCompleter Widget for Widget Sidebar
+QCompleter fed from an in-memory suggestion source (AutocompleteService)
+"""
+
+from typing import Callable, List
+
+from PyQt6.QtWidgets import QCompleter, QLineEdit
+from PyQt6.QtCore import Qt, QStringListModel
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCompleter(QCompleter):
+    """
+    Completer whose model is refilled with ranked suggestions on every edit
+
+    The suggestions are already filtered and ordered by the source (matches
+    at any word start), so the popup shows them unfiltered.
+    """
+
+    def __init__(self, line_edit: QLineEdit, suggest: Callable[[str, int], List[str]],
+                 max_suggestions: int = 10):
+        """Attach a completer to a search input
+
+        Args:
+            line_edit: Search input to complete
+            suggest: Callable (prefix, limit) -> suggestion texts
+            max_suggestions: Maximum entries in the popup
+        """
+        self._model = QStringListModel()
+        super().__init__(self._model, line_edit)
+
+        self.suggest = suggest
+        self.max_suggestions = max_suggestions
+
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.setMaxVisibleItems(max_suggestions)
+        self.popup().setStyleSheet("""
+            QListView {
+                background-color: #1e1e1e;
+                color: #ffffff;
+                border: 1px solid #3a3a3a;
+                selection-background-color: #007acc;
+            }
+        """)
+
+        line_edit.setCompleter(self)
+        # textEdited (no textChanged): aceptar una sugerencia no vuelve a consultar
+        line_edit.textEdited.connect(self.update_suggestions)
+
+    def update_suggestions(self, text: str):
+        """Refill the popup with suggestions for the current text"""
+        try:
+            suggestions = self.suggest(text, self.max_suggestions)
+        except Exception as e:
+            logger.error(f"Error getting autocomplete suggestions: {e}")
+            suggestions = []
+
+        self._model.setStringList(suggestions)
+        if suggestions:
+            self.complete()
+        else:
+            self.popup().hide()